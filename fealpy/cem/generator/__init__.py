@@ -1,2 +1,3 @@
 
 from .eit_data_generator import EITDataGenerator
+from .eit_dataset import generate_eit_dataset
@@ -10,14 +10,15 @@ from fealpy.fem import (
     ScalarDiffusionIntegrator,
     ScalarNeumannBCIntegrator
 )
-from fealpy.sparse import COOTensor
-from fealpy.solver import cg
+from fealpy.sparse import CSRTensor
+from fealpy.solver import cg, LUPreconditioner
 
 
 class EITDataGenerator():
     """Generate boundary voltage and current data for EIT.
     """
-    def __init__(self, mesh: Mesh, p: int=1, q: Optional[int]=None) -> None:
+    def __init__(self, mesh: Mesh, p: int=1, q: Optional[int]=None, *,
+                 solver: str='cg') -> None:
         """Create a new EIT data generator.
 
         Args:
@@ -25,11 +26,16 @@ class EITDataGenerator():
             p (int, optional): Order of the Lagrange finite element space. Defaults to 1.
             q (int | None, optional): Order of the quadrature, use `q = p + 2` if None.
                 Defaults to None.
+            solver (str, optional): 'cg' to solve all current patterns by the batched
+                conjugate gradient, or 'lu' to factorize the system once per
+                conductivity and solve the patterns as a multi-RHS block. Defaults to 'cg'.
         """
         q = p + 2 if q is None else q
+        if solver not in ('cg', 'lu'):
+            raise ValueError(f"Unknown solver '{solver}', use 'cg' or 'lu'.")
+        self.solver = solver
 
         # setup function space
-        kwargs = dict(dtype=mesh.itype, device=mesh.device)
         space = LagrangeFESpace(mesh, p=p) # FE space
         self.space = space
 
@@ -42,15 +48,16 @@ class EITDataGenerator():
         # initialize integrators
         self._bsi = ScalarNeumannBCIntegrator(None, q=q)
         self._di = ScalarDiffusionIntegrator(None, q=q)
+        self._bform = BilinearForm(space)
+        self._bform.add_integrator(self._di)
+        self._neumann_pattern = None
+        self._lu = None
 
         # prepare for the unique condition in the neumann case
         self.gdof = space.number_of_global_dofs()
         lform_c = LinearForm(space)
         lform_c.add_integrator(ScalarNeumannBCIntegrator(1.))
         self.cdata = lform_c.assembly()
-        cdata_row = bm.arange(self.gdof, **kwargs)
-        cdata_col = bm.full((self.gdof,), self.gdof, **kwargs)
-        self.cdata_indices = bm.stack([cdata_row, cdata_col], axis=0)
 
     def set_levelset(self, sigma_vals: Tuple[float, float],
                      levelset: Callable[[Tensor], Tensor],
@@ -75,23 +82,42 @@ class EITDataGenerator():
             return sigma
         _coef_func.coordtype = getattr(levelset, 'coordtype', 'cartesian')
 
-        space = self.space
-
-        bform = BilinearForm(space)
         self._di.coef = _coef_func
         self._di.clear() # clear the cached result as the coef has changed
-        bform.add_integrator(self._di)
-        self._A = bform.assembly(format='coo')
-
-        cdata_indices = self.cdata_indices
-        cdataT_indices = bm.flip(cdata_indices, axis=0)
-        A_n_indices = bm.concat([self._A.indices(), cdata_indices, cdataT_indices], axis=1)
-        A_n_values = bm.concat([self._A.values(), self.cdata, self.cdata], axis=-1)
-        A_n = COOTensor(A_n_indices, A_n_values, spshape=(self.gdof+1, self.gdof+1))
-        self.A_n = A_n.tocsr()
+        self._A = self._bform.pattern_assembly()
+        self.A_n = self._neumann_matrix(self._A)
+        self._lu = None
 
         return levelset(pixel) < 0.
 
+    def _neumann_matrix(self, A: CSRTensor) -> CSRTensor:
+        """Border the stiffness matrix with the constraint vector c into the
+        CSR matrix [[A, c], [c^T, 0]], reusing the pattern for the same A pattern."""
+        crow = A.crow()
+        if (self._neumann_pattern is None) or (self._neumann_pattern[0] is not crow):
+            gdof = self.gdof
+            nnz = A.col().shape[0]
+            kwargs = bm.context(crow)
+            idx = bm.arange(gdof, **kwargs)
+            # In each row, the column gdof is the last; the last row is c^T.
+            slot_a = bm.arange(nnz, **kwargs) + A.row()
+            slot_c = crow[1:] + idx
+            slot_ct = nnz + gdof + idx
+            crow_n = bm.concat([crow + bm.arange(gdof + 1, **kwargs),
+                                bm.tensor([nnz + 2*gdof], **kwargs)])
+            col_n = bm.zeros((nnz + 2*gdof, ), **kwargs)
+            col_n = bm.set_at(col_n, slot_a, A.col())
+            col_n = bm.set_at(col_n, slot_c, gdof)
+            col_n = bm.set_at(col_n, slot_ct, idx)
+            self._neumann_pattern = (crow, crow_n, col_n, slot_a, slot_c, slot_ct)
+
+        _, crow_n, col_n, slot_a, slot_c, slot_ct = self._neumann_pattern
+        values = bm.zeros(col_n.shape, **bm.context(A.values()))
+        values = bm.set_at(values, slot_a, A.values())
+        values = bm.set_at(values, slot_c, self.cdata)
+        values = bm.set_at(values, slot_ct, self.cdata)
+        return CSRTensor(crow_n, col_n, values, spshape=(self.gdof+1, self.gdof+1))
+
     def set_boundary(self, gn_source: Union[Callable[[Tensor], Tensor], Tensor],
                      batch_size: int=0, *, zero_integral=False) -> Tensor:
         """Set boundary current density.
@@ -145,10 +171,17 @@ class EITDataGenerator():
             Tensor: gd Tensor, shaped (Boundary nodes, )\
                 or (Batch, Boundary nodes).
         """
-        uh = cg(self.A_n, self.b_, batch_first=True, atol=1e-12, rtol=0.)
+        if self.solver == 'lu':
+            if self._lu is None: # factorize once for all current patterns
+                self._lu = LUPreconditioner(self.A_n)
+            b_ = self.b_
+            uh = self._lu.solve(b_.T if b_.ndim == 2 else b_)
+            uh = uh.T if b_.ndim == 2 else uh
+        else:
+            uh = cg(self.A_n, self.b_, batch_first=True, atol=1e-12, rtol=0.)
 
         if return_full:
-            return uh[:-1]
+            return uh[..., :-1]
 
         # NOTE: interpolation points on nodes are arranged firstly,
         # therefore the value on the boundary nodes can be fetched like this:
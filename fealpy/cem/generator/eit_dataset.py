@@ -0,0 +1,187 @@
+
+import os
+import json
+from typing import Tuple, Callable, Optional, Dict, Any
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from fealpy.backend import backend_manager as bm
+from fealpy.backend import TensorLike as Tensor
+from fealpy.mesh import Mesh
+from fealpy import logger
+
+from .eit_data_generator import EITDataGenerator
+
+Sampler = Callable[[int], Tuple[Tuple[float, float], Callable[[Tensor], Tensor]]]
+
+_WORKER_CACHE: Dict[str, Any] = {}
+
+
+def _write_json(fname: str, obj) -> None:
+    # Write to a temporary file then rename, so the checkpoint is never half-written.
+    tmp = fname + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(obj, f)
+    os.replace(tmp, fname)
+
+
+def _read_json(fname: str):
+    with open(fname, 'r') as f:
+        return json.load(f)
+
+
+def _shard_files(path: str, shard: int):
+    tag = f'{shard:05d}'
+    return (os.path.join(path, f'voltage-{tag}.npy'),
+            os.path.join(path, f'label-{tag}.npy'),
+            os.path.join(path, f'progress-{tag}.json'))
+
+
+def _worker_generator(path: str, config: Dict[str, Any]) -> EITDataGenerator:
+    """Build the generator once per process, and set the current patterns,
+    which do not depend on the samples."""
+    if path not in _WORKER_CACHE:
+        bm.set_backend(config['backend'])
+        mesh = Mesh.load(os.path.join(path, 'mesh'))
+        gen = EITDataGenerator(mesh, p=config['p'], q=config['q'], solver=config['solver'])
+        gen.set_boundary(config['gn_source'], config['batch_size'],
+                         zero_integral=config['zero_integral'])
+        _WORKER_CACHE[path] = gen
+    return _WORKER_CACHE[path]
+
+
+def _run_shard(path: str, shard: int, start: int, stop: int,
+               config: Dict[str, Any]) -> int:
+    gen = _worker_generator(path, config)
+    vfile, lfile, pfile = _shard_files(path, shard)
+    pixel = config['pixel']
+    NS = stop - start
+    NB = max(config['batch_size'], 1)
+    NBD = gen.bd_node.shape[0]
+
+    if os.path.exists(pfile):
+        count = _read_json(pfile)['count']
+        voltage = open_memmap(vfile, mode='r+')
+        label = open_memmap(lfile, mode='r+')
+    else:
+        count = 0
+        voltage = open_memmap(vfile, mode='w+', dtype=config['dtype'], shape=(NS, NB, NBD))
+        label = open_memmap(lfile, mode='w+', dtype=np.bool_, shape=(NS, pixel.shape[0]))
+
+    sampler = config['sampler']
+    checkpoint = config['checkpoint']
+
+    for i in range(count, NS):
+        sigma_vals, levelset = sampler(start + i)
+        label[i] = bm.to_numpy(gen.set_levelset(sigma_vals, levelset, pixel))
+        voltage[i] = bm.to_numpy(gen.run()).reshape(NB, NBD)
+
+        if (i + 1) % checkpoint == 0 or (i + 1) == NS:
+            voltage.flush()
+            label.flush()
+            _write_json(pfile, {'count': i + 1})
+
+    del voltage, label
+    return NS
+
+
+def generate_eit_dataset(path: str, mesh: Mesh, sampler: Sampler,
+                         gn_source: Callable[[Tensor], Tensor], num_samples: int, *,
+                         pixel: Tensor, batch_size: int=0,
+                         p: int=1, q: Optional[int]=None, solver: str='lu',
+                         shard_size: int=1000, num_workers: int=0,
+                         checkpoint: int=100, dtype=np.float32,
+                         zero_integral: bool=True) -> int:
+    """Generate EIT boundary voltages for many conductivity samples, writing
+    sharded `.npy` files that can be resumed after interruption.
+
+    For each sample, the stiffness matrix is assembled on the cached sparsity
+    pattern, and all the current patterns are solved as one multi-RHS block
+    (factorized once if `solver='lu'`). The shards are generated by a pool of
+    `num_workers` processes, each of which loads the mesh saved in `path`.
+
+    Files in `path`:
+        - `mesh/`: the mesh, see `Mesh.save`.
+        - `current.npy`: boundary currents, shaped (batch, boundary nodes).
+        - `voltage-XXXXX.npy`: boundary voltages, shaped (shard, batch, boundary nodes).
+        - `label-XXXXX.npy`: inclusion labels on the pixels, shaped (shard, pixels).
+        - `progress-XXXXX.json`: number of finished samples in the shard.
+
+    Args:
+        path (str): The output directory. Calling again with the same arguments
+            continues from the last checkpoints.
+        mesh (Mesh): The mesh.
+        sampler (Callable): Function returning `(sigma_vals, levelset)` of the
+            sample with the given index, see `EITDataGenerator.set_levelset`.
+            It should be deterministic in the index to make the data resumable,
+            and picklable if `num_workers > 0`.
+        gn_source (Callable): Current density of the patterns, see
+            `EITDataGenerator.set_boundary`. Picklable if `num_workers > 0`.
+        num_samples (int): Number of samples.
+        pixel (Tensor): Points where the inclusion labels are evaluated.
+        batch_size (int, optional): Number of the current patterns. Defaults to 0.
+        p (int, optional): Order of the Lagrange finite element space. Defaults to 1.
+        q (int | None, optional): Order of the quadrature. Defaults to None.
+        solver (str, optional): 'lu' or 'cg'. Defaults to 'lu'.
+        shard_size (int, optional): Number of samples in a shard. Defaults to 1000.
+        num_workers (int, optional): Number of worker processes, 0 to run in the
+            current process. Defaults to 0.
+        checkpoint (int, optional): Flush the shard and record the progress every
+            `checkpoint` samples. Defaults to 100.
+        dtype (optional): Data type of the voltage files. Defaults to float32.
+        zero_integral (bool, optional): Whether zero the integral of the current
+            density on the boundary. Defaults to True.
+
+    Returns:
+        int: Number of the shards.
+    """
+    os.makedirs(path, exist_ok=True)
+    config = {
+        'backend': bm.backend_name, 'p': p, 'q': q, 'solver': solver,
+        'gn_source': gn_source, 'batch_size': batch_size,
+        'zero_integral': zero_integral, 'sampler': sampler,
+        'pixel': pixel, 'checkpoint': checkpoint, 'dtype': np.dtype(dtype).str
+    }
+    meta = {'num_samples': num_samples, 'shard_size': shard_size,
+            'batch_size': batch_size, 'p': p, 'dtype': config['dtype']}
+    meta_file = os.path.join(path, 'dataset.json')
+
+    if os.path.exists(meta_file):
+        old_meta = _read_json(meta_file)
+        if old_meta != meta:
+            raise ValueError(f"The dataset in {path} was generated with {old_meta}, "
+                             f"which does not match {meta}.")
+        logger.info(f"Resuming the EIT dataset in {path}.")
+    else:
+        mesh.save(os.path.join(path, 'mesh'))
+        _write_json(meta_file, meta)
+
+    _WORKER_CACHE.pop(path, None)
+    gen = _worker_generator(path, config)
+    current = gen.set_boundary(gn_source, batch_size, zero_integral=zero_integral)
+    np.save(os.path.join(path, 'current.npy'), bm.to_numpy(current))
+
+    shards = []
+    for shard, start in enumerate(range(0, num_samples, shard_size)):
+        stop = min(start + shard_size, num_samples)
+        pfile = _shard_files(path, shard)[2]
+        if os.path.exists(pfile) and _read_json(pfile)['count'] == stop - start:
+            continue
+        shards.append((shard, start, stop))
+
+    try:
+        if num_workers > 0:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=num_workers) as pool:
+                futures = [pool.submit(_run_shard, path, *args, config) for args in shards]
+                for future in futures:
+                    future.result()
+        else:
+            for args in shards:
+                _run_shard(path, *args, config)
+    finally:
+        _WORKER_CACHE.pop(path, None)
+
+    return -(-num_samples // shard_size)
@@ -1,3 +1,7 @@
 from .ns_mac_solver import NSMacSolver
-from .ns_fem_solver import NSFEMSolver
+from .ns_projection_stepper import NSProjectionStepper
+# NOTE: NSFEMSolver is built on the legacy FEM API (add_domain_integrator,
+# MixedBilinearForm, ...), which is not available in fealpy.fem any more.
+# Use NSProjectionStepper for the Chorin and IPCS schemes.
+#from .ns_fem_solver import NSFEMSolver
 #from .ns_flip_solver import NSFlipSolver
@@ -0,0 +1,275 @@
+
+from typing import Optional, Callable, Union
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..decorator import barycentric
+from ..sparse import CSRTensor
+from ..fem import (
+    BilinearForm,
+    ScalarMassIntegrator, ScalarDiffusionIntegrator,
+    ScalarConvectionIntegrator, PressWorkIntegrator
+)
+from ..solver import fgmres, LUPreconditioner
+
+from .. import logger
+
+
+class NSProjectionStepper():
+    """Time-stepping engine of the projection (Chorin and IPCS) schemes for
+    the incompressible Navier-Stokes equations
+
+        rho (u_t + u.grad(u)) - mu lap(u) + grad(p) = f,  div(u) = 0.
+
+    Each step solves three linear systems:
+    1. the tentative velocity u* from the momentum equation, where the
+       convection is linearized at u^n;
+    2. the pressure (increment) from a Poisson equation;
+    3. the corrected velocity u^{n+1} from a mass matrix projection.
+
+    The mass, diffusion, divergence and pressure Laplacian matrices are
+    assembled once, and the factorizations of the constant systems are kept
+    across steps. Only the convection matrix is re-assembled in each step,
+    reusing the sparsity pattern shared with the mass matrix. Dirichlet
+    conditions are applied on the values of the fixed pattern as well.
+
+    Parameters:
+        uspace (TensorFunctionSpace): The velocity space, e.g. P2 with shape (GD, -1).
+        pspace (FunctionSpace): The pressure space, e.g. P1.
+        dt (float): The time step.
+        rho (float, optional): The density. Defaults to 1.0.
+        mu (float, optional): The dynamic viscosity. Defaults to 1.0.
+        q (int | None, optional): The index of quadrature formula. Defaults to None.
+        scheme (str, optional): 'ipcs' (incremental pressure correction) or\
+        'chorin'. Defaults to 'ipcs'.
+        convection (str, optional): 'implicit' to put the linearized convection\
+        u^n.grad(u*) in the matrix, or 'explicit' to move u^n.grad(u^n) to the\
+        right-hand side, so that the momentum matrix is constant. Defaults to 'implicit'.
+        preconditioner_refresh (int, optional): With the implicit convection, the\
+        momentum system is solved by FGMRES preconditioned with the LU factorization\
+        of the momentum matrix in some step, which is refreshed every\
+        `preconditioner_refresh` steps. Defaults to 10.
+        rtol (float, optional): Relative tolerance of FGMRES. Defaults to 1e-10.
+
+    Example:
+    ```
+        stepper = NSProjectionStepper(uspace, pspace, dt=0.01, rho=1., mu=1e-3)
+        stepper.set_velocity_bc(inflow, threshold=is_wall_or_inflow)
+        stepper.set_pressure_bc(0., threshold=is_outflow)
+        for i in range(nt):
+            u, p = stepper.step()
+    ```
+    """
+    def __init__(self, uspace, pspace, dt: float, *,
+                 rho: float=1.0, mu: float=1.0, q: Optional[int]=None,
+                 scheme: str='ipcs', convection: str='implicit',
+                 preconditioner_refresh: int=10,
+                 rtol: float=1e-10) -> None:
+        if scheme not in {'ipcs', 'chorin'}:
+            raise ValueError(f"Unknown projection scheme '{scheme}'.")
+        if convection not in {'implicit', 'explicit'}:
+            raise ValueError(f"Unknown convection treatment '{convection}'.")
+
+        self.uspace = uspace
+        self.pspace = pspace
+        self.rho = rho
+        self.mu = mu
+        self.scheme = scheme
+        self.convection = convection
+        self.preconditioner_refresh = preconditioner_refresh
+        self.rtol = rtol
+        self.n_step = 0
+
+        # Per-step fields, updated in place.
+        self.u = uspace.function()
+        self.us = uspace.function()
+        self.p = pspace.function()
+        self.phi = pspace.function()
+
+        # Constant operators sharing the velocity pattern
+        M_form = BilinearForm(uspace)
+        M_form.add_integrator(ScalarMassIntegrator(q=q))
+        self.M = M_form.pattern_assembly()
+        S_form = BilinearForm(uspace)
+        S_form.add_integrator(ScalarDiffusionIntegrator(q=q))
+        self.S = S_form.pattern_assembly()
+        Bt_form = BilinearForm((pspace, uspace))
+        Bt_form.add_integrator(PressWorkIntegrator(q=q))
+        self.Bt = Bt_form.pattern_assembly() # (p, div v)
+        self.B = Bt_form.T.pattern_assembly()
+        Sp_form = BilinearForm(pspace)
+        Sp_form.add_integrator(ScalarDiffusionIntegrator(q=q))
+        self.Sp = Sp_form.pattern_assembly()
+
+        u = self.u
+        @barycentric
+        def convection_coef(bcs, index):
+            return rho * u(bcs, index=index)
+        self._C_int = ScalarConvectionIntegrator(convection_coef, q=q)
+        C_form = BilinearForm(uspace)
+        C_form.add_integrator(self._C_int)
+        self._C_form = C_form.T # rows for the test functions
+
+        ugdof = uspace.number_of_global_dofs()
+        pgdof = pspace.number_of_global_dofs()
+        self.set_velocity_bc(None, threshold=bm.zeros((ugdof, ), dtype=bm.bool))
+        self.set_pressure_bc(None, threshold=bm.zeros((pgdof, ), dtype=bm.bool))
+        self.set_timestep(dt)
+
+    ### Boundary conditions ###
+
+    @staticmethod
+    def _bc_slots(A: CSRTensor, isDDof: TensorLike):
+        """Find the slots of the values in the rows and columns of Dirichlet DoFs,
+        and the diagonal slots in these rows."""
+        row, col = A.row(), A.col()
+        zero_flag = isDDof[row] | isDDof[col]
+        diag_slot = bm.nonzero(zero_flag & (row == col))[0]
+        return zero_flag, diag_slot
+
+    @staticmethod
+    def _apply_slots(A: CSRTensor, values: TensorLike, slots) -> CSRTensor:
+        zero_flag, diag_slot = slots
+        values = bm.where(zero_flag, 0., values)
+        values = bm.set_at(values, diag_slot, 1.)
+        return CSRTensor(A.crow(), A.col(), values, spshape=A.sparse_shape)
+
+    def set_velocity_bc(self, gD, threshold=None) -> None:
+        """Set the Dirichlet boundary condition of the velocity.
+
+        Parameters:
+            gD (Callable | TensorLike | None): The boundary values.
+            threshold (Callable | TensorLike | None, optional): Select the boundary\
+            DoFs. Defaults to None, for the whole boundary.
+        """
+        if gD is None:
+            self.uD = self.uspace.function()
+            self.isUDDof = self.uspace.is_boundary_dof(threshold=threshold)
+        else:
+            self.uD, self.isUDDof = self.uspace.boundary_interpolate(
+                gD, self.uspace.function(), threshold=threshold
+            )
+        self._u_slots = self._bc_slots(self.M, self.isUDDof)
+        self._M_bc = LUPreconditioner(self._apply_slots(self.M, self.M.values(), self._u_slots))
+        self.u[self.isUDDof] = self.uD[self.isUDDof]
+        if hasattr(self, 'dt'):
+            self.set_timestep(self.dt)
+
+    def set_pressure_bc(self, gD, threshold=None) -> None:
+        """Set the Dirichlet boundary condition of the pressure, e.g. on the outflow
+        boundary. If no pressure DoF is fixed, the first DoF is pinned to remove
+        the null space of the pressure Poisson equation.
+
+        Parameters:
+            gD (Callable | TensorLike | float | None): The boundary values.
+            threshold (Callable | TensorLike | None, optional): Select the boundary\
+            DoFs. Defaults to None, for the whole boundary.
+        """
+        if gD is None:
+            self.pD = self.pspace.function()
+            isPDDof = self.pspace.is_boundary_dof(threshold=threshold)
+        else:
+            self.pD, isPDDof = self.pspace.boundary_interpolate(
+                gD, self.pspace.function(), threshold=threshold
+            )
+        self.pinned = not bool(bm.any(isPDDof))
+        if self.pinned:
+            isPDDof = bm.set_at(bm.zeros_like(isPDDof), 0, True)
+        self.isPDDof = isPDDof
+        self._p_slots = self._bc_slots(self.Sp, isPDDof)
+        self._Sp_bc = LUPreconditioner(self._apply_slots(self.Sp, self.Sp.values(), self._p_slots))
+        if not self.pinned:
+            self.p[isPDDof] = self.pD[isPDDof]
+
+    def set_timestep(self, dt: float) -> None:
+        """Change the time step, and re-combine the constant part of the momentum
+        matrix, K = rho/dt M + mu S."""
+        self.dt = dt
+        self._K_values = (self.rho / dt) * self.M.values() + self.mu * self.S.values()
+        self._A_bc = None
+
+    def init(self, u0: Optional[TensorLike]=None, p0: Optional[TensorLike]=None) -> None:
+        """Set the initial velocity and pressure. The boundary values are kept."""
+        if u0 is not None:
+            self.u[:] = u0[:]
+            self.u[self.isUDDof] = self.uD[self.isUDDof]
+        if p0 is not None:
+            self.p[:] = p0[:]
+            if not self.pinned:
+                self.p[self.isPDDof] = self.pD[self.isPDDof]
+
+    ### Time stepping ###
+
+    def _momentum_matrix(self) -> CSRTensor:
+        values = self._K_values
+        if self.convection == 'implicit':
+            self._C_int.clear()
+            values = values + self._C_form.pattern_assembly().values()
+        return CSRTensor(self.M.crow(), self.M.col(), values, spshape=self.M.sparse_shape)
+
+    def _lift(self, A: CSRTensor, b: TensorLike, isDDof, gD) -> TensorLike:
+        gD = bm.where(isDDof, gD[:], 0.)
+        b = b - A @ gD
+        return bm.set_at(b, isDDof, gD[isDDof])
+
+    def step(self, F: Optional[TensorLike]=None):
+        """Advance one time step.
+
+        Parameters:
+            F (TensorLike | None, optional): The assembled load vector (f, v) at the\
+            new time level. Defaults to None.
+
+        Returns:
+            Tuple[Function, Function]: The velocity and pressure, which are the\
+            buffers updated in place.
+        """
+        rho, dt = self.rho, self.dt
+        u, us, p, phi = self.u, self.us, self.p, self.phi
+
+        # 1. tentative velocity
+        A = self._momentum_matrix()
+        b = (rho / dt) * (self.M @ u[:])
+        if self.scheme == 'ipcs':
+            b = b + self.Bt @ p[:]
+        if F is not None:
+            b = b + F
+        if self.convection == 'explicit':
+            self._C_int.clear()
+            b = b - self._C_form.pattern_assembly() @ u[:]
+        b = self._lift(A, b, self.isUDDof, self.uD)
+
+        if self.convection == 'explicit':
+            if self._A_bc is None:
+                self._A_bc = LUPreconditioner(self._apply_slots(A, A.values(), self._u_slots))
+            us[:] = self._A_bc @ b
+        else:
+            A = self._apply_slots(A, A.values(), self._u_slots)
+            if (self._A_bc is None) or (self.n_step % self.preconditioner_refresh == 0):
+                self._A_bc = LUPreconditioner(A)
+            us[:] = fgmres(A, b, us[:], M=self._A_bc, atol=0., rtol=self.rtol)
+
+        # 2. pressure (increment)
+        b = -(rho / dt) * (self.B @ us[:])
+        if self.pinned:
+            b = bm.set_at(b, self.isPDDof, 0.)
+        elif self.scheme == 'ipcs':
+            pD = self.pD[:] - p[:]
+            b = self._lift(self.Sp, b, self.isPDDof, pD)
+        else:
+            b = self._lift(self.Sp, b, self.isPDDof, self.pD)
+        phi[:] = self._Sp_bc @ b
+
+        # 3. velocity correction
+        b = self.M @ us[:] + (dt / rho) * (self.Bt @ phi[:])
+        b = self._lift(self.M, b, self.isUDDof, self.uD)
+        u[:] = self._M_bc @ b
+
+        if self.scheme == 'ipcs':
+            p[:] = p[:] + phi[:]
+        else:
+            p[:] = phi[:]
+
+        self.n_step += 1
+        logger.info(f"NSProjectionStepper: step {self.n_step} finished.")
+
+        return u, p
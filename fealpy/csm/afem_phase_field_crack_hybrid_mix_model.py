@@ -18,6 +18,7 @@ from ..mesh.halfedge_mesh import HalfEdgeMesh2d
 from ..mesh import TriangleMesh
 
 from scipy.sparse.linalg import spsolve, lgmres, cg
+from .spectral_kernel import sym_eigh, strain_pm_split, spectral_split
 from scipy.sparse import csr_matrix, coo_matrix
 
 
@@ -413,41 +414,13 @@ class AFEMPhaseFieldCrackHybridMixModel():
         @brief 应变的正负特征分解
         @param[in] s 单元应变数组，（NC, 2, 2）
         """
-        w, v = np.linalg.eigh(s) # w 特征值, v 特征向量
-        p, m = self.macaulay_operation(w)
-
-        sp = np.zeros_like(s)
-        sm = np.zeros_like(s)
-        
-        GD = self.GD
-        for i in range(GD):
-            n0 = v[:, :, i]  # (NC, 2)
-            n1 = p[:, i, None] * n0  # (NC, 2)
-            sp += n1[:, :, None] * n0[:, None, :]
-
-            n1 = m[:, i, None] * n0
-            sm += n1[:, :, None] * n0[:, None, :]
-
-        return sp, sm
+        return strain_pm_split(s)
 
     def strain_energy_density_decomposition(self, s):
         """
         @brief 应变能密度的分解
         """
-
-        lam = self.model.lam
-        mu = self.model.mu
-
-        # 应变正负分解
-        sp, sm = self.strain_pm_eig_decomposition(s)
-
-        ts = np.trace(s, axis1=1, axis2=2)
-        tp, tm = self.macaulay_operation(ts)
-        tsp = np.trace(sp**2, axis1=1, axis2=2)
-        tsm = np.trace(sm**2, axis1=1, axis2=2)
-
-        phi_p = lam * tp ** 2 / 2.0 + mu * tsp
-        phi_m = lam * tm ** 2 / 2.0 + mu * tsm
+        _, _, phi_p, phi_m, _ = spectral_split(s, self.model.lam, self.model.mu, tangent=False)
         return phi_p, phi_m
     
     def dsigma_depsilon(self, phi, D0):
@@ -496,8 +469,7 @@ class AFEMPhaseFieldCrackHybridMixModel():
         @brief 给定每个单元上的应变，进行特征值分解
         """
 
-        w, v = np.linalg.eig(s)
-        return w, v
+        return sym_eigh(s)
 
     def heaviside(self, x, k=1):
         """
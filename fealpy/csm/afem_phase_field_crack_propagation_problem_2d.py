@@ -14,6 +14,7 @@ from ..fem import LinearRecoveryAlg
 from ..mesh.adaptive_tools import mark
 
 from scipy.sparse.linalg import spsolve
+from .spectral_kernel import sym_eigh, strain_pm_split, spectral_split
 
 class AFEMPhaseFieldCrackPropagationProblem2d():
     """
@@ -257,40 +258,13 @@ class AFEMPhaseFieldCrackPropagationProblem2d():
         @brief 应变的正负特征分解
         @param[in] s 单元应变数组，（NC, 2, 2）
         """
-        w, v = np.linalg.eigh(s) # w 特征值, v 特征向量
-        p, m = self.macaulay_operation(w)
-
-        sp = np.zeros_like(s)
-        sm = np.zeros_like(s)
-
-        for i in range(2):
-            n0 = v[:, :, i]  # (NC, 2)
-            n1 = p[:, i, None] * n0  # (NC, 2)
-            sp += n1[:, :, None] * n0[:, None, :]
-
-            n1 = m[:, i, None] * n0
-            sm += n1[:, :, None] * n0[:, None, :]
-
-        return sp, sm
+        return strain_pm_split(s)
 
     def strain_energy_density_decomposition(self, s):
         """
         @brief 应变能密度的分解
         """
-
-        lam = self.model.lam
-        mu = self.model.mu
-
-        # 应变正负分解
-        sp, sm = self.strain_pm_eig_decomposition(s)
-
-        ts = np.trace(s, axis1=1, axis2=2)
-        tp, tm = self.macaulay_operation(ts)
-        tsp = np.trace(sp**2, axis1=1, axis2=2)
-        tsm = np.trace(sm**2, axis1=1, axis2=2)
-
-        phi_p = lam * tp ** 2 / 2.0 + mu * tsp
-        phi_m = lam * tm ** 2 / 2.0 + mu * tsm
+        _, _, phi_p, phi_m, _ = spectral_split(s, self.model.lam, self.model.mu, tangent=False)
         return phi_p, phi_m
 
     def strain_eigs(self, s):
@@ -298,8 +272,7 @@ class AFEMPhaseFieldCrackPropagationProblem2d():
         @brief 给定每个单元上的应变，进行特征值分解
         """
 
-        w, v = np.linalg.eig(s)
-        return w, v
+        return sym_eigh(s)
 
     def heaviside(self, x, k=1):
         """
@@ -320,51 +293,11 @@ class AFEMPhaseFieldCrackPropagationProblem2d():
         """
 
         eps = 1e-10
-        lam = self.model.lam # 拉梅第一参数
-        mu = self.model.mu # 拉梅第二参数
         s = self.strain(uh) # 计算应变
 
-        NC = len(s)
-        D = np.zeros((NC, 3, 3), dtype=np.float64)
-
-        ts = np.trace(s, axis1=1, axis2=2) # 计算应变的迹
-        w, v = self.strain_eigs(s)
-        hwp = self.heaviside(w)
-        hwm = self.heaviside(-w)
-
         bc = np.array([1 / 3, 1 / 3, 1 / 3], dtype=np.float64)
         c0 = (1 - phi(bc)) ** 2 + eps
-        c1 = np.zeros_like(c0)
-        c2 = np.zeros_like(c0)
-
-        flag = (w[:, 0] == w[:, 1])
-        c1[flag] = hwp[flag, 0] / 2.0
-        c2[flag] = hwm[flag, 0] / 2.0
-
-        r = np.sum(w[~flag], axis=-1) / np.sum(np.abs(w[~flag]), axis=-1)
-        c1[~flag] = (1 + r) / 4.0 
-        c2[~flag] = (1 - r) / 4.0
-
-
-        d0 = 2 * mu * (c0 * hwp[:, 0] + hwm[:, 0])
-        d1 = 2 * mu * (c0 * hwp[:, 1] + hwm[:, 1])
-        d2 = 2 * mu * (c0 * c1 + c2)
-
-        val = lam * (c0 * self.heaviside(ts) + self.heaviside(-ts))
-        D[:, 0, 0] = val
-        D[:, 0, 1] = val
-        D[:, 1, 0] = val
-        D[:, 1, 1] = val
-        
-        for m, n, i, j, k, l in self.index:
-            D[:, m, n] += d0 * v[:, i, 0] * v[:, j, 0] * v[:, k, 0] * v[:, l, 0]
-            D[:, m, n] += d1 * v[:, i, 1] * v[:, j, 1] * v[:, k, 1] * v[:, l, 1]
-            val = v[:, i, 0] * v[:, k, 0] * v[:, j, 1] * v[:, l, 1]
-            val += v[:, i, 0] * v[:, l, 0] * v[:, j, 1] * v[:, k, 1]
-            val += v[:, i, 1] * v[:, k, 1] * v[:, j, 0] * v[:, l, 0]
-            val += v[:, i, 1] * v[:, l, 1] * v[:, j, 0] * v[:, k, 0]
-            D[:, m, n] += d2 * val
-        D = (D + D.swapaxes(1,2))/2
+        _, _, _, _, D = spectral_split(s, self.model.lam, self.model.mu, c0)
         return D
     
     def get_dissipated_energy(self, d):
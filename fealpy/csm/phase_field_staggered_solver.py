@@ -0,0 +1,319 @@
+
+from typing import Optional, Callable, Union
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import CSRTensor
+from ..functionspace import LagrangeFESpace, TensorFunctionSpace
+from ..material import LinearElasticMaterial
+from ..fem import (
+    BilinearForm, LinearForm,
+    LinearElasticIntegrator, ScalarDiffusionIntegrator,
+    ScalarMassIntegrator, ScalarSourceIntegrator
+)
+from ..solver import cg, LUPreconditioner, ILUPreconditioner
+
+from .. import logger
+from .spectral_kernel import spectral_split
+
+
+class _DegradedElasticMaterial(LinearElasticMaterial):
+    """Linear elastic material whose elastic matrix is degraded by the phase
+    field, g(d) D with g(d) = (1 - d)^2 + eps."""
+    def __init__(self, lam: float, mu: float, hypo: str, eps: float) -> None:
+        super().__init__('degraded', lame_lambda=lam, shear_modulus=mu, hypo=hypo)
+        self.eps = eps
+        self.d = None
+
+    def elastic_matrix(self, bcs: Optional[TensorLike]=None) -> TensorLike:
+        gd = (1 - self.d(bcs))**2 + self.eps # (NC, NQ)
+        return gd[..., None, None] * self.D[None, None, ...]
+
+
+class PhaseFieldStaggeredSolver():
+    """Staggered (alternate minimization) solver of the hybrid phase field
+    fracture model. In every iteration of a load step,
+
+    1. the displacement is solved from div(g(d) C eps(u)) = 0;
+    2. the history field H = max(H_n, psi_+(eps(u))) is updated at the
+       quadrature points, where psi_+ comes from the spectral split;
+    3. the phase field is solved from
+       -Gc l0 lap(d) + (Gc/l0 + 2H) d = 2H.
+
+    The spaces, integrators and sparsity patterns are built once. In the
+    iterations, only the degradation g(d) and the history field H enter the
+    assembly, where the cached basis functions and the CSR patterns are
+    reused, and the Dirichlet conditions are applied on the values of the
+    fixed pattern. The preconditioners of CG are kept across iterations and
+    load steps, and rebuilt every `preconditioner_refresh` solves. After
+    adaptive refinement by `refine`, the mesh-dependent structures are
+    rebuilt while the parameters and boundary selections are kept.
+
+    Parameters:
+        mesh (HomogeneousMesh): The mesh, triangle or tetrahedron.
+        lam (float): The first Lame constant.
+        mu (float): The shear modulus.
+        Gc (float): The critical energy release rate.
+        l0 (float): The length scale of the phase field.
+        p (int, optional): The degree of the Lagrange spaces. Defaults to 1.
+        q (int | None, optional): The index of quadrature formula. Defaults to p+2.
+        eps (float, optional): The residual stiffness. Defaults to 1e-10.
+        linear_solver (str, optional): 'cg' or 'direct'. Defaults to 'cg'.
+        preconditioner (Callable | None, optional): Build the preconditioner of\
+        CG from the matrix. Defaults to `ILUPreconditioner`.
+        preconditioner_refresh (int, optional): Rebuild the preconditioners\
+        every `preconditioner_refresh` solves. Defaults to 10.
+        rtol (float, optional): Relative tolerance of CG. Defaults to 1e-10.
+        maxit (int, optional): Maximum number of staggered iterations in a load\
+        step. Defaults to 100.
+        tol (float, optional): Tolerance of the staggered iterations on the change\
+        of the phase field and the relative change of the displacement.\
+        Defaults to 1e-6.
+
+    Example:
+    ```
+        solver = PhaseFieldStaggeredSolver(mesh, lam=121.15, mu=80.77, Gc=2.7e-3, l0=0.015)
+        solver.set_displacement_bc(is_fixed, load_threshold=is_top)
+        for disp in bm.linspace(0, 6e-3, 61):
+            uh, d = solver.step(disp)
+            force.append(solver.force)
+    ```
+    """
+    def __init__(self, mesh, *, lam: float, mu: float, Gc: float, l0: float,
+                 p: int=1, q: Optional[int]=None, eps: float=1e-10,
+                 linear_solver: str='cg',
+                 preconditioner: Optional[Callable]=None,
+                 preconditioner_refresh: int=10,
+                 rtol: float=1e-10, maxit: int=100, tol: float=1e-6) -> None:
+        if linear_solver not in {'cg', 'direct'}:
+            raise ValueError(f"Unknown linear solver '{linear_solver}'.")
+
+        self.mesh = mesh
+        self.lam = lam
+        self.mu = mu
+        self.Gc = Gc
+        self.l0 = l0
+        self.p = p
+        self.q = p + 2 if q is None else q
+        self.linear_solver = linear_solver
+        self.preconditioner = ILUPreconditioner if preconditioner is None else preconditioner
+        self.preconditioner_refresh = preconditioner_refresh
+        self.rtol = rtol
+        self.maxit = maxit
+        self.tol = tol
+
+        GD = mesh.geo_dimension()
+        hypo = 'plane_strain' if GD == 2 else '3D'
+        self.material = _DegradedElasticMaterial(lam, mu, hypo, eps)
+
+        self._u_threshold = None
+        self._load_threshold = None
+        self._d_threshold = None
+        self.force = 0.
+        self.n_iter = 0
+        self._setup()
+
+    def _setup(self) -> None:
+        """Build the spaces, the fields and the operators on the current mesh."""
+        mesh, q = self.mesh, self.q
+        GD = mesh.geo_dimension()
+        self.space = LagrangeFESpace(mesh, p=self.p)
+        self.uspace = TensorFunctionSpace(self.space, (GD, -1))
+
+        self.uh = self.uspace.function()
+        self.d = self.space.function()
+        qf = mesh.quadrature_formula(q, 'cell')
+        self._bcs, _ = qf.get_quadrature_points_and_weights()
+        NC = mesh.number_of_cells()
+        self.H = bm.zeros((NC, self._bcs.shape[0]), dtype=mesh.ftype)
+        self.material.d = self.d
+
+        self._K_int = LinearElasticIntegrator(self.material, q=q)
+        self._K_form = BilinearForm(self.uspace)
+        self._K_form.add_integrator(self._K_int)
+        self.K = self._K_form.pattern_assembly()
+
+        S_form = BilinearForm(self.space)
+        S_form.add_integrator(ScalarDiffusionIntegrator(self.Gc * self.l0, q=q))
+        self._S = S_form.pattern_assembly()
+        self._M_int = ScalarMassIntegrator(self.Gc / self.l0 + 2 * self.H, q=q)
+        self._M_form = BilinearForm(self.space)
+        self._M_form.add_integrator(self._M_int)
+        self._F_int = ScalarSourceIntegrator(2 * self.H, q=q)
+        self._F_form = LinearForm(self.space)
+        self._F_form.add_integrator(self._F_int)
+
+        self.set_displacement_bc(self._u_threshold, load_threshold=self._load_threshold)
+        self.set_damage_bc(self._d_threshold)
+        self._P = {'u': None, 'd': None}
+        self._n_solve = {'u': 0, 'd': 0}
+
+    ### Boundary conditions ###
+
+    @staticmethod
+    def _bc_slots(A: CSRTensor, isDDof: TensorLike):
+        """Find the slots of the values in the rows and columns of Dirichlet DoFs,
+        and the diagonal slots in these rows."""
+        row, col = A.row(), A.col()
+        zero_flag = isDDof[row] | isDDof[col]
+        diag_slot = bm.nonzero(zero_flag & (row == col))[0]
+        return zero_flag, diag_slot
+
+    @staticmethod
+    def _apply_slots(A: CSRTensor, values: TensorLike, slots) -> CSRTensor:
+        zero_flag, diag_slot = slots
+        values = bm.where(zero_flag, 0., values)
+        values = bm.set_at(values, diag_slot, 1.)
+        return CSRTensor(A.crow(), A.col(), values, spshape=A.sparse_shape)
+
+    @staticmethod
+    def _lift(A: CSRTensor, b: TensorLike, isDDof, gD) -> TensorLike:
+        gD = bm.where(isDDof, gD[:], 0.)
+        b = b - A @ gD
+        return bm.set_at(b, isDDof, gD[isDDof])
+
+    def set_displacement_bc(self, threshold=None, *, load_threshold=None) -> None:
+        """Select the Dirichlet DoFs of the displacement. The values on these DoFs
+        are kept as they are in `uh` (zero by default), except for the loaded DoFs
+        which are set by `step`.
+
+        Parameters:
+            threshold (Callable | TensorLike | None, optional): Select the DoFs with\
+            prescribed displacement. Defaults to None, for no Dirichlet DoF.
+            load_threshold (Callable | TensorLike | None, optional): Select the\
+            loaded DoFs, whose values are given in each load step. Defaults to None.
+        """
+        self._u_threshold = threshold
+        self._load_threshold = load_threshold
+        self.isUDDof = self._select(self.uspace, threshold)
+        self.isLoadDof = self._select(self.uspace, load_threshold)
+        self.isUDDof = self.isUDDof | self.isLoadDof
+        self._u_slots = self._bc_slots(self.K, self.isUDDof)
+
+    def set_damage_bc(self, threshold=None) -> None:
+        """Select the Dirichlet DoFs of the phase field, e.g. the initial crack
+        with d = 1. The values are kept as they are in `d`.
+
+        Parameters:
+            threshold (Callable | TensorLike | None, optional): Select the DoFs.\
+            Defaults to None, for no Dirichlet DoF.
+        """
+        self._d_threshold = threshold
+        self.isDDDof = self._select(self.space, threshold)
+        self._d_slots = self._bc_slots(self._S, self.isDDDof)
+
+    @staticmethod
+    def _select(space, threshold) -> TensorLike:
+        gdof = space.number_of_global_dofs()
+        if threshold is None:
+            return bm.zeros((gdof, ), dtype=bm.bool)
+        return space.is_boundary_dof(threshold=threshold)
+
+    ### Solvers ###
+
+    def _solve(self, key: str, A: CSRTensor, b: TensorLike, x0: TensorLike) -> TensorLike:
+        if self.linear_solver == 'direct':
+            return LUPreconditioner(A) @ b
+
+        if (self._P[key] is None) or (self._n_solve[key] % self.preconditioner_refresh == 0):
+            self._P[key] = self.preconditioner(A)
+        self._n_solve[key] += 1
+        return cg(A, b, x0, M=self._P[key], atol=0., rtol=self.rtol)
+
+    def positive_energy(self, uh: Optional[TensorLike]=None) -> TensorLike:
+        """The positive strain energy density of the spectral split at the
+        quadrature points, shaped (NC, NQ)."""
+        uh = self.uh if uh is None else uh
+        GD = self.mesh.geo_dimension()
+        gphi = self.space.grad_basis(self._bcs, variable='x') # (NC, NQ, ldof, GD)
+        cell2dof = self.space.cell_to_dof()
+        U = bm.reshape(uh[:], (GD, -1))[:, cell2dof] # (GD, NC, ldof)
+        gu = bm.einsum('cqlj, icl -> cqij', gphi, U)
+        strain = (gu + bm.swapaxes(gu, -1, -2)) / 2.
+        _, _, psi_p, _, _ = spectral_split(strain, self.lam, self.mu, tangent=False)
+        return psi_p
+
+    def step(self, disp: Union[float, TensorLike, None]=None):
+        """Solve a load step by the staggered iterations.
+
+        Parameters:
+            disp (float | TensorLike | None, optional): The displacement on the\
+            loaded DoFs. Defaults to None, keeping the current values.
+
+        Returns:
+            Tuple[Function, Function]: The displacement and the phase field,\
+            which are the buffers updated in place.
+        """
+        uh, d = self.uh, self.d
+        if disp is not None:
+            uh[self.isLoadDof] = disp
+        H0 = bm.copy(self.H)
+        zero_u = bm.zeros_like(uh[:])
+
+        for k in range(self.maxit):
+            # displacement
+            self._K_int.clear()
+            self.K = self._K_form.pattern_assembly()
+            b = self._lift(self.K, zero_u, self.isUDDof, uh)
+            A = self._apply_slots(self.K, self.K.values(), self._u_slots)
+            u_new = self._solve('u', A, b, uh[:])
+            self.force = bm.sum((self.K @ u_new)[self.isLoadDof])
+
+            # history field
+            self.H = bm.maximum(H0, self.positive_energy(u_new))
+
+            # phase field
+            self._M_int.coef = self.Gc / self.l0 + 2 * self.H
+            self._M_int.clear()
+            M = self._M_form.pattern_assembly()
+            self._F_int.source = 2 * self.H
+            self._F_int.clear()
+            b = self._F_form.assembly()
+            A = CSRTensor(self._S.crow(), self._S.col(), self._S.values() + M.values(),
+                          spshape=self._S.sparse_shape)
+            b = self._lift(A, b, self.isDDDof, d)
+            A = self._apply_slots(A, A.values(), self._d_slots)
+            d_new = self._solve('d', A, b, d[:])
+
+            du = bm.linalg.norm(u_new - uh[:]) / max(float(bm.linalg.norm(u_new)), 1e-300)
+            dd = bm.max(bm.abs(d_new - d[:]))
+            uh[:] = u_new
+            d[:] = d_new
+            err = max(float(du), float(dd))
+            if err < self.tol:
+                break
+
+        self.n_iter = k + 1
+        logger.info(f"PhaseFieldStaggeredSolver: {self.n_iter} iterations, "
+                    f"error {err:.3e}, force {float(self.force):.6e}.")
+        return uh, d
+
+    ### Adaptivity ###
+
+    def refine(self, isMarkedCell: TensorLike) -> None:
+        """Bisect the marked cells, transfer the displacement, the phase field and
+        the history field to the new mesh, and rebuild the mesh-dependent
+        structures. Only the linear elements on triangle meshes are supported.
+
+        Parameters:
+            isMarkedCell (TensorLike): Boolean flags of the cells to refine.
+        """
+        if self.p != 1:
+            raise ValueError("Only the linear elements support refinement.")
+        for th in (self._u_threshold, self._load_threshold, self._d_threshold):
+            if (th is not None) and (not callable(th)):
+                raise ValueError("Boundary selections must be callable to be re-evaluated "
+                                 "on the refined mesh.")
+
+        GD = self.mesh.geo_dimension()
+        U = bm.reshape(self.uh[:], (GD, -1))
+        data = {f'u{i}': U[i] for i in range(GD)}
+        data['d'] = self.d[:]
+        options = {'data': data, 'HB': None, 'disp': False}
+        self.mesh.bisect(isMarkedCell, options=options)
+        H = self.H[options['HB']] # the children inherit the values of the parent
+
+        self._setup()
+        self.uh[:] = bm.concat([options['data'][f'u{i}'] for i in range(GD)])
+        self.d[:] = options['data']['d']
+        self.H = H
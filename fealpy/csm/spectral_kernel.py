@@ -0,0 +1,226 @@
+
+from typing import Optional, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+def voigt_indices(GD: int) -> Tuple[TensorLike, TensorLike]:
+    """The tensor indices (i, j) of the Voigt components, in the order of the
+    normal components followed by the shear components (0, 1), (0, 2), (1, 2),
+    consistent with the strain matrix of `LinearElasticMaterial`.
+
+    Returns:
+        Tuple[TensorLike, TensorLike]: The first and second indices shaped (NNZ, ).
+    """
+    I = list(range(GD))
+    J = list(range(GD))
+    for i in range(GD - 1):
+        for j in range(i + 1, GD):
+            I.append(i)
+            J.append(j)
+    return bm.array(I, dtype=bm.int32), bm.array(J, dtype=bm.int32)
+
+
+def heaviside(x: TensorLike, tol: float=1e-13) -> TensorLike:
+    """Heaviside function taking 0.5 in the band |x| < tol."""
+    one = bm.ones_like(x)
+    val = bm.where(x > tol, one, 0.5 * one)
+    return bm.where(x < -tol, 0. * one, val)
+
+
+def _eigh2(a: TensorLike, b: TensorLike, c: TensorLike):
+    """Closed-form eigenpairs of the symmetric matrices [[a, b], [b, c]].
+    Return the eigenvalues in ascending order and the rotation angle `t`
+    such that the eigenvectors are (-sin t, cos t) and (cos t, sin t)."""
+    m = (a + c) / 2.
+    d = (a - c) / 2.
+    r = bm.sqrt(d**2 + b**2)
+    t = bm.atan2(b, d) / 2.
+    return m - r, m + r, t
+
+
+def sym_eigh2(s: TensorLike) -> Tuple[TensorLike, TensorLike]:
+    """Batched closed-form eigendecomposition of symmetric 2x2 matrices.
+
+    Parameters:
+        s (TensorLike): The symmetric matrices shaped (..., 2, 2).
+
+    Returns:
+        Tuple[TensorLike, TensorLike]: The eigenvalues shaped (..., 2) in\
+        ascending order, and the eigenvectors shaped (..., 2, 2) in columns,\
+        as returned by `eigh`.
+    """
+    w0, w1, t = _eigh2(s[..., 0, 0], s[..., 0, 1], s[..., 1, 1])
+    cos, sin = bm.cos(t), bm.sin(t)
+    w = bm.stack([w0, w1], axis=-1)
+    v = bm.stack([bm.stack([-sin, cos], axis=-1),
+                  bm.stack([cos, sin], axis=-1)], axis=-1)
+    return w, v
+
+
+def sym_eigh3(s: TensorLike) -> Tuple[TensorLike, TensorLike]:
+    """Batched closed-form eigendecomposition of symmetric 3x3 matrices.
+
+    The most separated eigenvalue is computed by the trigonometric formula,
+    and its eigenvector by the largest cross product of the rows of
+    `s - w I`. The remaining pair is solved in the orthogonal complement of
+    this eigenvector by the 2x2 formula, which stays accurate for repeated
+    eigenvalues.
+
+    Parameters:
+        s (TensorLike): The symmetric matrices shaped (..., 3, 3).
+
+    Returns:
+        Tuple[TensorLike, TensorLike]: The eigenvalues shaped (..., 3) in\
+        ascending order, and the eigenvectors shaped (..., 3, 3) in columns.
+    """
+    kwargs = bm.context(s)
+    q = (s[..., 0, 0] + s[..., 1, 1] + s[..., 2, 2]) / 3.
+    eye = bm.eye(3, **kwargs)
+    B = s - q[..., None, None] * eye
+    p = bm.sqrt(bm.sum(B**2, axis=(-2, -1)) / 6.)
+    safe_p = bm.where(p > 0., p, 1.)
+    r = bm.linalg.det(B) / (2. * safe_p**3)
+    r = bm.clip(bm.where(p > 0., r, 0.), -1., 1.)
+    phi = bm.acos(r) / 3.
+    # The largest eigenvalue is the most separated one iff r >= 0.
+    w_max = q + 2. * p * bm.cos(phi)
+    w_min = q + 2. * p * bm.cos(phi + 2. * bm.pi / 3.)
+    w0 = bm.where(r >= 0., w_max, w_min)
+
+    # eigenvector of w0
+    A = s - w0[..., None, None] * eye
+    c = bm.stack([bm.cross(A[..., 0, :], A[..., 1, :], axis=-1),
+                  bm.cross(A[..., 0, :], A[..., 2, :], axis=-1),
+                  bm.cross(A[..., 1, :], A[..., 2, :], axis=-1)], axis=-2)
+    cn = bm.sum(c**2, axis=-1)
+    k = bm.argmax(cn, axis=-1)
+    onehot = bm.astype(k[..., None] == bm.arange(3, device=bm.get_device(s)), s.dtype)
+    e0 = bm.einsum('...k, ...ki -> ...i', onehot, c)
+    en = bm.sqrt(bm.max(cn, axis=-1))
+    flag = en > 0.
+    e0 = bm.where(flag[..., None], e0 / bm.where(flag, en, 1.)[..., None], eye[0])
+
+    # orthonormal basis (u, v) of the complement
+    x, y, z = e0[..., 0], e0[..., 1], e0[..., 2]
+    zero = bm.zeros_like(x)
+    use_y = bm.abs(x) > bm.abs(y)
+    u = bm.where(use_y[..., None],
+                 bm.stack([-z, zero, x], axis=-1),
+                 bm.stack([zero, z, -y], axis=-1))
+    u = u / bm.sqrt(bm.sum(u**2, axis=-1, keepdims=True))
+    v = bm.cross(e0, u, axis=-1)
+
+    su = bm.einsum('...ij, ...j -> ...i', s, u)
+    sv = bm.einsum('...ij, ...j -> ...i', s, v)
+    a = bm.sum(u * su, axis=-1)
+    b = bm.sum(u * sv, axis=-1)
+    c = bm.sum(v * sv, axis=-1)
+    w1, w2, t = _eigh2(a, b, c)
+    cos, sin = bm.cos(t)[..., None], bm.sin(t)[..., None]
+    e1 = -sin * u + cos * v
+    e2 = cos * u + sin * v
+
+    w = bm.stack([w0, w1, w2], axis=-1)
+    V = bm.stack([e0, e1, e2], axis=-1)
+    # sort by the one-hot permutation P[..., a, b] = (idx[..., a] == b)
+    idx = bm.argsort(w, axis=-1)
+    P = bm.astype(idx[..., None] == bm.arange(3, device=bm.get_device(s)), s.dtype)
+    w = bm.einsum('...ab, ...b -> ...a', P, w)
+    V = bm.einsum('...ib, ...ab -> ...ia', V, P)
+    return w, V
+
+
+def sym_eigh(s: TensorLike) -> Tuple[TensorLike, TensorLike]:
+    """Batched closed-form eigendecomposition of symmetric 2x2 or 3x3 matrices,
+    a drop-in replacement of `eigh` for the strain tensors."""
+    GD = s.shape[-1]
+    if GD == 2:
+        return sym_eigh2(s)
+    elif GD == 3:
+        return sym_eigh3(s)
+    else:
+        raise ValueError(f"Unsupported matrix size {GD}, only 2 and 3 are supported.")
+
+
+def strain_pm_split(s: TensorLike) -> Tuple[TensorLike, TensorLike]:
+    """Split the strain into the positive and negative parts,
+    s_{+-} = sum_a <w_a>_{+-} n_a n_a^T.
+
+    Parameters:
+        s (TensorLike): The strain shaped (..., GD, GD).
+
+    Returns:
+        Tuple[TensorLike, TensorLike]: The positive and negative parts.
+    """
+    w, v = sym_eigh(s)
+    wp = (w + bm.abs(w)) / 2.
+    sp = bm.einsum('...ia, ...a, ...ja -> ...ij', v, wp, v)
+    return sp, s - sp
+
+
+def spectral_split(s: TensorLike, lam: float, mu: float,
+                   c0: Optional[TensorLike]=None, *,
+                   tangent: bool=True):
+    """Fused kernel of the spectral (Miehe) decomposition of the strain.
+    In one pass, compute the positive and negative strain, the positive and
+    negative strain energy densities
+
+        psi_{+-} = lam/2 <tr s>_{+-}^2 + mu tr(s_{+-}^2),
+
+    and the Voigt matrix of the tangent d(sigma)/d(s) of the degraded stress
+    sigma = c0 sigma_+ + sigma_-.
+
+    Parameters:
+        s (TensorLike): The strain shaped (..., GD, GD), GD is 2 or 3.
+        lam (float): The first Lame constant.
+        mu (float): The shear modulus.
+        c0 (TensorLike | None, optional): The degradation factor broadcastable\
+        to s.shape[:-2]. Defaults to None, for no degradation.
+        tangent (bool, optional): Whether to compute the tangent. Defaults to True.
+
+    Returns:
+        Tuple: sp, sm, psi_p, psi_m and the tangent shaped (..., NNZ, NNZ),\
+        where NNZ = GD*(GD+1)/2 (None if `tangent` is False).
+    """
+    GD = s.shape[-1]
+    w, v = sym_eigh(s)
+    wp = (w + bm.abs(w)) / 2.
+    wm = w - wp
+    sp = bm.einsum('...ia, ...a, ...ja -> ...ij', v, wp, v)
+    sm = s - sp
+
+    ts = bm.sum(w, axis=-1)
+    tp = (ts + bm.abs(ts)) / 2.
+    tm = ts - tp
+    psi_p = lam * tp**2 / 2. + mu * bm.sum(wp**2, axis=-1)
+    psi_m = lam * tm**2 / 2. + mu * bm.sum(wm**2, axis=-1)
+
+    if not tangent:
+        return sp, sm, psi_p, psi_m, None
+
+    if c0 is None:
+        c0 = bm.ones_like(ts)
+    else:
+        c0 = bm.broadcast_to(c0, ts.shape)
+
+    # Theta_ab = (<w_a>_+ - <w_b>_+) / (w_a - w_b), and H(w_a) if w_a = w_b.
+    hw = heaviside(w)
+    dw = w[..., :, None] - w[..., None, :]
+    dp = wp[..., :, None] - wp[..., None, :]
+    close = bm.abs(dw) < 1e-13
+    theta = bm.where(close, (hw[..., :, None] + hw[..., None, :]) / 2.,
+                     dp / bm.where(close, 1., dw))
+    theta = c0[..., None, None] * theta + (1. - theta)
+
+    # P_ijkl = sum_ab Theta_ab / 2 v_ia v_jb (v_ka v_lb + v_kb v_la)
+    I, J = voigt_indices(GD)
+    Nm = v[..., I, :, None] * v[..., J, None, :] # (..., NNZ, GD, GD)
+    Nt = Nm + bm.swapaxes(Nm, -1, -2)
+    D = mu * bm.einsum('...ab, ...mab, ...nab -> ...mn', theta, Nm, Nt)
+
+    val = lam * (c0 * heaviside(ts) + heaviside(-ts))
+    normal = bm.astype(bm.arange(len(I)) < GD, s.dtype)
+    D = D + val[..., None, None] * (normal[:, None] * normal[None, :])
+    return sp, sm, psi_p, psi_m, D
@@ -0,0 +1,4 @@
+
+from .fast_poisson_solver import FastPoissonSolver
+from .stencil_operator import StencilOperator, GradientOperator, DivergenceOperator
+from .laplace_operator import DiffusionOperator, LaplaceOperator
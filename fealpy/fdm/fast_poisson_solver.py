@@ -0,0 +1,202 @@
+
+from typing import Union, Sequence, Callable, Optional, Tuple
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from .. import logger
+
+_BCType = Union[str, Sequence[str]]
+_Data = Union[TensorLike, Callable[[TensorLike], TensorLike], float, None]
+
+
+class FastPoissonSolver():
+    """Fast solver of the finite difference Poisson and Helmholtz equations
+    on the nodes of `UniformMesh2d` and `UniformMesh3d`.
+
+    It solves `c*u - Δ_h u = f` with the standard (2d+1)-point stencil, where
+    the boundary condition of every axis is 'dirichlet', 'neumann' or 'periodic'.
+    The discrete operator is diagonalized by the sine (DST-I), cosine (DCT-I)
+    and Fourier transforms along the axes respectively, so a solve costs
+    O(N log N) and no matrix is assembled.
+
+    - 'dirichlet': the boundary nodes take the values of `gD`.
+    - 'neumann': the boundary nodes are unknowns, with the ghost points
+      reflected by the outward normal derivative `gN` (second order).
+    - 'periodic': the last node of the axis is identified with the first one.
+
+    Without any Dirichlet axis and with `c == 0`, the problem is singular. The
+    constant mode is dropped, which solves the problem for the right-hand side
+    with the compatible part only, and the solution has zero mean in the
+    sense of the transform.
+
+    The transforms are done by `scipy.fft` on the CPU, as the backends do not
+    provide the sine and cosine transforms.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        bc (str | Sequence[str], optional): Boundary condition type of all the
+            axes, or of each axis. Defaults to 'dirichlet'.
+        c (float, optional): Coefficient of the zeroth-order term, negative for
+            the Helmholtz equation `-Δu - k^2 u = f`. Defaults to 0.0.
+        workers (int | None, optional): Number of threads of `scipy.fft`.
+            Defaults to None.
+
+    Example:
+    ```
+        mesh = UniformMesh2d((0, 1024, 0, 1024), h=(1/1024, 1/1024))
+        solver = FastPoissonSolver(mesh, bc='neumann')
+        p = solver.solve(div_u / dt)
+    ```
+    """
+    _TYPES = ('dirichlet', 'neumann', 'periodic')
+
+    def __init__(self, mesh, bc: _BCType='dirichlet', c: float=0.0,
+                 workers: Optional[int]=None) -> None:
+        TD = mesh.top_dimension()
+        if isinstance(bc, str):
+            bc = (bc, ) * TD
+        bc = tuple(bc)
+        if len(bc) != TD:
+            raise ValueError(f"Expected {TD} boundary condition types, but got {len(bc)}.")
+        for t in bc:
+            if t not in self._TYPES:
+                raise ValueError(f"Unknown boundary condition type '{t}', "
+                                 f"should be one of {self._TYPES}.")
+
+        self.mesh = mesh
+        self.bc = bc
+        self.c = float(c)
+        self.workers = workers
+        self.shape = tuple(getattr(mesh, name) + 1 for name in ('nx', 'ny', 'nz')[:TD])
+        self.h = tuple(float(h) for h in mesh.h[:TD])
+
+        # Unknowns and eigenvalues of the 1-d second difference along each axis.
+        self._unknowns = []
+        eig = 0.
+        for axis, (t, n, h) in enumerate(zip(bc, self.shape, self.h)):
+            n = n - 1 # number of intervals
+            if t == 'dirichlet':
+                k, s = np.arange(1, n), slice(1, n)
+                theta = k * np.pi / (2*n)
+            elif t == 'neumann':
+                k, s = np.arange(0, n + 1), slice(0, n + 1)
+                theta = k * np.pi / (2*n)
+            else:
+                k, s = np.arange(0, n), slice(0, n)
+                theta = k * np.pi / n
+            lam = 4. / h**2 * np.sin(theta)**2
+            self._unknowns.append(s)
+            shape = [1, ] * TD
+            shape[axis] = -1
+            eig = eig + lam.reshape(shape)
+        eig = eig + self.c
+
+        singular = np.abs(eig) < 1e-12 * np.max(np.abs(eig))
+        if np.any(singular):
+            if self.c != 0.:
+                logger.warning("The Helmholtz operator is singular, the "
+                               "resonant modes are dropped in the solution.")
+            eig = np.where(singular, np.inf, eig)
+        self._inv_eig = 1. / eig
+
+    def _transform(self, a: np.ndarray, inverse: bool=False) -> np.ndarray:
+        import scipy.fft as fft
+
+        kw = dict(workers=self.workers)
+        for axis, t in enumerate(self.bc):
+            if t == 'dirichlet':
+                func = fft.idst if inverse else fft.dst
+                a = func(a, type=1, axis=axis, **kw)
+            elif t == 'neumann':
+                func = fft.idct if inverse else fft.dct
+                a = func(a, type=1, axis=axis, **kw)
+            else:
+                func = fft.ifft if inverse else fft.fft
+                a = func(a, axis=axis, **kw)
+        return a
+
+    def _boundary_points(self, axis: int, side: int) -> Tuple[Tuple, TensorLike]:
+        index = [slice(None), ] * len(self.shape)
+        index[axis] = 0 if side == 0 else -1
+        index = tuple(index)
+        node = self.mesh.entity('node').reshape(self.shape + (-1, ))
+        return index, node[index]
+
+    def _grid(self, v: _Data) -> np.ndarray:
+        if callable(v):
+            v = v(self.mesh.entity('node'))
+        v = np.asarray(bm.to_numpy(v) if bm.is_tensor(v) else v, dtype=np.float64)
+        return np.broadcast_to(v.reshape(-1) if v.ndim > 0 else v,
+                               (int(np.prod(self.shape)), )).reshape(self.shape)
+
+    def solve(self, f: _Data, gD: _Data=None, gN: Optional[Callable]=None) -> TensorLike:
+        """Solve the equation.
+
+        Parameters:
+            f (Tensor | Callable | float): The source term on the nodes, shaped (NN,),
+                or a function of the node coordinates.
+            gD (Tensor | Callable | float | None, optional): The Dirichlet boundary
+                values, given as values on the nodes (only the boundary ones are used)
+                or a function of the points. Defaults to None (zero).
+            gN (Callable | None, optional): Function `gN(p, n)` of the boundary
+                points and the outward unit normals, giving the normal derivative
+                on the Neumann boundaries. Defaults to None (zero).
+
+        Returns:
+            Tensor: The solution on the nodes, shaped (NN,).
+        """
+        f = self._grid(f)
+        rhs = np.array(f, dtype=np.float64)
+        u = np.zeros(self.shape, dtype=np.float64)
+
+        if gD is not None and 'dirichlet' in self.bc:
+            g = self._grid(gD)
+            for axis, t in enumerate(self.bc):
+                if t != 'dirichlet':
+                    continue
+                for side in (0, 1):
+                    index, _ = self._boundary_points(axis, side)
+                    u[index] = g[index]
+
+        if gN is not None:
+            for axis, (t, h) in enumerate(zip(self.bc, self.h)):
+                if t != 'neumann':
+                    continue
+                for side in (0, 1):
+                    index, p = self._boundary_points(axis, side)
+                    n = bm.zeros(p.shape, dtype=p.dtype)
+                    n = bm.set_at(n, (..., axis), 1. if side else -1.)
+                    rhs[index] += 2./h * bm.to_numpy(gN(p, n))
+
+        # Move the Dirichlet boundary values to the right-hand side.
+        unknowns = tuple(self._unknowns)
+        r = rhs[unknowns]
+        for axis, (t, h) in enumerate(zip(self.bc, self.h)):
+            if t != 'dirichlet':
+                continue
+            for side, near in ((0, 0), (-1, -1)):
+                src = list(unknowns)
+                src[axis] = side
+                dst = [slice(None), ] * len(self.shape)
+                dst[axis] = near
+                r[tuple(dst)] += u[tuple(src)] / h**2
+
+        a = self._transform(r)
+        a *= self._inv_eig
+        a = self._transform(a, inverse=True)
+        if np.iscomplexobj(a):
+            a = a.real
+        u[unknowns] = a
+
+        # Copy the periodic images, except on the Dirichlet boundary.
+        for axis, t in enumerate(self.bc):
+            if t == 'periodic':
+                dst = [s if b == 'dirichlet' else slice(None)
+                       for s, b in zip(unknowns, self.bc)]
+                src = list(dst)
+                dst[axis], src[axis] = -1, 0
+                u[tuple(dst)] = u[tuple(src)]
+
+        return bm.tensor(u.reshape(-1), dtype=self.mesh.ftype)
@@ -0,0 +1,134 @@
+
+from typing import Union, Sequence, Callable, List
+from math import prod
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from .stencil_operator import StencilOperator, grid_shapes, shift
+
+_BCType = Union[str, Sequence[str]]
+CoefLike = Union[float, TensorLike, Callable[[TensorLike], TensorLike]]
+
+
+class DiffusionOperator(StencilOperator):
+    """Matrix-free finite difference operator `c*u - div(a grad u)` on the
+    nodes of `UniformMesh2d` and `UniformMesh3d`.
+
+    The coefficient `a` lives on the edges (the midpoints between the nodes),
+    which gives the standard (2d+1)-point stencil. The boundary condition of
+    each axis is
+
+    - 'dirichlet': the rows of the boundary nodes are the identity, so that
+      `A @ u` takes the values of `u` there;
+    - 'neumann': the homogeneous Neumann condition by the reflected ghost
+      points, the same as `FastPoissonSolver`.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        coef (float | Tensor | Callable, optional): The diffusion coefficient,
+            given as a constant, the values on the edges numbered as
+            `mesh.entity('edge')`, or a function of the points. Defaults to 1.0.
+        bc (str | Sequence[str], optional): Boundary condition type of all the
+            axes, or of each axis. Defaults to 'dirichlet'.
+        c (float, optional): Coefficient of the zeroth-order term. Defaults to 0.0.
+
+    Example:
+    ```
+        A = DiffusionOperator(mesh, coef=lambda p: 1 + p[..., 0]**2)
+        x = cg(A, b, M=JacobiPreconditioner(A))
+    ```
+    """
+    _TYPES = ('dirichlet', 'neumann')
+
+    def __init__(self, mesh, coef: CoefLike=1.0, bc: _BCType='dirichlet',
+                 c: float=0.0) -> None:
+        node, edge = grid_shapes(mesh)
+        TD = len(node)
+        device = bm.get_device(mesh.entity('node'))
+        super().__init__([node], [node], ftype=mesh.ftype, device=device)
+
+        if isinstance(bc, str):
+            bc = (bc, ) * TD
+        bc = tuple(bc)
+        if len(bc) != TD:
+            raise ValueError(f"Expected {TD} boundary condition types, but got {len(bc)}.")
+        for t in bc:
+            if t not in self._TYPES:
+                raise ValueError(f"Unknown boundary condition type '{t}', "
+                                 f"should be one of {self._TYPES}.")
+        self.bc = bc
+        self.c = c
+
+        a = self._edge_coef(mesh, coef, node, edge)
+        h = mesh.h[:TD]
+        # Rows of the stencil, without the Dirichlet boundary nodes.
+        R = tuple(slice(1, n - 1) if t == 'dirichlet' else slice(None)
+                  for t, n in zip(bc, node))
+
+        diag = c
+        for k in range(TD):
+            n = node[k] - 1
+            a_k, h2 = a[k], h[k]**2
+            Rk = shift(R, k, slice(1, n))
+            if bm.is_tensor(a_k):
+                left = -a_k[shift(Rk, k, slice(0, n - 1))] / h2
+                right = -a_k[shift(Rk, k, slice(1, n))] / h2
+                a0 = a_k[shift(R, k, slice(0, 1))]
+                a1 = a_k[shift(R, k, slice(n - 1, n))]
+                first, last = -2 * a0 / h2, -2 * a1 / h2
+                d_k = bm.concat([2 * a0, a_k[shift(R, k, slice(0, n - 1))]
+                                 + a_k[shift(R, k, slice(1, n))], 2 * a1], axis=k) / h2
+                d_k = d_k[shift((slice(None), ) * TD, k, R[k])]
+            else:
+                left = right = -a_k / h2
+                first = last = -2 * a_k / h2
+                d_k = 2 * a_k / h2
+            self.add_term(Rk, shift(Rk, k, slice(0, n - 1)), left)
+            self.add_term(Rk, shift(Rk, k, slice(2, n + 1)), right)
+            if bc[k] == 'neumann':
+                self.add_term(shift(R, k, slice(0, 1)), shift(R, k, slice(1, 2)), first)
+                self.add_term(shift(R, k, slice(n, n + 1)), shift(R, k, slice(n - 1, n)), last)
+            diag = diag + d_k
+        self.add_term(R, R, diag)
+
+        # Identity rows of the Dirichlet boundary, each node assigned to the
+        # first Dirichlet axis it lies on.
+        for k in range(TD):
+            if bc[k] != 'dirichlet':
+                continue
+            B = tuple(R[m] if m < k else slice(None) for m in range(TD))
+            for j in (0, node[k] - 1):
+                Bj = shift(B, k, slice(j, j + 1))
+                self.add_term(Bj, Bj, 1.)
+
+    @staticmethod
+    def _edge_coef(mesh, coef: CoefLike, node, edge) -> List[Union[float, TensorLike]]:
+        """The coefficient on the edge grids along each axis."""
+        TD = len(node)
+        if callable(coef):
+            point = mesh.entity('node').reshape(node + (-1, ))
+            full = (slice(None), ) * TD
+            return [coef((point[shift(full, k, slice(1, None))] +
+                          point[shift(full, k, slice(0, -1))]) / 2) for k in range(TD)]
+        if bm.is_tensor(coef):
+            NE = [prod(s) for s in edge]
+            if coef.shape != (sum(NE), ):
+                raise ValueError(f"The coefficient should be given on the {sum(NE)} "
+                                 f"edges, but got the shape {tuple(coef.shape)}.")
+            start = [sum(NE[:k]) for k in range(TD)]
+            return [coef[start[k]:start[k] + NE[k]].reshape(edge[k]) for k in range(TD)]
+        return [coef, ] * TD
+
+
+class LaplaceOperator(DiffusionOperator):
+    """Matrix-free finite difference operator `c*u - Δu` on the nodes of
+    `UniformMesh2d` and `UniformMesh3d`, see `DiffusionOperator`.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        bc (str | Sequence[str], optional): Boundary condition type of all the
+            axes, or of each axis. Defaults to 'dirichlet'.
+        c (float, optional): Coefficient of the zeroth-order term. Defaults to 0.0.
+    """
+    def __init__(self, mesh, bc: _BCType='dirichlet', c: float=0.0) -> None:
+        super().__init__(mesh, 1.0, bc=bc, c=c)
@@ -0,0 +1,171 @@
+
+from typing import List, Sequence, Tuple, Union
+from math import prod
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+_Slices = Tuple[slice, ...]
+_Coef = Union[float, TensorLike]
+
+
+def grid_shapes(mesh) -> Tuple[Tuple[int, ...], List[Tuple[int, ...]]]:
+    """Shapes of the node grid and of the edge grids along each axis of a
+    uniform mesh. The edge grids follow the numbering of `mesh.entity('edge')`,
+    i.e. the edges along the x-axis come first, then the y-axis and z-axis."""
+    TD = mesh.top_dimension()
+    n = tuple(getattr(mesh, name) for name in ('nx', 'ny', 'nz')[:TD])
+    node = tuple(m + 1 for m in n)
+    edge = [tuple(m if i == k else m + 1 for i, m in enumerate(n)) for k in range(TD)]
+    return node, edge
+
+
+def shift(slices: _Slices, axis: int, s: slice) -> _Slices:
+    """Replace the slice of `axis` in a tuple of slices."""
+    slices = list(slices)
+    slices[axis] = s
+    return tuple(slices)
+
+
+class StencilOperator():
+    """Base class of the matrix-free finite difference operators on the grids
+    of the uniform meshes.
+
+    The input and output vectors consist of one or more blocks, each viewed
+    as a C-ordered grid. The operator is a sum of terms `(ob, os, ib, is, coef)`,
+    which add `coef * x[ib][is]` to `y[ob][os]`, where `os` and `is` are
+    boxes (tuples of slices) of the same shape in the grids and `coef` is a
+    scalar or a tensor shaped as the box. A product with the operator only
+    slices the grids, and no index arrays are stored.
+
+    Parameters:
+        out_shapes (Sequence[Tuple[int, ...]]): Grid shapes of the output blocks.
+        in_shapes (Sequence[Tuple[int, ...]]): Grid shapes of the input blocks.
+        ftype (dtype, optional): Data type of the coefficients. Defaults to float64.
+        device (str | None, optional): Device of the coefficients. Defaults to None.
+    """
+    def __init__(self, out_shapes: Sequence[Tuple[int, ...]],
+                 in_shapes: Sequence[Tuple[int, ...]], *,
+                 ftype=None, device=None) -> None:
+        self.out_shapes = [tuple(s) for s in out_shapes]
+        self.in_shapes = [tuple(s) for s in in_shapes]
+        self.out_offset = self._offset(self.out_shapes)
+        self.in_offset = self._offset(self.in_shapes)
+        self.shape = (self.out_offset[-1], self.in_offset[-1])
+        self.ftype = bm.float64 if ftype is None else ftype
+        self.device = device
+        self.terms: List[Tuple[int, _Slices, int, _Slices, _Coef]] = []
+
+    @staticmethod
+    def _offset(shapes: Sequence[Tuple[int, ...]]) -> List[int]:
+        offset = [0]
+        for s in shapes:
+            offset.append(offset[-1] + prod(s))
+        return offset
+
+    def add_term(self, os: _Slices, is_: _Slices, coef: _Coef,
+                 ob: int=0, ib: int=0) -> None:
+        """Add `coef * x[ib][is_]` to `y[ob][os]`."""
+        self.terms.append((ob, tuple(os), ib, tuple(is_), coef))
+
+    def _blocks(self, x: TensorLike, shapes, offset) -> List[TensorLike]:
+        batch = x.shape[1:]
+        return [x[offset[i]:offset[i+1]].reshape(s + batch) for i, s in enumerate(shapes)]
+
+    def __matmul__(self, x: TensorLike) -> TensorLike:
+        """Apply the operator on a vector shaped (N,), or on a batch of vectors
+        shaped (N, K)."""
+        if x.shape[0] != self.shape[1]:
+            raise ValueError(f"The operator shaped {self.shape} can not be applied "
+                             f"to the tensor shaped {tuple(x.shape)}.")
+        batch = x.shape[1:]
+        xs = self._blocks(x, self.in_shapes, self.in_offset)
+        kw = dict(dtype=x.dtype, device=bm.get_device(x))
+        ys = [bm.zeros(s + batch, **kw) for s in self.out_shapes]
+
+        for ob, os, ib, is_, coef in self.terms:
+            if batch and bm.is_tensor(coef):
+                coef = coef.reshape(coef.shape + (1, ) * len(batch))
+            y = ys[ob]
+            ys[ob] = bm.set_at(y, os, y[os] + coef * xs[ib][is_])
+
+        return bm.concat([y.reshape((-1, ) + batch) for y in ys], axis=0)
+
+    def diagonal(self) -> TensorLike:
+        """The main diagonal of the operator, shaped (N,)."""
+        if self.out_shapes != self.in_shapes:
+            raise ValueError("The diagonal is only defined for the operators "
+                             "between the same grids.")
+        kw = dict(dtype=self.ftype, device=self.device)
+        ds = [bm.zeros(s, **kw) for s in self.out_shapes]
+
+        for ob, os, ib, is_, coef in self.terms:
+            if ob == ib and os == is_:
+                d = ds[ob]
+                ds[ob] = bm.set_at(d, os, d[os] + coef)
+
+        return bm.concat([d.reshape(-1) for d in ds], axis=0)
+
+    def to_csr(self) -> CSRTensor:
+        """Assemble the operator into a sparse matrix."""
+        kw = dict(dtype=bm.int64, device=self.device)
+        out_index = [bm.arange(self.out_offset[i], self.out_offset[i+1], **kw).reshape(s)
+                     for i, s in enumerate(self.out_shapes)]
+        in_index = [bm.arange(self.in_offset[i], self.in_offset[i+1], **kw).reshape(s)
+                    for i, s in enumerate(self.in_shapes)]
+        rows, cols, vals = [], [], []
+
+        for ob, os, ib, is_, coef in self.terms:
+            row = out_index[ob][os].reshape(-1)
+            rows.append(row)
+            cols.append(in_index[ib][is_].reshape(-1))
+            if bm.is_tensor(coef):
+                vals.append(bm.astype(coef.reshape(-1), self.ftype))
+            else:
+                vals.append(bm.full(row.shape, coef, dtype=self.ftype, device=self.device))
+
+        indices = bm.stack([bm.concat(rows), bm.concat(cols)], axis=0)
+        return COOTensor(indices, bm.concat(vals), spshape=self.shape).tocsr()
+
+
+class GradientOperator(StencilOperator):
+    """Gradient of the node values onto the edges of a uniform mesh, i.e. the
+    forward differences `(u[i+1] - u[i]) / h` along each axis.
+
+    The output is the values on all the edges, numbered as `mesh.entity('edge')`.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+    """
+    def __init__(self, mesh) -> None:
+        node, edge = grid_shapes(mesh)
+        super().__init__(edge, [node], ftype=mesh.ftype,
+                         device=bm.get_device(mesh.entity('node')))
+        full = (slice(None), ) * len(node)
+        for k, h in enumerate(mesh.h[:len(node)]):
+            n = node[k] - 1
+            self.add_term(full, shift(full, k, slice(1, n + 1)), 1./h, ob=k)
+            self.add_term(full, shift(full, k, slice(0, n)), -1./h, ob=k)
+
+
+class DivergenceOperator(StencilOperator):
+    """Divergence of the edge values onto the nodes of a uniform mesh, defined
+    as the negative adjoint of `GradientOperator`.
+
+    The differences are `(v[i+1/2] - v[i-1/2]) / h` along each axis, where the
+    values out of the boundary are zero, so `-D @ G` is the symmetric
+    Laplacian with the homogeneous Neumann boundary condition.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+    """
+    def __init__(self, mesh) -> None:
+        node, edge = grid_shapes(mesh)
+        super().__init__([node], edge, ftype=mesh.ftype,
+                         device=bm.get_device(mesh.entity('node')))
+        full = (slice(None), ) * len(node)
+        for k, h in enumerate(mesh.h[:len(node)]):
+            n = node[k] - 1
+            self.add_term(shift(full, k, slice(0, n)), full, 1./h, ib=k)
+            self.add_term(shift(full, k, slice(1, n + 1)), full, -1./h, ib=k)
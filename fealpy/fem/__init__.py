@@ -18,6 +18,7 @@ from .linear_elastic_integrator import LinearElasticIntegrator
 from .press_work_integrator import PressWorkIntegrator, PressWorkIntegrator0, PressWorkIntegrator1
 from .vector_mass_integrator import VectorMassIntegrator
 from .curl_integrator import CurlIntegrator
+from .sum_factorization import SumFactorization, SumFactorizationOperator
 
 
 ### Cell Source
@@ -26,6 +27,9 @@ from .vector_source_integrator import VectorSourceIntegrator
 
 ### Face Operator
 from .scalar_neumann_bc_integrator import ScalarNeumannBCIntegrator
+from .scalar_robin_bc_integrator import ScalarRobinBCIntegrator
+from .vector_robin_bc_integrator import VectorRobinBCIntegrator
+from .interface_penalty_integrator import InterfacePenaltyIntegrator
 
 ### Face Source
 
@@ -11,6 +11,7 @@ from .integrator import LinearInt
 
 class BilinearForm(Form[LinearInt]):
     _M = None
+    _pattern = None
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -73,6 +74,91 @@ class BilinearForm(Form[LinearInt]):
 
         return M
 
+    def _pattern_key(self):
+        # The entity-to-dof arrays are held by the key, so that their identity
+        # can not be taken by new arrays while the pattern is alive.
+        key = []
+        for group, INTS in self.integrators.items():
+            for s in self._spaces:
+                e2dof = INTS[0].to_global_dof(s)
+                key.append((group, len(INTS), e2dof, tuple(e2dof.shape)))
+        return key, getattr(self, '_transposed', False)
+
+    def _pattern_is_valid(self):
+        if self._pattern is None:
+            return False
+        old, old_transposed = self._pattern[-1]
+        new, new_transposed = self._pattern_key()
+        if (old_transposed != new_transposed) or (len(old) != len(new)):
+            return False
+        return all((a[0] == b[0]) and (a[1] == b[1]) and (a[2] is b[2]) and (a[3] == b[3])
+                   for a, b in zip(old, new))
+
+    def _build_pattern(self):
+        space = self._spaces
+        ugdof = space[0].number_of_global_dofs()
+        vgdof = space[1].number_of_global_dofs() if (len(space) > 1) else ugdof
+        I_list, J_list = [], []
+
+        for group, INTS in self.integrators.items():
+            e2dofs = [INTS[0].to_global_dof(s) for s in space]
+            ue2dof = e2dofs[0]
+            ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
+            local_shape = (ue2dof.shape[0], ve2dof.shape[1], ue2dof.shape[1])
+            I_list.append(bm.broadcast_to(ve2dof[:, :, None], local_shape).ravel())
+            J_list.append(bm.broadcast_to(ue2dof[:, None, :], local_shape).ravel())
+
+        I, J = bm.concat(I_list, axis=0), bm.concat(J_list, axis=0)
+        nrow, ncol = vgdof, ugdof
+        if getattr(self, '_transposed', False):
+            I, J = J, I
+            nrow, ncol = ncol, nrow
+
+        key, slot = bm.unique(I * ncol + J, return_inverse=True)
+        row, col = key // ncol, key % ncol
+        crow = bm.searchsorted(row, bm.arange(nrow + 1, **bm.context(row)))
+        self._pattern = (crow, col, slot, (nrow, ncol), self._pattern_key())
+
+    def pattern_assembly(self, *, retain_ints: bool=False) -> CSRTensor:
+        """Assemble the bilinear form matrix in CSR format, reusing the sparsity
+        pattern of the previous call.
+
+        The CSR structure and the map from local entries to the CSR slots are
+        computed in the first call, so later assemblies only evaluate the
+        integrators and scatter the values, skipping the sort of the COO
+        indices. This is helpful when the coefficients change but the mesh
+        and the integrators do not, e.g. in time-stepping and optimization loops.
+        Face integrators, e.g. `ScalarRobinBCIntegrator`, added to the same form
+        are scattered into the same pattern, so the whole operator is assembled
+        in one pass.
+
+        Parameters:
+            retain_ints (bool, optional): Whether to retain the integrator cache.
+
+        Returns:
+            CSRTensor: Global sparse matrix shaped ([batch, ]gdof, gdof).
+        """
+        self.check_space()
+        if not self._pattern_is_valid():
+            self._build_pattern()
+        crow, col, slot, shape, _ = self._pattern
+        batch_size = self.batch_size
+        values_list = []
+
+        for group in self.integrators.keys():
+            group_tensor, _ = self._assembly_group(group, retain_ints)
+            if (batch_size > 0) and (group_tensor.ndim == 3):
+                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+            values_list.append(bm.reshape(group_tensor, self._values_ravel_shape))
+
+        local_values = bm.concat(values_list, axis=-1)
+        values_shape = local_values.shape[:-1] + (col.shape[0], )
+        values = bm.zeros(values_shape, **bm.context(local_values))
+        values = bm.index_add(values, slot, local_values, axis=-1)
+        self._M = CSRTensor(crow, col, values, spshape=shape)
+
+        return self._M
+
     @overload
     def assembly(self, *, retain_ints: bool=False) -> CSRTensor: ...
     @overload
@@ -65,27 +65,39 @@ class BlockForm(Form):
         return self._M
     
     
+    def assembly_blocks(self, format='csr') -> List[List]:
+        """Assemble each block separately and keep the block structure.
+
+        Parameters:
+            format (str, optional): Layout of the blocks ('csr' | 'coo'). Defaults to 'csr'.
+
+        Returns:
+            List[List[CSRTensor | COOTensor | None]]: Nested list of the block matrices,\
+            where `None` stands for a zero block.
+        """
+        return [[None if block is None else block.assembly(format=format)
+                 for block in row] for row in self.blocks]
+
     def __matmul__(self, u: TensorLike):
         if self._M is not None:
             return self._M @ u
-        
-        # u的不同ndim情况
-        kwargs = bm.context(u)
-        v = bm.zeros_like(u, **kwargs)
 
         row_offset = bm.cumsum(bm.max(self.block_shape[...,0],axis = 1), axis=0)
         col_offset = bm.cumsum(bm.max(self.block_shape[...,1],axis = 0), axis=0)
         row_offset = bm.concatenate((bm.array([0]),row_offset))
         col_offset = bm.concatenate((bm.array([0]),col_offset))
+        v = []
+
         for i in range(self.nrows):
+            vi = bm.zeros((row_offset[i+1] - row_offset[i],) + u.shape[1:], **bm.context(u))
             for j in range(self.ncols):
                 block = self.blocks[i][j]
                 if block is None:
                     continue
-                v = bm.index_add(v, bm.arange(row_offset[i],row_offset[i+1]), 
-                                 block @ u[row_offset[j]:row_offset[j+1]] )
-                #v[row_offset[i]:row_offset[i+1]] += block @ u[row_offset[j]:row_offset[j+1]] 
-        return v
+                vi = vi + block @ u[col_offset[j]:col_offset[j+1]]
+            v.append(vi)
+
+        return bm.concatenate(v, axis=0)
 
 
 Form.register(BlockForm)
@@ -147,7 +147,14 @@ class NonlinearInt(Integrator):
 class SemilinearInt(Integrator):
     """### Semilinear Integrator
     Base class for integrators generating integration linear to test functions `v`."""
-    pass
+    def residual(self, space: _FS) -> TensorLike:
+        """Assemble the local residual vector only, without the tangent matrix.
+
+        The result is not cached, as it changes with the current solution.
+        Subclasses may override this to skip the computation of the tangent
+        matrix, which is useful when the Jacobian is reused by Newton methods.
+        """
+        return getattr(self, self._assembly)(space)[1]
 
 
 class LinearInt(Integrator):
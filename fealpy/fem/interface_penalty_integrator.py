@@ -0,0 +1,107 @@
+from typing import Optional
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike, Threshold
+from ..mesh.mesh_base import SimplexMesh
+from ..functionspace.space import FunctionSpace as _FS
+from ..utils import process_coef_func
+from ..functional import bilinear_integral
+from .integrator import LinearInt, OpInt, FaceInt, enable_cache, CoefLike
+
+
+class InterfacePenaltyIntegrator(LinearInt, OpInt, FaceInt):
+    """The interior penalty of the normal derivative jumps across the interior
+    faces, i.e. the continuous interior penalty stabilization
+
+        sum_F gamma h_F^2 ([grad u . n], [grad v . n])_F
+
+    for the Lagrange spaces on the simplex meshes.
+
+    The dofs of a face are the dofs of its two adjacent cells, so the local
+    matrices are shaped (NF, 2*ldof, 2*ldof) and a shared dof may appear twice,
+    which is accumulated by the scatter of the form. The entries coupling two
+    neighbour cells extend the pattern of the cell integrators; it is computed
+    once when used with `BilinearForm.pattern_assembly`.
+
+    Parameters:
+        coef (CoefLike | None, optional): The penalty parameter `gamma`. Defaults to None.
+        q (int | None, optional): Index of the face quadrature. Defaults to `p+3`.
+        threshold (Threshold | None, optional): The interior faces to integrate,
+            given as a tensor of face indices or a function of the face
+            barycenters. Defaults to None (all the interior faces).
+        batched (bool, optional): Whether the coef is batched. Defaults to False.
+    """
+    def __init__(self, coef: Optional[CoefLike]=None, q: Optional[int]=None, *,
+                 threshold: Optional[Threshold]=None,
+                 batched: bool=False):
+        super().__init__()
+        self.coef = coef
+        self.q = q
+        self.threshold = threshold
+        self.batched = batched
+
+    @enable_cache
+    def make_index(self, space: _FS):
+        threshold = self.threshold
+
+        if isinstance(threshold, TensorLike):
+            index = threshold
+        else:
+            mesh = space.mesh
+            index = bm.nonzero(~mesh.boundary_face_flag())[0]
+            if callable(threshold):
+                bc = mesh.entity_barycenter('face', index=index)
+                index = index[threshold(bc)]
+
+        return index
+
+    @enable_cache
+    def to_global_dof(self, space: _FS) -> TensorLike:
+        index = self.make_index(space)
+        face2cell = space.mesh.face_to_cell()[index]
+        cell2dof = space.cell_to_dof()
+        return bm.concat([cell2dof[face2cell[:, 0]], cell2dof[face2cell[:, 1]]], axis=-1)
+
+    @enable_cache
+    def fetch(self, space: _FS):
+        index = self.make_index(space)
+        mesh = space.mesh
+
+        if not isinstance(mesh, SimplexMesh):
+            raise RuntimeError(f"The {self.__class__.__name__} only support spaces on "
+                               f"simplex meshes, but {type(mesh).__name__} is "
+                               "not a subclass of SimplexMesh.")
+
+        n = mesh.face_unit_normal(index=index)
+        fm = mesh.entity_measure('face', index=index)
+        TD = mesh.top_dimension()
+        h = fm if TD == 2 else fm**(1./(TD - 1))
+
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q, 'face')
+        bcs, ws = qf.get_quadrature_points_and_weights()
+
+        # The face quadrature points in the barycentric coordinates of the
+        # two adjacent cells, then the normal derivatives of the cell basis.
+        face = mesh.entity('face', index=index)
+        cell = mesh.entity('cell')
+        face2cell = mesh.face_to_cell()[index]
+        glambda = mesh.grad_lambda()
+        dn = []
+        for side in (0, 1):
+            cidx = face2cell[:, side]
+            P = bm.astype(face[:, :, None] == cell[cidx][:, None, :], bcs.dtype)
+            cbcs = bm.einsum('qj, fjk -> fqk', bcs, P)
+            R = bm.simplex_grad_shape_function(cbcs, space.p) # (NF, NQ, ldof, TD+1)
+            gn = bm.einsum('fkd, fd -> fk', glambda[cidx], n)
+            dn.append(bm.einsum('fqlk, fk -> fql', R, gn))
+        jump = bm.concat([dn[0], -dn[1]], axis=-1) # (NF, NQ, 2*ldof)
+
+        return bcs, ws, jump, fm * h**2, index
+
+    def assembly(self, space: _FS) -> TensorLike:
+        mesh = space.mesh
+        bcs, ws, jump, fm, index = self.fetch(space)
+        val = process_coef_func(self.coef, bcs=bcs, mesh=mesh, etype='face', index=index)
+
+        return bilinear_integral(jump, jump, ws, fm, val, batched=self.batched)
@@ -15,10 +15,19 @@ from .integrator import (
 class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
     """
     The linear elastic integrator for function spaces based on homogeneous meshes.
+
+    The optional `coef` scales the element stiffness matrices cell by cell,
+    e.g. by the interpolated Young's modulus E(rho) of SIMP topology
+    optimization, and is supported by all the assembly methods.
+    With `method='scaled'`, the element matrices of the material
+    are computed once and cached, so that changing `coef` only costs a scaling
+    of the cached matrices; use `clear(result_only=False)` after the material
+    itself has changed.
     """
     def __init__(self, 
                  material,
                  q: Optional[int]=None, *,
+                 coef: Optional[TensorLike]=None,
                  index: Index=_S,
                  method: Optional[str]=None) -> None:
         method = 'assembly' if (method is None) else method
@@ -26,6 +35,7 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
 
         self.material = material
         self.q = q
+        self.coef = coef
         self.index = index
 
     @enable_cache
@@ -50,16 +60,65 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
         
         return bcs, ws, gphi, cm, index, q
     
-    def assembly(self, space: _TS) -> TensorLike:
+    def _element_matrix(self, space: _TS) -> TensorLike:
         scalar_space = space.scalar_space
         bcs, ws, gphi, cm, index, q = self.fetch(scalar_space)
         
-        D = self.material.elastic_matrix(bcs)
+        D = bm.astype(self.material.elastic_matrix(bcs), gphi.dtype)
         B = self.material.strain_matrix(dof_priority=space.dof_priority, gphi=gphi)
 
-        KK = bm.einsum('q, c, cqki, cqkl, cqlj -> cij', ws, cm, B, D, B)
-        
-        return KK
+        return bm.einsum('q, c, cqki, cqkl, cqlj -> cij', ws, cm, B, D, B)
+
+    def _scale(self, KK: TensorLike) -> TensorLike:
+        if self.coef is None:
+            return KK
+        return bm.einsum('c, cij -> cij', self.coef, KK)
+
+    def assembly(self, space: _TS) -> TensorLike:
+        return self._scale(self._element_matrix(space))
+
+    @enable_cache
+    def fetch_element_matrix(self, space: _TS) -> TensorLike:
+        """Element stiffness matrices of the material without `coef`, cached
+        for the 'scaled' assembly method and the compliance kernels."""
+        return self._element_matrix(space)
+
+    @assemblymethod('scaled')
+    def scaled_assembly(self, space: _TS) -> TensorLike:
+        return self._scale(self.fetch_element_matrix(space))
+
+    def element_compliance(self, space: _TS, uh: TensorLike) -> TensorLike:
+        """Cell-wise compliance u_e^T K_e u_e with the element matrices of the
+        material, excluding `coef`.
+
+        Parameters:
+            space (TensorFunctionSpace): The tensor function space.
+            uh (TensorLike): The displacement dofs shaped (gdof, ).
+
+        Returns:
+            TensorLike: The element compliance shaped (NC, ).
+        """
+        KE = self.fetch_element_matrix(space)
+        ue = uh[self.to_global_dof(space)]
+        return bm.einsum('ci, cij, cj -> c', ue, KE, ue)
+
+    def compliance_sensitivity(self, space: _TS, uh: TensorLike,
+                               dcoef: TensorLike) -> TensorLike:
+        """Derivative of the compliance F^T u = u^T K u with respect to the
+        design variables, i.e. -dcoef_e u_e^T K_e u_e, in one contraction.
+
+        Parameters:
+            space (TensorFunctionSpace): The tensor function space.
+            uh (TensorLike): The displacement dofs shaped (gdof, ).
+            dcoef (TensorLike): Derivative of `coef` with respect to the design\
+                variables shaped (NC, ), e.g. p*rho**(p-1)*(E0 - Emin) for SIMP.
+
+        Returns:
+            TensorLike: The sensitivities shaped (NC, ).
+        """
+        KE = self.fetch_element_matrix(space)
+        ue = uh[self.to_global_dof(space)]
+        return -bm.einsum('c, ci, cij, cj -> c', dcoef, ue, KE, ue)
 
     @assemblymethod('fast_strain')
     def fast_assembly_strain(self, space: _TS) -> TensorLike:
@@ -92,10 +151,10 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
         NC = mesh.number_of_cells()
         ldof = scalar_space.number_of_local_dofs()
         tldof = space.number_of_local_dofs()
-        KK = bm.zeros((NC, tldof, tldof), dtype=bm.float64)
+        KK = bm.zeros((NC, tldof, tldof), **bm.context(A_xx))
 
         # TODO 只能处理 (NC, 1, 3, 3) 和 (1, 1, 3, 3) 的情况 
-        D = self.material.elastic_matrix()
+        D = bm.astype(self.material.elastic_matrix(), KK.dtype)
         if D.shape[0] != 1:
             raise ValueError("Elastic matrix D must have shape (NC, 1, 3, 3) or (1, 1, 3, 3).")
         D00 = D[..., 0, 0, None]
@@ -127,7 +186,7 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
             # KK[:, 0:KK.shape[1]:GD, 1:KK.shape[2]:GD] = D01 * A_xy + D22 * A_yx
             # KK[:, 1:KK.shape[1]:GD, 0:KK.shape[2]:GD] = D01 * A_yx + D22 * A_xy
         
-        return KK
+        return self._scale(KK)
 
     @assemblymethod('fast_stress')
     def fast_assembly_stress(self, space: _TS) -> TensorLike:
@@ -159,10 +218,10 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
 
         NC = mesh.number_of_cells()
         ldof = scalar_space.number_of_local_dofs()
-        KK = bm.zeros((NC, GD * ldof, GD * ldof), dtype=bm.float64)
+        KK = bm.zeros((NC, GD * ldof, GD * ldof), **bm.context(A_xx))
 
         # TODO 只能处理 (NC, 1, 3, 3) 和 (1, 1, 3, 3) 的情况 
-        D = self.material.elastic_matrix()
+        D = bm.astype(self.material.elastic_matrix(), KK.dtype)
         if D.shape[1] != 1:
             raise ValueError("fast_assembly_stress currently only supports elastic matrices "
                             "with shape (NC, 1, 3, 3) or (1, 1, 3, 3).")
@@ -195,12 +254,11 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
             # KK[:, 0:KK.shape[1]:GD, 1:KK.shape[2]:GD] = D01 * A_xy + D22 * A_yx
             # KK[:, 1:KK.shape[1]:GD, 0:KK.shape[2]:GD] = D22 * A_yx + D01 * A_xy
         
-        return KK
+        return self._scale(KK)
     
     @assemblymethod('fast_3d')
     def fast_assembly(self, space: _TS) -> TensorLike:
         index = self.index
-        # coef = self.coef
         scalar_space = space.scalar_space
         mesh = getattr(scalar_space, 'mesh', None)
 
@@ -234,9 +292,9 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
 
         NC = mesh.number_of_cells()
         ldof = scalar_space.number_of_local_dofs()
-        KK = bm.zeros((NC, GD * ldof, GD * ldof), dtype=bm.float64)
+        KK = bm.zeros((NC, GD * ldof, GD * ldof), **bm.context(A_xx))
 
-        D = self.material.elastic_matrix()
+        D = bm.astype(self.material.elastic_matrix(), KK.dtype)
         if D.shape[1] != 1:
             raise ValueError("fast_assembly currently only supports elastic matrices "
                             "with shape (NC, 1, 6, 6) or (1, 1, 6, 6).")
@@ -291,4 +349,4 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
             # KK[:, 2:KK.shape[1]:GD, 0:KK.shape[2]:GD] = D01 * A_zx + D55 * A_xz
             # KK[:, 2:KK.shape[1]:GD, 1:KK.shape[2]:GD] = D01 * A_zy + D55 * A_yz
 
-        return KK
+        return self._scale(KK)
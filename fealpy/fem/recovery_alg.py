@@ -1,11 +1,25 @@
 from typing import Optional
-import numpy as np
+from weakref import WeakKeyDictionary
 
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
+from ..sparse import COOTensor, CSRTensor
 from ..functionspace import TensorFunctionSpace
 
 class RecoveryAlg:
+    """Gradient recovery by averaging the piecewise constant gradients onto the dofs.
+
+    The weights of the chosen method are assembled into a sparse averaging
+    operator `R` shaped (gdof, NC), so that a recovery is one product of `R`
+    and the cell values. `R` is cached for each space and method, and reused
+    until the mesh changes, so keep the instance across the adaptive steps.
+    The cache holds the spaces weakly, so its entries go with the spaces.
+    """
+    _METHODS = ('simple', 'area', 'area_harmonic', 'distance', 'distance_harmonic')
+
+    def __init__(self) -> None:
+        self._cache = WeakKeyDictionary()
+        self._tensor_space = None
 
     def recovery_estimate(self, uh: TensorLike, method='simple'):
         """
@@ -21,6 +35,67 @@ class RecoveryAlg:
         eta = mesh.error(rguh.value, uh.grad_value, power=2, celltype=True) # 计算单元上的恢复型误差
         return eta
 
+    def averaging_operator(self, space, method='simple') -> CSRTensor:
+        """
+        @brief The averaging operator from the cell values to the dofs, i.e.
+        the value on a dof is the weighted mean of the values on the cells
+        around it.
+        ----------------------------------
+        @param space: The scalar Lagrange space.
+        @param method: The weights, one of 'simple', 'area', 'area_harmonic',
+            'distance' and 'distance_harmonic'. Default is 'simple'.
+        @return: CSRTensor shaped (gdof, NC).
+        """
+        if method not in self._METHODS:
+            raise ValueError('Unsupported method: %s' % method)
+
+        mesh = space.mesh
+        cell2dof = space.cell_to_dof()
+        gdof = space.number_of_global_dofs()
+        cache = self._cache.setdefault(space, {})
+        stamp = (mesh.entity('cell'), mesh.entity('node'), cell2dof.shape, gdof)
+        if method in cache and self._same_stamp(cache[method][0], stamp):
+            return cache[method][1]
+
+        NC, ldof = cell2dof.shape
+        context = dict(dtype=space.ftype, device=bm.get_device(cell2dof))
+
+        if method == 'simple':
+            w = bm.ones((NC, ldof), **context)
+        elif method in ('area', 'area_harmonic'):
+            val = mesh.entity_measure('cell')
+            if method == 'area_harmonic':
+                val = 1.0/val
+            w = bm.broadcast_to(val[:, None], (NC, ldof))
+        else:
+            ipoints = space.interpolation_points()
+            bp = mesh.entity_barycenter('cell')
+            v = bp[:, None, :] - ipoints[cell2dof, :]
+            w = bm.sqrt(bm.sum(v**2, axis=-1))
+            if method == 'distance_harmonic':
+                w = 1.0/w
+
+        rows = bm.reshape(cell2dof, (-1, ))
+        cols = bm.repeat(bm.arange(NC, **bm.context(cell2dof)), ldof)
+        w = bm.reshape(w, (-1, ))
+        deg = bm.index_add(bm.zeros((gdof, ), **context), rows, w)
+        indices = bm.stack([rows, cols], axis=0)
+        R = COOTensor(indices, w/deg[rows], spshape=(gdof, NC)).tocsr()
+
+        cache[method] = (stamp, R)
+        return R
+
+    @staticmethod
+    def _same_stamp(old, new) -> bool:
+        # The mesh arrays are held by the stamp and compared by identity, as
+        # the refinements replace them instead of changing them in place.
+        return (old[0] is new[0]) and (old[1] is new[1]) and (old[2:] == new[2:])
+
+    def clear(self) -> None:
+        """Clear the cached averaging operators."""
+        self._cache.clear()
+        self._tensor_space = None
+
     def grad_recovery(self, uh: TensorLike, method='simple'):
         """
         @brief Input a linear finite element function and restore its gradient
@@ -33,55 +108,16 @@ class RecoveryAlg:
         space = uh.space
         TD = space.top_dimension()
         GD = space.geo_dimension()
-        gdof = space.number_of_global_dofs()
-        cell2dof = space.cell_to_dof()
         bc = bm.array([[1/3]*(TD+1)], dtype=space.ftype)
 
+        R = self.averaging_operator(space, method=method)
         guh = uh.grad_value(bc) # (NC, 1, GD)
-        
-        tensor_space = TensorFunctionSpace(space, shape=(GD, -1))
-        rguh = tensor_space.function()
-        gval = bm.zeros((gdof, GD), dtype=space.ftype)
-        deg = bm.zeros(gdof, dtype=space.ftype)
-
-        if method == 'simple':
-            bm.index_add(deg, cell2dof, bm.tensor(1, **bm.context(deg)))
-            bm.index_add(gval, cell2dof, guh)
-        elif method == 'area_harmonic':
-            val = 1.0/space.mesh.entity_measure('cell')
-            bm.index_add(deg, cell2dof, val[:, None])
-            guh *= val[:, None, None] 
-            bm.index_add(gval, cell2dof, guh)
-        elif method == 'area':
-            val = space.mesh.entity_measure('cell')
-            bm.index_add(deg, cell2dof, val[:, None])
-            guh *= val[:, None, None] 
-            bm.index_add(gval, cell2dof, guh)
-        elif method == 'distance':
-            ipoints = space.interpolation_points()
-            bp = space.mesh.entity_barycenter('cell')
-            v = bp[:, None, :] - ipoints[cell2dof, :]
-            d = bm.sqrt(bm.sum(v**2, axis=-1))
-            guh = bm.einsum('ij...,ij->ij...', guh, d)
-
-            bm.index_add(deg, cell2dof, d)
-            bm.index_add(gval, cell2dof, guh)
-        elif method == 'distance_harmonic':
-            ipoints = space.interpolation_points()
-            bp = space.mesh.entity_barycenter('cell')
-            v = bp[:, None, :] - ipoints[cell2dof, :]
-            d = 1/bm.sqrt(bm.sum(v**2, axis=-1))
-            guh = bm.einsum('ij...,ij->ij...', guh, d)
-
-            bm.index_add(deg, cell2dof, d)
-            bm.index_add(gval, cell2dof, guh)
-        else:
-            raise ValueError('Unsupported method: %s' % method)
+        gval = R @ guh[:, 0, :] # (gdof, GD)
 
-        gval /= deg[:, None]
-        rguh[:] = gval.T.flatten()
+        # One tensor space is kept and replaced on mismatch, as it holds its
+        # scalar space and would pin the weak key of the cache.
+        if (self._tensor_space is None) or (self._tensor_space.scalar_space is not space):
+            self._tensor_space = TensorFunctionSpace(space, shape=(GD, -1))
+        rguh = self._tensor_space.function()
+        rguh[:] = bm.reshape(bm.swapaxes(gval, 0, 1), (-1, ))
         return rguh
-
-
-
-
@@ -13,6 +13,7 @@ from .integrator import (
     assemblymethod,
     CoefLike
 )
+from .sum_factorization import SumFactorization
 
 
 class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
@@ -77,6 +78,15 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
         A = bm.einsum('ijkl, ckm, clm, c->cij', M, glambda, glambda, cm)
         return A
 
+    @enable_cache
+    def fetch_sumfac(self, space: _FS) -> SumFactorization:
+        return SumFactorization(space, self.q, index=self.index)
+
+    @assemblymethod('sumfac')
+    def sumfac_assembly(self, space: _FS) -> TensorLike:
+        """Sum-factorized assembly, for the Lagrange spaces on tensor-product meshes."""
+        return self.fetch_sumfac(space).diffusion_matrix(self.coef)
+
     @assemblymethod('semilinear')
     def semilinear_assembly(self, space: _FS) -> TensorLike:
         uh = self.uh
@@ -13,6 +13,7 @@ from .integrator import (
     assemblymethod,
     CoefLike
 )
+from .sum_factorization import SumFactorization
 
 
 class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
@@ -57,6 +58,15 @@ class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
 
         return bilinear_integral(phi, phi, ws, cm, val, batched=self.batched)
 
+    @enable_cache
+    def fetch_sumfac(self, space: _FS) -> SumFactorization:
+        return SumFactorization(space, self.q, index=self.index)
+
+    @assemblymethod('sumfac')
+    def sumfac_assembly(self, space: _FS) -> TensorLike:
+        """Sum-factorized assembly, for the Lagrange spaces on tensor-product meshes."""
+        return self.fetch_sumfac(space).mass_matrix(self.coef)
+
     @assemblymethod('semilinear')
     def semilinear_assembly(self, space: _FS) -> TensorLike:
         uh = self.uh
@@ -0,0 +1,81 @@
+from typing import Optional
+
+from ..typing import TensorLike, Threshold
+from ..mesh import HomogeneousMesh
+from ..functionspace.space import FunctionSpace as _FS
+from ..utils import process_coef_func
+from ..functional import bilinear_integral
+from .integrator import LinearInt, OpInt, FaceInt, enable_cache, CoefLike
+
+
+class ScalarRobinBCIntegrator(LinearInt, OpInt, FaceInt):
+    """The Robin boundary term `(kappa u, v)` on the boundary faces.
+
+    The local matrices are shaped (NF, ldof, ldof) and scattered by
+    `space.face_to_dof()`. As every boundary face lies in a cell, the entries
+    are in the sparsity pattern of the cell integrators, so it can be added to
+    the same `BilinearForm` to assemble the whole operator in one pass.
+
+    Parameters:
+        coef (CoefLike | None, optional): The Robin coefficient `kappa`. Defaults to None.
+        q (int | None, optional): Index of the face quadrature. Defaults to `p+3`.
+        threshold (Threshold | None, optional): The boundary faces to integrate,
+            given as a tensor of face indices or a function of the face
+            barycenters. Defaults to None (all the boundary faces).
+        batched (bool, optional): Whether the coef is batched. Defaults to False.
+    """
+    def __init__(self, coef: Optional[CoefLike]=None, q: Optional[int]=None, *,
+                 threshold: Optional[Threshold]=None,
+                 batched: bool=False):
+        super().__init__()
+        self.coef = coef
+        self.q = q
+        self.threshold = threshold
+        self.batched = batched
+
+    @enable_cache
+    def make_index(self, space: _FS):
+        threshold = self.threshold
+
+        if isinstance(threshold, TensorLike):
+            index = threshold
+        else:
+            mesh = space.mesh
+            index = mesh.boundary_face_index()
+            if callable(threshold):
+                bc = mesh.entity_barycenter('face', index=index)
+                index = index[threshold(bc)]
+
+        return index
+
+    @enable_cache
+    def to_global_dof(self, space: _FS) -> TensorLike:
+        index = self.make_index(space)
+        return space.face_to_dof()[index]
+
+    @enable_cache
+    def fetch(self, space: _FS):
+        index = self.make_index(space)
+        mesh = space.mesh
+
+        if not isinstance(mesh, HomogeneousMesh):
+            raise RuntimeError(f"The {self.__class__.__name__} only support spaces on"
+                               f"homogeneous meshes, but {type(mesh).__name__} is"
+                               "not a subclass of HomoMesh.")
+
+        n = mesh.face_unit_normal(index=index)
+        facemeasure = mesh.entity_measure('face', index=index)
+
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q, 'face')
+        bcs, ws = qf.get_quadrature_points_and_weights()
+        phi = space.basis(bcs)
+
+        return bcs, ws, phi, facemeasure, n, index
+
+    def assembly(self, space: _FS) -> TensorLike:
+        mesh = space.mesh
+        bcs, ws, phi, fm, _, index = self.fetch(space)
+        val = process_coef_func(self.coef, bcs=bcs, mesh=mesh, etype='face', index=index)
+
+        return bilinear_integral(phi, phi, ws, fm, val, batched=self.batched)
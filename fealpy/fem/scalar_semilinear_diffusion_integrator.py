@@ -76,6 +76,24 @@ class ScalarSemilinearDiffusionIntegrator(SemilinearInt, OpInt, CellInt):
             A, F = self.auto_grad(space, uh_, coef, batched=self.batched) 
 
         return A, F
+
+    def residual(self, space: _FS) -> TensorLike:
+        uh = self.uh
+        coef = self.coef
+        mesh = getattr(space, 'mesh', None)
+        bcs, ws, gphi, cm, index = self.fetch(space)
+        coef = process_coef_func(coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+
+        if self.grad_kernel_func is not None:
+            val_F = -uh.grad_value(bcs)
+            coef_F = get_semilinear_coef(val_F, coef)
+            return linear_integral(gphi, ws, cm, coef_F, batched=self.batched)
+        else:
+            uh_ = uh[space.cell_to_dof()]
+            fn_F = bm.vmap(
+                partial(self.cell_integral, ws=ws, coef=coef, batched=self.batched)
+            )
+            return -fn_F(uh_, gphi, cm)
     
     def cell_integral(self, u, gphi, cm, ws, coef, batched) -> TensorLike:
         val = self.kernel_func(bm.einsum('i, qid -> qd', u, gphi))
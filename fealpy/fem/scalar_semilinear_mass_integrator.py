@@ -76,6 +76,24 @@ class ScalarSemilinearMassIntegrator(SemilinearInt, OpInt, CellInt):
             A, F = self.auto_grad(space, uh_, coef, batched=self.batched)
 
         return A, F
+
+    def residual(self, space: _FS) -> TensorLike:
+        uh = self.uh
+        coef = self.coef
+        mesh = getattr(space, 'mesh', None)
+        bcs, ws, phi, cm, index = self.fetch(space)
+        coef = process_coef_func(coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
+
+        if self.grad_kernel_func is not None:
+            val_F = -self.kernel_func(uh(bcs))
+            coef_F = get_semilinear_coef(val_F, coef)
+            return linear_integral(phi, ws, cm, coef_F, batched=self.batched)
+        else:
+            uh_ = uh[space.cell_to_dof()]
+            fn_F = bm.vmap(
+                partial(self.cell_integral, phi=phi, ws=ws, coef=coef, batched=self.batched)
+            )
+            return -fn_F(uh_, cm)
     
     def cell_integral(self, u, cm, phi, ws, coef, batched) -> TensorLike:
         val = self.kernel_func(bm.einsum('i, qi -> q', u, phi[0]))
@@ -127,6 +127,70 @@ class SemilinearForm(Form[SemilinearInt]):
 
         return M
 
+    def _assembly_group_residual(self, group: str):
+        INTS = self.integrators[group]
+        etg = [INTS[0].to_global_dof(s) for s in self._spaces]
+
+        if isinstance(INTS[0], SrcInt):
+            ct_F = INTS[0](self.space)
+            for int_ in INTS[1:]:
+                ct_F = ct_F + int_(self.space)
+            return ct_F, etg
+
+        ct_F = None
+        for int_ in INTS:
+            if isinstance(int_, OpInt) and isinstance(int_, SemilinearInt):
+                new_ct_F = int_.residual(self.space)
+                ct_F = new_ct_F if ct_F is None else ct_F + new_ct_F
+
+        return ct_F, etg
+
+    def assembly_residual(self, *, return_dense=True):
+        """Assemble the right-hand-side vector (the negative residual) only.
+
+        The tangent matrix is not assembled, so this is much cheaper than
+        `assembly` when the Jacobian is reused, e.g. in modified Newton
+        iterations and line searches. Results of the source integrators are
+        cached as usual, while the semilinear parts are re-computed from the
+        current `uh`.
+
+        Parameters:
+            return_dense (bool, optional): Whether to return a dense tensor.\
+            Defaults to True.
+
+        Returns:
+            TensorLike | COOTensor: The global right-hand-side vector.
+        """
+        space = self._spaces[0]
+        gdof = space.number_of_global_dofs()
+        batch_size = self.batch_size
+        init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
+        sparse_shape = (gdof, )
+
+        V = COOTensor(
+            indices = bm.empty((1, 0), dtype=space.itype),
+            values = bm.empty(init_value_shape, dtype=space.ftype),
+            spshape = sparse_shape
+        )
+
+        for group in self.integrators.keys():
+            group_tensor, e2dofs = self._assembly_group_residual(group)
+            if group_tensor is None:
+                continue
+
+            if (batch_size > 0) and (group_tensor.ndim == 2):
+                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+
+            indices = e2dofs[0].reshape(1, -1)
+            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+            V = V.add(COOTensor(indices, group_tensor, sparse_shape))
+
+        V = V.coalesce()
+        if return_dense:
+            return V.to_dense()
+
+        return V
+
     def assembly(self, *, return_dense=True, coalesce=True, retain_ints: bool=False) -> COOTensor:
         
         M = self._scalar_assembly_A(retain_ints, self.batch_size)
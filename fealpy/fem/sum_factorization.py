@@ -0,0 +1,276 @@
+
+from typing import Optional, List, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike, Index, _S
+from ..mesh.mesh_base import TensorMesh
+from ..utils import process_coef_func
+from .integrator import CoefLike
+
+_LETTERS = 'ijklmn'
+
+
+class SumFactorization():
+    """Sum-factorized kernels of the Lagrange spaces on tensor-product meshes,
+    e.g. `QuadrangleMesh`, `HexahedronMesh` and the uniform meshes.
+
+    The (p+1)^d shape functions of a cell are products of the 1-d shape
+    functions, so the values and the gradients at the (q)^d tensor-product
+    quadrature points are computed by applying the 1-d basis matrix `B` and
+    derivative matrix `D` (both shaped (q, p+1)) axis by axis. This costs
+    O(p^{d+1}) per cell for the operator application instead of O(p^{2d})
+    with the flat tables, and O(p^{2d+1}) for the element matrices instead
+    of O(p^{3d}).
+
+    The integrals use the Jacobian of the cell map at every quadrature point,
+    so the cells need not be parallelograms.
+
+    Parameters:
+        space (LagrangeFESpace): The scalar Lagrange space on a tensor-product mesh.
+        q (int | None, optional): Number of the 1-d quadrature points.
+            Defaults to p + 3 as the integrators.
+        index (Index, optional): The cells to integrate on. Defaults to all.
+
+    Example:
+    ```
+        space = LagrangeFESpace(HexahedronMesh.from_box(nx=8, ny=8, nz=8), p=6)
+        sf = SumFactorization(space)
+        A = sf.diffusion_matrix(coef)   # (NC, ldof, ldof)
+        Au = sf.diffusion_apply(uh[space.cell_to_dof()], coef) # (NC, ldof)
+    ```
+    """
+    def __init__(self, space, q: Optional[int]=None, *, index: Index=_S) -> None:
+        mesh = space.mesh
+        if not isinstance(mesh, TensorMesh):
+            raise TypeError("The sum factorization requires a tensor-product mesh, "
+                            f"but got {type(mesh).__name__}.")
+        TD = mesh.top_dimension()
+        if mesh.geo_dimension() != TD:
+            raise ValueError("The sum factorization only supports the meshes "
+                             "whose geometric and topological dimensions are equal.")
+
+        self.space = space
+        self.mesh = mesh
+        self.TD = TD
+        self.p = p = space.p
+        self.index = index
+        q = p + 3 if q is None else q
+
+        qf = mesh.quadrature_formula(q, 'cell')
+        self.bcs, self.ws = qf.get_quadrature_points_and_weights()
+        bc = self.bcs[0]
+        Dlambda = bm.array([-1, 1], dtype=mesh.ftype, device=bm.get_device(bc))
+        self.B = bm.simplex_shape_function(bc, p=p) # (q, p+1)
+        self.D = bm.einsum('qij, j -> qi', bm.simplex_grad_shape_function(bc, p=p),
+                           Dlambda) # (q, p+1)
+
+        J = mesh.jacobi_matrix(self.bcs, index=index) # (NQ, NC, TD, TD)
+        J = bm.swapaxes(J, 0, 1)
+        self.detJ = bm.abs(bm.linalg.det(J))  # (NC, NQ)
+        self.invJ = bm.linalg.inv(J)          # (NC, NQ, TD, TD)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the 1-d factors, (q, p+1)."""
+        return tuple(self.B.shape)
+
+    def _coef(self, coef: Optional[CoefLike]) -> Optional[TensorLike]:
+        coef = process_coef_func(coef, bcs=self.bcs, mesh=self.mesh, etype='cell',
+                                 index=self.index)
+        if coef is None or not bm.is_tensor(coef):
+            return coef
+        if coef.ndim == 1: # (NC, )
+            return coef[:, None]
+        if coef.ndim == 2:
+            return coef
+        raise ValueError("The sum factorization only supports scalar coefficients, "
+                         f"but got the coefficient shaped {tuple(coef.shape)}.")
+
+    def _contract(self, u: TensorLike, mats: List[TensorLike], transpose: bool=False) -> TensorLike:
+        """Apply `mats[a]` (or its transpose) on the axis `a+1` of `u`."""
+        TD = self.TD
+        src = 'c' + _LETTERS[:TD]
+        for a, M in enumerate(mats):
+            dst = src[:a+1] + 'z' + src[a+2:]
+            sub = f'{src[a+1]}z' if transpose else f'z{src[a+1]}'
+            u = bm.einsum(f'{sub}, {src} -> {dst}', M, u)
+        return u
+
+    def _mats(self, k: Optional[int]) -> List[TensorLike]:
+        return [self.D if a == k else self.B for a in range(self.TD)]
+
+    def values(self, uc: TensorLike) -> TensorLike:
+        """Values of the cell DoF values `uc` (NC, ldof) at the quadrature
+        points, shaped (NC, NQ)."""
+        NC = uc.shape[0]
+        u = uc.reshape((NC, ) + (self.p + 1, ) * self.TD)
+        return self._contract(u, self._mats(None)).reshape(NC, -1)
+
+    def grad_values(self, uc: TensorLike) -> TensorLike:
+        """Gradients of the cell DoF values `uc` (NC, ldof) in the reference
+        coordinates at the quadrature points, shaped (NC, NQ, TD)."""
+        NC = uc.shape[0]
+        u = uc.reshape((NC, ) + (self.p + 1, ) * self.TD)
+        return bm.stack([self._contract(u, self._mats(k)).reshape(NC, -1)
+                         for k in range(self.TD)], axis=-1)
+
+    def integrate_values(self, vq: TensorLike) -> TensorLike:
+        """The integrals `sum_q vq * phi_i` on the reference cell, the adjoint
+        of `values`, shaped (NC, ldof)."""
+        NC = vq.shape[0]
+        v = vq.reshape((NC, ) + (self.B.shape[0], ) * self.TD)
+        return self._contract(v, self._mats(None), transpose=True).reshape(NC, -1)
+
+    def integrate_grad_values(self, gq: TensorLike) -> TensorLike:
+        """The integrals `sum_q gq . grad phi_i` on the reference cell, the
+        adjoint of `grad_values`, shaped (NC, ldof)."""
+        NC = gq.shape[0]
+        shape = (NC, ) + (self.B.shape[0], ) * self.TD
+        val = 0.
+        for k in range(self.TD):
+            v = gq[..., k].reshape(shape)
+            val = val + self._contract(v, self._mats(k), transpose=True)
+        return val.reshape(NC, -1)
+
+    def _mass_factor(self, coef) -> TensorLike:
+        f = self.ws * self.detJ
+        return f if coef is None else f * coef
+
+    def _diffusion_factor(self, coef) -> TensorLike:
+        # w |det J| J^{-1} J^{-T}, shaped (NC, NQ, TD, TD)
+        G = bm.einsum('cqkm, cqlm -> cqkl', self.invJ, self.invJ)
+        f = self._mass_factor(coef)
+        return G * f[..., None, None]
+
+    def mass_apply(self, uc: TensorLike, coef: Optional[CoefLike]=None) -> TensorLike:
+        """Apply the cell mass matrices on the cell DoF values, matrix-free."""
+        return self._mass_apply(uc, self._mass_factor(self._coef(coef)))
+
+    def diffusion_apply(self, uc: TensorLike, coef: Optional[CoefLike]=None) -> TensorLike:
+        """Apply the cell stiffness matrices on the cell DoF values, matrix-free."""
+        return self._diffusion_apply(uc, self._diffusion_factor(self._coef(coef)))
+
+    def _mass_apply(self, uc: TensorLike, f: TensorLike) -> TensorLike:
+        return self.integrate_values(f * self.values(uc))
+
+    def _diffusion_apply(self, uc: TensorLike, G: TensorLike) -> TensorLike:
+        g = bm.einsum('cqkl, cql -> cqk', G, self.grad_values(uc))
+        return self.integrate_grad_values(g)
+
+    def _assemble(self, f: TensorLike, k: Optional[int], l: Optional[int]) -> TensorLike:
+        """The matrices sum_q f_q * d_k(phi_i) * d_l(phi_j), contracted axis by
+        axis from the last one, shaped (NC, ldof, ldof)."""
+        TD = self.TD
+        NC = f.shape[0]
+        nq = self.B.shape[0]
+        Mk, Ml = self._mats(k), self._mats(l)
+        # (NC, q_0 ... q_a, i_{a+1} j_{a+1} ... i_d j_d)
+        u = f.reshape(NC, -1, nq, 1)
+        for a in reversed(range(TD)):
+            P = bm.einsum('qi, qj -> qij', Mk[a], Ml[a]).reshape(nq, -1)
+            u = bm.einsum('cmqr, qs -> cmsr', u, P)
+            u = u.reshape(NC, -1, nq, u.shape[-2] * u.shape[-1]) if a > 0 else u
+        n = self.p + 1
+        ldof = n**TD
+        # (NC, i_1 j_1 i_2 j_2 ...) -> (NC, i_1 i_2 ..., j_1 j_2 ...)
+        u = u.reshape((NC, ) + (n, n) * TD)
+        perm = (0, ) + tuple(range(1, 2*TD, 2)) + tuple(range(2, 2*TD + 1, 2))
+        return bm.permute_dims(u, perm).reshape(NC, ldof, ldof)
+
+    def mass_matrix(self, coef: Optional[CoefLike]=None) -> TensorLike:
+        """The cell mass matrices, shaped (NC, ldof, ldof)."""
+        f = self._mass_factor(self._coef(coef))
+        return self._assemble(f * bm.ones_like(self.detJ), None, None)
+
+    def diffusion_matrix(self, coef: Optional[CoefLike]=None) -> TensorLike:
+        """The cell stiffness matrices, shaped (NC, ldof, ldof)."""
+        G = self._diffusion_factor(self._coef(coef))
+        val = 0.
+        for k in range(self.TD):
+            val = val + self._assemble(G[..., k, k], k, k)
+            for l in range(k + 1, self.TD):
+                # G is symmetric, so the (l, k) term is the transpose.
+                A = self._assemble(G[..., k, l], k, l)
+                val = val + A + bm.swapaxes(A, -1, -2)
+        return val
+
+    def diffusion_diagonal(self, coef: Optional[CoefLike]=None) -> TensorLike:
+        """Diagonals of the cell stiffness matrices, shaped (NC, ldof)."""
+        return self._diffusion_diagonal(self._diffusion_factor(self._coef(coef)))
+
+    def mass_diagonal(self, coef: Optional[CoefLike]=None) -> TensorLike:
+        """Diagonals of the cell mass matrices, shaped (NC, ldof)."""
+        return self._mass_diagonal(self._mass_factor(self._coef(coef)))
+
+    def _diffusion_diagonal(self, G: TensorLike) -> TensorLike:
+        NC = G.shape[0]
+        shape = (NC, ) + (self.B.shape[0], ) * self.TD
+        val = 0.
+        for k in range(self.TD):
+            for l in range(self.TD):
+                mats = [Mk * Ml for Mk, Ml in zip(self._mats(k), self._mats(l))]
+                v = G[..., k, l].reshape(shape)
+                val = val + self._contract(v, mats, transpose=True)
+        return val.reshape(NC, -1)
+
+    def _mass_diagonal(self, f: TensorLike) -> TensorLike:
+        f = f * bm.ones_like(self.detJ)
+        NC = f.shape[0]
+        v = f.reshape((NC, ) + (self.B.shape[0], ) * self.TD)
+        mats = [M * M for M in self._mats(None)]
+        return self._contract(v, mats, transpose=True).reshape(NC, -1)
+
+class SumFactorizationOperator():
+    """Matrix-free operator of `diffusion * (grad u, grad v) + mass * (u, v)`
+    on a Lagrange space of a tensor-product mesh, applied cell by cell with the
+    sum-factorized kernels. The coefficients are evaluated once in `__init__`.
+
+    Parameters:
+        space (LagrangeFESpace): The scalar Lagrange space on a tensor-product mesh.
+        diffusion (CoefLike | None, optional): The diffusion coefficient, or None
+            for no diffusion term. Defaults to 1.0.
+        mass (CoefLike | None, optional): The mass coefficient, or None for no
+            mass term. Defaults to None.
+        q (int | None, optional): Number of the 1-d quadrature points.
+            Defaults to p + 3.
+
+    Example:
+    ```
+        A = SumFactorizationOperator(space, diffusion=1.0, mass=1.0)
+        x = cg(A, b, M=JacobiPreconditioner(A))
+    ```
+    """
+    def __init__(self, space, diffusion: Optional[CoefLike]=1.0,
+                 mass: Optional[CoefLike]=None, q: Optional[int]=None) -> None:
+        self.space = space
+        self.kernel = SumFactorization(space, q)
+        self.cell2dof = space.cell_to_dof()
+        gdof = space.number_of_global_dofs()
+        self.shape = (gdof, gdof)
+        kernel = self.kernel
+        self._G = None if diffusion is None else kernel._diffusion_factor(kernel._coef(diffusion))
+        self._f = None if mass is None else kernel._mass_factor(kernel._coef(mass))
+
+    def _cell_apply(self, uc: TensorLike) -> TensorLike:
+        val = 0.
+        if self._G is not None:
+            val = val + self.kernel._diffusion_apply(uc, self._G)
+        if self._f is not None:
+            val = val + self.kernel._mass_apply(uc, self._f)
+        return val
+
+    def _scatter(self, vc: TensorLike) -> TensorLike:
+        v = bm.zeros((self.shape[0], ), dtype=vc.dtype, device=bm.get_device(vc))
+        return bm.index_add(v, self.cell2dof.reshape(-1), vc.reshape(-1))
+
+    def __matmul__(self, u: TensorLike) -> TensorLike:
+        return self._scatter(self._cell_apply(u[self.cell2dof]))
+
+    def diagonal(self) -> TensorLike:
+        """The main diagonal of the operator, shaped (gdof,)."""
+        val = 0.
+        if self._G is not None:
+            val = val + self.kernel._diffusion_diagonal(self._G)
+        if self._f is not None:
+            val = val + self.kernel._mass_diagonal(self._f)
+        return self._scatter(val)
@@ -0,0 +1,17 @@
+from ..functionspace.space import FunctionSpace as _FS
+from .scalar_robin_bc_integrator import ScalarRobinBCIntegrator
+
+
+class VectorRobinBCIntegrator(ScalarRobinBCIntegrator):
+    """The Robin boundary term `(kappa u, v)` of the vector-valued functions in
+    a `TensorFunctionSpace`, e.g. the elastic support `sigma(u) n + kappa u = g`.
+
+    The tensor basis is contracted over its components, so `kappa` is a
+    scalar coefficient applied to every component. See `ScalarRobinBCIntegrator`
+    for the parameters.
+    """
+    def fetch(self, space: _FS):
+        if not hasattr(space, 'scalar_space'):
+            raise TypeError(f"The {self.__class__.__name__} requires a TensorFunctionSpace, "
+                            f"but got {type(space).__name__}.")
+        return super().fetch(space)
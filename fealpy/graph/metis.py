@@ -117,7 +117,7 @@ try:
 except ImportError:
     networkx = None
 
-__all__ = ['part_graph', 'networkx_to_metis', 'adjlist_to_metis']
+__all__ = ['part_graph', 'part_csr', 'node_nd', 'networkx_to_metis', 'adjlist_to_metis']
 
 # Sadly, METIS does not currently include any API call to determine
 # the correct datatypes. So we either have to guess, let the user tell
@@ -735,8 +735,65 @@ def _METIS_PartGraphRecursive(nvtxs, ncon, xadj, adjncy, vwgt, vsize,
     return _METIS_PartGraphRecursive.call(nvtxs, ncon, xadj, adjncy, vwgt, vsize,
                 adjwgt, nparts, tpwgts, ubvec, options, objval, part)
 
+@_wrapdll(P(idx_t), P(idx_t), P(idx_t), P(idx_t), P(idx_t), P(idx_t), P(idx_t))
+def _METIS_NodeND(nvtxs, xadj, adjncy, vwgt, options, perm, iperm):
+    """
+    Called by `node_nd`
+    """
+    return _METIS_NodeND.call(nvtxs, xadj, adjncy, vwgt, options, perm, iperm)
+
 ### End METIS wrappers. ###
 
+def node_nd(adj, adjLocation, **opts):
+    """ Compute the fill-reducing ordering of a graph by nested dissection
+
+    Returns a 2-tuple `(perm, iperm)`. Row i of the permuted matrix is the
+    row perm[i] of the original one, and iperm is the inverse of perm.
+
+    :param adj: the adjacency list of the graph without self loops, in the
+      CSR format together with `adjLocation`.
+    :param adjLocation: the offsets of each vertex in `adj`.
+    """
+    adj = np.ascontiguousarray(adj, dtype=np.int32)
+    adjLocation = np.ascontiguousarray(adjLocation, dtype=np.int32)
+    graph = array_to_metis(adj, adjLocation)
+    options = METIS_Options(**opts)
+
+    perm = (idx_t*graph.nvtxs.value)()
+    iperm = (idx_t*graph.nvtxs.value)()
+    _METIS_NodeND(byref(graph.nvtxs), graph.xadj, graph.adjncy, graph.vwgt,
+                  options.array, perm, iperm)
+
+    return np.ctypeslib.as_array(perm), np.ctypeslib.as_array(iperm)
+
+def part_csr(adj, adjLocation, nparts=2, recursive=False, **opts):
+    """ Partition a graph given in the CSR format by k-way or recursive methods
+
+    Returns a 2-tuple `(objval, parts)` as :func:`part_graph`.
+
+    :param adj: the adjacency list of the graph without self loops, in the
+      CSR format together with `adjLocation`.
+    :param adjLocation: the offsets of each vertex in `adj`.
+    """
+    adj = np.ascontiguousarray(adj, dtype=np.int32)
+    adjLocation = np.ascontiguousarray(adjLocation, dtype=np.int32)
+    graph = array_to_metis(adj, adjLocation)
+    options = METIS_Options(**opts)
+
+    nparts_var = idx_t(nparts)
+    objval = idx_t()
+    partition = (idx_t*graph.nvtxs.value)()
+    args = (byref(graph.nvtxs), byref(graph.ncon), graph.xadj,
+            graph.adjncy, graph.vwgt, graph.vsize, graph.adjwgt,
+            byref(nparts_var), None, None, options.array,
+            byref(objval), partition)
+    if recursive:
+        _METIS_PartGraphRecursive(*args)
+    else:
+        _METIS_PartGraphKway(*args)
+
+    return objval.value, np.ctypeslib.as_array(partition)
+
 def part_mesh(mesh, entity='cell', nparts=2, 
         tpwgts=None, ubvec=None, recursive=False, **opts):
     """ Perform graph partitioning using k-way or recursive methods
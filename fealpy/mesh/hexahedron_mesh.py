@@ -36,7 +36,8 @@ class HexahedronMesh(TensorMesh, Plotable):
             [2, 4], [4, 3], [3, 5], [5, 2],
             [1, 4], [1, 3], [1, 5], [2, 1]], **kwargs)
 
-        self.construct()
+        if not self._restore_topology():
+            self.construct()
         self.nodedata = {}
         self.edgedata = {}
         self.facedata = {} 
@@ -45,7 +45,8 @@ class IntervalMesh(SimplexMesh,Plotable):
         self.itype = self.cell.dtype
         self.ftype = self.node.dtype
 
-        self.construct()
+        if not self._restore_topology():
+            self.construct()
         self.face2cell = self.face_to_cell()
 
 
@@ -62,7 +63,7 @@ class IntervalMesh(SimplexMesh,Plotable):
         @brief 返回第 k 个高斯积分公式。
         """
         from ..quadrature import GaussLegendreQuadrature
-        return GaussLegendreQuadrature(q)
+        return GaussLegendreQuadrature(q, dtype=self.ftype, device=self.device)
     
     def entity_measure(self, etype: Union[int, str]='cell', index:Index=_S, node=None):
         """
@@ -78,10 +78,11 @@ class LagrangeTriangleMesh(HomogeneousMesh):
 
         if isinstance(etype, str):
             etype = estr2dim(self, etype)
+        kwargs = {'dtype': self.ftype, 'device': self.device}
         if etype == 2:
-            quad = TriangleQuadrature(q)
+            quad = TriangleQuadrature(q, **kwargs)
         elif etype == 1:
-            quad = GaussLegendreQuadrature(q)
+            quad = GaussLegendreQuadrature(q, **kwargs)
         else:
             raise ValueError(f"Unsupported entity or top-dimension: {etype}")
 
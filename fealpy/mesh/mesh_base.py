@@ -25,6 +25,41 @@ class Mesh(MeshDS):
 
     GD = property(geo_dimension)
 
+    def save(self, path: str) -> None:
+        """Save the mesh into a directory of `.npy` files.
+
+        The nodes, cells, the topology built by `construct()` and the tensors
+        in the node/edge/face/cell data are stored, with a `meta.json` recording
+        the format version, the mesh class and the checksums of the arrays.
+
+        Parameters:
+            path (str): The directory, created if not existing.
+        """
+        from .mesh_io import save_mesh
+        save_mesh(self, path)
+
+    @classmethod
+    def load(cls, path: str, *, mmap_mode: Optional[str]='r', verify: bool=False):
+        """Load a mesh saved by `save`, restoring the saved topology.
+
+        With the default `mmap_mode='r'`, the arrays are memory-mapped read-only
+        and shared among the processes loading the same directory. Load with
+        `mmap_mode='c'` (copy-on-write) or None to modify the mesh in place.
+
+        Parameters:
+            path (str): The mesh directory.
+            mmap_mode (str | None, optional): Memory-map mode of `numpy.load`.\
+                Defaults to 'r'.
+            verify (bool, optional): Verify the CRC-32 checksums of the arrays,\
+                which reads all the data. The shapes and dtypes are always checked.\
+                Defaults to False.
+
+        Returns:
+            Mesh: The mesh, of the saved class.
+        """
+        from .mesh_io import load_mesh
+        return load_mesh(cls, path, mmap_mode=mmap_mode, verify=verify)
+
     def multi_index_matrix(self, p: int, etype: int, dtype=None, device=None) -> TensorLike:
         dtype = self.itype if dtype is None else dtype
         device = self.device if device is None else device
@@ -373,6 +408,46 @@ class HomogeneousMesh(Mesh):
     def face_to_ipoint(self, p: int, index: Index=_S) -> TensorLike:
         raise NotImplementedError
 
+    def prolongation_matrix(self, p0: int, p1: int):
+        """Interpolation of the continuous Lagrange functions of order `p0`
+        into the space of order `p1`, where `0 < p0 < p1`.
+
+        The transfer matrix on the reference cell (the order-`p0` shape functions
+        at the order-`p1` interpolation points) is computed once, and scattered
+        to the global interpolation points.
+
+        Parameters:
+            p0 (int): The lower order.
+            p1 (int): The higher order.
+
+        Returns:
+            CSRTensor: The prolongation matrix shaped (gdof1, gdof0).
+        """
+        from ..sparse import CSRTensor
+
+        if not 0 < p0 < p1:
+            raise ValueError(f"Expected 0 < p0 < p1, but got p0={p0} and p1={p1}.")
+        phi = self._reference_prolongation(p0, p1) # (ldof1, ldof0)
+        c2p0 = self.cell_to_ipoint(p0)
+        c2p1 = self.cell_to_ipoint(p1)
+        gdof0 = self.number_of_global_ipoints(p0)
+        gdof1 = self.number_of_global_ipoints(p1)
+        NC, ldof1 = c2p1.shape
+        kwargs = {'dtype': c2p1.dtype, 'device': bm.get_device(c2p1)}
+
+        # Any cell containing an interpolation point gives the same row.
+        loc = bm.zeros((gdof1, ), **kwargs)
+        loc = bm.set_at(loc, bm.reshape(c2p1, (-1, )), bm.arange(NC*ldof1, **kwargs))
+        col = c2p0[loc // ldof1]
+        val = phi[loc % ldof1]
+        flag = bm.abs(val) > 1e-12
+        crow = bm.concatenate([bm.zeros((1, ), **kwargs),
+                               bm.cumsum(bm.sum(flag, axis=1), axis=0)])
+        return CSRTensor(crow, col[flag], val[flag], spshape=(gdof1, gdof0))
+
+    def _reference_prolongation(self, p0: int, p1: int) -> TensorLike:
+        raise NotImplementedError
+
     # tools
     def integral(self, f, q=3, celltype=False) -> TensorLike:
         """
@@ -467,6 +542,11 @@ class SimplexMesh(HomogeneousMesh):
         nums = [self.entity(i).shape[0] for i in range(self.TD+1)]
         return simplex_gdof(p, nums)
 
+    def _reference_prolongation(self, p0: int, p1: int) -> TensorLike:
+        TD = self.top_dimension()
+        bcs = bm.multi_index_matrix(p1, TD, dtype=self.ftype) / p1
+        return self.shape_function(bcs, p=p0)
+
     # shape function
     def grad_lambda(self, index: Index=_S) -> TensorLike:
         raise NotImplementedError
@@ -544,6 +624,11 @@ class TensorMesh(HomogeneousMesh):
     face_bc_to_point = bc_to_point
     cell_bc_to_point = bc_to_point
 
+    def _reference_prolongation(self, p0: int, p1: int) -> TensorLike:
+        TD = self.top_dimension()
+        bc = bm.multi_index_matrix(p1, 1, dtype=self.ftype) / p1
+        return self.shape_function((bc, ) * TD, p=p0)
+
     # shape function
     def grad_lambda(self, index: Index=_S) -> TensorLike:
         raise NotImplementedError
@@ -256,6 +256,33 @@ class MeshDS(metaclass=MeshMeta):
         total_edge = cell[..., local_edge].reshape(-1, NVE)
         return total_edge
 
+    @classmethod
+    def _from_topology(cls, node: TensorLike, cell: TensorLike,
+                       topology: Dict[str, TensorLike]):
+        """Build the mesh by its constructor, taking the topology given instead
+        of calling `construct()`, e.g. the arrays of a saved mesh. Only for the
+        classes calling `_restore_topology()` in `__init__`.
+
+        Parameters:
+            node (TensorLike): The nodes.
+            cell (TensorLike): The cells.
+            topology (Dict[str, TensorLike]): The entities and the relations\
+                set by `construct()`, e.g. 'edge', 'face2cell' and 'cell2edge'.
+        """
+        mesh = cls.__new__(cls)
+        object.__setattr__(mesh, '_topology', topology)
+        mesh.__init__(node, cell)
+        return mesh
+
+    def _restore_topology(self) -> bool:
+        """Set the topology passed by `_from_topology`, if any."""
+        topology = self.__dict__.pop('_topology', None)
+        if topology is None:
+            return False
+        for name, value in topology.items():
+            setattr(self, name, value)
+        return True
+
     def construct(self):
         if not self.is_homogeneous():
             raise RuntimeError('Can not construct for a non-homogeneous mesh.')
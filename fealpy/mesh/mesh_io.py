@@ -0,0 +1,176 @@
+"""
+Binary directory format of meshes, loaded by memory mapping.
+
+A mesh directory holds one `.npy` file per array and a `meta.json` written
+last, recording the format version, the mesh class, and the shape, dtype and
+CRC-32 checksum of every array. The entities and the topology built by
+`construct()` are stored, so loading skips the topology reconstruction and
+the loaded mesh keeps the saved numbering of the edges and faces.
+"""
+import os
+import json
+import zlib
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from .. import logger
+from .utils import estr2dim
+from .mesh_base import StructuredMesh
+
+FORMAT_NAME = 'fealpy-mesh'
+FORMAT_VERSION = 1
+
+_ENTITIES = ('node', 'edge', 'face', 'cell')
+_TOPOLOGY = ('face2cell', 'cell2face', 'edge2cell', 'cell2edge')
+_DATA = ('nodedata', 'edgedata', 'facedata', 'celldata', 'meshdata')
+_CHUNK = 1 << 24
+
+
+def _checksum(array: np.ndarray) -> int:
+    buf = np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+    crc = 0
+    for start in range(0, buf.shape[0], _CHUNK):
+        crc = zlib.crc32(buf[start:start+_CHUNK], crc)
+    return crc
+
+
+def _entry(array: np.ndarray, fname: str) -> Dict[str, Any]:
+    return {'file': fname, 'shape': list(array.shape), 'dtype': array.dtype.str,
+            'crc32': _checksum(array)}
+
+
+def save_mesh(mesh, path: str) -> None:
+    """Save the mesh into the directory `path`, see `Mesh.save`."""
+    if isinstance(mesh, StructuredMesh):
+        raise TypeError("Structured meshes can not be saved in the binary format.")
+    if not mesh.is_homogeneous():
+        raise TypeError("Only homogeneous meshes can be saved in the binary format.")
+    os.makedirs(path, exist_ok=True)
+    meta_file = os.path.join(path, 'meta.json')
+    if os.path.exists(meta_file):
+        os.remove(meta_file) # invalidate the directory until the arrays are written
+
+    arrays: Dict[str, Any] = {}
+    alias: Dict[str, str] = {}
+    saved: Dict[int, str] = {}
+
+    def write(name: str, value) -> None:
+        if id(value) in saved:
+            alias[name] = saved[id(value)]
+            return
+        array = bm.to_numpy(value)
+        fname = name + '.npy'
+        np.save(os.path.join(path, fname), array)
+        arrays[name] = _entry(array, fname)
+        saved[id(value)] = name
+
+    for name in _ENTITIES:
+        value = mesh.storage().get(estr2dim(mesh, name))
+        if value is not None:
+            write(name, value)
+    for name in _TOPOLOGY:
+        if name in mesh.__dict__:
+            write(name, mesh.__dict__[name])
+
+    data = {}
+    for dname in _DATA:
+        d = getattr(mesh, dname, None)
+        if not isinstance(d, dict):
+            continue
+        if id(d) in saved:
+            data[dname] = saved[id(d)]
+            continue
+        saved[id(d)] = dname
+        keys = []
+        for key, value in d.items():
+            if not bm.is_tensor(value):
+                logger.warning(f"save_mesh: {dname}['{key}'] is not a tensor "
+                               "and is not saved.")
+                continue
+            write(f'{dname}.{key}', value)
+            keys.append(key)
+        data[dname] = keys
+
+    meta = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'class': mesh.__class__.__name__,
+        'TD': mesh.TD,
+        'arrays': arrays,
+        'alias': alias,
+        'data': data,
+    }
+    with open(meta_file, 'w') as f:
+        json.dump(meta, f, indent=1)
+
+
+def read_meta(path: str) -> Dict[str, Any]:
+    meta_file = os.path.join(path, 'meta.json')
+    if not os.path.exists(meta_file):
+        raise FileNotFoundError(f"{path} is not a complete mesh directory, "
+                                "meta.json is missing.")
+    with open(meta_file, 'r') as f:
+        meta = json.load(f)
+    if meta.get('format') != FORMAT_NAME:
+        raise ValueError(f"{path} is not a fealpy mesh directory.")
+    if meta['version'] > FORMAT_VERSION:
+        raise ValueError(f"Mesh format version {meta['version']} is newer than "
+                         f"the supported version {FORMAT_VERSION}.")
+    return meta
+
+
+def load_arrays(path: str, meta: Dict[str, Any], mmap_mode: Optional[str]='r',
+                verify: bool=False) -> Dict[str, Any]:
+    """Load the arrays of a mesh directory as tensors, checking the shapes and
+    dtypes against the meta data, and the checksums if `verify` is True."""
+    arrays = {}
+    for name, entry in meta['arrays'].items():
+        array = np.load(os.path.join(path, entry['file']), mmap_mode=mmap_mode,
+                        allow_pickle=False)
+        if list(array.shape) != entry['shape'] or array.dtype.str != entry['dtype']:
+            raise ValueError(f"The array '{name}' in {path} is corrupted: expected "
+                             f"{tuple(entry['shape'])} {entry['dtype']}, but got "
+                             f"{array.shape} {array.dtype.str}.")
+        if verify and _checksum(array) != entry['crc32']:
+            raise ValueError(f"Checksum mismatch of the array '{name}' in {path}.")
+        arrays[name] = bm.from_numpy(array)
+    for name, target in meta['alias'].items():
+        arrays[name] = arrays[target]
+    return arrays
+
+
+def load_mesh(cls, path: str, mmap_mode: Optional[str]='r', verify: bool=False):
+    """Load a mesh from the directory `path`, see `Mesh.load`."""
+    from .. import mesh as mesh_module
+
+    meta = read_meta(path)
+    mesh_class = getattr(mesh_module, meta['class'], None)
+    if mesh_class is None or not issubclass(mesh_class, cls):
+        raise TypeError(f"The mesh in {path} is a {meta['class']}, "
+                        f"which is not a {cls.__name__}.")
+    arrays = load_arrays(path, meta, mmap_mode, verify)
+
+    TD = meta['TD']
+    topology = {}
+    for name, dim in (('edge', 1), ('face', TD - 1)):
+        if name in arrays and 0 < dim < TD:
+            topology[name] = arrays[name]
+    for name in _TOPOLOGY:
+        if name in arrays:
+            topology[name] = arrays[name]
+    mesh = mesh_class._from_topology(arrays['node'], arrays['cell'], topology)
+
+    for dname, keys in meta['data'].items():
+        if isinstance(keys, str): # shared dict, e.g. facedata of triangle meshes
+            setattr(mesh, dname, getattr(mesh, keys))
+            continue
+        d = getattr(mesh, dname, None)
+        if d is None:
+            d = {}
+            setattr(mesh, dname, d)
+        for key in keys:
+            d[key] = arrays[f'{dname}.{key}']
+
+    return mesh
@@ -5,439 +5,218 @@ from ..backend import TensorLike
 
 from .opt import MeshCellQuality
 
+# The adjacency of the local triangle: _TRI_OPP[i, j] is the edge opposite
+# to the vertex other than i and j, the skew pattern gives the rotation part.
+_TRI_OPP = ((0, 2, 1), (2, 1, 0), (1, 0, 2))
+_TRI_SKEW = ((0., -1., 1.), (1., 0., -1.), (-1., 1., 0.))
+# The local node whose coordinate appears in the entry (i, j) of the skew
+# blocks of a tetrahedron. Diagonal entries are masked out.
+_TET_SKEW = ((0, 2, 3, 1), (3, 0, 0, 2), (1, 3, 0, 0), (2, 0, 1, 0))
+
+
 class RadiusRatioQuality(MeshCellQuality):
     def __init__(self,mesh):
         self.mesh = mesh
 
     def fun(self,x:TensorLike) -> TensorLike:
-        node = x
         cell = self.mesh.entity('cell')
-        NC = self.mesh.number_of_cells()
+        xc = x[cell]
 
         if self.mesh.top_dimension() == 2:
-            localEdge = self.mesh.localEdge
-            v = [node[cell[:,j],:] - node[cell[:,i],:] for i,j in localEdge]
-            l2 = bm.zeros((NC, 3))
-            for i in range(3):
-                l2[:, i] = bm.sum(v[i]**2, axis=1)
-            l = bm.sqrt(l2)
-            p = l.sum(axis=1)
-            q = l.prod(axis=1)
-            area = bm.cross(v[2], -v[1])/2
+            v, area = self._triangle_geometry(xc)
+            l = bm.sqrt(bm.sum(v**2, axis=-1))
+            p = bm.sum(l, axis=1)
+            q = bm.prod(l, axis=1)
             quality = p*q/(16*area**2)
         elif self.mesh.top_dimension() == 3:
-            s = self.mesh.face_area()
-            cell2face = self.mesh.cell_to_face()
-            ss = bm.sum(s[cell2face], axis=1)
-            d = self.mesh.direction(0)
+            v10 = xc[:, 0] - xc[:, 1]
+            v20 = xc[:, 0] - xc[:, 2]
+            v30 = xc[:, 0] - xc[:, 3]
+            s, vol = self._tetrahedron_measure(xc)
+            ss = bm.sum(s, axis=1)
+            l10 = bm.sum(v10**2, axis=-1, keepdims=True)
+            l20 = bm.sum(v20**2, axis=-1, keepdims=True)
+            l30 = bm.sum(v30**2, axis=-1, keepdims=True)
+            d = l10*bm.cross(v20, v30) + l20*bm.cross(v30, v10) + l30*bm.cross(v10, v20)
             ld = bm.sqrt(bm.sum(d**2, axis=1))
-            vol = self.mesh.cell_volume()
             R = ld/vol/12.0
             r = 3.0*vol/ss
             quality = R/r/3.0
         return quality
 
     def jac(self,x:TensorLike) -> TensorLike:
-        #node = self.mesh.entity('node')
-        node = x
         cell = self.mesh.entity('cell')
-        NC = self.mesh.number_of_cells()
-        NN = self.mesh.number_of_nodes()
+        return self._cell_jac(x[cell])
 
+    def hess(self,x:TensorLike):
+        """Frozen-coefficient Hessian blocks of the cell quality.
+
+        As the quality is invariant under scaling, the gradient reads
+        grad = M(x) x, where the local matrix M is [[A, B], [-B, A]] for
+        triangles and [[A, B2, B1], [-B2, A, B0], [-B1, -B0, A]] for tetrahedra.
+        M is the matrix of the block Jacobi smoothing; see `cell_hess` for
+        the exact Hessian.
+
+        Returns:
+            Tuple[TensorLike, ...]: `(A, B)` for triangles and `(A, B0, B1, B2)`\
+            for tetrahedra, each shaped (NC, NVC, NVC).
+        """
+        cell = self.mesh.entity('cell')
         if self.mesh.TD == 2:
-            idxi = cell[:, 0]
-            idxj = cell[:, 1] 
-            idxk = cell[:, 2] 
-
-            v0 = node[idxk] - node[idxj]
-            v1 = node[idxi] - node[idxk]
-            v2 = node[idxj] - node[idxi]
-
-            area = 0.5*(-v2[:, [0]]*v1[:, [1]] + v2[:, [1]]*v1[:, [0]])
-            l2 = bm.zeros((NC, 3), dtype=bm.float64)
-            l2[:, 0] = bm.sum(v0**2, axis=1)
-            l2[:, 1] = bm.sum(v1**2, axis=1)
-            l2[:, 2] = bm.sum(v2**2, axis=1)
-            l = bm.sqrt(l2)
-            p = l.sum(axis=1, keepdims=True)
-            q = l.prod(axis=1, keepdims=True)
-            mu = p*q/(16*area**2)
-
-            c = mu*(1/(p*l)+1/l2)
-            cn = mu/area
-
-            grad = bm.zeros((NC, 3, 2), dtype=bm.float64)
-            cn = cn.reshape(-1)
-            grad[:,0,0] = c[:, 1]*v1[:,0] - c[:, 2]*v2[:,0] + cn*v0[:,1]
-            grad[:,0,1] = c[:, 1]*v1[:,1] - c[:, 2]*v2[:,1] - cn*v0[:,0]
-            grad[:,1,0] = -c[:, 0]*v0[:,0] + c[:, 2]*v2[:,0] + cn*v1[:,1]
-            grad[:,1,1] = -c[:, 0]*v0[:,1] + c[:, 2]*v2[:,1] - cn*v1[:,0]
-            grad[:,2,0] = c[:, 0]*v0[:,0] - c[:, 1]*v1[:,0] + cn*v2[:,1]
-            grad[:,2,1] = c[:, 0]*v0[:,1] - c[:, 1]*v1[:,1] - cn*v2[:,0]
-            return grad
-
+            return self._triangle_blocks(x[cell])
         elif self.mesh.TD == 3:
-            v10 = node[cell[:, 0]] - node[cell[:, 1]]
-            v20 = node[cell[:, 0]] - node[cell[:, 2]]
-            v30 = node[cell[:, 0]] - node[cell[:, 3]]
-
-            v21 = node[cell[:, 1]] - node[cell[:, 2]]
-            v31 = node[cell[:, 1]] - node[cell[:, 3]]
-            v32 = node[cell[:, 2]] - node[cell[:, 3]]
-
-            l10 = bm.sum(v10**2, axis=-1)
-            l20 = bm.sum(v20**2, axis=-1)
-            l30 = bm.sum(v30**2, axis=-1)
-            l21 = bm.sum(v21**2, axis=-1)
-            l31 = bm.sum(v31**2, axis=-1)
-            l32 = bm.sum(v32**2, axis=-1)
-
-            d0 = bm.zeros((NC, 3), dtype=self.mesh.ftype)
-            c12 =  bm.cross(v10, v20)
-            d0 += l30[:, None]*c12
-            c23 = bm.cross(v20, v30)
-            d0 += l10[:, None]*c23
-            c31 = bm.cross(v30, v10)
-            d0 += l20[:, None]*c31
-
-            c12 = bm.sum(c12*d0, axis=-1)
-            c23 = bm.sum(c23*d0, axis=-1)
-            c31 = bm.sum(c31*d0, axis=-1)
-            c = c12 + c23 + c31
-
-            A = bm.zeros((NC, 4, 4), dtype=self.mesh.ftype)
-            A[:, 0, 0]  = 2*c
-            A[:, 0, 1] -= 2*c23
-            A[:, 0, 2] -= 2*c31
-            A[:, 0, 3] -= 2*c12
-
-            A[:, 1, 1] = 2*c23
-            A[:, 2, 2] = 2*c31
-            A[:, 3, 3] = 2*c12
-            A[:, 1:, 0] = A[:, 0, 1:]
-            
-            K = bm.zeros((NC, 4, 4), dtype=self.mesh.ftype)
-            K[:, 0, 1] -= l30 - l20
-            K[:, 0, 2] -= l10 - l30
-            K[:, 0, 3] -= l20 - l10
-            K[:, 1:, 0] -= K[:, 0, 1:]
-
-            K[:, 1, 2] -= l30
-            K[:, 1, 3] += l20
-            K[:, 2:, 1] -= K[:, 1, 2:]
-
-            K[:, 2, 3] -= l10
-            K[:, 3, 2] += l10
-
-            S = bm.zeros((NC, 4, 4), dtype=self.mesh.ftype)
-            fm = self.mesh.entity_measure("face")
-            cm = self.mesh.entity_measure("cell")
-            c2f = self.mesh.cell_to_face()
-
-            s = fm[c2f]
-            s_sum = bm.sum(s, axis=-1)
-             
-            p0 = (l31/s[:,2] + l21/s[:,3] + l32/s[:,1])/4
-            p1 = (l32/s[:,0] + l20/s[:,3] + l30/s[:,2])/4
-            p2 = (l30/s[:,1] + l10/s[:,3] + l31/s[:,0])/4
-            p3 = (l10/s[:,2] + l20/s[:,1] + l21/s[:,0])/4
-
-            q10 = -(bm.sum(v31*v30, axis=-1)/s[:,2]+bm.sum(v21*v20, axis=-1)/s[:,3])/4
-            q20 = -(bm.sum(v32*v30, axis=-1)/s[:,1]+bm.sum(-v21*v10, axis=-1)/s[:,3])/4
-            q30 = -(bm.sum(-v32*v20, axis=-1)/s[:,1]+bm.sum(-v31*v10, axis=-1)/s[:,2])/4
-            q21 = -(bm.sum(v32*v31, axis=-1)/s[:,0]+bm.sum(v20*v10, axis=-1)/s[:,3])/4
-            q31 = -(bm.sum(v30*v10, axis=-1)/s[:,2]+bm.sum(-v32*v21, axis=-1)/s[:,0])/4
-            q32 = -(bm.sum(v31*v21, axis=-1)/s[:,0]+bm.sum(v30*v20, axis=-1)/s[:,1])/4
-            
-            S[:, 0, 0] = p0
-            S[:, 0, 1] = q10
-            S[:, 0, 2] = q20
-            S[:, 0, 3] = q30
-            S[:, 1:,0] = S[:, 0, 1:]
-
-            S[:, 1, 1] = p1
-            S[:, 1, 2] = q21
-            S[:, 1, 3] = q31
-            S[:, 2:,1] = S[:, 1, 2:]
-
-            S[:, 2, 2] = p2
-            S[:, 2, 3] = q32
-            S[:, 3, 2] = q32
-            S[:, 3, 3] = p3
-            
-            C0 = bm.zeros((NC, 4, 4), dtype=bm.float64)
-            C1 = bm.zeros((NC, 4, 4), dtype=bm.float64)
-            C2 = bm.zeros((NC, 4, 4), dtype=bm.float64)
-            
-            def f(CC, xx):
-                CC[:, 0, 1] = xx[:, 2]
-                CC[:, 0, 2] = xx[:, 3]
-                CC[:, 0, 3] = xx[:, 1]
-                CC[:, 1, 0] = xx[:, 3]
-                CC[:, 1, 2] = xx[:, 0]
-                CC[:, 1, 3] = xx[:, 2]
-                CC[:, 2, 0] = xx[:, 1]
-                CC[:, 2, 1] = xx[:, 3]
-                CC[:, 2, 3] = xx[:, 0]
-                CC[:, 3, 0] = xx[:, 2]
-                CC[:, 3, 1] = xx[:, 0]
-                CC[:, 3, 2] = xx[:, 1]
-
-            f(C0, node[cell, 0])
-            f(C1, node[cell, 1])
-            f(C2, node[cell, 2])
-
-            C0 = 0.5*(-C0 + C0.swapaxes(-1, -2))
-            C1 = 0.5*(C1  - C1.swapaxes(-1, -2))
-            C2 = 0.5*(-C2 + C2.swapaxes(-1, -2))
-            
-            B0 = -d0[:,0,None,None]*K
-            B1 = d0[:,1,None,None]*K
-            B2 = -d0[:,2,None,None]*K
-            
-            ld0 = bm.sum(d0**2,axis=-1)
-     
-            A  /= ld0[:,None,None]
-            B0 /= ld0[:,None,None]
-            B1 /= ld0[:,None,None]
-            B2 /= ld0[:,None,None]
-
-            S  /= s_sum[:,None,None]
-
-            #''' 
-            C0 /= 3*cm[:,None,None]
-            C1 /= 3*cm[:,None,None]
-            C2 /= 3*cm[:,None,None]
-            '''
-            C0 /= 3
-            C1 /= 3
-            C2 /= 3
-            '''
-            A  += S
-            B0 -= C0
-            B1 -= C1
-            B2 -= C2
-
-            mu = s_sum*bm.sqrt(ld0)/(108*cm**2)
-            #mu = s_sum*np.sqrt(ld0)/(108)
-
-            #''' 
-            A  *= mu[:,None,None]/NC
-            B0 *= mu[:,None,None]/NC
-            B1 *= mu[:,None,None]/NC
-            B2 *= mu[:,None,None]/NC
-            '''
-            A  *= mu[:,None,None]
-            B0 *= mu[:,None,None]
-            B1 *= mu[:,None,None]
-            B2 *= mu[:,None,None]
-            '''
-            cell_node = node[cell]
-            grad = bm.zeros((NC, 4, 3), dtype=bm.float64)
-
-            grad[:, :, 0]=bm.einsum('ijk,ik->ij',A,cell_node[:,:,0])+bm.einsum('ijk,ik->ij',B2,cell_node[:,:,1])+bm.einsum('ijk,ik->ij',B1,cell_node[:,:,2])
-
-            grad[:, :, 1]=bm.einsum('ijk,ik->ij', A,cell_node[:,:,1])-bm.einsum('ijk,ik->ij',B2,cell_node[:,:,0])+bm.einsum('ijk,ik->ij',B0,cell_node[:,:,2])
-
-            grad[:, :, 2]=bm.einsum('ijk,ik->ij', A,cell_node[:,:,2])-bm.einsum('ijk,ik->ij',B1,cell_node[:,:,0])-bm.einsum('ijk,ik->ij',B0,cell_node[:,:,1])
-            return grad
+            return self._tetrahedron_blocks(x[cell])
 
-    def hess(self,x:TensorLike):
-        #node = self.mesh.entity('node')
-        node = x
+    def cell_hess(self, x: TensorLike) -> TensorLike:
+        """Exact local Hessian matrices of the cell quality.
+
+        The columns are the complex-step derivatives of the analytic cell
+        gradient, which are free of cancellation errors.
+
+        Returns:
+            TensorLike: Hessian shaped (NC, NVC, GD, NVC, GD).
+        """
+        cell = self.mesh.entity('cell')
+        xc = x[cell]
+        NC, NVC, GD = xc.shape
+        E = bm.eye(NVC*GD, **bm.context(xc)).reshape(NVC*GD, NVC, GD)
+        H = bm.stack([self._cell_jvp(xc, E[i]) for i in range(NVC*GD)], axis=-1)
+        return H.reshape(NC, NVC, GD, NVC, GD)
+
+    def cell_hessp(self, x: TensorLike, p: TensorLike) -> TensorLike:
+        """Local Hessian-vector products, shaped (NC, NVC, GD), evaluated by a
+        single complex-step derivative of the cell gradient in the direction p."""
         cell = self.mesh.entity('cell')
-        NC = self.mesh.number_of_cells()
-        NN = self.mesh.number_of_nodes()
+        return self._cell_jvp(x[cell], p[cell])
 
+    def _cell_jac(self, xc: TensorLike) -> TensorLike:
         if self.mesh.TD == 2:
-            idxi = cell[:, 0]
-            idxj = cell[:, 1] 
-            idxk = cell[:, 2] 
-
-            v0 = node[idxk] - node[idxj]
-            v1 = node[idxi] - node[idxk]
-            v2 = node[idxj] - node[idxi]
-
-            area = 0.5*(-v2[:, [0]]*v1[:, [1]] + v2[:, [1]]*v1[:, [0]])
-            l2 = bm.zeros((NC, 3), dtype=bm.float64)
-            l2[:, 0] = bm.sum(v0**2, axis=1)
-            l2[:, 1] = bm.sum(v1**2, axis=1)
-            l2[:, 2] = bm.sum(v2**2, axis=1)
-            l = bm.sqrt(l2)
-            p = l.sum(axis=1, keepdims=True)
-            q = l.prod(axis=1, keepdims=True)
-            mu = p*q/(16*area**2)
-
-            c = mu*(1/(p*l)+1/l2)
-            cn = mu/area
-
-            A = bm.zeros((NC, 3, 3), dtype=bm.float64)
-            B = bm.zeros((NC, 3, 3), dtype=bm.float64)
-            A[:, 0, 0] = c[:, 1] + c[:, 2]
-            A[:, 0, 1] = -c[:, 2]
-            A[:, 0, 2] = -c[:, 1]
-            A[:, 1, 0] = -c[:, 2]
-            A[:, 1, 1] = c[:, 0] + c[:, 2]
-            A[:, 1, 2] = -c[:, 0]
-            A[:, 2, 0] = -c[:, 1]
-            A[:, 2, 1] = -c[:, 0]
-            A[:, 2, 2] = c[:, 0] + c[:, 1]
-
-            B[:, 0, 1] = B[:, 1, 2] = B[:, 2, 0] = -cn.reshape(-1)
-            B[:, 1, 0] = B[:, 2, 1] = B[:, 0, 2] = cn.reshape(-1)
-            return (A,B)
-
+            A, B = self._triangle_blocks(xc)
+            rows = [[A, B], [-B, A]]
         elif self.mesh.TD == 3:
-            v10 = node[cell[:, 0]] - node[cell[:, 1]]
-            v20 = node[cell[:, 0]] - node[cell[:, 2]]
-            v30 = node[cell[:, 0]] - node[cell[:, 3]]
-
-            v21 = node[cell[:, 1]] - node[cell[:, 2]]
-            v31 = node[cell[:, 1]] - node[cell[:, 3]]
-            v32 = node[cell[:, 2]] - node[cell[:, 3]]
-
-            l10 = bm.sum(v10**2, axis=-1)
-            l20 = bm.sum(v20**2, axis=-1)
-            l30 = bm.sum(v30**2, axis=-1)
-            l21 = bm.sum(v21**2, axis=-1)
-            l31 = bm.sum(v31**2, axis=-1)
-            l32 = bm.sum(v32**2, axis=-1)
-
-            d0 = bm.zeros((NC, 3), dtype=self.mesh.ftype)
-            c12 =  bm.cross(v10, v20)
-            d0 += l30[:, None]*c12
-            c23 = bm.cross(v20, v30)
-            d0 += l10[:, None]*c23
-            c31 = bm.cross(v30, v10)
-            d0 += l20[:, None]*c31
-
-            c12 = bm.sum(c12*d0, axis=-1)
-            c23 = bm.sum(c23*d0, axis=-1)
-            c31 = bm.sum(c31*d0, axis=-1)
-            c = c12 + c23 + c31
-
-            A = bm.zeros((NC, 4, 4), dtype=self.mesh.ftype)
-            A[:, 0, 0]  = 2*c
-            A[:, 0, 1] -= 2*c23
-            A[:, 0, 2] -= 2*c31
-            A[:, 0, 3] -= 2*c12
-
-            A[:, 1, 1] = 2*c23
-            A[:, 2, 2] = 2*c31
-            A[:, 3, 3] = 2*c12
-            A[:, 1:, 0] = A[:, 0, 1:]
-            
-            K = bm.zeros((NC, 4, 4), dtype=self.mesh.ftype)
-            K[:, 0, 1] -= l30 - l20
-            K[:, 0, 2] -= l10 - l30
-            K[:, 0, 3] -= l20 - l10
-            K[:, 1:, 0] -= K[:, 0, 1:]
-
-            K[:, 1, 2] -= l30
-            K[:, 1, 3] += l20
-            K[:, 2:, 1] -= K[:, 1, 2:]
-
-            K[:, 2, 3] -= l10
-            K[:, 3, 2] += l10
-
-            S = bm.zeros((NC, 4, 4), dtype=self.mesh.ftype)
-            fm = self.mesh.entity_measure("face")
-            cm = self.mesh.entity_measure("cell")
-            c2f = self.mesh.cell_to_face()
-
-            s = fm[c2f]
-            s_sum = bm.sum(s, axis=-1)
-             
-            p0 = (l31/s[:,2] + l21/s[:,3] + l32/s[:,1])/4
-            p1 = (l32/s[:,0] + l20/s[:,3] + l30/s[:,2])/4
-            p2 = (l30/s[:,1] + l10/s[:,3] + l31/s[:,0])/4
-            p3 = (l10/s[:,2] + l20/s[:,1] + l21/s[:,0])/4
-
-            q10 = -(bm.sum(v31*v30, axis=-1)/s[:,2]+bm.sum(v21*v20, axis=-1)/s[:,3])/4
-            q20 = -(bm.sum(v32*v30, axis=-1)/s[:,1]+bm.sum(-v21*v10, axis=-1)/s[:,3])/4
-            q30 = -(bm.sum(-v32*v20, axis=-1)/s[:,1]+bm.sum(-v31*v10, axis=-1)/s[:,2])/4
-            q21 = -(bm.sum(v32*v31, axis=-1)/s[:,0]+bm.sum(v20*v10, axis=-1)/s[:,3])/4
-            q31 = -(bm.sum(v30*v10, axis=-1)/s[:,2]+bm.sum(-v32*v21, axis=-1)/s[:,0])/4
-            q32 = -(bm.sum(v31*v21, axis=-1)/s[:,0]+bm.sum(v30*v20, axis=-1)/s[:,1])/4
-            
-            S[:, 0, 0] = p0
-            S[:, 0, 1] = q10
-            S[:, 0, 2] = q20
-            S[:, 0, 3] = q30
-            S[:, 1:,0] = S[:, 0, 1:]
-
-            S[:, 1, 1] = p1
-            S[:, 1, 2] = q21
-            S[:, 1, 3] = q31
-            S[:, 2:,1] = S[:, 1, 2:]
-
-            S[:, 2, 2] = p2
-            S[:, 2, 3] = q32
-            S[:, 3, 2] = q32
-            S[:, 3, 3] = p3
-            
-            C0 = bm.zeros((NC, 4, 4), dtype=bm.float64)
-            C1 = bm.zeros((NC, 4, 4), dtype=bm.float64)
-            C2 = bm.zeros((NC, 4, 4), dtype=bm.float64)
-            
-            def f(CC, xx):
-                CC[:, 0, 1] = xx[:, 2]
-                CC[:, 0, 2] = xx[:, 3]
-                CC[:, 0, 3] = xx[:, 1]
-                CC[:, 1, 0] = xx[:, 3]
-                CC[:, 1, 2] = xx[:, 0]
-                CC[:, 1, 3] = xx[:, 2]
-                CC[:, 2, 0] = xx[:, 1]
-                CC[:, 2, 1] = xx[:, 3]
-                CC[:, 2, 3] = xx[:, 0]
-                CC[:, 3, 0] = xx[:, 2]
-                CC[:, 3, 1] = xx[:, 0]
-                CC[:, 3, 2] = xx[:, 1]
-
-            f(C0, node[cell, 0])
-            f(C1, node[cell, 1])
-            f(C2, node[cell, 2])
-
-            C0 = 0.5*(-C0 + C0.swapaxes(-1, -2))
-            C1 = 0.5*(C1  - C1.swapaxes(-1, -2))
-            C2 = 0.5*(-C2 + C2.swapaxes(-1, -2))
-            
-            B0 = -d0[:,0,None,None]*K
-            B1 = d0[:,1,None,None]*K
-            B2 = -d0[:,2,None,None]*K
-            
-            ld0 = bm.sum(d0**2,axis=-1)
-     
-            A  /= ld0[:,None,None]
-            B0 /= ld0[:,None,None]
-            B1 /= ld0[:,None,None]
-            B2 /= ld0[:,None,None]
-
-            S  /= s_sum[:,None,None]
-
-            C0 /= 3*cm[:,None,None]
-            C1 /= 3*cm[:,None,None]
-            C2 /= 3*cm[:,None,None]
-
-            A  += S
-            B0 -= C0
-            B1 -= C1
-            B2 -= C2
-
-            mu = s_sum*bm.sqrt(ld0)/(108*cm**2)
-            #mu = s_sum*np.sqrt(ld0)/(108)
-
-            #''' 
-            A  *= mu[:,None,None]/NC
-            B0 *= mu[:,None,None]/NC
-            B1 *= mu[:,None,None]/NC
-            B2 *= mu[:,None,None]/NC
-            return (A,B0,B1,B2)
-
-
-
-
-
-
-        
-
+            A, B0, B1, B2 = self._tetrahedron_blocks(xc)
+            rows = [[A, B2, B1], [-B2, A, B0], [-B1, -B0, A]]
+        M = bm.stack([bm.stack(r, axis=-1) for r in rows], axis=-2)
+        return bm.einsum('nijab, njb -> nia', M, xc)
+
+    def _cell_jvp(self, xc: TensorLike, v: TensorLike) -> TensorLike:
+        h = 1e-30
+        xz = bm.astype(xc, bm.complex128) + 1j*h*v
+        return bm.astype(bm.imag(self._cell_jac(xz))/h, xc.dtype)
+
+    def _triangle_geometry(self, xc: TensorLike):
+        v = bm.stack([xc[:, 2] - xc[:, 1], xc[:, 0] - xc[:, 2], xc[:, 1] - xc[:, 0]], axis=1)
+        area = 0.5*(-v[:, 2, 0]*v[:, 1, 1] + v[:, 2, 1]*v[:, 1, 0])
+        return v, area
+
+    def _triangle_blocks(self, xc: TensorLike):
+        v, area = self._triangle_geometry(xc)
+        kwargs = bm.context(xc)
+        l2 = bm.sum(v**2, axis=-1)
+        l = bm.sqrt(l2)
+        p = bm.sum(l, axis=1, keepdims=True)
+        q = bm.prod(l, axis=1, keepdims=True)
+        area = area[:, None]
+        mu = p*q/(16*area**2)
+
+        c = mu*(1/(p*l)+1/l2)
+        cn = mu/area
+
+        opp = bm.tensor(_TRI_OPP, dtype=bm.int32, device=bm.get_device(xc))
+        eye = bm.eye(3, **kwargs)
+        A = bm.sum(c, axis=1)[:, None, None]*eye - c[:, opp]
+        B = cn[:, :, None]*bm.tensor(_TRI_SKEW, **kwargs)
+        return (A, B)
+
+    def _tetrahedron_measure(self, xc: TensorLike):
+        """Areas of the faces opposite to the vertices, and the cell volumes."""
+        v10 = xc[:, 0] - xc[:, 1]
+        v20 = xc[:, 0] - xc[:, 2]
+        v30 = xc[:, 0] - xc[:, 3]
+        v21 = xc[:, 1] - xc[:, 2]
+        v31 = xc[:, 1] - xc[:, 3]
+        n = bm.stack([bm.cross(v21, v31), bm.cross(v30, v20),
+                      bm.cross(v10, v30), bm.cross(v20, v10)], axis=1)
+        s = 0.5*bm.sqrt(bm.sum(n**2, axis=-1))
+        vol = -bm.sum(v30*bm.cross(v10, v20), axis=-1)/6.0
+        return s, vol
+
+    def _tetrahedron_blocks(self, xc: TensorLike):
+        kwargs = bm.context(xc)
+        v10 = xc[:, 0] - xc[:, 1]
+        v20 = xc[:, 0] - xc[:, 2]
+        v30 = xc[:, 0] - xc[:, 3]
+
+        v21 = xc[:, 1] - xc[:, 2]
+        v31 = xc[:, 1] - xc[:, 3]
+        v32 = xc[:, 2] - xc[:, 3]
+
+        l10 = bm.sum(v10**2, axis=-1)
+        l20 = bm.sum(v20**2, axis=-1)
+        l30 = bm.sum(v30**2, axis=-1)
+        l21 = bm.sum(v21**2, axis=-1)
+        l31 = bm.sum(v31**2, axis=-1)
+        l32 = bm.sum(v32**2, axis=-1)
+
+        c12 = bm.cross(v10, v20)
+        c23 = bm.cross(v20, v30)
+        c31 = bm.cross(v30, v10)
+        d0 = l30[:, None]*c12 + l10[:, None]*c23 + l20[:, None]*c31
+
+        c12 = bm.sum(c12*d0, axis=-1)
+        c23 = bm.sum(c23*d0, axis=-1)
+        c31 = bm.sum(c31*d0, axis=-1)
+        c = c12 + c23 + c31
+        z = bm.zeros_like(c)
+
+        A = 2*bm.stack([
+            bm.stack([c, -c23, -c31, -c12], axis=-1),
+            bm.stack([-c23, c23, z, z], axis=-1),
+            bm.stack([-c31, z, c31, z], axis=-1),
+            bm.stack([-c12, z, z, c12], axis=-1)
+        ], axis=-2)
+
+        K = bm.stack([
+            bm.stack([z, l20 - l30, l30 - l10, l10 - l20], axis=-1),
+            bm.stack([l30 - l20, z, -l30, l20], axis=-1),
+            bm.stack([l10 - l30, l30, z, -l10], axis=-1),
+            bm.stack([l20 - l10, -l20, l10, z], axis=-1)
+        ], axis=-2)
+
+        s, cm = self._tetrahedron_measure(xc)
+        s_sum = bm.sum(s, axis=-1)
+
+        p0 = (l31/s[:,2] + l21/s[:,3] + l32/s[:,1])/4
+        p1 = (l32/s[:,0] + l20/s[:,3] + l30/s[:,2])/4
+        p2 = (l30/s[:,1] + l10/s[:,3] + l31/s[:,0])/4
+        p3 = (l10/s[:,2] + l20/s[:,1] + l21/s[:,0])/4
+
+        q10 = -(bm.sum(v31*v30, axis=-1)/s[:,2]+bm.sum(v21*v20, axis=-1)/s[:,3])/4
+        q20 = -(bm.sum(v32*v30, axis=-1)/s[:,1]+bm.sum(-v21*v10, axis=-1)/s[:,3])/4
+        q30 = -(bm.sum(-v32*v20, axis=-1)/s[:,1]+bm.sum(-v31*v10, axis=-1)/s[:,2])/4
+        q21 = -(bm.sum(v32*v31, axis=-1)/s[:,0]+bm.sum(v20*v10, axis=-1)/s[:,3])/4
+        q31 = -(bm.sum(v30*v10, axis=-1)/s[:,2]+bm.sum(-v32*v21, axis=-1)/s[:,0])/4
+        q32 = -(bm.sum(v31*v21, axis=-1)/s[:,0]+bm.sum(v30*v20, axis=-1)/s[:,1])/4
+
+        S = bm.stack([
+            bm.stack([p0, q10, q20, q30], axis=-1),
+            bm.stack([q10, p1, q21, q31], axis=-1),
+            bm.stack([q20, q21, p2, q32], axis=-1),
+            bm.stack([q30, q31, q32, p3], axis=-1)
+        ], axis=-2)
+
+        # C[:, i, j] = x[:, _TET_SKEW[i, j]] off the diagonal, for each coordinate.
+        skew = bm.tensor(_TET_SKEW, dtype=bm.int32, device=bm.get_device(xc))
+        offdiag = 1.0 - bm.eye(4, **kwargs)
+        C = xc[:, skew, :]*offdiag[None, :, :, None]
+        C = 0.5*(C - bm.swapaxes(C, 1, 2))
+        C0, C1, C2 = -C[..., 0], C[..., 1], -C[..., 2]
+
+        ld0 = bm.sum(d0**2, axis=-1)[:, None, None]
+        A = A/ld0 + S/s_sum[:, None, None]
+        B0 = -d0[:, 0, None, None]*K/ld0 - C0/(3*cm[:, None, None])
+        B1 = d0[:, 1, None, None]*K/ld0 - C1/(3*cm[:, None, None])
+        B2 = -d0[:, 2, None, None]*K/ld0 - C2/(3*cm[:, None, None])
+
+        mu = (s_sum*bm.sqrt(ld0[:, 0, 0])/(108*cm**2))[:, None, None]
+        return (A*mu, B0*mu, B1*mu, B2*mu)
@@ -1,8 +1,9 @@
 
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
+from ..sparse import CSRTensor
 from ..opt import Objective
 from .mesh_base import Mesh
 
@@ -45,12 +46,56 @@ class MeshCellQuality():
         """
         raise NotImplementedError
 
+    def cell_hess(self, x: TensorLike) -> TensorLike:
+        """Local Hessian matrices of the mesh cell quality function.
+
+        Parameters:
+            x (TensorLike): Cartesian coordinates of the mesh nodes, shaped (NN, GD).
+
+        Returns:
+            TensorLike: Hessian of cell quality in the shape of (NC, NVC, GD, NVC, GD).
+        """
+        raise NotImplementedError
+
+    def cell_hessp(self, x: TensorLike, p: TensorLike) -> TensorLike:
+        """Local Hessian of the mesh cell quality function times a vector.
+
+        Parameters:
+            x (TensorLike): Cartesian coordinates of the mesh nodes, shaped (NN, GD).
+            p (TensorLike): The vector shaped (NN, GD).
+
+        Returns:
+            TensorLike: The products in the shape of (NC, NVC, GD).
+        """
+        cell = self.mesh.entity('cell')
+        return bm.einsum('niajb, njb -> nia', self.cell_hess(x), p[cell])
+
 _QT = TypeVar('_QT', bound=MeshCellQuality)
 
 
 class SumObjective(Objective, Generic[_QT]):
-    def __init__(self, mesh_quality: _QT, /):
+    """Sum of the cell quality over the mesh.
+
+    The degrees of freedom are the node coordinates flattened in the order of
+    `x.reshape(-1)`, i.e. the index of the coordinate `a` of the node `i` is
+    `i*GD + a`. Nodes flagged by `fixed` are excluded from the optimization:
+    their gradient vanishes and their rows and columns in the Hessian are
+    replaced by the identity.
+
+    The sparsity pattern of the global Hessian is the node-to-node graph of the
+    mesh, which is built in the first call of `hess` and reused as long as the
+    cells do not change.
+    """
+    def __init__(self, mesh_quality: _QT, /, fixed: Optional[TensorLike]=None):
+        """
+        Parameters:
+            mesh_quality (MeshCellQuality): The cell quality function.
+            fixed (TensorLike | None, optional): Boolean flags of the fixed nodes\
+                shaped (NN, ), e.g. `mesh.boundary_node_flag()`. Defaults to None.
+        """
         self.mesh_quality = mesh_quality
+        self.fixed = fixed
+        self._pattern = None
 
     def fun(self, x: TensorLike):
         """Objective function.
@@ -73,10 +118,78 @@ class SumObjective(Objective, Generic[_QT]):
             TensorLike: Gradient of cell quality in the shape of (NN, GD).
         """
         cell = self.mesh_quality.mesh.entity('cell')
-        NN = self.mesh_quality.mesh.number_of_nodes()
-        TD = self.mesh_quality.mesh.TD
         grad = self.mesh_quality.jac(x)
-        jacobi = bm.zeros((NN,TD))
-        for i in range(TD):
-            bm.index_add(jacobi[:,i],cell.flatten(),grad[:,:,i].flatten())
-        return jacobi 
+        jacobi = bm.zeros(x.shape, **bm.context(grad))
+        jacobi = bm.index_add(jacobi, cell.reshape(-1), grad.reshape(-1, x.shape[-1]))
+        return self._free_weight(x)*jacobi
+
+    def hess(self, x: TensorLike) -> CSRTensor:
+        """Hessian of the objective function.
+
+        Parameters:
+            x (TensorLike): Cartesian coordinates of the mesh nodes, shaped (NN, GD).
+
+        Returns:
+            CSRTensor: Global Hessian matrix shaped (NN*GD, NN*GD).
+        """
+        crow, col, slot, diag, shape, _ = self._get_pattern(x)
+        w = bm.broadcast_to(self._free_weight(x), x.shape).reshape(-1)
+        ldof = self._cell_to_dof(x)
+        H = self.mesh_quality.cell_hess(x)
+        NC, L = ldof.shape
+        H = bm.reshape(H, (NC, L, L))*w[ldof][:, :, None]*w[ldof][:, None, :]
+        values = bm.zeros((col.shape[0], ), **bm.context(H))
+        values = bm.index_add(values, slot, H.reshape(-1))
+        values = bm.index_add(values, diag, 1.0 - w)
+        return CSRTensor(crow, col, values, spshape=shape)
+
+    def hessp(self, x: TensorLike, p: TensorLike) -> TensorLike:
+        """Hessian of the objective function times a vector, without assembling
+        the global matrix.
+
+        Parameters:
+            x (TensorLike): Cartesian coordinates of the mesh nodes, shaped (NN, GD).
+            p (TensorLike): The vector shaped (NN, GD).
+
+        Returns:
+            TensorLike: The product shaped (NN, GD).
+        """
+        cell = self.mesh_quality.mesh.entity('cell')
+        w = self._free_weight(x)
+        hp = self.mesh_quality.cell_hessp(x, w*p)
+        out = bm.zeros(x.shape, **bm.context(hp))
+        out = bm.index_add(out, cell.reshape(-1), hp.reshape(-1, x.shape[-1]))
+        return w*out + (1.0 - w)*p
+
+    def _free_weight(self, x: TensorLike) -> TensorLike:
+        if self.fixed is None:
+            return bm.ones((x.shape[0], 1), **bm.context(x))
+        return bm.astype(~self.fixed, x.dtype)[:, None]
+
+    def _cell_to_dof(self, x: TensorLike) -> TensorLike:
+        cell = self.mesh_quality.mesh.entity('cell')
+        GD = x.shape[-1]
+        ldof = cell[:, :, None]*GD + bm.arange(GD, **bm.context(cell))
+        return ldof.reshape(cell.shape[0], -1)
+
+    def _get_pattern(self, x: TensorLike):
+        # The cell array is held by the pattern and compared by identity, as
+        # the refinements and reorderings replace it instead of changing it.
+        cell = self.mesh_quality.mesh.entity('cell')
+        key = (cell, tuple(x.shape))
+        if (self._pattern is not None) and (self._pattern[-1][0] is cell) \
+                and (self._pattern[-1][1] == key[1]):
+            return self._pattern
+
+        ldof = self._cell_to_dof(x)
+        NC, L = ldof.shape
+        gdof = x.shape[0]*x.shape[1]
+        I = bm.broadcast_to(ldof[:, :, None], (NC, L, L)).reshape(-1)
+        J = bm.broadcast_to(ldof[:, None, :], (NC, L, L)).reshape(-1)
+        ij, slot = bm.unique(I * gdof + J, return_inverse=True)
+        row, col = ij // gdof, ij % gdof
+        crow = bm.searchsorted(row, bm.arange(gdof + 1, **bm.context(row)))
+        dof = bm.arange(gdof, **bm.context(row))
+        diag = bm.searchsorted(ij, dof * gdof + dof)
+        self._pattern = (crow, col, slot, diag, (gdof, gdof), key)
+        return self._pattern
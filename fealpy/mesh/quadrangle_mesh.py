@@ -3,7 +3,7 @@ from typing import Union, Optional, List, Tuple, Any, Callable
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-from .utils import estr2dim
+from .utils import estr2dim, refine_node_prolongation, refine_cell_prolongation
 
 from .mesh_base import TensorMesh
 from .plot import Plotable
@@ -23,7 +23,8 @@ class QuadrangleMesh(TensorMesh, Plotable):
 
         self.localCell = None
 
-        self.construct()
+        if not self._restore_topology():
+            self.construct()
 
         self.nodedata = {}
         self.edgedata = {}
@@ -284,12 +285,6 @@ class QuadrangleMesh(TensorMesh, Plotable):
         #     raise ValueError("Unsupported backend")
         return cell2ipoint[index]
 
-    def prolongation_matrix(self, p0: int, p1: int):
-        """
-        @brief 生成从 p0 元到 p1 元的延拓矩阵，假定 0 < p0 < p1
-        """
-        raise NotImplementedError
-
     def jacobi_at_corner(self) -> TensorLike:
         NC = self.number_of_cells()
         node = self.entity('node')
@@ -336,15 +331,29 @@ class QuadrangleMesh(TensorMesh, Plotable):
         # cell = cell[bm.arange(NC).reshape(-1, 1), self.localCell[idx]]
         # self.ds.reinit(NN, cell)
 
-    def uniform_refine(self, n:int=1) -> 'QuadrangleMesh':
+    def uniform_refine(self, n:int=1, returnim: bool=False):
         """
         @brief Uniformly refine the quadrilateral mesh
+
+        @param n Number of refinement iterations
+        @param returnim Whether to return the node and cell prolongation matrices
+            (CSRTensor) of each refinement, shaped (NN + NE + NC, NN) and (4*NC, NC)
         """
+        if returnim:
+            nodeIMatrix = []
+            cellIMatrix = []
+
         for i in range(n):
             NN = self.number_of_nodes()
             NE = self.number_of_edges()
             NC = self.number_of_cells()
 
+            if returnim:
+                nodeIMatrix.append(refine_node_prolongation(NN, self.entity('edge'), self.entity('cell'),
+                                                            dtype=self.ftype))
+                cellIMatrix.append(refine_cell_prolongation(NC, 4, interleaved=True,
+                                                            dtype=self.ftype))
+
             # Find the cutted edge
             cell2edge = self.cell2edge
             edgeCenter = self.entity_barycenter('edge')
@@ -394,6 +403,9 @@ class QuadrangleMesh(TensorMesh, Plotable):
             
             self.construct()
 
+        if returnim:
+            return nodeIMatrix, cellIMatrix
+
     def vtk_cell_type(self, etype='cell'):
         if etype in {'cell', 2}:
             VTK_Quad = 9
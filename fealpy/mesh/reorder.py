@@ -0,0 +1,244 @@
+"""
+Renumbering of mesh entities for cache locality and bandwidth reduction.
+
+The permutations in this module map the new indices to the old ones, i.e.
+`new_data = old_data[perm]`, the same convention as `numpy.argsort`.
+"""
+from typing import Union, Optional, Tuple, Sequence
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from .mesh_base import Mesh, StructuredMesh
+
+_Ordering = Union[str, TensorLike, None]
+
+
+def entity_graph(mesh: Mesh, etype: str='node') -> csr_matrix:
+    """Adjacency graph of the nodes (through the edges) or of the cells
+    (through the faces) as a scipy sparse matrix without the diagonal."""
+    if etype == 'node':
+        N = mesh.number_of_nodes()
+        pair = bm.to_numpy(mesh.entity('edge'))
+    elif etype == 'cell':
+        N = mesh.number_of_cells()
+        face2cell = bm.to_numpy(mesh.face_to_cell())
+        pair = face2cell[face2cell[:, 0] != face2cell[:, 1], :2]
+    else:
+        raise ValueError(f"Unsupported entity type '{etype}' for the graph, "
+                         "use 'node' or 'cell'.")
+    I = np.concatenate([pair[:, 0], pair[:, 1]])
+    J = np.concatenate([pair[:, 1], pair[:, 0]])
+    val = np.ones(I.shape[0], dtype=np.int32)
+    return csr_matrix((val, (I, J)), shape=(N, N))
+
+
+def rcm_ordering(mesh: Mesh, etype: str='node') -> TensorLike:
+    """Reverse Cuthill-McKee ordering of the nodes or cells, reducing the
+    bandwidth of the matrices assembled on them."""
+    G = entity_graph(mesh, etype)
+    perm = reverse_cuthill_mckee(G, symmetric_mode=True)
+    return bm.tensor(perm.astype(np.int64), dtype=mesh.itype, device=mesh.device)
+
+
+def nd_ordering(mesh: Mesh, etype: str='node', **options) -> TensorLike:
+    """Nested dissection ordering of the nodes or cells by METIS, reducing the
+    fill-in of sparse direct solvers. Requires the METIS shared library, see
+    `fealpy.graph.metis`."""
+    from ..graph import metis
+
+    G = entity_graph(mesh, etype)
+    perm, _ = metis.node_nd(G.indices, G.indptr, **options)
+    return bm.tensor(perm.astype(np.int64), dtype=mesh.itype, device=mesh.device)
+
+
+def _morton_key(X: np.ndarray, level: int) -> np.ndarray:
+    key = np.zeros(X.shape[0], dtype=np.uint64)
+    n = X.shape[1]
+    for b in range(level - 1, -1, -1):
+        for i in range(n):
+            key = (key << np.uint64(1)) | ((X[:, i] >> np.uint64(b)) & np.uint64(1))
+    return key
+
+
+def _hilbert_key(X: np.ndarray, level: int) -> np.ndarray:
+    # J. Skilling, Programming the Hilbert curve, AIP Conf. Proc. 707 (2004).
+    X = X.copy()
+    n = X.shape[1]
+    M = np.uint64(1 << (level - 1))
+    Q = M
+    while Q > 1:
+        P = Q - np.uint64(1)
+        for i in range(n):
+            flag = (X[:, i] & Q) != 0
+            X[flag, 0] ^= P
+            t = (X[~flag, 0] ^ X[~flag, i]) & P
+            X[~flag, 0] ^= t
+            X[~flag, i] ^= t
+        Q >>= np.uint64(1)
+
+    for i in range(1, n):
+        X[:, i] ^= X[:, i-1]
+    t = np.zeros(X.shape[0], dtype=np.uint64)
+    Q = M
+    while Q > 1:
+        flag = (X[:, n-1] & Q) != 0
+        t[flag] ^= Q - np.uint64(1)
+        Q >>= np.uint64(1)
+    X ^= t[:, None]
+
+    return _morton_key(X, level)
+
+
+def sfc_ordering(mesh: Mesh, etype: str='cell', curve: str='hilbert',
+                 level: Optional[int]=None) -> TensorLike:
+    """Space-filling-curve ordering of the nodes or cells by their barycenters.
+
+    Parameters:
+        mesh (Mesh): The mesh.
+        etype (str, optional): 'node' or 'cell'. Defaults to 'cell'.
+        curve (str, optional): 'hilbert' or 'morton'. Defaults to 'hilbert'.
+        level (int | None, optional): Number of bits per axis of the grid\
+            that the points are snapped to. Defaults to 63 // GD, at most 21.
+
+    Returns:
+        TensorLike: The permutation.
+    """
+    if etype == 'node':
+        point = mesh.entity('node')
+    elif etype == 'cell':
+        point = mesh.entity_barycenter('cell')
+    else:
+        raise ValueError(f"Unsupported entity type '{etype}', use 'node' or 'cell'.")
+    point = bm.to_numpy(point)
+    GD = point.shape[1]
+    if level is None:
+        level = min(21, 63 // GD)
+
+    pmin, pmax = point.min(axis=0), point.max(axis=0)
+    h = np.max(pmax - pmin) / ((1 << level) - 1)
+    h = 1.0 if h == 0 else h
+    X = np.rint((point - pmin) / h).astype(np.uint64)
+
+    if curve == 'hilbert':
+        key = _hilbert_key(X, level)
+    elif curve == 'morton':
+        key = _morton_key(X, level)
+    else:
+        raise ValueError(f"Unknown space-filling curve '{curve}', "
+                         "use 'hilbert' or 'morton'.")
+    perm = np.argsort(key, kind='stable')
+    return bm.tensor(perm, dtype=mesh.itype, device=mesh.device)
+
+
+_ORDERING_MAP = {
+    'rcm': rcm_ordering,
+    'nd': nd_ordering,
+    'hilbert': lambda mesh, etype: sfc_ordering(mesh, etype, curve='hilbert'),
+    'morton': lambda mesh, etype: sfc_ordering(mesh, etype, curve='morton'),
+}
+
+
+def _get_ordering(mesh: Mesh, etype: str, ordering: _Ordering, N: int):
+    if ordering is None:
+        return bm.arange(N, dtype=mesh.itype, device=mesh.device)
+    if isinstance(ordering, str):
+        if ordering not in _ORDERING_MAP:
+            raise ValueError(f"Unknown ordering '{ordering}', "
+                             f"use one of {list(_ORDERING_MAP.keys())}.")
+        return _ORDERING_MAP[ordering](mesh, etype)
+    if ordering.shape != (N, ):
+        raise ValueError(f"The {etype} permutation should be shaped ({N}, ), "
+                         f"but got {tuple(ordering.shape)}.")
+    return ordering
+
+
+def _permute_data(data: dict, perm: TensorLike, N: int):
+    for key, value in data.items():
+        if bm.is_tensor(value) and (value.ndim > 0) and (value.shape[0] == N):
+            data[key] = value[perm]
+
+
+def reorder_mesh(mesh: Mesh, node: _Ordering='rcm', cell: _Ordering='hilbert', *,
+                 spaces: Sequence=()) -> Tuple[TensorLike, ...]:
+    """Renumber the nodes and cells of the mesh in place.
+
+    The edges and faces are rebuilt by `construct()`, following the new cell
+    order. The node, edge, face and cell data of the mesh are permuted along.
+    The DoFs of the spaces are derived from the mesh, so they are renumbered
+    with it; rebuild the forms and integrators created before.
+
+    Parameters:
+        mesh (Mesh): The mesh with stored nodes and cells.
+        node (str | TensorLike | None, optional): Node ordering method ('rcm',\
+            'nd', 'hilbert', 'morton'), or a permutation, or None to keep.\
+            Defaults to 'rcm'.
+        cell (str | TensorLike | None, optional): Cell ordering, in the same\
+            way as `node`. Evaluated on the renumbered nodes. Defaults to 'hilbert'.
+        spaces (Sequence, optional): Function spaces on the mesh to compute\
+            DoF permutations for. Defaults to ().
+
+    Returns:
+        Tuple[TensorLike, ...]: The node permutation, the cell permutation and\
+        the DoF permutations of the spaces, mapping the new indices to the old.
+
+    Example:
+    ```
+        node_perm, cell_perm, dof_perm = reorder_mesh(mesh, spaces=[space])
+        uh_new = uh_old[dof_perm]
+    ```
+    """
+    if isinstance(mesh, StructuredMesh):
+        raise TypeError("Structured meshes can not be renumbered.")
+    if not mesh.is_homogeneous():
+        raise TypeError("Only homogeneous meshes can be renumbered.")
+
+    NN = mesh.number_of_nodes()
+    NC = mesh.number_of_cells()
+    TD = mesh.top_dimension()
+    old_c2d = [s.cell_to_dof() for s in spaces]
+    entity_data = []
+    for name, etype in (('edgedata', 1), ('facedata', TD - 1)):
+        data = getattr(mesh, name, None)
+        if data and (0 < etype < TD) and all(data is not d for d, _, _ in entity_data):
+            c2e = mesh.cell_to_edge() if etype == 1 else mesh.cell_to_face()
+            entity_data.append((data, etype, c2e))
+
+    node_perm = _get_ordering(mesh, 'node', node, NN)
+    iperm = bm.zeros((NN, ), dtype=mesh.itype, device=mesh.device)
+    iperm = bm.set_at(iperm, node_perm, bm.arange(NN, dtype=mesh.itype, device=mesh.device))
+    mesh.node = mesh.node[node_perm]
+    mesh.cell = iperm[mesh.cell]
+
+    cell_perm = _get_ordering(mesh, 'cell', cell, NC)
+    node_e, cell_e = mesh.node, mesh.cell[cell_perm]
+    mesh.clear()
+    mesh.node, mesh.cell = node_e, cell_e
+    mesh.construct()
+
+    if hasattr(mesh, 'nodedata'):
+        _permute_data(mesh.nodedata, node_perm, NN)
+    if hasattr(mesh, 'celldata'):
+        _permute_data(mesh.celldata, cell_perm, NC)
+    for data, etype, c2e in entity_data:
+        new_c2e = mesh.cell_to_edge() if etype == 1 else mesh.cell_to_face()
+        NE = mesh.count(etype)
+        _permute_data(data, _map_by_cell(c2e, new_c2e, cell_perm, NE), NE)
+
+    dof_perms = []
+    for s, c2d in zip(spaces, old_c2d):
+        gdof = s.number_of_global_dofs()
+        dof_perms.append(_map_by_cell(c2d, s.cell_to_dof(), cell_perm, gdof))
+
+    return (node_perm, cell_perm, *dof_perms)
+
+
+def _map_by_cell(old_c2e: TensorLike, new_c2e: TensorLike, cell_perm: TensorLike,
+                 N: int) -> TensorLike:
+    """Permutation of the entities attached to cells, whose local numbering in
+    each cell is unchanged."""
+    perm = bm.zeros((N, ), dtype=old_c2e.dtype, device=bm.get_device(old_c2e))
+    return bm.set_at(perm, new_c2e.reshape(-1), old_c2e[cell_perm].reshape(-1))
@@ -3,6 +3,8 @@ from math import sqrt
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .mesh_base import SimplexMesh
+from .utils import refine_node_prolongation, refine_cell_prolongation
+from .utils import simplex_transfer_operator
 from .plot import Plotable
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 from scipy.sparse import spdiags, eye, tril, triu, bmat
@@ -29,7 +31,8 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             (3, 0, 2, 1), (3, 2, 1, 0), (3, 1, 0, 2)], **kwargs)
 
         self.ccw = bm.tensor([0, 1, 2], **kwargs)
-        self.construct()
+        if not self._restore_topology():
+            self.construct()
         self.OFace = bm.tensor([
             (1, 2, 3),  (0, 3, 2), (0, 1, 3), (0, 2, 1)], **kwargs)
         self.SFace = bm.tensor([
@@ -140,7 +143,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         if etype in {'cell', 3}:
             if q > 7:
                 from ..quadrature.stroud_quadrature import StroudQuadrature
-                return StroudQuadrature(3, q)
+                return StroudQuadrature(3, q, **kwargs)
             else:
                 from ..quadrature import TetrahedronQuadrature
                 return TetrahedronQuadrature(q, **kwargs)
@@ -451,6 +454,8 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         Perform uniform refinement on the tetrahedral mesh.
 
         @param n Number of refinement iterations (default: 1)
+        @param returnim Whether to return the node and cell prolongation matrices
+            (CSRTensor) of each refinement, shaped (NN + NE, NN) and (8*NC, NC)
         """
         if returnim:
             nodeIMatrix = []
@@ -472,14 +477,8 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             self.node = bm.concatenate((node, newNode), axis=0)
 
             if returnim:
-                A = coo_matrix((bm.ones(NN), (range(NN), range(NN))), shape=(NN+NE, NN), dtype=self.ftype)
-                A += coo_matrix((0.5*bm.ones(NE), (range(NN, NN+NE), edge[:, 0])), shape=(NN+NE, NN), dtype=self.ftype)
-                A += coo_matrix((0.5*bm.ones(NE), (range(NN, NN+NE), edge[:, 1])), shape=(NN+NE, NN), dtype=self.ftype)
-                nodeIMatrix.append(A.tocsr())
-
-                B = eye(NC, dtype=self.ftype)
-                B = bmat([[B], [B], [B], [B], [B], [B], [B], [B]])
-                cellIMatrix.append(B.tocsr())
+                nodeIMatrix.append(refine_node_prolongation(NN, edge, dtype=self.ftype))
+                cellIMatrix.append(refine_cell_prolongation(NC, 8, dtype=self.ftype))
 
             p = edge2newNode[cell2edge]
             newCell = bm.zeros((8*NC, 4), dtype=self.itype)
@@ -527,6 +526,9 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             self.construct()
 
             #self.ds.reinit(NN+NE, newCell)
+
+        if returnim:
+            return nodeIMatrix, cellIMatrix
     def circumcenter(self, index=_S, returnradius=False):
         """
         @brief 计算外接圆圆心和半径
@@ -601,8 +603,17 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         for i in range(n):
             self.bisect()
 
-    def bisect_options(self, HB = None, data=None, disp=None):
-        options = {'HB' : HB, 'data': data, 'disp': disp}
+    def bisect_options(self, HB = None, data=None, disp=None, IM=None):
+        """
+        @brief 生成 `bisect` 的参数
+
+        @param HB 是否记录单元的父单元
+        @param data 需要插值到新网格上的数据
+        @param disp 是否打印信息
+        @param IM 若不为 None, 返回旧的 p 次 Lagrange 自由度到新自由度的转移矩阵
+            (CSRTensor), 其中 p 为 IM 的值 (True 时 p = 1)
+        """
+        options = {'HB' : HB, 'IM': IM, 'data': data, 'disp': disp}
         return options
            
     def bisect(self, isMarkedCell=None, data=None, returnim=False, options={'disp': True}):
@@ -619,11 +630,17 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             print('Current number of edges:', NE)
             print('Current number of cells:', NC)
 
-        if ('data' in options) and (options['data'] is not None):
+        order = options.get('IM', None)
+        hasData = options.get('data', None) is not None
+        if hasData or (order is not None):
             oldnode = self.entity('node')
             oldcell = self.entity('cell')
-        
-        if("HB" in options) & (options["HB"] is not None):
+        if order is not None:
+            p = 1 if order is True else int(order)
+            old2dof = self.cell_to_ipoint(p)
+
+        # 转移数据需要每个新单元的父单元
+        if (options.get("HB", None) is not None) or hasData or (order is not None):
             HB = bm.tile(bm.arange(NC*4)[:, None], (1, 2))
             options["HB"] = HB
    
@@ -794,25 +811,29 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         if("HB" in options) & (options["HB"] is not None):
             options['HB'] = options['HB'][:NC]
 
-        if ('data' in options) and (options['data'] is not None):
+        if hasData:
             options['data'] = self.interpolation_with_HB(oldnode, oldcell, options['HB'], options['data'])
-            
+
+        if order is not None:
+            options['IM'] = simplex_transfer_operator(
+                oldnode, oldcell, old2dof, self.node, self.cell,
+                self.cell_to_ipoint(p), options['HB'][:, 1], p=p)
 
         if returnim is True:
             return IM
 
     def interpolation_with_HB(self, oldnode, oldcell, HB, data={}):
+        """
+        @brief 把加密前的数据插值到加密后的网格上
 
-        node = self.entity('node')
-        cell = self.entity('cell')
-        NN = self.number_of_nodes()
-        NC = self.number_of_cells()
+        单元数据取父单元的值; 节点数据 (分片线性函数) 由一个转移矩阵
+        一次性插值, 见 `simplex_transfer_operator`.
 
-        v01 = oldnode[oldcell[..., 1]] - oldnode[oldcell[..., 0]]
-        v02 = oldnode[oldcell[..., 2]] - oldnode[oldcell[..., 0]]
-        v03 = oldnode[oldcell[..., 3]] - oldnode[oldcell[..., 0]]
-        volume = bm.sum(v03*bm.cross(v01, v02), axis=1,dtype=bm.float64)/6.0
-        
+        @param oldnode 加密前的节点
+        @param oldcell 加密前的单元
+        @param HB 第 1 列为每个新单元的父单元
+        @param data 含有 'celldata' 和 'nodedata' 列表的字典
+        """
         idx = HB[..., 1]
         ret = {"nodedata": [], "celldata": []}
 
@@ -820,31 +841,14 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             fval = u0[idx]
             ret["celldata"].append(fval)
 
-        if 'nodedata' in data:
-            lambdai = bm.zeros((NC, 4, 4), dtype=bm.float64)
-
-            # 计算所有单元的第 j 个点的第 i 个重心坐标分量
-            for j in range(4):
-                flag = node[cell[:, j]]
-                localface = bm.array([[2, 1, 3], [2, 3, 0], [1, 0, 3], [0, 1, 2]])
-                for i in range(4):
-                    v1 = oldnode[oldcell[idx, localface[i, 0]]] - flag
-                    v2 = oldnode[oldcell[idx, localface[i, 1]]] - flag
-                    v3 = oldnode[oldcell[idx, localface[i, 2]]] - flag
-                    volume1 = bm.sum(bm.cross(v2, v1)*v3, axis=-1,dtype=bm.float64)/6
-                    lambdai = bm.set_at(lambdai , (slice(None),j ,i), volume1/volume[idx])
-
-            fval0 = bm.zeros((NC, 4), dtype=bm.float64)
-            for u0 in data['nodedata']: 
-                fval = bm.zeros((NN), dtype=bm.float64)
-                for i in range(4):
-                    w = lambdai[:, i, :]
-                    fval0 = bm.set_at(fval0 , (slice(None) , i) , bm.sum(w*u0[oldcell[idx]], axis=1))
-                fval = bm.set_at(fval , cell , fval0)
-                ret["nodedata"].append(fval)
+        if len(data.get('nodedata', [])) > 0:
+            cell = self.entity('cell')
+            P = simplex_transfer_operator(oldnode, oldcell, oldcell,
+                                          self.entity('node'), cell, cell, idx)
+            fval = P @ bm.stack(data['nodedata'], axis=1)
+            ret["nodedata"] = [fval[:, i] for i in range(fval.shape[1])]
         return ret
 
-
    
     ## @ingroup MeshGenerators
     @classmethod
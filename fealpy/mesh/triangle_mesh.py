@@ -1,10 +1,13 @@
 from typing import Union, Optional, Callable
+from math import isqrt
 
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
 
 from .utils import simplex_gdof, simplex_ldof
+from .utils import refine_node_prolongation, refine_cell_prolongation
+from .utils import simplex_transfer_operator
 from .mesh_base import SimplexMesh, estr2dim
 from .plot import Plotable
 
@@ -34,7 +37,8 @@ class TriangleMesh(SimplexMesh, Plotable):
             (1, 2, 0),
             (2, 0, 1)], **kwargs)
 
-        self.construct()
+        if not self._restore_topology():
+            self.construct()
 
         self.nodedata = {}
         self.edgedata = {}
@@ -83,7 +87,7 @@ class TriangleMesh(SimplexMesh, Plotable):
             from ..quadrature.stroud_quadrature import StroudQuadrature
             from ..quadrature import TriangleQuadrature
             if q > 9:
-                quad = StroudQuadrature(2, q)
+                quad = StroudQuadrature(2, q, **kwargs)
             else:
                 quad = TriangleQuadrature(q, **kwargs)
         elif etype == 1:
@@ -250,12 +254,6 @@ class TriangleMesh(SimplexMesh, Plotable):
         cell2faceSign = bm.set_at(cell2faceSign, (face2cell[:, 0], face2cell[:, 2]), True)
         return cell2faceSign
 
-    def prolongation_matrix(self, po: int, p1: int):
-        """
-        @brief 生成从 p0 元到 p1 元的延拓矩阵，假定 0 < p0 < p1
-        """
-        pass
-
     def edge_frame(self, index: Index=_S):
         """
         @brief 计算二维网格中每条边上的局部标架
@@ -273,8 +271,15 @@ class TriangleMesh(SimplexMesh, Plotable):
 
     def uniform_refine(self, n=1, surface=None, interface=None, returnim=False):
         """
+        @brief 一致加密三角形网格
 
+        @param n 加密次数
+        @param returnim 是否返回每次加密的节点延拓矩阵和单元延拓矩阵,
+            均为 CSRTensor, 形状分别为 (NN + NE, NN) 和 (4*NC, NC)
         """
+        if returnim:
+            nodeIMatrix = []
+            cellIMatrix = []
 
         for i in range(n):
             NN = self.number_of_nodes()
@@ -287,6 +292,10 @@ class TriangleMesh(SimplexMesh, Plotable):
             edge2newNode = bm.arange(NN, NN + NE, dtype=self.itype, device=self.device)
             newNode = (node[edge[:, 0], :] + node[edge[:, 1], :]) / 2.0
 
+            if returnim:
+                nodeIMatrix.append(refine_node_prolongation(NN, edge, dtype=self.ftype))
+                cellIMatrix.append(refine_cell_prolongation(NC, 4, dtype=self.ftype))
+
             self.node = bm.concatenate((node, newNode), axis=0)
             p = bm.concatenate((cell, edge2newNode[cell2edge]), axis=1)
             self.cell = bm.concatenate(
@@ -294,6 +303,9 @@ class TriangleMesh(SimplexMesh, Plotable):
                     axis=0)
             self.construct()
 
+        if returnim:
+            return nodeIMatrix, cellIMatrix
+
     def is_crossed_cell(self, point, segment):
         """
         @berif 给定一组线段，找到这些线段的一个邻域单元集合, 且这些单元要满足一定的连通
@@ -396,6 +408,15 @@ class TriangleMesh(SimplexMesh, Plotable):
             data=None,
             disp=True,
     ):
+        """
+        @brief 生成 `bisect` 和 `coarsen` 的参数
+
+        @param HB 是否记录单元的父单元
+        @param IM 若不为 None, 返回旧的 p 次 Lagrange 自由度到新自由度的转移矩阵
+            (CSRTensor), 其中 p 为 IM 的值 (True 时 p = 1). 多个场可以堆叠成
+            (gdof0, K) 的张量, 用一次稀疏矩阵乘法转移到新网格上
+        @param data 需要插值到新网格上的数据
+        """
 
         options = {
             'HB': HB,
@@ -426,7 +447,13 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         cell2edge = self.cell_to_edge()
         cell2cell = self.cell_to_cell()
-        #cell2ipoint = self.cell_to_ipoint(self.p)
+        IM = options.get('IM', None)
+        if IM is not None:
+            im_p = 1 if IM is True else int(IM)
+            oldnode, oldcell = self.node, cell
+            old2dof = self.cell_to_ipoint(im_p)
+            parent = bm.arange(NC, **bm.context(cell))
+
         isCutEdge = bm.zeros((NE,), dtype=bm.bool, device=self.device)
 
         if options['disp']:
@@ -448,41 +475,7 @@ class TriangleMesh(SimplexMesh, Plotable):
         newNode = 0.5 * (node[edge[isCutEdge, 0], :] + node[edge[isCutEdge, 1], :])
         self.node = bm.concatenate((node, newNode), axis=0)
         cell2edge0 = cell2edge[:, 0]
-
-        if 'data' in options:
-            pass
-
-        if 'IM' in options:
-            nn = len(newNode)
-            IM = COOTensor( indices=bm.stack((bm.arange(NN), bm.arange(NN)), axis=0),
-                            values=bm.ones(NN), 
-                            shape=(NN + nn, NN))
-            # IM = coo_matrix((bm.ones(NN), (bm.arange(NN), bm.arange(NN))),
-            #                 shape=(NN + nn, NN))
-            val = bm.full((nn,), 0.5)
-            IM += COOTensor(indices=bm.stack((NN + bm.arange(nn), edge[isCutEdge, 0]), axis=0),
-                            values=val,
-                            shape=(NN + nn, NN))
-            # IM += coo_matrix(
-            #     (
-            #         val,
-            #         (
-            #             NN + bm.arange(nn),
-            #             edge[isCutEdge, 0]
-            #         )
-            #     ), shape=(NN + nn, NN))
-            IM += COOTensor(indices=bm.stack((NN + bm.arange(nn), edge[isCutEdge, 1]), axis=0),
-                            values=val,
-                            shape=(NN + nn, NN))
-            # IM += coo_matrix(
-            #     (
-            #         val,
-            #         (
-            #             NN + bm.arange(nn),
-            #             edge[isCutEdge, 1]
-            #         )
-            #     ), shape=(NN + nn, NN))
-            options['IM'] = IM.tocsr()
+        nn = len(newNode)
 
         if 'HB' in options:
             options['HB'] = bm.arange(NC)
@@ -496,6 +489,8 @@ class TriangleMesh(SimplexMesh, Plotable):
             if 'HB' in options:
                 HB = options['HB']
                 options['HB'] = bm.concatenate((HB, HB[idx]), axis=0)
+            if IM is not None:
+                parent = bm.concatenate((parent, parent[idx]), axis=0)
 
             L = idx
             R = bm.arange(NC, NC + nc)
@@ -507,11 +502,8 @@ class TriangleMesh(SimplexMesh, Plotable):
                     #elif value.ndim == 2 and value.shape[0] == NC:  # 处理(NC, NQ)的情况
                     #    value = bm.concatenate((value, value[idx, :])) 
                     #    options['data'][key] = value
-                    elif value.shape == (NN + k * nn,):
-                        if k == 0:
-                            value = bm.concatenate((value, bm.zeros((nn,),  dtype=self.ftype, device=self.device)))
-                            value = bm.set_at(value , slice(NN, None), 0.5 * (value[edge[isCutEdge, 0]] + value[edge[isCutEdge, 1]]))
-                            options['data'][key] = value
+                    elif value.shape == (NN,): # 节点数据在加密后一起插值
+                        continue
                     else:
                         ldof = value.shape[-1]
                         p = int((bm.sqrt(1 + 8 * bm.array(ldof)) - 3) // 2)
@@ -560,117 +552,223 @@ class TriangleMesh(SimplexMesh, Plotable):
         self.cell = cell
         self.construct()
 
+        if ('data' in options) and (options['data'] is not None):
+            data = options['data']
+            keys = [key for key, value in data.items() if value.shape == (NN,)]
+            if len(keys) > 0:
+                P = refine_node_prolongation(NN, edge[isCutEdge], dtype=self.ftype)
+                value = P @ bm.stack([data[key] for key in keys], axis=1)
+                for i, key in enumerate(keys):
+                    data[key] = value[:, i]
+
+        if IM is not None:
+            options['IM'] = simplex_transfer_operator(
+                oldnode, oldcell, old2dof, self.node, self.cell,
+                self.cell_to_ipoint(im_p), parent, p=im_p)
+
     def coarsen(self, isMarkedCell=None, options={}):
         """
-        @brief
+        @brief 粗化由最新顶点二分法加密得到的网格, 是 `bisect` 的逆过程
+
+        一个节点可以被删除, 当且仅当它是周围所有单元的最新顶点 (cell[:, 0]),
+        这些单元都被标记, 且内部节点周围有 4 个单元, 边界节点周围有 2 个单元.
+        每对兄弟单元 L = (m, v0, v1) 和 R = (m, v2, v0) 合并为父单元 (v0, v1, v2),
+        父单元存放在 L 的位置. 边的拓扑关系被增量地更新, 不调用 `construct`.
+
+        @param isMarkedCell 标记要粗化的单元
+        @param options 若有 'data', 其中的节点数据 (NN, ...) 和单元数据
+            (NC, ...) 与网格的 nodedata, celldata 一起被限制到粗网格上,
+            见 `coarsen_data`, 其中 (NC, ldof) 的数据在 'lagrange' 为 True 时视为
+            Lagrange 插值点的值; 若 'IM' 不为 None, 返回 p 次 Lagrange 自由度的
+            转移矩阵, 见 `bisect_options`
 
         https://lyc102.github.io/ifem/afem/coarsen/
         """
-
         if isMarkedCell is None:
             return
 
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
+        NE = self.number_of_edges()
+        kwargs = {'dtype': self.itype, 'device': self.device}
 
         cell = self.entity('cell')
-        node = self.entity('node')
-
-        valence = bm.zeros(NN, dtype=self.itype, device=self.device)
-        bm.add_at(valence, cell, 1)
-
-        valenceNew = bm.zeros(NN, dtype=self.itype, device=self.device)
-        bm.add_at(valenceNew, cell[isMarkedCell][:, 0], 1)
-
-        isIGoodNode = (valence == valenceNew) & (valence == 4)
-        isBGoodNode = (valence == valenceNew) & (valence == 2)
-
-        node2cell = self.node_to_cell()
-
-        I, J = bm.nonzero(node2cell[isIGoodNode, :])
-        nodeStar = J.reshape(-1, 4)
-
-        ix = (cell[nodeStar[:, 0], 2] == cell[nodeStar[:, 3], 1])
-        iy = (cell[nodeStar[:, 1], 1] == cell[nodeStar[:, 2], 2])
-        nodeStar = bm.set_at(nodeStar , ix & (~iy) ,nodeStar[ix & (~iy), :][:, [0, 2, 1, 3]])
-        nodeStar = bm.set_at(nodeStar , (~ix) & iy ,nodeStar[(~ix) & iy, :][:, [0, 3, 1, 2]])
-
-        t0 = nodeStar[:, 0]
-        t1 = nodeStar[:, 1]
-        t2 = nodeStar[:, 2]
-        t3 = nodeStar[:, 3]
-
-        p1 = cell[t0, 2]
-        p2 = cell[t1, 1]
-        p3 = cell[t0, 1]
-        p4 = cell[t2, 1]
-
-        cell = bm.set_at(cell , (t0, 0) , p3)
-        cell = bm.set_at(cell , (t0, 1) , p1)
-        cell = bm.set_at(cell , (t0, 2) , p2)
-        cell = bm.set_at(cell , (t1, 0) , -1)
-
-        cell = bm.set_at(cell , (t2, 0) , p4)
-        cell = bm.set_at(cell , (t2, 1) , p2)
-        cell = bm.set_at(cell , (t2, 2) , p1)
-        cell = bm.set_at(cell , (t3, 0) , -1)
-
-        I, J = bm.nonzero(node2cell[isBGoodNode, :])
-        nodeStar = J.reshape(-1, 2)
-        idx = (cell[nodeStar[:, 0], 2] == cell[nodeStar[:, 1], 1])
-        nodeStar = bm.set_at(nodeStar , idx , nodeStar[idx, :][:, [0, 1]])
-
-        t4 = nodeStar[:, 0]
-        t5 = nodeStar[:, 1]
-        p0 = cell[t4, 0]
-        p1 = cell[t4, 2]
-        p2 = cell[t5, 1]
-        p3 = cell[t4, 1]
-        cell = bm.set_at(cell , (t4, 0) , p3)
-        cell = bm.set_at(cell , (t4, 1) , p1)
-        cell = bm.set_at(cell , (t4, 2) , p2)
-        cell = bm.set_at(cell , (t5, 0) , -1)
-
-        isKeepCell = cell[:, 0] > -1
-        if ('data' in options) and (options['data'] is not None):
-            # value.shape == (NC, (p+1)*(p+2)//2)
-            lidx = bm.concatenate((t0, t2, t4))
-            ridx = bm.concatenate((t1, t3, t5))
-            for key, value in options['data'].items():
-                ldof = value.shape[1]
-                p = int((bm.sqrt(8 * ldof + 1) - 3) / 2)
-                bc = self.multi_index_matrix(p=p, etype=2) / p
-                bcl = bm.zeros_like(bc)
-                bcl = bm.set_at(bcl , (slice(None), 0) , 2 * bc[:, 2])
-                bcl = bm.set_at(bcl , (slice(None), 1) , bc[:, 0])
-                bcl = bm.set_at(bcl , (slice(None), 2) , bc[:, 1] - bc[:, 2])
- 
-                bcr = bm.zeros_like(bc)
-                bar = bm.set_at(bcr , (slice(None), 0) , 2 * bc[:, 1])
-                bar = bm.set_at(bcr , (slice(None), 1) , bc[:, 2] - bc[:, 1])
-                bar = bm.set_at(bcr , (slice(None), 2) , bc[:, 0])
-
-                phi = self.shape_function(bcl, p=p)  # (NQ, ldof)
-                value = bm.set_at(value , lidx , bm.einsum('ci, qi->cq', value[lidx, :], phi))
-
-                phi = self.shape_function(bcr, p=p)  # (NQ, ldof)
-
-                value = bm.add_at(value , lidx , bm.einsum('ci, qi->cq', value[ridx, :], phi))
-                value = bm.set_at(value , lidx , 0.5 * value[lidx])
-                options['data'] = bm.set_at(options['data'],key , value[isKeepCell])
-
-        cell = cell[isKeepCell]
-        isGoodNode = (isIGoodNode | isBGoodNode)
-
-        idxMap = bm.zeros(NN, dtype=self.itype, device=self.device)
-        self.node = node[~isGoodNode]
-
-        NN = self.node.shape[0]
-        idxMap = bm.set_at(idxMap , ~isGoodNode , bm.arange(NN))
-        cell = idxMap[cell]
-
-        self.cell = cell
-        self.construct()
+        edge = self.entity('edge')
+        cell2edge = self.cell_to_edge()
+        edge2cell = self.edge2cell
+
+        # 1. Good nodes: the newest vertex of all its cells, which are marked.
+        isMarkedCell = bm.astype(isMarkedCell, bm.bool)
+        peak = cell[:, 0]
+        valence = bm.index_add(bm.zeros((NN, ), **kwargs), cell.reshape(-1),
+                               bm.ones((3*NC, ), **kwargs))
+        valenceNew = bm.index_add(bm.zeros((NN, ), **kwargs), peak[isMarkedCell],
+                                  bm.ones((NC, ), **kwargs)[isMarkedCell])
+        isBdNode = self.boundary_node_flag()
+        isGood = (valence == valenceNew)
+
+        # 2. Node stars as rows of cells sorted by the index. In a star, the
+        # left child has a smaller index than its sibling, as `bisect` keeps it
+        # in the slot of the parent and appends the right child.
+        idx, = bm.nonzero(isMarkedCell & isGood[peak] & ~isBdNode[peak] & (valence[peak] == 4))
+        star = idx[bm.argsort(peak[idx], stable=True)].reshape(-1, 4)
+        # the right sibling of the first cell shares v0: R[2] == L[1]
+        isSib = cell[star[:, 1:], 2] == cell[star[:, 0:1], 1]
+        isOk = bm.sum(isSib, axis=1) == 1
+        star, isSib = star[isOk], isSib[isOk]
+        rest = star[:, 1:]
+        other = rest[~isSib].reshape(-1, 2)
+        L0, R0 = star[:, 0], rest[isSib]
+        L1, R1 = bm.min(other, axis=1), bm.max(other, axis=1)
+        # the other parent (w0, v2, v1) shares the refinement edge
+        isOk = ((cell[R1, 2] == cell[L1, 1]) & (cell[L1, 2] == cell[R0, 1]) &
+                (cell[R1, 1] == cell[L0, 2]))
+        L0, R0, L1, R1 = L0[isOk], R0[isOk], L1[isOk], R1[isOk]
+
+        idx, = bm.nonzero(isMarkedCell & isGood[peak] & isBdNode[peak] & (valence[peak] == 2))
+        star = idx[bm.argsort(peak[idx], stable=True)].reshape(-1, 2)
+        isOk = cell[star[:, 1], 2] == cell[star[:, 0], 1]
+        Lb, Rb = star[isOk, 0], star[isOk, 1]
+
+        L = bm.concatenate([L0, L1, Lb])
+        R = bm.concatenate([R0, R1, Rb])
+        nI, nB = L0.shape[0], Lb.shape[0]
+        isKeepNode = bm.ones((NN, ), dtype=bm.bool, device=self.device)
+        isKeepNode = bm.set_at(isKeepNode, cell[L, 0], False)
+        isKeepCell = bm.ones((NC, ), dtype=bm.bool, device=self.device)
+        isKeepCell = bm.set_at(isKeepCell, R, False)
+        isKeepEdge = isKeepNode[edge[:, 0]] & isKeepNode[edge[:, 1]]
+
+        # 3. Restrict the data before the cells are merged.
+        for d in (self.nodedata, self.celldata):
+            d.update(self.coarsen_data(d, isKeepNode, L, R))
+        if options.get('data', None) is not None:
+            d = options['data']
+            d.update(self.coarsen_data(d, isKeepNode, L, R,
+                                       lagrange=options.get('lagrange', False)))
+
+        IM = options.get('IM', None)
+        if IM is not None:
+            im_p = 1 if IM is True else int(IM)
+            oldnode, oldcell = self.node, bm.copy(cell)
+            old2dof = oldcell if im_p == 1 else self.cell_to_ipoint(im_p)
+            # a parent lies in its two children, others in themselves
+            sibling = bm.arange(NC, **kwargs)
+            sibling = bm.set_at(sibling, L, R)
+
+        # 4. Merge the siblings into the parents in the slots of L, and update
+        # the edges. The parent (v0, v1, v2) takes the new edge (v1, v2) as its
+        # edge 0, the edge 0 of R as edge 1, and the edge 0 of L as edge 2.
+        v0, v1, v2 = cell[L, 1], cell[L, 2], cell[R, 1]
+        cell = bm.set_at(cell, L, bm.stack([v0, v1, v2], axis=1))
+
+        eL, eR = cell2edge[L, 0], cell2edge[R, 0]
+        for e, t, lidx in ((eL, L, 2), (eR, R, 1)):
+            for side in (0, 1): # both sides of the boundary edges
+                flag = edge2cell[e, side] == t
+                edge2cell = bm.set_at(edge2cell, (e[flag], side), L[flag])
+                edge2cell = bm.set_at(edge2cell, (e[flag], side + 2), lidx)
+
+        keepEdge, = bm.nonzero(isKeepEdge)
+        keepCell, = bm.nonzero(isKeepCell)
+        keepNode, = bm.nonzero(isKeepNode)
+        NE0 = keepEdge.shape[0]
+        edgeMap = bm.zeros((NE, ), **kwargs)
+        edgeMap = bm.set_at(edgeMap, keepEdge, bm.arange(NE0, **kwargs))
+        newEdge = bm.concatenate([bm.stack([v1[:nI], v2[:nI]], axis=1),
+                                  bm.stack([v1[2*nI:], v2[2*nI:]], axis=1)])
+        zero = bm.zeros((nI + nB, ), **kwargs)
+        newEdge2cell = bm.stack([bm.concatenate([L0, Lb]), bm.concatenate([L1, Lb]),
+                                 zero, zero], axis=1)
+        # the two parents in an interior star share their new edge
+        newIdx = NE0 + bm.concatenate([bm.arange(nI, **kwargs), bm.arange(nI, **kwargs),
+                                       bm.arange(nI, nI + nB, **kwargs)])
+        cell2edge = edgeMap[cell2edge]
+        cell2edge = bm.set_at(cell2edge, L,
+                              bm.stack([newIdx, edgeMap[eR], edgeMap[eL]], axis=1))
+
+        cellMap = bm.zeros((NC, ), **kwargs)
+        cellMap = bm.set_at(cellMap, keepCell, bm.arange(keepCell.shape[0], **kwargs))
+        nodeMap = bm.zeros((NN, ), **kwargs)
+        nodeMap = bm.set_at(nodeMap, keepNode, bm.arange(keepNode.shape[0], **kwargs))
+        edge2cell = bm.concatenate([edge2cell[keepEdge], newEdge2cell], axis=0)
+        edge2cell = bm.set_at(edge2cell, (slice(None), slice(0, 2)), cellMap[edge2cell[:, :2]])
+
+        self.node = self.node[keepNode]
+        self.cell = nodeMap[cell[keepCell]]
+        self.face = nodeMap[bm.concatenate([edge[keepEdge], newEdge], axis=0)]
+        self.face2cell = edge2cell
+        self.cell2face = cell2edge[keepCell]
+        self.edge2cell = self.face2cell
+        self.cell2edge = self.cell2face
+
+        if IM is not None:
+            candidate = bm.stack([keepCell, sibling[keepCell]], axis=1)
+            options['IM'] = simplex_transfer_operator(
+                oldnode, oldcell, old2dof, self.node, self.cell,
+                self.cell_to_ipoint(im_p), candidate, p=im_p)
+
+    def coarsen_data(self, data: dict, isKeepNode: TensorLike,
+                     left: TensorLike, right: TensorLike,
+                     lagrange: bool=False) -> dict:
+        """
+        @brief 把节点数据和单元数据限制到 `coarsen` 得到的粗网格上
+
+        节点数据 (NN, ...) 取保留节点上的值. 浮点型单元数据 (NC, ...) 在父单元上
+        取两个子单元的平均; 若 `lagrange` 为 True, (NC, ldof) 且 ldof 为 p 次
+        Lagrange 单元的局部自由度个数的数据视为单元上插值点的值, 用子单元上的
+        多项式在父单元插值点处的值. 其它单元数据取左子单元的值.
+
+        @param data 数据字典
+        @param isKeepNode 保留的节点
+        @param left 左子单元, 其位置存放父单元
+        @param right 右子单元, 将被删除
+        @param lagrange 是否把 (NC, ldof) 的单元数据视为 Lagrange 插值点的值
+        """
+        NN = self.number_of_nodes()
+        NC = self.number_of_cells()
+        isKeepCell = bm.ones((NC, ), dtype=bm.bool, device=self.device)
+        isKeepCell = bm.set_at(isKeepCell, right, False)
+        phis = {}
+        out = {}
+        for key, value in data.items():
+            if not bm.is_tensor(value) or value.ndim == 0:
+                continue
+            if value.shape[0] == NC:
+                if value.dtype not in (bm.float32, bm.float64):
+                    pass
+                elif (lagrange and value.ndim == 2 and value.shape[1] > 1 and
+                      self._coarsen_interpolation(value.shape[1], phis) is not None):
+                    phiL, phiR = phis[value.shape[1]]
+                    vp = (bm.einsum('cj, kj -> ck', value[left], phiL) +
+                          bm.einsum('cj, kj -> ck', value[right], phiR))
+                    value = bm.set_at(value, left, vp)
+                else:
+                    value = bm.set_at(value, left, 0.5*(value[left] + value[right]))
+                out[key] = value[isKeepCell]
+            elif value.shape[0] == NN:
+                out[key] = value[isKeepNode]
+        return out
+
+    def _coarsen_interpolation(self, ldof: int, phis: dict):
+        """The parent (v0, v1, v2) with L = (m, v0, v1) and R = (m, v2, v0), where
+        the interpolation point (b0, b1, b2) is in L if b1 >= b2, and in R otherwise.
+        The values are cached in `phis`; returns None if `ldof` is not the number
+        of the local dofs of a Lagrange space."""
+        if ldof in phis:
+            return phis[ldof]
+        p = (isqrt(8*ldof + 1) - 3) // 2
+        if (p + 1)*(p + 2)//2 != ldof:
+            return None
+        bc = self.multi_index_matrix(p, 2) / p
+        b0, b1, b2 = bc[:, 0], bc[:, 1], bc[:, 2]
+        inL = bm.astype(b1 >= b2, self.ftype)[:, None]
+        bcl = bm.stack([2*b2, b0, b1 - b2], axis=1)
+        bcr = bm.stack([2*b1, b2 - b1, b0], axis=1)
+        phiL = self.shape_function(bcl, p=p) * inL
+        phiR = self.shape_function(bcr, p=p) * (1 - inL)
+        phis[ldof] = (phiL, phiR)
+        return phis[ldof]
 
     def label(self, node=None, cell=None, cellidx=None):
         """
@@ -155,3 +155,129 @@ def tensor_gdof(p: int, nums: Tuple[int, ...]) -> int:
         coef *= (p-1)
         count += coef * nums[i]
     return count
+
+
+def refine_node_prolongation(NN: int, *parents: TensorLike, dtype=None):
+    """Prolongation of the node values from a mesh to its uniform refinement,
+    which keeps the old nodes and appends a new node at the barycenter of every
+    parent entity, in order.
+
+    Parameters:
+        NN (int): Number of the nodes before refinement.
+        *parents (TensorLike): Entities whose barycenters are the new nodes,
+            e.g. the edges and the cells, each shaped (N_k, m_k).
+        dtype (optional): Data type of the values, e.g. the `ftype` of the mesh.
+            Defaults to None, for float64.
+
+    Returns:
+        CSRTensor: The prolongation matrix shaped (NN + sum(N_k), NN).
+    """
+    from ..sparse import COOTensor
+
+    dtype = bm.float64 if dtype is None else dtype
+    kwargs = {'dtype': parents[0].dtype, 'device': bm.get_device(parents[0])}
+    rows = [bm.arange(NN, **kwargs)]
+    cols = [bm.arange(NN, **kwargs)]
+    vals = [bm.ones((NN, ), dtype=dtype, device=kwargs['device'])]
+    start = NN
+    for entity in parents:
+        N, m = entity.shape
+        rows.append(bm.repeat(bm.arange(start, start + N, **kwargs), m))
+        cols.append(bm.reshape(entity, (-1, )))
+        vals.append(bm.full((N*m, ), 1./m, dtype=dtype, device=kwargs['device']))
+        start += N
+    indices = bm.stack((bm.concatenate(rows), bm.concatenate(cols)), axis=0)
+    return COOTensor(indices, bm.concatenate(vals), spshape=(start, NN)).tocsr()
+
+
+def refine_cell_prolongation(NC: int, nchild: int, interleaved: bool=False,
+                             dtype=None):
+    """Map of the cells to their children after uniform refinement, i.e. the
+    prolongation of the piecewise constant functions.
+
+    Parameters:
+        NC (int): Number of the cells before refinement.
+        nchild (int): Number of the children of a cell.
+        interleaved (bool, optional): Whether the children of a cell are
+            consecutive, otherwise the `k`-th children of all the cells form
+            the `k`-th block. Defaults to False.
+        dtype (optional): Data type of the values, e.g. the `ftype` of the mesh.
+            Defaults to None, for float64.
+
+    Returns:
+        CSRTensor: The matrix shaped (nchild*NC, NC).
+    """
+    from ..sparse import CSRTensor
+
+    if interleaved:
+        parent = bm.repeat(bm.arange(NC), nchild)
+    else:
+        parent = bm.tile(bm.arange(NC), nchild)
+    crow = bm.arange(nchild*NC + 1)
+    dtype = bm.float64 if dtype is None else dtype
+    return CSRTensor(crow, parent, bm.ones((nchild*NC, ), dtype=dtype),
+                     spshape=(nchild*NC, NC))
+
+
+def simplex_transfer_operator(oldnode: TensorLike, oldcell: TensorLike, old2dof: TensorLike,
+                              node: TensorLike, cell: TensorLike, new2dof: TensorLike,
+                              candidate: TensorLike, p: int=1):
+    """Transfer of the p-order Lagrange functions from a simplex mesh to a mesh
+    obtained by its local refinement or coarsening, i.e. the values of the old
+    function at the interpolation points of the new mesh.
+
+    Every interpolation point of a new cell is located in one of the old cells
+    in its row of `candidate`, e.g. the parent for the refinement and the two
+    children for the coarsening, where the one with the largest minimal
+    barycentric coordinate is taken.
+
+    Parameters:
+        oldnode (TensorLike): Nodes of the old mesh, shaped (NN0, GD).
+        oldcell (TensorLike): Cells of the old mesh, shaped (NC0, TD+1).
+        old2dof (TensorLike): Cell-to-dof map of the old space, shaped (NC0, ldof).
+        node (TensorLike): Nodes of the new mesh, shaped (NN, GD).
+        cell (TensorLike): Cells of the new mesh, shaped (NC, TD+1).
+        new2dof (TensorLike): Cell-to-dof map of the new space, shaped (NC, ldof).
+        candidate (TensorLike): Old cells containing each new cell, shaped (NC, k).
+        p (int, optional): Order of the Lagrange space. Defaults to 1.
+
+    Returns:
+        CSRTensor: The transfer matrix shaped (gdof, gdof0). A batch of fields
+            shaped (gdof0, K) is transferred by one product.
+    """
+    from ..sparse import COOTensor
+
+    TD = cell.shape[-1] - 1
+    ldof = new2dof.shape[-1]
+    kwargs = bm.context(oldnode)
+    candidate = bm.reshape(candidate, (cell.shape[0], -1))
+
+    # The first appearance of each new dof, and its interpolation point.
+    dof, first = bm.unique(bm.reshape(new2dof, (-1, )), return_index=True)
+    cidx, lidx = first // ldof, first % ldof
+    mi = bm.astype(bm.multi_index_matrix(p, TD), oldnode.dtype) / p
+    point = bm.einsum('dk, dkg -> dg', mi[lidx], node[cell[cidx]])
+
+    # Barycentric coordinates in the candidate cells, by the normal equations
+    # so that the surface meshes are supported.
+    lams = []
+    for k in range(candidate.shape[1]):
+        v = oldnode[oldcell[candidate[cidx, k]]]
+        B = v[:, 1:] - v[:, 0:1]
+        G = bm.einsum('dig, djg -> dij', B, B)
+        r = bm.einsum('dig, dg -> di', B, point - v[:, 0])
+        lam = bm.linalg.solve(G, r[..., None])[..., 0]
+        lams.append(bm.concat([1 - bm.sum(lam, axis=-1, keepdims=True), lam], axis=-1))
+    lams = bm.stack(lams, axis=1) # (ND, k, TD+1)
+    sel = bm.argmax(bm.min(lams, axis=-1), axis=1)
+    arange = bm.arange(dof.shape[0], **bm.context(sel))
+    lam = lams[arange, sel]
+    owner = candidate[cidx, sel]
+
+    phi = bm.simplex_shape_function(lam, p) # (ND, ldof0)
+    rows = bm.broadcast_to(dof[:, None], phi.shape)
+    cols = old2dof[owner]
+    flag = bm.abs(phi) > 1e-12
+    indices = bm.stack([rows[flag], cols[flag]], axis=0)
+    spshape = (dof.shape[0], int(bm.max(old2dof)) + 1)
+    return COOTensor(indices, phi[flag], spshape=spshape).tocsr()
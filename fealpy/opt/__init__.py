@@ -3,7 +3,7 @@ from .objective import Objective
 from .A_star import AStar, GridMap
 from .ANT_TSP import calD, Ant_TSP
 from .particle_swarm_opt_alg import  PSOProblem, PSO
-from .optimizer_base import opt_alg_options, Optimizer
+from .optimizer_base import opt_alg_options, Optimizer, PopulationEvaluator
 from .initialize import initialize
 from .crayfish_opt_alg import CrayfishOptAlg
 from .honeybadger_opt_alg import HoneybadgerOptAlg
@@ -12,4 +12,5 @@ from .snowmelt_opt_alg import SnowmeltOptAlg
 from .grey_wolf_optimizer import GreyWolfOptimizer
 from .particle_swarm_opt import ParticleSwarmOptAlg
 from .hippopotamus_opt_alg import HippopotamusOptAlg
-from .antcolony_opt_alg import AntColonyOptAlg
\ No newline at end of file
+from .antcolony_opt_alg import AntColonyOptAlg
+from .truncated_newton_alg import TruncatedNewtonAlg
@@ -1,7 +1,6 @@
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
-import random
 from .optimizer_base import Optimizer
 
 
@@ -31,9 +30,9 @@ class AntColonyOptAlg(Optimizer):
         gbest = None
 
         for t in range(T):
-            start = [random.randint(0, dim - 1) for _ in range(N)]
+            start = bm.random.randint(0, dim, (N,))
             
-            Table[:, 0] = bm.array(start)
+            Table[:, 0] = start
             citys_index = bm.arange(dim)
 
             P = bm.zeros((N, dim - 1))
@@ -2,7 +2,6 @@
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
-import random
 from .optimizer_base import Optimizer, opt_alg_options
 
 
@@ -37,7 +36,7 @@ class CrayfishOptAlg(Optimizer):
             p = 0.2 * ( 1 / (bm.sqrt(bm.array(2 * bm.pi) * 3))) * bm.exp( bm.array(- (temp - 25) ** 2 / (2 * 3 ** 2)))
             rand = bm.random.rand(N, 1)
             rr = bm.random.rand(4, N, dim)
-            z = [random.randint(0, N - 1) for _ in range(N)]
+            z = bm.random.randint(0, N, (N,))
 
             gbest = gbest.reshape(1, dim)
 
@@ -2,7 +2,6 @@
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
-import random
 from .optimizer_base import Optimizer
 from .Levy import levy
 
@@ -38,15 +37,17 @@ class HippopotamusOptAlg(Optimizer):
             Alfa2 = bm.random.rand(i1, dim) 
             Alfa3 = I1 * bm.random.rand(i1, dim) + Ip2
             Alfa4 = bm.random.rand(i1, 1) * bm.ones((i1, dim))
-            AA = bm.array([random.randint(0, 5) for _ in range(i1)])[:, None] 
-            BB = bm.array([random.randint(0, 5) for _ in range(i1)])[:, None]
+            AA = bm.random.randint(0, 6, (i1, 1))
+            BB = bm.random.randint(0, 6, (i1, 1))
             A = (AA == 0) * Alfa0 + (AA == 1) * Alfa1 + (AA == 2) * Alfa2 + (AA == 3) * Alfa3 + (AA == 4) * Alfa4
             B = (BB == 0) * Alfa0 + (BB == 1) * Alfa1 + (BB == 2) * Alfa2 + (BB == 3) * Alfa3 + (BB == 4) * Alfa4
-            RandGroupNumber = [random.randint(1, N + 1) for _ in range(i1)]
-            MeanGroup = bm.zeros((i1, dim))
-            for i in range(i1):
-                RandGroup = bm.random.permutation(N)[: RandGroupNumber[i]]
-                MeanGroup[i] = x[RandGroup].mean(axis=0)
+            # Mean of a random group of the population for each row, the group
+            # is the leading part of a random permutation.
+            RandGroupNumber = bm.random.randint(1, N + 2, (i1, 1))
+            RandGroupNumber = bm.minimum(RandGroupNumber, N)
+            rank = bm.argsort(bm.argsort(bm.random.rand(i1, N), axis=1), axis=1)
+            RandGroup = bm.astype(rank < RandGroupNumber, x.dtype)
+            MeanGroup = (RandGroup @ x) / RandGroupNumber
 
             r1 = bm.random.rand(i1 ,1)
             X_P1 = x[: i1] + r1 * (gbest - I1 * x[: i1]) # Eq.(3)
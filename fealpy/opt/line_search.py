@@ -22,7 +22,7 @@ def show_line_fun(axes, fun, a, b, n=100):
         F[i] = f
     axes.plot(t, F)
 
-def quadratic_search(x0: NDArray, f: np.float_, d: NDArray, fun: ObjFunc,
+def quadratic_search(x0: NDArray, f: np.float64, d: NDArray, fun: ObjFunc,
                 alpha: Optional[float]=None,**kwargs) -> Tuple[Optional[float], NDArray, np.floating, NDArray]:
     """
     @brief 二次搜索算法
@@ -45,7 +45,7 @@ def quadratic_search(x0: NDArray, f: np.float_, d: NDArray, fun: ObjFunc,
     x = x0 + a1*d
     f, g = fun(x)
     f1 = f
-    g1: np.float_ = np.sum(g*d)
+    g1: np.float64 = np.sum(g*d)
 
     k = 0
     while k < 100:
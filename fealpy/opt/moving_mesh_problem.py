@@ -1,13 +1,9 @@
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
-from fealpy.mesh import TriangleMesh
 
 from fealpy.functionspace import LagrangeFESpace
-from fealpy.fem import (BilinearForm,
-                                     LinearForm,
-                                     ScalarDiffusionIntegrator,
-                                     ScalarSourceIntegrator,
-                                     DirichletBC)
+from fealpy.fem import (ScalarDiffusionIntegrator,
+                                     ScalarSourceIntegrator)
 
 from .. import logger
 
@@ -23,6 +19,11 @@ class MovingMeshAlg:
         self.model = model
         self.isbdnode = mesh.boundary_node_flag()
 
+        # The integrators are built once on the mesh, and only their geometry
+        # dependent cache is cleared when the nodes move.
+        self._A_int = ScalarDiffusionIntegrator(method="fast")
+        self._F_int = ScalarSourceIntegrator(pde.source)
+
 
     def __call__(self, node: TensorLike):
 
@@ -38,31 +39,36 @@ class MovingMeshAlg:
             grad = node.grad
 
         return E , grad
-    
+
+    def set_node(self, node: TensorLike):
+        """
+        @brief 移动网格节点, 拓扑 (cell, edge, cell_to_dof) 保持不变,
+        只清除积分子中依赖几何的缓存 (基函数梯度, 单元测度等)
+        """
+        if node.shape != self.mesh.node.shape:
+            raise ValueError(f"The shape of node {tuple(node.shape)} does not match "
+                             f"the mesh {tuple(self.mesh.node.shape)}.")
+        self.mesh.node = node
+        self._A_int.clear(result_only=False)
+        self._F_int.clear(result_only=False)
+
     def get_energy(self,node : TensorLike):
-        p =1
-        cell = self.mesh.cell
-        isbdnode = self.isbdnode
-        source = self.pde.source
+        """
+        @brief 计算能量 E = 1/2 u_I^T A_II u_I - u_I^T F_I, 其中 I 为内部节点.
+        在单元上逐个缩并局部矩阵, 不组装 (也不稠密化) 全局矩阵
+        """
+        self.set_node(node)
+        space = self.space
+        cell2dof = space.cell_to_dof()
 
-        mesh = TriangleMesh(node,cell)     
-        space = LagrangeFESpace(mesh,p)
+        A_k = self._A_int(space) # (NC, ldof, ldof)
+        F_k = self._F_int(space) # (NC, ldof)
 
-        bform = BilinearForm(space)
-        bform.add_integrator(ScalarDiffusionIntegrator(method="fast"))
-        A = bform.assembly()
-        lform = LinearForm(space)
-        lform.add_integrator(ScalarSourceIntegrator(source))
-        F = lform.assembly()
         # 去除边界项的影响
-        A = A.to_dense()
-        A = A[~isbdnode]
-        A = A[:,~isbdnode]
-        F = F[~isbdnode]
-
-        uh = self.pde.solution(node)[~isbdnode]  
+        uh = bm.where(self.isbdnode, 0., self.pde.solution(node))
+        u_k = uh[cell2dof]
 
-        E = 1/2 * bm.einsum('i , ij ,j->', uh, A, uh) - bm.dot(uh,F)
+        E = 1/2 * bm.einsum('ki, kij, kj ->', u_k, A_k, u_k) - bm.einsum('ki, ki ->', u_k, F_k)
         return E
     
     def get_energy_local(self):
@@ -106,18 +112,15 @@ class MovingMeshAlg:
         pde = self.pde
         cell = self.cell
         p = self.p
-        self.mesh = TriangleMesh(node , cell)
-        self.space = LagrangeFESpace(self.mesh, p)
+        self.set_node(node)
         mesh = self.mesh
 
         u = self.pde.solution(node)
 
         I_k,J_k = self.get_energy_local()
-        print("J_k:",J_k)
  
         g_tau = self.grad_tau()
         tau = mesh.entity_measure('cell') 
-        print("1/tau:\n",1/tau)
 
         cell2dof = self.space.cell_to_dof()
 
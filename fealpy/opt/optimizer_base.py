@@ -4,6 +4,9 @@ from fealpy.backend import backend_manager as bm
 from fealpy.typing import TensorLike, Index, _S
 from fealpy import logger
 
+ObjFunc = Callable[[TensorLike], Tuple[TensorLike, TensorLike]]
+Float = Union[float, TensorLike]
+
 def opt_alg_options(
     x0: TensorLike,
     objective,
@@ -19,6 +22,8 @@ def opt_alg_options(
     NumGrad: int = 10,
     LineSearch: Optional[str] = None,
     Print: bool = True,
+    Vectorized: bool = True,
+    NumWorkers: int = 0,
 ):
     options = {
             "x0": x0,
@@ -36,14 +41,95 @@ def opt_alg_options(
             "NumGrad": NumGrad,
             "LineSearch": LineSearch,
             "Print": Print,
+            "Vectorized": Vectorized,
+            "NumWorkers": NumWorkers,
             }
     return options 
 
+class PopulationEvaluator():
+    """Evaluate the objective function over a whole population.
+
+    Parameters:
+        objective (Callable): The objective function.
+        vectorized (bool, optional): Whether the objective accepts the population\
+        shaped (NP, ndim) and returns the values shaped (NP,) in one call.\
+        Defaults to True.
+        workers (int, optional): The number of worker processes used to evaluate\
+        non-vectorized objectives. The objective must be picklable, e.g. defined\
+        on the module level. Evaluate row by row in the current process if 0.\
+        Defaults to 0.
+        chunksize (int | None, optional): Number of rows sent to a worker in a\
+        task. Defaults to None, splitting the population evenly.
+    """
+    def __init__(self, objective: Callable, *, vectorized: bool=True,
+                 workers: int=0, chunksize: Optional[int]=None) -> None:
+        self.objective = objective
+        self.vectorized = vectorized
+        self.workers = workers
+        self.chunksize = chunksize
+        self._pool = None
+
+    def __call__(self, x: TensorLike, out: Optional[TensorLike]=None) -> TensorLike:
+        """Evaluate the population `x` shaped (NP, ndim).
+
+        Parameters:
+            x (TensorLike): The population.
+            out (TensorLike | None, optional): A preallocated buffer shaped (NP,)\
+            receiving the values of non-vectorized objectives. Defaults to None.
+
+        Returns:
+            TensorLike: The objective values shaped (NP,).
+        """
+        if self.vectorized:
+            return self.objective(x)
+
+        NP = x.shape[0]
+        if out is None:
+            out = bm.zeros((NP,), **bm.context(x))
+
+        if self.workers > 0:
+            chunksize = self.chunksize
+            if chunksize is None:
+                chunksize = max(1, -(-NP // self.workers))
+            rows = list(bm.to_numpy(x))
+            values = list(self.pool.map(self.objective, rows, chunksize=chunksize))
+            out[:] = bm.tensor(values, **bm.context(out))
+        else:
+            for i in range(NP):
+                out[i] = self.objective(x[i])
+
+        return out
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
 class Optimizer():
     def __init__(self, options) -> None:
         self.options = options 
         self.debug: bool = False
         self.__NF: int = 0
+        self.evaluator = PopulationEvaluator(
+            options['objective'],
+            vectorized=options.get('Vectorized', True),
+            workers=options.get('NumWorkers', 0)
+        )
 
     @property
     def NF(self) -> int:
@@ -53,19 +139,25 @@ class Optimizer():
         return self.__NF
 
 
-    def fun(self, x: TensorLike):
+    def fun(self, x: TensorLike, out: Optional[TensorLike]=None):
         """
         Objective function.
         The counter `self.NF` works automatically when call `fun(x)`.
 
         Parameters:
             x [TensorLike]: Input of objective function.
+            out [TensorLike | None]: Preallocated buffer for the values of\
+            non-vectorized objectives.
 
         Return:
             The function value, with gradient value for gradient methods.
         """
         self.__NF += self.options['NP'] 
-        return self.options['objective'](x)
+        return self.evaluator(x, out=out)
+
+    def close(self) -> None:
+        """Release the worker processes of the population evaluator."""
+        self.evaluator.close()
 
 
     def run(self):
@@ -41,20 +41,45 @@ class PSOProblem:
         self.data['noS'] = bm.where((self.data['node'][:, 0] == self.dataS[0]) & (self.data['node'][:, 1] == self.dataS[1]))[0][0]
         self.data['noE'] = bm.where((self.data['node'][:, 0] == self.dataE[0]) & (self.data['node'][:, 1] == self.dataE[1]))[0][0]
         self.data['numLM0'] = 1
+        self.build_distance_table()
         return self.data
-    
+
+    def build_distance_table(self):
+        """Precompute the shortest path lengths (number of steps) on the grid graph,
+        so that the fitness is evaluated by table lookups instead of graph searches.
+
+        With one landmark, only the distances from the start node and to the end
+        node are needed. Otherwise, the all-pairs table is computed.
+        """
+        from scipy.sparse.csgraph import shortest_path
+        net = self.data['net']
+        noS, noE = int(self.data['noS']), int(self.data['noE'])
+
+        if self.data['numLM0'] == 1:
+            self.data['DS'] = shortest_path(net, unweighted=True, indices=noS)
+            self.data['DE'] = shortest_path(net.T, unweighted=True, indices=noE)
+            self.data['DA'] = None
+        else:
+            DA = shortest_path(net, unweighted=True)
+            self.data['DS'] = DA[noS]
+            self.data['DE'] = DA[:, noE]
+            self.data['DA'] = DA
+
     def fitness(self, X):
-        sorted_numbers = bm.argsort(X)
-        G = nx.DiGraph(self.data["net"])
-        sorted_numbers_flat = sorted_numbers[:, :self.data['numLM0']]
-        noS = bm.full((X.shape[0],), self.data['noS']).reshape(-1, 1)
-        noE = bm.full((X.shape[0],), self.data['noE']).reshape(-1, 1)
-        path0 = bm.concatenate((noS, sorted_numbers_flat, noE), axis=1)
-        distances = bm.zeros((X.shape[0], path0.shape[1] - 1))
-        for j in range(0, X.shape[0]):   
-            distance = [nx.shortest_path_length(G, source=int(path0[j][i]), target=int(path0[j][i + 1]), weight=None) for i in range(path0.shape[1] - 1)]
-            distances[j, :] = bm.tensor(distance)
-        fit = bm.sum(distances, axis=1)
+        if 'DS' not in self.data:
+            self.build_distance_table()
+        numLM0 = self.data['numLM0']
+        LM = bm.argsort(X, axis=-1)[:, :numLM0]
+        DS = bm.tensor(self.data['DS'], dtype=X.dtype)
+        DE = bm.tensor(self.data['DE'], dtype=X.dtype)
+        fit = DS[LM[:, 0]] + DE[LM[:, -1]]
+
+        if numLM0 > 1:
+            if self.data['DA'] is None:
+                self.build_distance_table()
+            DA = bm.tensor(self.data['DA'], dtype=X.dtype)
+            fit = fit + bm.sum(DA[LM[:, :-1], LM[:, 1:]], axis=1)
+
         return fit
     
     def calresult(self, X):
@@ -0,0 +1,101 @@
+import math
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from .optimizer_base import Optimizer
+from .line_search import get_linesearch
+
+"""
+Reference
+---------
+J. Nocedal, S. J. Wright. Numerical Optimization, 2nd ed., Algorithm 7.1.
+"""
+
+
+class TruncatedNewtonAlg(Optimizer):
+    """Line-search Newton-CG method.
+
+    The Newton direction is solved inexactly by the conjugate gradient method,
+    which only needs the Hessian-vector products `objective.hessp(x, p)`, and
+    is truncated when the residual is small relative to the gradient or when
+    a direction of negative curvature is met. The objective in the options
+    must provide `fun`, `jac` and `hessp`, see `fealpy.opt.Objective`.
+    """
+    def __init__(self, options) -> None:
+        super().__init__(options)
+        self.NCG = 0
+
+    def _fun_jac(self, x: TensorLike):
+        return self.fun(x), self.options['objective'].jac(x)
+
+    def newton_direction(self, x: TensorLike, g: TensorLike, maxit: int) -> TensorLike:
+        """Solve H(x) d = -g by the truncated conjugate gradient method.
+
+        Parameters:
+            x (TensorLike): The current point.
+            g (TensorLike): The gradient at x.
+            maxit (int): The maximum number of the CG iterations.
+
+        Returns:
+            TensorLike: The search direction, in the same shape as x.
+        """
+        hessp = self.options['objective'].hessp
+        gnorm = bm.sqrt(bm.sum(g**2))
+        tol = min(0.5, float(bm.sqrt(gnorm)))*gnorm
+        z = bm.zeros_like(g)
+        r = g
+        p = -r
+        rr = bm.sum(r**2)
+
+        for j in range(maxit):
+            Hp = hessp(x, p)
+            pHp = bm.sum(p*Hp)
+            self.NCG += 1
+            if pHp <= 0:
+                return -g if j == 0 else z
+            alpha = rr/pHp
+            z = z + alpha*p
+            r = r + alpha*Hp
+            rr_new = bm.sum(r**2)
+            if bm.sqrt(rr_new) < tol:
+                break
+            p = -r + (rr_new/rr)*p
+            rr = rr_new
+
+        return z
+
+    def run(self, queue=None, maxit=None, inner_maxit=None):
+        options = self.options
+        x = options['x0']
+        f, g = self._fun_jac(x)
+        search = get_linesearch(options['LineSearch'] or 'wolfe')
+        self.diff = bm.inf
+
+        if maxit is None:
+            maxit = options['MaxIters']
+        if inner_maxit is None:
+            inner_maxit = math.prod(g.shape)
+
+        for i in range(maxit):
+            maxg = bm.max(bm.abs(g))
+            if maxg < options['NormGradTol']:
+                break
+
+            d = self.newton_direction(x, g, inner_maxit)
+            s = bm.sum(g*d)
+            alpha, x, fc, g = search(x0=x, f=f, s=s, d=d, fun=self._fun_jac,
+                                     alpha0=options['StepLength'],
+                                     alpha=options['StepLength'])
+            self.diff = bm.abs(fc - f)
+            f = fc
+
+            if options['Print']:
+                print(f"Newton iteration {i}: f = {float(f):12.11g}, "
+                      f"max|g| = {float(bm.max(bm.abs(g))):12.11g}, "
+                      f"step length = {float(alpha):.4g}")
+
+            if (alpha is not None) and (alpha*bm.max(bm.abs(d)) < options['StepLengthTol']):
+                break
+
+        self.x, self.f, self.g = x, f, g
+        return self.x, self.f, self.g, self.diff
@@ -6,7 +6,7 @@ from .quadrature import Quadrature
 
 class GaussLegendreQuadrature(Quadrature):
     def make(self, index: int):
-        kwargs = {'dtype': bm.float64, 'device': self.device}
+        kwargs = {'dtype': self.dtype, 'device': self.device}
         if index == 1:
             A = bm.tensor([[0.0, 2.0]], **kwargs)
         elif index == 2:
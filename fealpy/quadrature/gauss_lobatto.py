@@ -5,7 +5,7 @@ from .quadrature import Quadrature
 
 class GaussLobattoQuadrature(Quadrature):
     def make(self, index:int):
-        kwargs = {'dtype': bm.float64, 'device': self.device}
+        kwargs = {'dtype': self.dtype, 'device': self.device}
         if index == 2:
             A = bm.tensor([[-1, 1], [1, 1]], **kwargs)
         elif index == 3:
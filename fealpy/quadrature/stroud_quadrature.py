@@ -3,14 +3,17 @@ from scipy.special import j_roots, factorial
 from ..backend import backend_manager as bm
 
 class StroudQuadrature:
-    def __init__(self, dim, n):
+    def __init__(self, dim, n, *, dtype=None, device=None):
         self.dim = dim
         self.n = n
+        self.dtype = dtype if dtype else bm.float64
+        self.device = device
         p, self.weights = self._compute_quadrature()
         self.points = self._to_simplex(p)
 
-        self.points  = bm.tensor(self.points, dtype=bm.float64)
-        self.weights = bm.tensor(self.weights, dtype=bm.float64)
+        kwargs = {'dtype': self.dtype, 'device': self.device}
+        self.points  = bm.tensor(self.points, **kwargs)
+        self.weights = bm.tensor(self.weights, **kwargs)
 
     def _to_simplex(self, points):
         d = self.dim
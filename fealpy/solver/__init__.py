@@ -1,3 +1,20 @@
 
 from .conjugate_gradient import cg
 from .direct_solver import spsolve
+from .mixed_precision import mpir
+from .minres import minres
+from .gmres import fgmres
+from .preconditioner import (
+    JacobiPreconditioner, LUPreconditioner, ILUPreconditioner, AMGPreconditioner
+)
+from .schwarz_preconditioner import SchwarzPreconditioner
+from .multigrid import GMGPreconditioner, PMGPreconditioner
+from .block_preconditioner import (
+    BlockOperator,
+    BlockDiagonalPreconditioner, BlockTriangularPreconditioner,
+    MassSchurComplement, LSCSchurComplement
+)
+from .newton import NewtonSolver
+from .time_integrator import (
+    OperatorCombination, TimeIntegrator, ThetaScheme, BDFScheme, NewmarkScheme
+)
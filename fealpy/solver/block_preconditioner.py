@@ -0,0 +1,205 @@
+
+from typing import List, Optional, Sequence, Union
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+from .preconditioner import Preconditioner, LUPreconditioner
+
+_SP = Union[COOTensor, CSRTensor]
+
+
+class BlockOperator():
+    """A linear operator composed of sparse blocks, e.g. the saddle point
+    system [[A, B^T], [B, 0]]. The blocks are kept separately instead of being
+    merged into one monolithic matrix, so that block preconditioners can
+    access them.
+
+    Parameters:
+        blocks (List[List[COOTensor | CSRTensor | None]]): Nested list of the\
+        sparse blocks. `None` stands for a zero block.
+    """
+    def __init__(self, blocks: List[List[Optional[_SP]]]) -> None:
+        self.blocks = blocks
+        self.nrows = len(blocks)
+        self.ncols = len(blocks[0])
+        row_sizes = [0] * self.nrows
+        col_sizes = [0] * self.ncols
+
+        for i, row in enumerate(blocks):
+            if len(row) != self.ncols:
+                raise ValueError("All the block rows must have the same length.")
+            for j, block in enumerate(row):
+                if block is None:
+                    continue
+                row_sizes[i] = max(row_sizes[i], block.shape[-2])
+                col_sizes[j] = max(col_sizes[j], block.shape[-1])
+
+        self.row_offset = [0]
+        for n in row_sizes:
+            self.row_offset.append(self.row_offset[-1] + n)
+        self.col_offset = [0]
+        for n in col_sizes:
+            self.col_offset.append(self.col_offset[-1] + n)
+
+        self.shape = (self.row_offset[-1], self.col_offset[-1])
+
+    @classmethod
+    def from_block_form(cls, form, *, format: str='csr') -> 'BlockOperator':
+        """Assemble all the blocks of a `BlockForm` into a block operator."""
+        return cls(form.assembly_blocks(format=format))
+
+    def __getitem__(self, index):
+        i, j = index
+        return self.blocks[i][j]
+
+    def row_slice(self, i: int) -> slice:
+        return slice(self.row_offset[i], self.row_offset[i+1])
+
+    def col_slice(self, j: int) -> slice:
+        return slice(self.col_offset[j], self.col_offset[j+1])
+
+    def split(self, u: TensorLike) -> List[TensorLike]:
+        """Split a global vector into the block column components."""
+        return [u[self.col_slice(j)] for j in range(self.ncols)]
+
+    def __matmul__(self, u: TensorLike) -> TensorLike:
+        parts = self.split(u)
+        out = []
+
+        for i in range(self.nrows):
+            v = None
+            for j in range(self.ncols):
+                block = self.blocks[i][j]
+                if block is None:
+                    continue
+                r = block @ parts[j]
+                v = r if v is None else v + r
+            if v is None:
+                n = self.row_offset[i+1] - self.row_offset[i]
+                v = bm.zeros((n,) + u.shape[1:], **bm.context(u))
+            out.append(v)
+
+        return bm.concat(out, axis=0)
+
+    def to_sparse(self) -> COOTensor:
+        """Merge the blocks into one monolithic COO tensor."""
+        indices_list = []
+        values_list = []
+
+        for i in range(self.nrows):
+            for j in range(self.ncols):
+                block = self.blocks[i][j]
+                if block is None:
+                    continue
+                block = block.tocoo()
+                offset = bm.array([[self.row_offset[i]], [self.col_offset[j]]],
+                                  **bm.context(block.indices()))
+                indices_list.append(block.indices() + offset)
+                values_list.append(block.values())
+
+        indices = bm.concat(indices_list, axis=1)
+        values = bm.concat(values_list, axis=-1)
+        return COOTensor(indices, values, self.shape).coalesce()
+
+
+class BlockDiagonalPreconditioner(Preconditioner):
+    """Block diagonal preconditioner P = diag(P_0, P_1, ...).
+
+    For the saddle point system [[A, B^T], [B, 0]], use P_0 ≈ A^{-1} (AMG, ILU, ...)
+    and P_1 ≈ S^{-1} where S = B A^{-1} B^T is the Schur complement. This
+    preconditioner is symmetric positive definite when the sub-preconditioners
+    are, so it can be used in `minres`.
+
+    Parameters:
+        preconditioners (Sequence[SupportsMatmul]): Approximate inverses of the\
+        diagonal blocks, applied by `P_i @ r_i`.
+        operator (BlockOperator): Provides the block layout.
+    """
+    def __init__(self, preconditioners: Sequence, operator: BlockOperator) -> None:
+        if len(preconditioners) != operator.nrows:
+            raise ValueError(f"{operator.nrows} diagonal preconditioners are required, "
+                             f"but got {len(preconditioners)}.")
+        self.preconditioners = preconditioners
+        self.operator = operator
+        self.shape = operator.shape
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        op = self.operator
+        out = [P @ r[op.row_slice(i)] for i, P in enumerate(self.preconditioners)]
+        return bm.concat(out, axis=0)
+
+
+class BlockTriangularPreconditioner(BlockDiagonalPreconditioner):
+    """Block upper triangular preconditioner for 2x2 block systems.
+
+    For [[A, B^T], [B, 0]], this applies the inverse of [[A, B^T], [0, -S]]
+    with the approximate inverses of A and S. With the exact inverses, GMRES
+    converges in two iterations. Use it with `fgmres`.
+
+    Parameters:
+        preconditioners (Sequence[SupportsMatmul]): Approximate inverses of A and S.
+        operator (BlockOperator): The 2x2 block operator.
+    """
+    def __init__(self, preconditioners: Sequence, operator: BlockOperator) -> None:
+        if operator.nrows != 2 or operator.ncols != 2:
+            raise ValueError("BlockTriangularPreconditioner only supports 2x2 blocks.")
+        super().__init__(preconditioners, operator)
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        op = self.operator
+        PA, PS = self.preconditioners
+        r0, r1 = r[op.row_slice(0)], r[op.row_slice(1)]
+        y = -(PS @ r1)
+        Bt = op[0, 1]
+        x = PA @ (r0 - Bt @ y) if Bt is not None else PA @ r0
+        return bm.concat([x, y], axis=0)
+
+
+class MassSchurComplement(Preconditioner):
+    """Approximate the inverse Schur complement of Stokes-like systems by the
+    scaled inverse of the pressure mass matrix, S^{-1} ≈ coef * M_p^{-1}.
+
+    Parameters:
+        Mp (COOTensor | CSRTensor): The pressure mass matrix.
+        coef (float, optional): The scale, e.g. the viscosity. Defaults to 1.0.
+        preconditioner (type, optional): The class approximating M_p^{-1}.\
+        Defaults to `LUPreconditioner`. `JacobiPreconditioner` is cheaper and\
+        usually good enough because the mass matrix is well conditioned.
+    """
+    def __init__(self, Mp: _SP, coef: float=1.0,
+                 preconditioner=LUPreconditioner) -> None:
+        super().__init__(Mp)
+        self.inv_Mp = preconditioner(Mp)
+        self.coef = coef
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        return self.coef * (self.inv_Mp @ r)
+
+
+class LSCSchurComplement(Preconditioner):
+    """Least-squares commutator (LSC) approximation of the inverse Schur
+    complement of the (Navier-)Stokes system [[F, B^T], [B, 0]],
+
+        S^{-1} ≈ (B B^T)^{-1} (B F B^T) (B B^T)^{-1}.
+
+    Parameters:
+        F (COOTensor | CSRTensor): The velocity block.
+        B (COOTensor | CSRTensor): The divergence block.
+        Bt (COOTensor | CSRTensor): The gradient block, B^T.
+        preconditioner (type, optional): The class approximating (B B^T)^{-1}.\
+        Defaults to `LUPreconditioner`.
+    """
+    def __init__(self, F: _SP, B: _SP, Bt: _SP,
+                 preconditioner=LUPreconditioner) -> None:
+        BBt = (B.to_scipy() @ Bt.to_scipy()).tocsr()
+        BBt = CSRTensor.from_scipy(BBt)
+        super().__init__(BBt)
+        self.F, self.B, self.Bt = F, B, Bt
+        self.inv_BBt = preconditioner(BBt)
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        y = self.inv_BBt @ r
+        y = self.B @ (self.F @ (self.Bt @ y))
+        return self.inv_BBt @ y
@@ -1,5 +1,5 @@
 
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Tuple, Dict
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
@@ -12,25 +12,44 @@ class SupportsMatmul(Protocol):
 
 
 def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+       M: Optional[SupportsMatmul]=None,
        batch_first: bool=False,
        atol: float=1e-12, rtol: float=1e-8,
-       maxiter: Optional[int]=10000) -> TensorLike:
+       maxiter: Optional[int]=10000,
+       method: str='cg',
+       return_info: bool=False):
     """Solve a linear system Ax = b using the Conjugate Gradient (CG) method.
 
+    For multiple right-hand sides, the convergence is checked column by column.
+    Converged columns are removed from the iteration (deflated), so the later
+    products `A @ p` only involve the columns still running.
+
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
         b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
         x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
         Must have the same shape as b when reshaped appropriately.
+        M (SupportsMatmul | None, optional): The symmetric positive definite\
+        preconditioner applied by `M @ r`. Defaults to None.
         batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
         is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
         atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
-        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        rtol (float, optional): Relative tolerance for convergence, relative to\
+        the norm of each column of `b`. Default is 1e-8.
         maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.\
         If not provided, the method will continue until convergence based on the given tolerances.
+        method (str, optional): 'cg' to iterate the columns independently, or\
+        'block' for the block CG of O'Leary, where the columns share one block\
+        Krylov space and usually converge in fewer iterations. The block method\
+        requires linearly independent columns of `b`. Default is 'cg'.
+        return_info (bool, optional): Whether to return the iteration statistics.\
+        Default is False.
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
+        dict: Only if `return_info` is True, with the number of iterations 'niter',\
+        the residual norms 'residual' and the flags 'converged' of the columns,\
+        shaped (batch,), or scalars for 1-d `b`.
 
     Raises:
         ValueError: If inputs do not meet the specified conditions (e.g., A is not sparse, dimensions mismatch).
@@ -57,55 +76,172 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
         b = bm.swapaxes(b, 0, 1)
         x0 = bm.swapaxes(x0, 0, 1)
 
-    sol = _cg_impl(A, b, x0, atol, rtol, maxiter)
+    if method == 'cg':
+        impl = _cg_impl
+    elif method == 'block':
+        impl = _block_cg_impl
+    else:
+        raise ValueError(f"Unknown CG method '{method}', use 'cg' or 'block'.")
+
+    if single_vector:
+        A_, M_ = _ColumnOperator(A), (None if M is None else _ColumnOperator(M))
+        sol, info = impl(A_, b[:, None], x0[:, None], M_, atol, rtol, maxiter)
+        sol = sol[:, 0]
+        info = {k: v[0] for k, v in info.items()}
+    else:
+        sol, info = impl(A, b, x0, M, atol, rtol, maxiter)
 
     if (not single_vector) and batch_first:
         sol = bm.swapaxes(sol, 0, 1)
 
+    if return_info:
+        return sol, info
     return sol
 
 
-def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, atol, rtol, maxiter):
-    # initialize
-    x = x0              # (dof, batch)
-    r = b - A @ x       # (dof, batch)
-    p = r               # (dof, batch)
+def _coldot(a: TensorLike, b: TensorLike) -> TensorLike:
+    """Inner products of the corresponding columns, without a temporary a*b."""
+    return bm.einsum('ij, ij -> j', a, b)
+
+
+def _take_columns(keep: TensorLike, *arrays: TensorLike):
+    # `take` keeps the row-major layout, which `a[:, mask]` does not in numpy,
+    # so the sparse matrix products read the columns without copying.
+    idx = bm.nonzero(keep)[0]
+    return tuple(bm.take(a, idx, axis=a.ndim - 1) for a in arrays)
+
+
+class _ColumnOperator():
+    """Apply an operator of 1-d vectors to the single column of a 2-d tensor."""
+    def __init__(self, A: SupportsMatmul) -> None:
+        self.A = A
+
+    def __matmul__(self, x: TensorLike) -> TensorLike:
+        return (self.A @ x[:, 0])[:, None]
+
+
+class _CGState():
+    """Output buffers and the bookkeeping of the columns still iterating."""
+    def __init__(self, x: TensorLike, b: TensorLike, atol: float, rtol: float):
+        kwargs = bm.context(b)
+        NB = b.shape[1]
+        self.x = x
+        self.active = bm.arange(NB, dtype=bm.int64, device=bm.get_device(b))
+        self.niter = bm.zeros((NB, ), dtype=bm.int64, device=bm.get_device(b))
+        self.residual = bm.zeros((NB, ), **kwargs)
+        self.converged = bm.zeros((NB, ), dtype=bm.bool, device=bm.get_device(b))
+        self.tol = bm.maximum(rtol * bm.sqrt(_coldot(b, b)),
+                              bm.full((NB, ), atol, **kwargs))
+
+    def check(self, X: TensorLike, R: TensorLike, n_iter: int) -> TensorLike:
+        """Record the columns converged in this iteration, and return the mask
+        of the columns to keep."""
+        r_norm = bm.sqrt(_coldot(R, R))
+        done = r_norm < self.tol
+        act = self.active
+        self.residual = bm.set_at(self.residual, act, r_norm)
+        self.niter = bm.set_at(self.niter, act, n_iter)
+        if bm.any(done):
+            idx = act[done]
+            self.x = bm.set_at(self.x, (slice(None), idx), X[:, done])
+            self.converged = bm.set_at(self.converged, idx, True)
+            self.active = act[~done]
+            self.tol = self.tol[~done]
+        return ~done
+
+    def finish(self, X: TensorLike, name: str, maxiter) -> Tuple[TensorLike, Dict]:
+        NB = self.niter.shape[0]
+        n_conv = int(bm.sum(self.converged))
+        if self.active.shape[0] > 0:
+            self.x = bm.set_at(self.x, (slice(None), self.active), X)
+            logger.info(f"{name}: failed for {NB - n_conv} of {NB} columns, "
+                        f"stopped by maxiter ({maxiter}).")
+        else:
+            logger.info(f"{name}: converged in {int(bm.max(self.niter))} iterations "
+                        f"for all {NB} columns.")
+        info = {'niter': self.niter, 'residual': self.residual,
+                'converged': self.converged}
+        return self.x, info
+
+
+def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter):
+    # The iterates of the active columns are updated in place; converged
+    # columns are written to the output and dropped from the iteration.
+    psolve = (lambda r: r) if M is None else (lambda r: M @ r)
+    state = _CGState(bm.copy(x0), b, atol, rtol)
+    X = bm.copy(x0)         # (dof, active)
+    R = b - A @ X           # (dof, active)
     n_iter = 0
-    b_norm = bm.linalg.norm(b)
-    sum_func = bm.sum
-    sqrt_func = bm.sqrt
-
-    # iterate
-    while True:
-        Ap = A @ p      # (dof, batch)
-        rTr = sum_func(r**2, axis=0)
-        alpha = rTr / sum_func(p*Ap, axis=0)  # r @ r / (p @ Ap) # (batch,)
-        x = x + alpha[None, ...] * p  # (dof, batch)
-        r_new = r - alpha[None, ...] * Ap
-        rTr_new = sum_func(r_new**2, axis=0)  # (batch,)
-        r_norm_new = sqrt_func(sum_func(rTr_new))
-
+    keep = state.check(X, R, n_iter)
+    if not bm.all(keep):
+        X, R = _take_columns(keep, X, R)
+    Z = psolve(R)
+    P = bm.copy(Z)
+    rTz = _coldot(R, Z)  # (active,)
+
+    while state.active.shape[0] > 0:
+        if (maxiter is not None) and (n_iter >= maxiter):
+            break
+        Ap = A @ P
+        alpha = rTz / _coldot(P, Ap)
+        X += alpha[None, :] * P
+        R -= alpha[None, :] * Ap
         n_iter += 1
 
-        if r_norm_new < atol:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by absolute tolerance.")
-            break
+        keep = state.check(X, R, n_iter)
+        if not bm.all(keep):
+            X, R, P, rTz = _take_columns(keep, X, R, P, rTz)
+            if X.shape[1] == 0:
+                break
+
+        Z = psolve(R)
+        rTz_new = _coldot(R, Z)
+        P *= (rTz_new / rTz)[None, :]
+        P += Z
+        rTz = rTz_new
+
+    return state.finish(X, 'CG', maxiter)
+
+
+def _block_cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter):
+    # D. P. O'Leary, The block conjugate gradient algorithm and related methods,
+    # Linear Algebra Appl. 29 (1980). The block is restarted on the remaining
+    # columns when some of them converge, which keeps the block of full rank.
+    psolve = (lambda r: r) if M is None else (lambda r: M @ r)
+    solve = bm.linalg.solve
+    state = _CGState(bm.copy(x0), b, atol, rtol)
+    X = bm.copy(x0)
+    R = b - A @ X
+    n_iter = 0
+    restart = True
 
-        if r_norm_new < rtol * b_norm:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by relative tolerance.")
+    while True:
+        keep = state.check(X, R, n_iter)
+        if not bm.all(keep):
+            X, R = _take_columns(keep, X, R)
+            restart = True
+        if state.active.shape[0] == 0:
             break
-
         if (maxiter is not None) and (n_iter >= maxiter):
-            logger.info(f"CG: failed, stopped by maxiter ({maxiter}).")
             break
 
-        beta = rTr_new / rTr # (batch,)
-        p = r_new + beta[None, ...] * p
-        r = r_new
+        Z = psolve(R)
+        RZ_new = R.T @ Z       # (active, active)
+        if restart:
+            P = bm.copy(Z)
+            restart = False
+        else:
+            P = Z + P @ solve(RZ, RZ_new)
+        RZ = RZ_new
+
+        Q = A @ P
+        alpha = solve(P.T @ Q, RZ)
+        X += P @ alpha
+        R -= Q @ alpha
+        n_iter += 1
+
+    return state.finish(X, 'Block CG', maxiter)
 
-    return x
 
     # @staticmethod
     # def setup_context(ctx, inputs, output):
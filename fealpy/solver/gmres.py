@@ -0,0 +1,123 @@
+
+from typing import Optional
+from math import hypot
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .. import logger
+from .conjugate_gradient import SupportsMatmul
+
+
+def fgmres(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+           M: Optional[SupportsMatmul]=None, restart: int=30,
+           atol: float=1e-12, rtol: float=1e-8,
+           maxiter: Optional[int]=10000) -> TensorLike:
+    """Solve a general linear system Ax = b using the Flexible GMRES method.
+
+    FGMRES is right-preconditioned and stores the preconditioned directions,
+    so the preconditioner `M` is allowed to change from one iteration to
+    another (e.g. an inner Krylov solve or a multigrid cycle).
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, a 1D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D tensor.
+        M (SupportsMatmul | None, optional): The right preconditioner applied\
+        by `M @ r`. Defaults to None.
+        restart (int, optional): Dimension of the Krylov space between restarts. Default is 30.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of (inner) iterations allowed. Default is 10000.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+    """
+    if b.ndim != 1:
+        raise ValueError("b must be a 1D dense tensor")
+
+    if x0 is None:
+        x = bm.zeros_like(b)
+    else:
+        if x0.shape != b.shape:
+            raise ValueError("x0 and b must have the same shape")
+        x = x0
+
+    psolve = (lambda r: r) if M is None else (lambda r: M @ r)
+    dot = lambda u, v: float(bm.sum(u * v))
+    b_norm = float(bm.linalg.norm(b))
+    n_iter = 0
+
+    while True:
+        r = b - A @ x
+        beta = float(bm.linalg.norm(r))
+
+        if beta < atol:
+            logger.info(f"FGMRES: converged in {n_iter} iterations, "
+                        "stopped by absolute tolerance.")
+            break
+
+        if beta < rtol * b_norm:
+            logger.info(f"FGMRES: converged in {n_iter} iterations, "
+                        "stopped by relative tolerance.")
+            break
+
+        if (maxiter is not None) and (n_iter >= maxiter):
+            logger.info(f"FGMRES: failed, stopped by maxiter ({maxiter}).")
+            break
+
+        V = [r / beta]
+        Z = []
+        H = np.zeros((restart + 1, restart), dtype=np.float64)
+        cs = np.zeros(restart, dtype=np.float64)
+        sn = np.zeros(restart, dtype=np.float64)
+        g = np.zeros(restart + 1, dtype=np.float64)
+        g[0] = beta
+        k = 0
+
+        for j in range(restart):
+            z = psolve(V[j])
+            Z.append(z)
+            w = A @ z
+
+            # Modified Gram-Schmidt
+            for i in range(j + 1):
+                H[i, j] = dot(w, V[i])
+                w = w - H[i, j] * V[i]
+            h_next = float(bm.linalg.norm(w))
+            H[j + 1, j] = h_next
+
+            # Apply the previous Givens rotations on the new column
+            for i in range(j):
+                t = cs[i] * H[i, j] + sn[i] * H[i + 1, j]
+                H[i + 1, j] = -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+                H[i, j] = t
+
+            rho = hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / rho, H[j + 1, j] / rho
+            H[j, j] = rho
+            H[j + 1, j] = 0.
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+
+            k = j + 1
+            n_iter += 1
+            res = abs(g[j + 1])
+
+            if (res < atol) or (res < rtol * b_norm):
+                break
+            if (maxiter is not None) and (n_iter >= maxiter):
+                break
+            if h_next == 0.: # lucky breakdown
+                break
+
+            V.append(w / h_next)
+
+        y = np.linalg.solve(np.triu(H[:k, :k]), g[:k])
+
+        for i in range(k):
+            x = x + float(y[i]) * Z[i]
+
+    return x
@@ -0,0 +1,117 @@
+
+from typing import Optional
+from math import sqrt
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .. import logger
+from .conjugate_gradient import SupportsMatmul
+
+
+def minres(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+           M: Optional[SupportsMatmul]=None,
+           atol: float=1e-12, rtol: float=1e-8,
+           maxiter: Optional[int]=10000) -> TensorLike:
+    """Solve a symmetric (possibly indefinite) linear system Ax = b using the
+    preconditioned Minimal Residual (MINRES) method.
+
+    Parameters:
+        A (SupportsMatmul): The symmetric coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, a 1D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D tensor.
+        M (SupportsMatmul | None, optional): The symmetric positive definite\
+        preconditioner applied by `M @ r`, e.g. a block diagonal preconditioner\
+        of a saddle point system. Defaults to None.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+
+    Note:
+        The residual is measured in the norm induced by the preconditioner,
+        as in the algorithm of Paige and Saunders.
+    """
+    if b.ndim != 1:
+        raise ValueError("b must be a 1D dense tensor")
+
+    if x0 is None:
+        x = bm.zeros_like(b)
+    else:
+        if x0.shape != b.shape:
+            raise ValueError("x0 and b must have the same shape")
+        x = x0
+
+    psolve = (lambda r: r) if M is None else (lambda r: M @ r)
+    dot = lambda u, v: float(bm.sum(u * v))
+    eps = float(bm.finfo(b.dtype).eps)
+
+    r1 = b - A @ x
+    y = psolve(r1)
+    beta1 = dot(r1, y)
+
+    if beta1 < 0:
+        raise ValueError("MINRES: the preconditioner is not positive definite.")
+    if beta1 == 0:
+        return x
+
+    beta1 = sqrt(beta1)
+    oldb, beta, dbar, epsln = 0., beta1, 0., 0.
+    phibar, cs, sn = beta1, -1., 0.
+    w = bm.zeros_like(b)
+    w2 = bm.zeros_like(b)
+    r2 = r1
+    n_iter = 0
+
+    while True:
+        v = y / beta
+        y = A @ v
+        if n_iter >= 1:
+            y = y - (beta / oldb) * r1
+
+        alpha = dot(v, y)
+        y = y - (alpha / beta) * r2
+        r1 = r2
+        r2 = y
+        y = psolve(r2)
+        oldb = beta
+        beta = dot(r2, y)
+        if beta < 0:
+            raise ValueError("MINRES: the preconditioner is not positive definite.")
+        beta = sqrt(beta)
+
+        # Apply the previous rotation, and compute the next one.
+        oldeps = epsln
+        delta = cs * dbar + sn * alpha
+        gbar = sn * dbar - cs * alpha
+        epsln = sn * beta
+        dbar = -cs * beta
+        gamma = max(sqrt(gbar**2 + beta**2), eps)
+        cs = gbar / gamma
+        sn = beta / gamma
+        phi = cs * phibar
+        phibar = sn * phibar
+
+        w1 = w2
+        w2 = w
+        w = (v - oldeps * w1 - delta * w2) / gamma
+        x = x + phi * w
+        n_iter += 1
+
+        if phibar < atol:
+            logger.info(f"MINRES: converged in {n_iter} iterations, "
+                        "stopped by absolute tolerance.")
+            break
+
+        if phibar < rtol * beta1:
+            logger.info(f"MINRES: converged in {n_iter} iterations, "
+                        "stopped by relative tolerance.")
+            break
+
+        if (maxiter is not None) and (n_iter >= maxiter):
+            logger.info(f"MINRES: failed, stopped by maxiter ({maxiter}).")
+            break
+
+    return x
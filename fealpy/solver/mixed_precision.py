@@ -0,0 +1,121 @@
+
+from typing import Optional, Callable, Union
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+from .. import logger
+from .conjugate_gradient import cg
+
+_Correction = Callable[[TensorLike], TensorLike]
+
+
+def _lu_correction(A: Union[COOTensor, CSRTensor], low_dtype) -> _Correction:
+    """Factorize `A` once in low precision with SuperLU, and return the solver
+    of the correction equation."""
+    from scipy.sparse.linalg import splu
+
+    A_low = A.astype(low_dtype).to_scipy().tocsc()
+    lu = splu(A_low)
+
+    def correction(r: TensorLike) -> TensorLike:
+        d = lu.solve(bm.to_numpy(r))
+        return bm.tensor(d)
+
+    return correction
+
+
+def _cg_correction(A: Union[COOTensor, CSRTensor], low_dtype, rtol: float,
+                   maxiter: int) -> _Correction:
+    """Cast `A` once to low precision, and return an inexact CG solver
+    of the correction equation."""
+    A_low = A.astype(low_dtype)
+
+    def correction(r: TensorLike) -> TensorLike:
+        return cg(A_low, r, atol=0., rtol=rtol, maxiter=maxiter)
+
+    return correction
+
+
+def mpir(A: Union[COOTensor, CSRTensor], b: TensorLike, x0: Optional[TensorLike]=None, *,
+         inner: str='lu', low_dtype=None,
+         atol: float=1e-12, rtol: float=1e-10, maxiter: int=50,
+         inner_rtol: float=1e-4, inner_maxiter: int=1000) -> TensorLike:
+    """Solve a linear system Ax = b by Mixed-Precision Iterative Refinement (MPIR).
+
+    The correction equation A d = r is solved in low precision (a factorization
+    or an inexact CG solve of `A` cast to `low_dtype`, which is set up only once),
+    while the residual r = b - Ax and the update x = x + d are computed in the
+    working precision of `b`. This halves the memory traffic of the inner solver
+    without losing the accuracy of the working precision.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The coefficient matrix in the working precision.
+        b (TensorLike): The right-hand side, a 1D or 2D tensor. Its dtype is the\
+        working precision.
+        x0 (TensorLike | None, optional): Initial guess with the same shape as `b`.
+        inner (str, optional): The low precision inner solver. It can be 'lu'\
+        (scipy SuperLU factorization on the CPU) or 'cg' (preconditioner-like\
+        inexact CG). Defaults to 'lu'.
+        low_dtype (dtype | None, optional): Dtype of the inner solver. Defaults to `bm.float32`.
+        atol (float, optional): Absolute tolerance of the residual. Default is 1e-12.
+        rtol (float, optional): Relative tolerance of the residual. Default is 1e-10.
+        maxiter (int, optional): Maximum number of refinement steps. Default is 50.
+        inner_rtol (float, optional): Relative tolerance of the inner CG. Default is 1e-4.
+        inner_maxiter (int, optional): Maximum iterations of the inner CG. Default is 1000.
+
+    Returns:
+        Tensor: The approximate solution in the working precision.
+
+    Raises:
+        ValueError: If `inner` is not supported, or the shapes mismatch.
+    """
+    if b.ndim not in {1, 2}:
+        raise ValueError("b must be a 1D or 2D dense tensor")
+
+    if low_dtype is None:
+        low_dtype = bm.float32
+
+    if inner == 'lu':
+        correction = _lu_correction(A, low_dtype)
+    elif inner == 'cg':
+        correction = _cg_correction(A, low_dtype, inner_rtol, inner_maxiter)
+    else:
+        raise ValueError(f"Unknown inner solver: {inner}")
+
+    if x0 is None:
+        x = bm.zeros_like(b)
+    else:
+        if x0.shape != b.shape:
+            raise ValueError("x0 and b must have the same shape")
+        x = x0
+
+    b_norm = bm.linalg.norm(b)
+    n_iter = 0
+
+    while True:
+        r = b - A @ x
+        r_norm = bm.linalg.norm(r)
+
+        if r_norm < atol:
+            logger.info(f"MPIR: converged in {n_iter} iterations, "
+                        "stopped by absolute tolerance.")
+            break
+
+        if r_norm < rtol * b_norm:
+            logger.info(f"MPIR: converged in {n_iter} iterations, "
+                        "stopped by relative tolerance.")
+            break
+
+        if n_iter >= maxiter:
+            logger.info(f"MPIR: failed, stopped by maxiter ({maxiter}).")
+            break
+
+        # Scale the residual to avoid underflow in low precision.
+        r_low = bm.astype(r / r_norm, low_dtype)
+        d = correction(r_low)
+        x = x + r_norm * bm.astype(d, b.dtype)
+        n_iter += 1
+
+    return x
@@ -0,0 +1,178 @@
+
+from typing import Optional, Sequence, List, Union
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from .. import logger
+from .preconditioner import Preconditioner
+
+
+class _Level():
+    """Matrix and smoother on one level of the hierarchy."""
+    def __init__(self, A, smoother: str, omega: float) -> None:
+        from scipy.sparse import tril, triu
+        from scipy.sparse.linalg import splu
+
+        self.A = A
+        self.smoother = smoother
+        if smoother == 'jacobi':
+            self.inv_diag = omega / A.diagonal()
+        elif smoother == 'gs':
+            # The triangular parts are "factorized" without pivoting or fill-in,
+            # so that each sweep is a single sparse triangular solve.
+            opts = dict(permc_spec='NATURAL', diag_pivot_thresh=0.,
+                        options=dict(SymmetricMode=True))
+            self.lower = splu(tril(A, format='csc'), **opts)
+            self.upper = splu(triu(A, format='csc'), **opts)
+        else:
+            raise ValueError(f"Unknown smoother '{smoother}', "
+                             "should be 'jacobi' or 'gs'.")
+
+    def _scale(self, r: np.ndarray) -> np.ndarray:
+        return self.inv_diag[:, None] * r if r.ndim == 2 else self.inv_diag * r
+
+    def presmooth(self, x: np.ndarray, b: np.ndarray, nsmooth: int) -> np.ndarray:
+        for _ in range(nsmooth):
+            r = b - self.A @ x
+            x += self._scale(r) if self.smoother == 'jacobi' else self.lower.solve(r)
+        return x
+
+    def postsmooth(self, x: np.ndarray, b: np.ndarray, nsmooth: int) -> np.ndarray:
+        # Backward sweeps after forward ones keep the cycle symmetric.
+        for _ in range(nsmooth):
+            r = b - self.A @ x
+            x += self._scale(r) if self.smoother == 'jacobi' else self.upper.solve(r)
+        return x
+
+
+class GMGPreconditioner(Preconditioner):
+    """One cycle of the geometric multigrid on a hierarchy of nested spaces.
+
+    The coarse matrices are the Galerkin products `P^T A P` of the given
+    prolongations, e.g. those returned by `mesh.uniform_refine(n, returnim=True)`,
+    and the coarsest problem is solved by SuperLU.
+
+    With the Gauss-Seidel smoother, the pre-smoothing sweeps are forward and
+    the post-smoothing sweeps are backward, so the preconditioner is symmetric
+    for a symmetric `A` and suits `cg`.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The sparse matrix on the finest level.
+        prolongations (Sequence[COOTensor | CSRTensor]): Prolongation matrices
+            between consecutive levels, from the coarsest to the finest.
+        cycle (str, optional): 'V' or 'W'. Defaults to 'V'.
+        smoother (str, optional): 'gs' (Gauss-Seidel) or 'jacobi'
+            (damped Jacobi). Defaults to 'gs'.
+        nsmooth (int, optional): Number of the pre- and post-smoothing sweeps.
+            Defaults to 1.
+        omega (float, optional): Damping factor of the Jacobi smoother.
+            Defaults to 2/3.
+
+    Example:
+    ```
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        Ps, _ = mesh.uniform_refine(5, returnim=True)
+        space = LagrangeFESpace(mesh, p=1)
+        ...
+        x = cg(A, b, M=GMGPreconditioner(A, Ps))
+    ```
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor],
+                 prolongations: Sequence[CSRTensor], *,
+                 cycle: str='V', smoother: str='gs', nsmooth: int=1,
+                 omega: float=2/3) -> None:
+        from scipy.sparse.linalg import splu
+
+        super().__init__(A)
+        if cycle not in ('V', 'W'):
+            raise ValueError(f"Unknown cycle type '{cycle}', should be 'V' or 'W'.")
+        self.cycle = cycle
+        self.nsmooth = nsmooth
+
+        Ak = A.to_scipy().tocsr()
+        levels: List[_Level] = []
+        Ps = []
+        for P in reversed(prolongations):
+            P = P.to_scipy().tocsr()
+            if P.shape[0] != Ak.shape[0]:
+                raise ValueError(f"The prolongation shaped {P.shape} does not match "
+                                 f"the matrix shaped {Ak.shape} on the finer level.")
+            levels.append(_Level(Ak, smoother, omega))
+            Ps.append(P)
+            Ak = (P.T @ Ak @ P).tocsr()
+
+        self.levels = levels
+        self.prolongations = Ps
+        self.restrictions = [P.T.tocsr() for P in Ps]
+        self.coarse_solver = splu(Ak.tocsc())
+        logger.info(f"Geometric multigrid with {len(levels) + 1} levels, "
+                    f"{A.shape[0]} to {Ak.shape[0]} DoFs.")
+
+    @property
+    def number_of_levels(self) -> int:
+        return len(self.levels) + 1
+
+    def _cycle(self, level: int, b: np.ndarray) -> np.ndarray:
+        if level == len(self.levels):
+            return self.coarse_solver.solve(b)
+
+        lv = self.levels[level]
+        P, R = self.prolongations[level], self.restrictions[level]
+        x = lv.presmooth(np.zeros_like(b), b, self.nsmooth)
+        rc = R @ (b - lv.A @ x)
+        e = self._cycle(level + 1, rc)
+        if self.cycle == 'W' and level + 1 < len(self.levels):
+            Ac = self.levels[level + 1].A
+            e += self._cycle(level + 1, rc - Ac @ e)
+        x += P @ e
+        return lv.postsmooth(x, b, self.nsmooth)
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        r_ = np.ascontiguousarray(bm.to_numpy(r), dtype=np.float64)
+        x = self._cycle(0, r_)
+        return bm.astype(bm.tensor(x), r.dtype)
+
+
+class PMGPreconditioner(GMGPreconditioner):
+    """One cycle of the p-multigrid for the continuous Lagrange spaces.
+
+    The levels are the Lagrange spaces of the orders in `orders` on the same
+    mesh, connected by `mesh.prolongation_matrix`. The problem of order 1 is
+    solved directly, or by the geometric multigrid when the `prolongations`
+    of the mesh refinements are given.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The sparse matrix of the scalar Lagrange space.
+        space (LagrangeFESpace): The space of `A`, of order p > 1.
+        orders (Sequence[int] | None, optional): Increasing orders of the levels
+            from 1 to p. Defaults to (1, 2, ..., p).
+        prolongations (Sequence[CSRTensor], optional): Prolongation matrices of
+            the order-1 spaces on the coarser meshes, from the coarsest to the
+            finest. Defaults to ().
+        **kwargs: Other arguments passed to `GMGPreconditioner`.
+
+    Example:
+    ```
+        Hs, _ = mesh.uniform_refine(4, returnim=True)
+        space = LagrangeFESpace(mesh, p=4)
+        ...
+        x = cg(A, b, M=PMGPreconditioner(A, space, prolongations=Hs))
+    ```
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], space, *,
+                 orders: Optional[Sequence[int]]=None,
+                 prolongations: Sequence[CSRTensor]=(), **kwargs) -> None:
+        p = space.p
+        if orders is None:
+            orders = range(1, p + 1)
+        orders = list(orders)
+        if orders[0] != 1 or orders[-1] != p:
+            raise ValueError(f"The orders should start from 1 and end with the "
+                             f"order of the space {p}, but got {orders}.")
+        mesh = space.mesh
+        Ps = [mesh.prolongation_matrix(p0, p1) for p0, p1 in zip(orders[:-1], orders[1:])]
+        self.orders = orders
+        super().__init__(A, list(prolongations) + Ps, **kwargs)
@@ -0,0 +1,234 @@
+
+from typing import Optional, Union, Callable
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .. import logger
+from .conjugate_gradient import cg
+from .gmres import fgmres
+from .preconditioner import LUPreconditioner, ILUPreconditioner
+
+
+class NewtonSolver():
+    """Newton solver for the nonlinear systems assembled by `SemilinearForm`.
+
+    In every step, the increment `du` is solved from `A du = F`, where `A` is
+    the tangent matrix (Jacobian) and `F` is the negative residual returned
+    by `SemilinearForm.assembly`. Then `uh` is updated by `uh += lam * du`.
+
+    The following variants are supported:
+    - Modified Newton: the Jacobian is re-assembled every `jacobian_refresh`
+      iterations, and only the residual is assembled in between. The Jacobian
+      is refreshed earlier if the residual does not decrease fast enough.
+    - Inexact Newton: the increment is solved by a preconditioned Krylov
+      method ('cg' or 'gmres') to the relative tolerance given by the
+      Eisenstat-Walker forcing terms. The preconditioner can be kept for
+      several Jacobians by `preconditioner_refresh`.
+    - Backtracking line search on the norm of the residual.
+
+    Parameters:
+        form (SemilinearForm): The semilinear form whose integrators are\
+        evaluated at `uh`.
+        uh (Function): The current solution, updated in place. Boundary values\
+        should have been set before solving.
+        isDDof (TensorLike | None, optional): Boolean flags of the Dirichlet DoFs,\
+        where the increment is kept to zero. Defaults to None.
+        linear_solver (str, optional): 'direct', 'cg' or 'gmres'. Defaults to 'direct'.
+        preconditioner (Callable | None, optional): Build the preconditioner of\
+        the Krylov method from the Jacobian. Defaults to `ILUPreconditioner`.
+        jacobian_refresh (int, optional): Re-assemble the Jacobian every\
+        `jacobian_refresh` iterations. 1 for the classical Newton method.\
+        Defaults to 1.
+        preconditioner_refresh (int, optional): Rebuild the preconditioner every\
+        `preconditioner_refresh` Jacobian assemblies. Only used by the Krylov\
+        methods, as the direct factorization is always refreshed with the\
+        Jacobian. Defaults to 1.
+        refresh_ratio (float, optional): Refresh the Jacobian in the next step when\
+        the residual norm is reduced by less than this ratio with a reused\
+        Jacobian. Defaults to 0.5.
+        forcing (str | float, optional): 'ew' for the Eisenstat-Walker forcing terms,\
+        or a constant relative tolerance of the Krylov method. Defaults to 'ew'.
+        eta_max (float, optional): Upper bound of the forcing terms. Defaults to 0.9.
+        line_search (bool, optional): Whether to backtrack the step length.\
+        Defaults to True.
+        max_backtrack (int, optional): Maximum number of step halvings. Defaults to 10.
+        atol (float, optional): Absolute tolerance of the residual norm. Default is 1e-10.
+        rtol (float, optional): Relative tolerance of the residual norm. Default is 1e-8.
+        maxiter (int, optional): Maximum number of Newton iterations. Default is 50.
+        krylov_maxiter (int, optional): Maximum number of Krylov iterations in\
+        each Newton step. Default is 1000.
+
+    Example:
+    ```
+        sform = SemilinearForm(space)
+        sform.add_integrator([D, M])
+        sform.add_integrator(f)
+        solver = NewtonSolver(sform, uh, isDDof=isDDof, jacobian_refresh=3)
+        solver.solve()
+    ```
+    """
+    def __init__(self, form, uh, *, isDDof: Optional[TensorLike]=None,
+                 linear_solver: str='direct',
+                 preconditioner: Optional[Callable]=None,
+                 jacobian_refresh: int=1,
+                 preconditioner_refresh: int=1,
+                 refresh_ratio: float=0.5,
+                 forcing: Union[str, float]='ew',
+                 eta_max: float=0.9,
+                 line_search: bool=True,
+                 max_backtrack: int=10,
+                 atol: float=1e-10, rtol: float=1e-8,
+                 maxiter: int=50,
+                 krylov_maxiter: int=1000) -> None:
+        if linear_solver not in {'direct', 'cg', 'gmres'}:
+            raise ValueError(f"Unknown linear solver '{linear_solver}'.")
+        if jacobian_refresh < 1 or preconditioner_refresh < 1:
+            raise ValueError("The refresh frequencies must be positive.")
+        if isinstance(forcing, str) and forcing != 'ew':
+            raise ValueError(f"Unknown forcing term '{forcing}'.")
+
+        self.form = form
+        self.uh = uh
+        self.isDDof = isDDof
+        self.linear_solver = linear_solver
+        self.preconditioner = ILUPreconditioner if preconditioner is None else preconditioner
+        self.jacobian_refresh = jacobian_refresh
+        self.preconditioner_refresh = preconditioner_refresh
+        self.refresh_ratio = refresh_ratio
+        self.forcing = forcing
+        self.eta_max = eta_max
+        self.line_search = line_search
+        self.max_backtrack = max_backtrack
+        self.atol = atol
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.krylov_maxiter = krylov_maxiter
+
+        if isDDof is not None:
+            from ..fem import DirichletBC
+            self._bc = DirichletBC(form.space, threshold=isDDof)
+        else:
+            self._bc = None
+
+        self._A = None
+        self._P = None
+        self.n_jacobian = 0
+        self.residuals = []
+
+    def _semilinear_integrators(self):
+        from ..fem.integrator import SemilinearInt
+        for group in self.form.integrators.values():
+            for int_ in group:
+                if isinstance(int_, SemilinearInt):
+                    yield int_
+
+    def _mask(self, F: TensorLike) -> TensorLike:
+        if self.isDDof is None:
+            return F
+        return bm.set_at(F, self.isDDof, 0.)
+
+    def assemble_jacobian(self) -> TensorLike:
+        """Re-assemble the Jacobian at the current `uh` and set up the linear
+        solver. Return the right-hand-side vector assembled together."""
+        for int_ in self._semilinear_integrators():
+            int_.clear()
+        self.form.clear_memory()
+        A, F = self.form.assembly()
+
+        if self._bc is not None:
+            A = self._bc.apply_matrix(A)
+        self._A = A.tocsr()
+
+        if self.linear_solver == 'direct':
+            self._P = LUPreconditioner(self._A)
+        elif (self._P is None) or (self.n_jacobian % self.preconditioner_refresh == 0):
+            self._P = self.preconditioner(self._A)
+
+        self.n_jacobian += 1
+        return self._mask(F)
+
+    def assemble_residual(self) -> TensorLike:
+        """Assemble the right-hand-side vector (negative residual) only."""
+        return self._mask(self.form.assembly_residual())
+
+    def _solve_increment(self, F: TensorLike, eta: float) -> TensorLike:
+        if self.linear_solver == 'direct':
+            return self._P @ F
+        elif self.linear_solver == 'cg':
+            return cg(self._A, F, M=self._P, atol=0., rtol=eta,
+                      maxiter=self.krylov_maxiter)
+        else:
+            return fgmres(self._A, F, M=self._P, atol=0., rtol=eta,
+                          maxiter=self.krylov_maxiter)
+
+    def _forcing_term(self, eta: float, norm: float, norm_old: float, stop: float) -> float:
+        if not isinstance(self.forcing, str):
+            return self.forcing
+        if (norm == 0.) or (norm_old == 0.):
+            # converged, and the forcing term will not be used
+            return eta
+        # Eisenstat-Walker choice 2 with safeguards
+        gamma, alpha = 0.9, 2.
+        eta_new = gamma * (norm / norm_old)**alpha
+        eta_safe = gamma * eta**alpha
+        if eta_safe > 0.1:
+            eta_new = max(eta_new, eta_safe)
+        eta_new = min(eta_new, self.eta_max)
+        # avoid over-solving near the solution
+        return max(eta_new, 0.5 * stop / norm)
+
+    def solve(self):
+        """Run the Newton iterations and update `uh` in place.
+
+        Returns:
+            Function: The solution `uh`.
+        """
+        uh = self.uh
+        F = self.assemble_residual()
+        norm = float(bm.linalg.norm(F))
+        stop = max(self.atol, self.rtol * norm)
+        eta = self.eta_max if isinstance(self.forcing, str) else self.forcing
+        self.residuals = [norm]
+        need_jacobian = True
+        n_reuse = 0
+
+        for n_iter in range(self.maxiter):
+            if norm <= stop:
+                logger.info(f"Newton: converged in {n_iter} iterations "
+                            f"with {self.n_jacobian} Jacobian assemblies.")
+                break
+
+            if need_jacobian:
+                F = self.assemble_jacobian()
+                n_reuse = 0
+            else:
+                n_reuse += 1
+
+            du = self._solve_increment(F, eta)
+            u0 = bm.copy(uh[:])
+            lam = 1.
+
+            for _ in range(self.max_backtrack + 1):
+                uh[:] = u0 + lam * du
+                F_new = self.assemble_residual()
+                norm_new = float(bm.linalg.norm(F_new))
+                if (not self.line_search) or (norm_new <= (1. - 1e-4 * lam) * norm):
+                    break
+                lam *= 0.5
+            else:
+                logger.info(f"Newton: line search failed at iteration {n_iter}.")
+
+            need_jacobian = ((n_reuse + 1) % self.jacobian_refresh == 0) or \
+                            (n_reuse > 0 and norm_new > self.refresh_ratio * norm)
+            eta = self._forcing_term(eta, norm_new, norm, stop)
+            norm, F = norm_new, F_new
+            self.residuals.append(norm)
+        else:
+            if norm <= stop:
+                logger.info(f"Newton: converged in {self.maxiter} iterations "
+                            f"with {self.n_jacobian} Jacobian assemblies.")
+            else:
+                logger.info(f"Newton: failed, stopped by maxiter ({self.maxiter}).")
+
+        return uh
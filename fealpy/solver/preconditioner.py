@@ -0,0 +1,111 @@
+
+from typing import Optional, Union
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+from .. import logger
+
+
+def diagonal(A: Union[COOTensor, CSRTensor]) -> TensorLike:
+    """Extract the main diagonal of a 2-D sparse tensor, or of a matrix-free
+    operator providing `diagonal()`.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The sparse matrix.
+
+    Returns:
+        Tensor: The diagonal entries, shaped (min(M, N),).
+    """
+    if not isinstance(A, (COOTensor, CSRTensor)):
+        return A.diagonal()
+    if isinstance(A, CSRTensor):
+        row, col = A.row(), A.col()
+    else:
+        row, col = A.indices()
+    N = min(A.shape[-2:])
+    flag = (row == col)
+    diag = bm.zeros((N,), **A.values_context())
+    return bm.index_add(diag, row[flag], A.values()[flag])
+
+
+class Preconditioner():
+    """Base class of the preconditioners, which approximate the inverse of a
+    matrix and are applied by `P @ r`."""
+    def __init__(self, A: Union[COOTensor, CSRTensor]) -> None:
+        self.shape = A.shape
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return self.solve(r)
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        raise NotImplementedError
+
+
+class JacobiPreconditioner(Preconditioner):
+    """Jacobi (diagonal) preconditioner, P = ω D^{-1}."""
+    def __init__(self, A: Union[COOTensor, CSRTensor], omega: float=1.0) -> None:
+        super().__init__(A)
+        self.inv_diag = omega / diagonal(A)
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        if r.ndim == 1:
+            return self.inv_diag * r
+        return self.inv_diag[:, None] * r
+
+
+class _ScipyPreconditioner(Preconditioner):
+    """Preconditioners set up by scipy on the CPU. The factorization is done
+    once in `__init__`, and reused in every `solve`."""
+    solver = None
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        x = self.solver.solve(bm.to_numpy(r))
+        return bm.astype(bm.tensor(x), r.dtype)
+
+
+class LUPreconditioner(_ScipyPreconditioner):
+    """Exact inverse by the SuperLU factorization."""
+    def __init__(self, A: Union[COOTensor, CSRTensor]) -> None:
+        from scipy.sparse.linalg import splu
+        super().__init__(A)
+        self.solver = splu(A.to_scipy().tocsc())
+
+
+class ILUPreconditioner(_ScipyPreconditioner):
+    """Incomplete LU factorization by SuperLU.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The sparse matrix.
+        drop_tol (float, optional): Drop tolerance of the factorization. Defaults to 1e-4.
+        fill_factor (float, optional): Upper bound of the fill ratio. Defaults to 10.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], drop_tol: float=1e-4,
+                 fill_factor: float=10.) -> None:
+        from scipy.sparse.linalg import spilu
+        super().__init__(A)
+        self.solver = spilu(A.to_scipy().tocsc(), drop_tol=drop_tol,
+                            fill_factor=fill_factor)
+
+
+class AMGPreconditioner(Preconditioner):
+    """One V-cycle of the smoothed aggregation algebraic multigrid.
+
+    This requires the `pyamg` package to be installed.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The sparse matrix.
+        cycle (str, optional): Cycle type of the multigrid. Defaults to 'V'.
+        **kwargs: Other arguments passed to `pyamg.smoothed_aggregation_solver`.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], cycle: str='V', **kwargs) -> None:
+        from pyamg import smoothed_aggregation_solver
+        super().__init__(A)
+        self.ml = smoothed_aggregation_solver(A.to_scipy().tocsr(), **kwargs)
+        self.cycle = cycle
+        logger.info(f"AMG hierarchy constructed with {len(self.ml.levels)} levels.")
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        x = self.ml.solve(bm.to_numpy(r), maxiter=1, cycle=self.cycle, tol=1e-12)
+        return bm.astype(bm.tensor(x), r.dtype)
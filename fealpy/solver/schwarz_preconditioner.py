@@ -0,0 +1,273 @@
+
+from typing import Optional, List, Tuple, Union
+import weakref
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from .. import logger
+from .preconditioner import Preconditioner
+
+_Subdomain = Tuple[np.ndarray, np.ndarray] # (dofs, mask of the owned dofs)
+
+
+def _local_solve(subdomains: List[_Subdomain], solvers, r: np.ndarray,
+                 out: np.ndarray, restricted: bool) -> None:
+    out[:] = 0.
+    for (idx, owned), lu in zip(subdomains, solvers):
+        x = lu.solve(r[idx])
+        if restricted:
+            out[idx[owned]] += x[owned]
+        else:
+            out[idx] += x
+
+
+def _schwarz_worker(conn, matrices, subdomains, restricted) -> None:
+    """Factorize the subdomain matrices assigned to this process once, then
+    apply the local solves on the shared-memory vectors on every request."""
+    from multiprocessing import shared_memory, resource_tracker
+    from scipy.sparse.linalg import splu
+
+    solvers = [splu(A_k) for A_k in matrices]
+    del matrices
+    buffers = {}
+    conn.send(True)
+
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            break
+        in_name, out_name, shape, slot = msg
+        for name in (in_name, out_name):
+            if name not in buffers:
+                buffers[name] = shared_memory.SharedMemory(name=name)
+                # The blocks are owned and unlinked by the main process.
+                resource_tracker.unregister(buffers[name]._name, 'shared_memory')
+        r = np.ndarray(shape, dtype=np.float64, buffer=buffers[in_name].buf)
+        out = np.ndarray((slot[1], ) + shape, dtype=np.float64,
+                         buffer=buffers[out_name].buf)[slot[0]]
+        _local_solve(subdomains, solvers, r, out, restricted)
+        conn.send(True)
+
+    for shm in buffers.values():
+        shm.close()
+    conn.close()
+
+
+class _SchwarzPool():
+    """Worker processes holding the local factorizations, exchanging the
+    vectors through shared memory."""
+    def __init__(self, matrices, subdomains, restricted: bool, workers: int) -> None:
+        import multiprocessing as mp
+
+        ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else mp.get_context()
+        # Balance the local problem sizes greedily over the workers.
+        order = np.argsort([-A_k.nnz for A_k in matrices], kind='stable')
+        load = np.zeros(workers)
+        groups = [[] for _ in range(workers)]
+        for k in order:
+            w = int(np.argmin(load))
+            groups[w].append(k)
+            load[w] += matrices[k].nnz
+
+        self.conns = []
+        self.procs = []
+        for group in groups:
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_schwarz_worker, daemon=True, args=(
+                child, [matrices[k] for k in group], [subdomains[k] for k in group],
+                restricted))
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+        for conn in self.conns:
+            conn.recv()
+
+        self._shm = None
+        self._shape = None
+        self._finalizer = weakref.finalize(self, _SchwarzPool._shutdown,
+                                           self.conns, self.procs, [None])
+
+    def _buffers(self, shape):
+        from multiprocessing import shared_memory
+
+        if self._shape != shape:
+            self._release()
+            nbytes = int(np.prod(shape)) * 8
+            r_shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 8))
+            out_shm = shared_memory.SharedMemory(create=True,
+                                                 size=max(nbytes*len(self.conns), 8))
+            self._shm = (r_shm, out_shm)
+            self._shape = shape
+            self._finalizer.detach()
+            self._finalizer = weakref.finalize(self, _SchwarzPool._shutdown,
+                                               self.conns, self.procs, [self._shm])
+        return self._shm
+
+    def _release(self):
+        if self._shm is not None:
+            for shm in self._shm:
+                shm.close()
+                shm.unlink()
+            self._shm = None
+
+    def solve(self, r: np.ndarray) -> np.ndarray:
+        shape = r.shape
+        r_shm, out_shm = self._buffers(shape)
+        NW = len(self.conns)
+        np.ndarray(shape, dtype=np.float64, buffer=r_shm.buf)[:] = r
+        for w, conn in enumerate(self.conns):
+            conn.send((r_shm.name, out_shm.name, shape, (w, NW)))
+        for conn in self.conns:
+            conn.recv()
+        out = np.ndarray((NW, ) + shape, dtype=np.float64, buffer=out_shm.buf)
+        return out.sum(axis=0)
+
+    def close(self):
+        self._finalizer()
+
+    @staticmethod
+    def _shutdown(conns, procs, shms):
+        for conn in conns:
+            try:
+                conn.send(None)
+                conn.close()
+            except (OSError, BrokenPipeError):
+                pass
+        for proc in procs:
+            proc.join(timeout=5)
+        for pair in shms:
+            if pair is None:
+                continue
+            for shm in pair:
+                shm.close()
+                shm.unlink()
+
+
+class SchwarzPreconditioner(Preconditioner):
+    """One-level or two-level overlapping Schwarz preconditioner.
+
+    The DoFs are split into subdomains from a partition of the mesh cells
+    (or of the matrix graph without a space), and the subdomains are extended
+    by `overlap` layers in the graph of the matrix. The local matrices are
+    extracted from `A` and factorized once by SuperLU.
+
+    The restricted variant (RAS) adds each local solution only on the DoFs
+    owned by the subdomain. It is not symmetric, use it with `fgmres`;
+    the additive variant (ASM, `restricted=False`) suits `cg`.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The sparse matrix.
+        space (FunctionSpace | None, optional): The space of `A`, whose cells are
+            partitioned. If None, the rows of `A` are partitioned. Defaults to None.
+        parts (TensorLike | None, optional): Partition of the cells (with `space`)
+            or of the rows, computed by METIS if None. Defaults to None.
+        nparts (int, optional): Number of subdomains for METIS. Defaults to 4.
+        overlap (int, optional): Number of the overlap layers. Defaults to 1.
+        restricted (bool, optional): Whether to use RAS. Defaults to True.
+        coarse (bool, optional): Add the coarse correction on the space of the
+            constant functions on the subdomains. Defaults to False.
+        workers (int, optional): Number of processes for the local solves, 0 to
+            solve in the current process. Defaults to 0.
+
+    Example:
+    ```
+        P = SchwarzPreconditioner(A, space, nparts=8, overlap=2, restricted=False,
+                                  coarse=True, workers=4)
+        x = cg(A, b, M=P)
+        P.close()
+    ```
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], space=None, *,
+                 parts: Optional[TensorLike]=None, nparts: int=4,
+                 overlap: int=1, restricted: bool=True, coarse: bool=False,
+                 workers: int=0) -> None:
+        from scipy.sparse.linalg import splu
+
+        super().__init__(A)
+        S = A.to_scipy().tocsr()
+        gdof = S.shape[0]
+        G = S.copy()
+        G.data = np.ones_like(G.data, dtype=np.int32)
+
+        if space is None:
+            if parts is None:
+                parts = self._metis_parts(G, nparts)
+            dof_part = np.asarray(bm.to_numpy(parts))
+            nparts = int(dof_part.max()) + 1
+            base = [np.nonzero(dof_part == k)[0] for k in range(nparts)]
+            owner = dof_part
+        else:
+            cell2dof = bm.to_numpy(space.cell_to_dof())
+            if parts is None:
+                from ..mesh.reorder import entity_graph
+                parts = self._metis_parts(entity_graph(space.mesh, 'cell'), nparts)
+            cell_part = np.asarray(bm.to_numpy(parts))
+            nparts = int(cell_part.max()) + 1
+            base = [np.unique(cell2dof[cell_part == k]) for k in range(nparts)]
+            owner = np.full(gdof, nparts, dtype=np.int64)
+            np.minimum.at(owner, cell2dof, cell_part[:, None])
+
+        subdomains: List[_Subdomain] = []
+        matrices = []
+        for k in range(nparts):
+            mask = np.zeros(gdof, dtype=np.bool_)
+            mask[base[k]] = True
+            for _ in range(overlap):
+                mask = (G @ mask.astype(np.int32)) > 0
+            idx = np.nonzero(mask)[0]
+            subdomains.append((idx, owner[idx] == k))
+            matrices.append(S[idx][:, idx].tocsc())
+
+        self.nparts = nparts
+        self.restricted = restricted
+        self.subdomains = subdomains
+        nloc = [idx.shape[0] for idx, _ in subdomains]
+        logger.info(f"Schwarz preconditioner with {nparts} subdomains of "
+                    f"{min(nloc)} to {max(nloc)} DoFs, overlap {overlap}.")
+
+        if workers > 0:
+            self._pool = _SchwarzPool(matrices, subdomains, restricted, workers)
+            self._solvers = None
+        else:
+            self._pool = None
+            self._solvers = [splu(A_k) for A_k in matrices]
+
+        if coarse:
+            from scipy.sparse import csr_matrix
+            R0 = csr_matrix((np.ones(gdof), (np.minimum(owner, nparts-1), np.arange(gdof))),
+                            shape=(nparts, gdof))
+            self._R0 = R0
+            self._A0 = np.linalg.inv((R0 @ S @ R0.T).toarray())
+        else:
+            self._R0 = None
+
+    @staticmethod
+    def _metis_parts(G, nparts: int) -> np.ndarray:
+        from ..graph import metis
+        G = G.tocsr()
+        G.setdiag(0)
+        G.eliminate_zeros()
+        _, parts = metis.part_csr(G.indices, G.indptr, nparts=nparts)
+        return np.asarray(parts)
+
+    def solve(self, r: TensorLike) -> TensorLike:
+        r_ = np.ascontiguousarray(bm.to_numpy(r), dtype=np.float64)
+        if self._pool is not None:
+            x = self._pool.solve(r_)
+        else:
+            x = np.empty_like(r_)
+            _local_solve(self.subdomains, self._solvers, r_, x, self.restricted)
+        if self._R0 is not None:
+            R0 = self._R0
+            x += R0.T @ (self._A0 @ (R0 @ r_))
+        return bm.astype(bm.tensor(x), r.dtype)
+
+    def close(self) -> None:
+        """Stop the worker processes and release the shared memory."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
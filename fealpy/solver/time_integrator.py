@@ -0,0 +1,373 @@
+
+from typing import Optional, Callable, Union, Dict, Tuple, Sequence
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from .. import logger
+from .preconditioner import LUPreconditioner
+
+_SP = Union[COOTensor, CSRTensor]
+SourceLike = Optional[Callable[[float], TensorLike]]
+BCLike = Optional[Union[TensorLike, Callable[[float], TensorLike]]]
+
+
+class OperatorCombination():
+    """Linear combinations `a*M + b*A` of two sparse matrices on their union
+    sparsity pattern.
+
+    The values of `M` and `A` are scattered into the slots of the union
+    pattern once, so a combination only costs a vector update of the values.
+    The rows and columns of the Dirichlet DoFs are eliminated by the slot maps
+    cached in `__init__`.
+
+    Parameters:
+        M (COOTensor | CSRTensor): The first matrix, e.g. the mass matrix.
+        A (COOTensor | CSRTensor): The second matrix, e.g. the stiffness matrix.
+        isDDof (Tensor | None, optional): Boolean flags of the Dirichlet DoFs.
+            Defaults to None.
+    """
+    def __init__(self, M: _SP, A: _SP, isDDof: Optional[TensorLike]=None) -> None:
+        from scipy.sparse import identity
+
+        Ms = M.to_scipy().tocsr()
+        As = A.to_scipy().tocsr()
+        if Ms.shape != As.shape:
+            raise ValueError(f"The matrices shaped {Ms.shape} and {As.shape} "
+                             "can not be combined.")
+        N = Ms.shape[0]
+        pattern = [Ms.copy(), As.copy(), identity(N, format='csr')]
+        for P in pattern:
+            P.data = np.ones_like(P.data)
+        U = (pattern[0] + pattern[1] + pattern[2]).tocsr()
+        U.sort_indices()
+        row = np.repeat(np.arange(N), np.diff(U.indptr))
+        key = row.astype(np.int64) * N + U.indices
+
+        def scatter(X) -> np.ndarray:
+            X = X.tocoo()
+            slot = np.searchsorted(key, X.row.astype(np.int64) * N + X.col)
+            val = np.zeros(U.nnz, dtype=np.float64)
+            np.add.at(val, slot, X.data)
+            return val
+
+        self.shape = (N, N)
+        self.crow = bm.from_numpy(U.indptr)
+        self.col = bm.from_numpy(U.indices)
+        self.mval = bm.tensor(scatter(Ms))
+        self.aval = bm.tensor(scatter(As))
+
+        if isDDof is None:
+            self.isDDof = None
+        else:
+            isD = np.asarray(bm.to_numpy(isDDof), dtype=np.bool_)
+            self.isDDof = isDDof
+            self.zero_slots = bm.from_numpy(np.nonzero(isD[row] | isD[U.indices])[0])
+            self.diag_slots = bm.from_numpy(np.nonzero(isD[row] & (row == U.indices))[0])
+
+    def values(self, a: float, b: float) -> TensorLike:
+        return a * self.mval + b * self.aval
+
+    def matrix(self, a: float, b: float) -> CSRTensor:
+        """The combination `a*M + b*A`."""
+        return CSRTensor(self.crow, self.col, self.values(a, b), spshape=self.shape)
+
+    def eliminated_matrix(self, a: float, b: float) -> CSRTensor:
+        """The combination with the Dirichlet rows and columns replaced by
+        those of the identity."""
+        val = self.values(a, b)
+        if self.isDDof is not None:
+            val = bm.set_at(val, self.zero_slots, 0.)
+            val = bm.set_at(val, self.diag_slots, 1.)
+        return CSRTensor(self.crow, self.col, val, spshape=self.shape)
+
+
+class TimeIntegrator():
+    """Base class of the time integrators for the linear systems
+    `M u' + A u = F(t)` (or `M u'' + A u = F(t)`) from assembled matrices.
+
+    Every step solves `(a*M + b*A) x = r` for a few distinct pairs `(a, b)`
+    determined by the scheme and the step size. The combined matrix, its
+    Dirichlet elimination and its factorization (or preconditioner) are set
+    up once for each pair and reused in the later steps.
+
+    Parameters:
+        M (COOTensor | CSRTensor): The mass matrix.
+        A (COOTensor | CSRTensor): The stiffness matrix.
+        source (Callable | None, optional): Function `source(t)` returning the
+            load vector at time t. Defaults to None (zero).
+        isDDof (Tensor | None, optional): Boolean flags of the Dirichlet DoFs.
+            Defaults to None.
+        gd (Tensor | Callable | None, optional): The Dirichlet values on all the
+            DoFs (only those of `isDDof` are used), or a function `gd(t)` returning
+            them. Defaults to None (zero).
+        solver (Callable | None, optional): Iterative solver called as
+            `solver(K, b, x0, M=P, **kwargs)`, e.g. `cg`. If None, the systems are
+            solved by the SuperLU factorization. Defaults to None.
+        preconditioner (Callable | None, optional): Preconditioner factory called
+            as `preconditioner(K)` for the iterative solver. Defaults to None.
+        maxcache (int, optional): Maximum number of the cached systems.
+            Defaults to 4.
+        **kwargs: Other arguments passed to `solver`.
+    """
+    def __init__(self, M: _SP, A: _SP, *, source: SourceLike=None,
+                 isDDof: Optional[TensorLike]=None, gd: BCLike=None,
+                 solver: Optional[Callable]=None,
+                 preconditioner: Optional[Callable]=None,
+                 maxcache: int=4, **kwargs) -> None:
+        self.M = M
+        self.A = A
+        self.source = source
+        self.isDDof = isDDof
+        self.gd = gd
+        self.solver = solver
+        self.preconditioner = preconditioner
+        self.maxcache = maxcache
+        self.options = kwargs
+        self.operators = OperatorCombination(M, A, isDDof)
+        self._systems: Dict[Tuple[float, float], Tuple] = {}
+        self.t = 0.
+
+    def system(self, a: float, b: float):
+        """The combined matrix, its Dirichlet elimination and the solver of the
+        pair `(a, b)`, set up on the first call."""
+        key = (float(a), float(b))
+        if key in self._systems:
+            return self._systems[key]
+        if len(self._systems) >= self.maxcache:
+            self._systems.pop(next(iter(self._systems)))
+
+        K = self.operators.matrix(*key)
+        Kd = self.operators.eliminated_matrix(*key)
+        if self.solver is None:
+            P = LUPreconditioner(Kd)
+        elif self.preconditioner is not None:
+            P = self.preconditioner(Kd)
+        else:
+            P = None
+        logger.info(f"Time integrator system {key[0]:.6g}*M + {key[1]:.6g}*A set up.")
+        self._systems[key] = (K, Kd, P)
+        return self._systems[key]
+
+    def load(self, t: float) -> Optional[TensorLike]:
+        return None if self.source is None else self.source(t)
+
+    def dirichlet(self, t: float) -> Optional[TensorLike]:
+        """The Dirichlet values at time t on all the DoFs, zero elsewhere."""
+        if self.isDDof is None:
+            return None
+        gd = self.gd(t) if callable(self.gd) else self.gd
+        if gd is None:
+            return bm.zeros(self.operators.shape[0], dtype=self.operators.mval.dtype)
+        return bm.where(self.isDDof, gd, 0.)
+
+    def solve(self, a: float, b: float, r: TensorLike,
+              g: Optional[TensorLike]=None, x0: Optional[TensorLike]=None) -> TensorLike:
+        """Solve `(a*M + b*A) x = r` with the Dirichlet values `g`."""
+        K, Kd, P = self.system(a, b)
+        if self.isDDof is not None:
+            if g is None:
+                g = bm.zeros_like(r)
+            r = r - K @ g
+            r = bm.set_at(r, self.isDDof, g[self.isDDof])
+        if self.solver is None:
+            return P @ r
+        return self.solver(Kd, r, x0, M=P, **self.options)
+
+    def step(self, dt: float) -> TensorLike:
+        raise NotImplementedError
+
+    def run(self, nt: int, dt: float, callback: Optional[Callable]=None) -> TensorLike:
+        """Advance `nt` steps of size `dt`, calling `callback(t, u)` after each step.
+
+        Returns:
+            Tensor: The solution at the last step.
+        """
+        for _ in range(nt):
+            u = self.step(dt)
+            if callback is not None:
+                callback(self.t, u)
+        return u
+
+
+class ThetaScheme(TimeIntegrator):
+    """The θ-scheme for `M u' + A u = F(t)`:
+
+        (M/dt + θA) u^{n+1} = (M/dt - (1-θ)A) u^n + θF^{n+1} + (1-θ)F^n,
+
+    i.e. backward Euler for θ = 1 and Crank-Nicolson for θ = 1/2.
+
+    Parameters:
+        M (COOTensor | CSRTensor): The mass matrix.
+        A (COOTensor | CSRTensor): The stiffness matrix.
+        theta (float, optional): Defaults to 0.5.
+        **kwargs: Other arguments of `TimeIntegrator`.
+
+    Example:
+    ```
+        stepper = ThetaScheme(M, A, theta=1., source=lambda t: F(t), isDDof=isBdDof)
+        stepper.set_initial(u0, t0=0.)
+        u = stepper.run(nt=100, dt=0.01)
+    ```
+    """
+    def __init__(self, M: _SP, A: _SP, theta: float=0.5, **kwargs) -> None:
+        super().__init__(M, A, **kwargs)
+        self.theta = theta
+
+    def set_initial(self, u0: TensorLike, t0: float=0.) -> None:
+        self.u = bm.copy(u0)
+        self.t = t0
+        self._F = self.load(t0)
+
+    def step(self, dt: float) -> TensorLike:
+        theta = self.theta
+        u, t1 = self.u, self.t + dt
+        r = self.M @ u / dt
+        if theta != 1.:
+            r = r - (1 - theta) * (self.A @ u)
+        F = self.load(t1)
+        if F is not None:
+            r = r + theta * F + (1 - theta) * self._F
+        self.u = self.solve(1/dt, theta, r, self.dirichlet(t1), x0=u)
+        self.t, self._F = t1, F
+        return self.u
+
+
+class BDFScheme(TimeIntegrator):
+    """The backward differentiation formulas of order 1 to 3 for
+    `M u' + A u = F(t)`:
+
+        (α_0/dt M + A) u^{n+1} = -M Σ_{j>0} α_j/dt u^{n+1-j} + F^{n+1}.
+
+    The first steps use the lower orders, and the history is restarted in the
+    same way when `dt` changes. The previous solutions are kept in a
+    preallocated ring buffer.
+
+    Parameters:
+        M (COOTensor | CSRTensor): The mass matrix.
+        A (COOTensor | CSRTensor): The stiffness matrix.
+        order (int, optional): Order of the formula, 1, 2 or 3. Defaults to 2.
+        **kwargs: Other arguments of `TimeIntegrator`.
+    """
+    _COEF = {
+        1: (1., -1.),
+        2: (3/2, -2., 1/2),
+        3: (11/6, -3., 3/2, -1/3)
+    }
+
+    def __init__(self, M: _SP, A: _SP, order: int=2, **kwargs) -> None:
+        if order not in self._COEF:
+            raise ValueError(f"The order of BDF should be 1, 2 or 3, but got {order}.")
+        super().__init__(M, A, **kwargs)
+        self.order = order
+
+    def set_initial(self, u0: TensorLike, t0: float=0.,
+                    history: Sequence[TensorLike]=(), dt: Optional[float]=None) -> None:
+        """Set the initial solution.
+
+        Parameters:
+            u0 (Tensor): The solution at `t0`.
+            t0 (float, optional): The initial time. Defaults to 0.
+            history (Sequence[Tensor], optional): The solutions at `t0 - dt`,
+                `t0 - 2*dt`, ..., which let the first steps use the full order.
+                Without them, the lower-order start-up steps limit the global
+                accuracy to the second order. Defaults to ().
+            dt (float | None, optional): The step size of `history`. Defaults to None.
+        """
+        history = list(history)[:self.order - 1]
+        if history and dt is None:
+            raise ValueError("The step size of the history should be given.")
+        self._history = bm.zeros((self.order, ) + tuple(u0.shape), **bm.context(u0))
+        for j, u in enumerate(reversed([u0] + history)):
+            self._history = bm.set_at(self._history, j, u)
+        self._head = len(history) # slot of the latest solution
+        self._nhist = len(history) + 1 # number of the valid slots
+        self._dt = dt
+        self.t = t0
+
+    @property
+    def u(self) -> TensorLike:
+        return self._history[self._head]
+
+    def step(self, dt: float) -> TensorLike:
+        if self._dt != dt:
+            if self._dt is not None:
+                logger.info("BDF history restarted for the new time step size.")
+            self._nhist = 1
+            self._dt = dt
+        k = self._nhist
+        alpha = self._COEF[k]
+        N = self.order
+
+        w = 0.
+        for j in range(1, k + 1):
+            w = w - alpha[j] / dt * self._history[(self._head - j + 1) % N]
+        t1 = self.t + dt
+        r = self.M @ w
+        F = self.load(t1)
+        if F is not None:
+            r = r + F
+        u = self.solve(alpha[0]/dt, 1., r, self.dirichlet(t1), x0=self.u)
+
+        self._head = (self._head + 1) % N
+        self._history = bm.set_at(self._history, self._head, u)
+        self._nhist = min(k + 1, N)
+        self.t = t1
+        return u
+
+
+class NewmarkScheme(TimeIntegrator):
+    """The Newmark-β method for `M u'' + A u = F(t)`, in the displacement form
+
+        (M/(β dt^2) + A) u^{n+1} = F^{n+1} + M (u^n/(β dt^2) + v^n/(β dt) + (1/(2β) - 1) a^n),
+
+    followed by the updates of the acceleration and the velocity. The
+    defaults β = 1/4 and γ = 1/2 give the unconditionally stable average
+    acceleration method.
+
+    Parameters:
+        M (COOTensor | CSRTensor): The mass matrix.
+        A (COOTensor | CSRTensor): The stiffness matrix.
+        beta (float, optional): Defaults to 0.25.
+        gamma (float, optional): Defaults to 0.5.
+        **kwargs: Other arguments of `TimeIntegrator`.
+    """
+    def __init__(self, M: _SP, A: _SP, beta: float=0.25, gamma: float=0.5,
+                 **kwargs) -> None:
+        super().__init__(M, A, **kwargs)
+        self.beta = beta
+        self.gamma = gamma
+
+    def set_initial(self, u0: TensorLike, v0: Optional[TensorLike]=None,
+                    t0: float=0., a0: Optional[TensorLike]=None) -> None:
+        """Set the initial displacement and velocity. The initial acceleration
+        is solved from `M a0 = F(t0) - A u0` if not given, being zero on the
+        Dirichlet DoFs."""
+        self.u = bm.copy(u0)
+        self.v = bm.zeros_like(u0) if v0 is None else bm.copy(v0)
+        self.t = t0
+        if a0 is None:
+            r = -(self.A @ u0)
+            F = self.load(t0)
+            if F is not None:
+                r = r + F
+            a0 = self.solve(1., 0., r)
+        self.a = bm.copy(a0)
+
+    def step(self, dt: float) -> TensorLike:
+        beta, gamma = self.beta, self.gamma
+        c0, c1, c2 = 1/(beta*dt**2), 1/(beta*dt), 1/(2*beta) - 1
+        u, v, a = self.u, self.v, self.a
+        t1 = self.t + dt
+
+        r = self.M @ (c0*u + c1*v + c2*a)
+        F = self.load(t1)
+        if F is not None:
+            r = r + F
+        u1 = self.solve(c0, 1., r, self.dirichlet(t1), x0=u)
+        a1 = c0*(u1 - u) - c1*v - c2*a
+        self.v = v + dt*((1 - gamma)*a + gamma*a1)
+        self.u, self.a, self.t = u1, a1, t1
+        return u1
@@ -0,0 +1,81 @@
+import os
+import json
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.cem import EITDataGenerator, generate_eit_dataset
+
+
+def current_density(p, *args):
+    angle = bm.atan2(p[..., 1], p[..., 0])
+    return bm.stack([bm.sin(k*angle) for k in range(1, 5)], axis=0)
+current_density.coordtype = 'cartesian'
+
+
+def sampler(index: int):
+    rng = np.random.default_rng(index)
+    cx, cy = rng.uniform(-0.4, 0.4, 2)
+    def levelset(p):
+        return (p[..., 0] - cx)**2 + (p[..., 1] - cy)**2 - 0.09
+    levelset.coordtype = 'cartesian'
+    return (10., 1.), levelset
+
+
+class TestEITDataset:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_lu_solver(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([-1, 1, -1, 1], nx=12, ny=12)
+        results = []
+        for solver in ['cg', 'lu']:
+            gen = EITDataGenerator(mesh, p=1, solver=solver)
+            gen.set_boundary(current_density, batch_size=4, zero_integral=True)
+            gen.set_levelset(*sampler(0), mesh.entity('node'))
+            results.append(bm.to_numpy(gen.run()))
+        np.testing.assert_allclose(results[0], results[1], atol=1e-8)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_resume(self, backend, tmp_path):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([-1, 1, -1, 1], nx=8, ny=8)
+        pixel = mesh.entity('node')
+        kwargs = dict(pixel=pixel, batch_size=4, shard_size=3, checkpoint=2,
+                      dtype=np.float64)
+        path = os.path.join(tmp_path, 'data')
+        assert generate_eit_dataset(path, mesh, sampler, current_density, 7, **kwargs) == 3
+        voltage = np.concatenate([np.load(os.path.join(path, f'voltage-{k:05d}.npy'))
+                                  for k in range(3)], axis=0)
+        assert voltage.shape == (7, 4, 32)
+        assert np.load(os.path.join(path, 'current.npy')).shape == (4, 32)
+
+        gen = EITDataGenerator(mesh, p=1)
+        gen.set_boundary(current_density, batch_size=4, zero_integral=True)
+        gen.set_levelset(*sampler(5), pixel)
+        np.testing.assert_allclose(voltage[5], bm.to_numpy(gen.run()), atol=1e-8)
+
+        # interrupt the last shard after the first checkpoint and resume
+        vfile = os.path.join(path, 'voltage-00002.npy')
+        pfile = os.path.join(path, 'progress-00001.json')
+        os.remove(vfile)
+        os.remove(os.path.join(path, 'progress-00002.json'))
+        with open(pfile, 'w') as f:
+            json.dump({'count': 2}, f)
+        data = np.load(os.path.join(path, 'voltage-00001.npy'))
+        data[2] = 0.
+        np.save(os.path.join(path, 'voltage-00001.npy'), data)
+
+        generate_eit_dataset(path, mesh, sampler, current_density, 7, **kwargs)
+        for k in range(3):
+            new = np.load(os.path.join(path, f'voltage-{k:05d}.npy'))
+            np.testing.assert_allclose(new, voltage[3*k:3*k+3])
+
+        with pytest.raises(ValueError):
+            generate_eit_dataset(path, mesh, sampler, current_density, 8, **kwargs)
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_eit_dataset.py', '-q'])
@@ -0,0 +1,119 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import LinearForm, VectorSourceIntegrator
+from fealpy.cfd import NSProjectionStepper
+
+
+@cartesian
+def velocity(p):
+    x, y = p[..., 0], p[..., 1]
+    return bm.stack([4*y*(1-y), bm.zeros_like(x)], axis=-1)
+
+@cartesian
+def pressure(p):
+    return 8*(1 - p[..., 0])
+
+@cartesian
+def is_outflow(p):
+    return bm.abs(p[..., 0] - 1.) < 1e-12
+
+@cartesian
+def is_not_outflow(p):
+    return bm.abs(p[..., 0] - 1.) > 1e-12
+
+# The Taylor-Green vortex is a steady solution with u.grad(u) = -grad(p),
+# when the viscous term is balanced by the source f = 2 pi^2 mu u.
+TG_MU = 0.1
+
+@cartesian
+def tg_velocity(p):
+    x, y = p[..., 0], p[..., 1]
+    pi = bm.pi
+    return bm.stack([-bm.cos(pi*x)*bm.sin(pi*y), bm.sin(pi*x)*bm.cos(pi*y)], axis=-1)
+
+@cartesian
+def tg_pressure(p):
+    x, y = p[..., 0], p[..., 1]
+    return -(bm.cos(2*bm.pi*x) + bm.cos(2*bm.pi*y))/4
+
+@cartesian
+def tg_source(p):
+    return 2*bm.pi**2*TG_MU*tg_velocity(p)
+
+
+class TestNSProjectionStepper:
+
+    def _get_stepper(self, **kwargs):
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        pspace = LagrangeFESpace(mesh, p=1)
+        uspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (2, -1))
+        stepper = NSProjectionStepper(uspace, pspace, 0.05, q=4, **kwargs)
+        stepper.set_velocity_bc(velocity, threshold=is_not_outflow)
+        stepper.set_pressure_bc(0., threshold=is_outflow)
+        return stepper, uspace.interpolate(velocity), pspace.interpolate(pressure)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('convection', ['implicit', 'explicit'])
+    def test_ipcs_poiseuille(self, backend, convection):
+        bm.set_backend(backend)
+        stepper, ue, pe = self._get_stepper(convection=convection, preconditioner_refresh=3)
+        stepper.init(ue, pe)
+        u, p = stepper.u, stepper.p
+
+        for _ in range(10):
+            out = stepper.step()
+            assert out[0] is u and out[1] is p
+
+        np.testing.assert_allclose(bm.to_numpy(u[:]), bm.to_numpy(ue), atol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(p[:]), bm.to_numpy(pe), atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('convection', ['implicit', 'explicit'])
+    def test_ipcs_taylor_green(self, backend, convection):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        pspace = LagrangeFESpace(mesh, p=1)
+        uspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (2, -1))
+        stepper = NSProjectionStepper(uspace, pspace, 0.05, mu=TG_MU, q=4,
+                                      convection=convection)
+        stepper.set_velocity_bc(tg_velocity)
+        lform = LinearForm(uspace)
+        lform.add_integrator(VectorSourceIntegrator(tg_source, q=4))
+        F = lform.assembly()
+
+        # The pressure is pinned to zero on the first DoF.
+        ue = uspace.interpolate(tg_velocity)
+        pe = pspace.interpolate(tg_pressure)
+        pe = pe - pe[0]
+        stepper.init(ue, pe)
+
+        for _ in range(20):
+            u, p = stepper.step(F)
+
+        # The pressure balances the convection, and is far off without it.
+        np.testing.assert_allclose(bm.to_numpy(u[:]), bm.to_numpy(ue), atol=5e-3)
+        np.testing.assert_allclose(bm.to_numpy(p[:]), bm.to_numpy(pe), atol=0.1)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('scheme', ['ipcs', 'chorin'])
+    def test_boundary_values(self, backend, scheme):
+        bm.set_backend(backend)
+        stepper, ue, _ = self._get_stepper(scheme=scheme)
+
+        for _ in range(5):
+            u, p = stepper.step()
+
+        isDDof = stepper.isUDDof
+        np.testing.assert_allclose(bm.to_numpy(u[isDDof]), bm.to_numpy(ue[isDDof]))
+        np.testing.assert_allclose(bm.to_numpy(p[stepper.isPDDof]), 0.)
+        assert np.all(np.isfinite(bm.to_numpy(u[:])))
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_ns_projection_stepper.py', '-q'])
@@ -0,0 +1,73 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.fem import BilinearForm, LinearElasticIntegrator
+from fealpy.csm import PhaseFieldStaggeredSolver
+
+
+@cartesian
+def is_fixed(p):
+    return bm.abs(p[..., 1]) < 1e-12
+
+@cartesian
+def is_top(p):
+    return bm.abs(p[..., 1] - 1.) < 1e-12
+
+
+class TestPhaseFieldStaggeredSolver:
+
+    def _get_solver(self, **kwargs):
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=8, ny=8)
+        solver = PhaseFieldStaggeredSolver(mesh, lam=121.15, mu=80.77, Gc=2.7e-3,
+                                           l0=0.1, **kwargs)
+        solver.set_displacement_bc(is_fixed, load_threshold=is_top)
+        return solver
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_step(self, backend):
+        bm.set_backend(backend)
+        s0 = self._get_solver(linear_solver='direct')
+        s1 = self._get_solver(linear_solver='cg', preconditioner_refresh=3)
+
+        for disp in [1e-3, 2e-3, 3e-3]:
+            u0, d0 = s0.step(disp)
+            u1, d1 = s1.step(disp)
+            np.testing.assert_allclose(bm.to_numpy(u1[:]), bm.to_numpy(u0[:]), atol=1e-8)
+            np.testing.assert_allclose(bm.to_numpy(d1[:]), bm.to_numpy(d0[:]), atol=1e-8)
+            assert s1.n_iter < s1.maxit
+
+        # the reused pattern against a freshly assembled stiffness matrix
+        form = BilinearForm(s0.uspace)
+        form.add_integrator(LinearElasticIntegrator(s0.material, q=s0.q))
+        s0._K_int.clear()
+        K = s0._K_form.pattern_assembly()
+        np.testing.assert_allclose(K.to_scipy().toarray(),
+                                   form.assembly().to_scipy().toarray(), atol=1e-12)
+        assert float(bm.min(d0[:])) > 0.
+        assert np.isclose(float(s0.force), float(s1.force))
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_refine(self, backend):
+        bm.set_backend(backend)
+        solver = self._get_solver()
+        solver.step(2e-3)
+        NC = solver.mesh.number_of_cells()
+        isMarkedCell = bm.zeros((NC, ), dtype=bm.bool)
+        isMarkedCell = bm.set_at(isMarkedCell, slice(0, NC, 4), True)
+        solver.refine(isMarkedCell)
+
+        assert solver.mesh.number_of_cells() > NC
+        assert solver.H.shape[0] == solver.mesh.number_of_cells()
+        assert solver.uh.shape[0] == solver.uspace.number_of_global_dofs()
+        # the loaded DoFs keep the prescribed displacement
+        np.testing.assert_allclose(bm.to_numpy(solver.uh[solver.isLoadDof]), 2e-3)
+        solver.step(2e-3)
+        assert solver.n_iter < solver.maxit
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_phase_field_staggered_solver.py', '-q'])
@@ -0,0 +1,76 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.csm import sym_eigh, spectral_split
+from fealpy.csm.spectral_kernel import voigt_indices
+
+
+def _sym_matrices(GD, NC=200, seed=0):
+    rng = np.random.default_rng(seed)
+    s = rng.standard_normal((NC, GD, GD))
+    s = s + s.swapaxes(-1, -2)
+    Q = np.linalg.qr(rng.standard_normal((GD, GD)))[0]
+    # repeated and zero eigenvalues
+    s[0] = 2 * np.eye(GD)
+    s[1] = 0.
+    s[2] = Q @ np.diag([1., 1., 3.][:GD]) @ Q.T
+    s[3] = Q @ np.diag([-1., 2., 2.][:GD]) @ Q.T
+    return s
+
+
+class TestSpectralKernel:
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    def test_sym_eigh(self, backend, GD):
+        bm.set_backend(backend)
+        s = _sym_matrices(GD)
+        w, v = sym_eigh(bm.tensor(s))
+        w, v = bm.to_numpy(w), bm.to_numpy(v)
+
+        np.testing.assert_allclose(w, np.linalg.eigh(s)[0], atol=1e-12)
+        np.testing.assert_allclose(np.einsum('nia, na, nja -> nij', v, w, v), s, atol=1e-12)
+        np.testing.assert_allclose(np.einsum('nia, nib -> nab', v, v),
+                                   np.broadcast_to(np.eye(GD), s.shape), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    def test_spectral_split(self, backend, GD):
+        bm.set_backend(backend)
+        lam, mu = 1.3, 0.7
+        s = _sym_matrices(GD, seed=1)[4:]
+        c0 = np.random.rand(s.shape[0])
+        sp, sm, psi_p, psi_m, D = spectral_split(s, lam, mu, c0)
+
+        w, v = np.linalg.eigh(s)
+        sp0 = np.einsum('nia, na, nja -> nij', v, np.maximum(w, 0.), v)
+        tr = np.trace(s, axis1=-2, axis2=-1)
+        np.testing.assert_allclose(sp, sp0, atol=1e-12)
+        np.testing.assert_allclose(sp + sm, s, atol=1e-12)
+        np.testing.assert_allclose(
+            psi_p, lam * np.maximum(tr, 0.)**2 / 2 + mu * np.sum(sp0**2, axis=(-2, -1)),
+            atol=1e-12
+        )
+
+        # the tangent against the central differences of the stress
+        def stress(e):
+            sp, sm, _, _, _ = spectral_split(e, lam, mu, tangent=False)
+            tr = np.trace(e, axis1=-2, axis2=-1)[:, None, None]
+            tp, tm = np.maximum(tr, 0.), np.minimum(tr, 0.)
+            eye = np.eye(GD)
+            return c0[:, None, None] * (lam * tp * eye + 2 * mu * sp) + lam * tm * eye + 2 * mu * sm
+
+        I, J = voigt_indices(GD)
+        h = 1e-6
+        for n in range(len(I)):
+            de = np.zeros((GD, GD))
+            val = h if I[n] == J[n] else h / 2 # engineering shear strain
+            de[I[n], J[n]] = de[J[n], I[n]] = val
+            ds = (stress(s + de) - stress(s - de)) / (2 * h)
+            np.testing.assert_allclose(D[:, :, n], ds[:, I, J], atol=1e-6)
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_spectral_kernel.py', '-q'])
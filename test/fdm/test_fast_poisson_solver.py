@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from scipy.sparse import diags, kron, identity
+from scipy.sparse.linalg import spsolve
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.fdm import FastPoissonSolver
+
+
+def _second_difference(n, h, bc):
+    """1-d matrix of -u'' on the n+1 nodes of an axis."""
+    T = diags([-np.ones(n), 2*np.ones(n+1), -np.ones(n)], [-1, 0, 1]).tolil()
+    if bc == 'dirichlet':
+        T[0, :], T[n, :] = 0., 0.
+        T[0, 0], T[n, n] = 1., 1.
+    elif bc == 'neumann':
+        T[0, 1], T[n, n-1] = -2., -2.
+    else:
+        T[0, n-1], T[0, n] = -1., 0.
+        T[n, :] = 0.
+        T[n, n], T[n, 0] = 1., -1.
+    return T.tocsr() / h**2, T
+
+
+def _reference(shape, h, bc, c, f, g):
+    """Assemble the stencil by Kronecker products and solve it directly."""
+    TD = len(shape)
+    A = 0.
+    fixed = np.zeros(shape, dtype=np.bool_)
+    for axis in range(TD):
+        n = shape[axis] - 1
+        T, _ = _second_difference(n, h[axis], bc[axis])
+        mats = [identity(m) for m in shape]
+        mats[axis] = T
+        K = mats[0]
+        for M in mats[1:]:
+            K = kron(K, M)
+        A = A + K
+        if bc[axis] != 'neumann':
+            index = [slice(None), ] * TD
+            index[axis] = -1
+            fixed[tuple(index)] = True
+            if bc[axis] == 'dirichlet':
+                index[axis] = 0
+                fixed[tuple(index)] = True
+    A = (A + c*identity(int(np.prod(shape)))).tolil()
+    b = f.copy()
+    for i in np.nonzero(fixed.reshape(-1))[0]:
+        A.rows[i], A.data[i] = [i], [1.]
+        b[i] = g[i]
+    # the periodic images equal their first nodes
+    for axis in range(TD):
+        if bc[axis] == 'periodic':
+            idx = np.arange(b.shape[0]).reshape(shape)
+            dst = np.take(idx, -1, axis=axis).reshape(-1)
+            src = np.take(idx, 0, axis=axis).reshape(-1)
+            for i, j in zip(dst, src):
+                if not _is_dirichlet(i, shape, bc):
+                    A.rows[i], A.data[i] = [i, j], [1., -1.]
+                    b[i] = 0.
+    return spsolve(A.tocsr(), b)
+
+
+def _is_dirichlet(i, shape, bc):
+    index = np.unravel_index(i, shape)
+    return any(t == 'dirichlet' and index[a] in (0, shape[a]-1) for a, t in enumerate(bc))
+
+
+class TestFastPoissonSolver:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('bc, c', [
+        (('dirichlet', 'dirichlet'), 0.), (('dirichlet', 'dirichlet'), -20.),
+        (('dirichlet', 'neumann'), 0.), (('periodic', 'dirichlet'), 0.),
+        (('neumann', 'periodic'), 3.)])
+    def test_2d(self, backend, bc, c):
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 12, 0, 10), h=(1/12, 0.1))
+        rng = np.random.default_rng(0)
+        f = rng.standard_normal(mesh.number_of_nodes())
+        g = rng.standard_normal(mesh.number_of_nodes())
+        u = FastPoissonSolver(mesh, bc=bc, c=c).solve(bm.tensor(f), gD=bm.tensor(g))
+        u0 = _reference((13, 11), mesh.h, bc, c, f, g)
+        np.testing.assert_allclose(bm.to_numpy(u), u0, atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_3d(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh3d((0, 6, 0, 5, 0, 4), h=(1/6, 0.2, 0.25))
+        rng = np.random.default_rng(1)
+        f = rng.standard_normal(mesh.number_of_nodes())
+        g = rng.standard_normal(mesh.number_of_nodes())
+        bc = ('dirichlet', 'periodic', 'dirichlet')
+        u = FastPoissonSolver(mesh, bc=bc).solve(bm.tensor(f), gD=bm.tensor(g))
+        u0 = _reference((7, 6, 5), mesh.h, bc, 0., f, g)
+        np.testing.assert_allclose(bm.to_numpy(u), u0, atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_neumann(self, backend):
+        bm.set_backend(backend)
+        # -Δu = f with u = cos(pi x) cos(pi y), second order convergence
+        errors = []
+        for n in [16, 32]:
+            mesh = UniformMesh2d((0, n, 0, n), h=(1/n, 1/n))
+            node = mesh.entity('node')
+            solution = lambda p: bm.cos(bm.pi*p[..., 0]) * bm.cos(bm.pi*p[..., 1])
+            source = lambda p: 2*bm.pi**2 * solution(p)
+            u = FastPoissonSolver(mesh, bc='neumann').solve(source)
+            e = bm.to_numpy(u - solution(node))
+            errors.append(np.max(np.abs(e - e.mean())))
+        assert errors[1] < errors[0] / 3.5
+
+        # inhomogeneous Neumann data with a reaction term
+        mesh = UniformMesh2d((0, 32, 0, 32), h=(1/32, 1/32))
+        node = mesh.entity('node')
+        solution = lambda p: bm.exp(p[..., 0] + p[..., 1])
+        flux = lambda p, n: bm.sum(n, axis=-1) * solution(p)
+        u = FastPoissonSolver(mesh, bc='neumann', c=1.).solve(
+                lambda p: -solution(p), gN=flux)
+        assert np.max(np.abs(bm.to_numpy(u - solution(node)))) < 1e-2
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_fast_poisson_solver.py', '-q'])
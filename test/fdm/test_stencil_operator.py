@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.fdm import (LaplaceOperator, DiffusionOperator, GradientOperator,
+                        DivergenceOperator, FastPoissonSolver)
+from fealpy.solver import cg, JacobiPreconditioner
+
+
+class TestStencilOperator:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('bc', ['dirichlet', 'neumann', ('neumann', 'dirichlet')])
+    def test_laplace(self, backend, bc):
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 8, 0, 6), h=(1/8, 1/6))
+        A = LaplaceOperator(mesh, bc=bc, c=2.)
+        S = bm.to_numpy(A.to_csr().to_scipy().toarray())
+        rng = np.random.default_rng(0)
+        x = rng.standard_normal((A.shape[1], 3))
+        np.testing.assert_allclose(bm.to_numpy(A @ bm.tensor(x)), S @ x, atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(A @ bm.tensor(x[:, 0])), S @ x[:, 0], atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(A.diagonal()), np.diag(S))
+
+        # the fast solver inverts the same stencil
+        f = rng.standard_normal(A.shape[0])
+        g = rng.standard_normal(A.shape[0])
+        u = FastPoissonSolver(mesh, bc=bc, c=2.).solve(bm.tensor(f), gD=bm.tensor(g))
+        isBdNode = (np.diag(S) == 1.)
+        r = bm.to_numpy(A @ u)
+        np.testing.assert_allclose(r[~isBdNode], f[~isBdNode], atol=1e-10)
+        np.testing.assert_allclose(r[isBdNode], g[isBdNode], atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_diffusion(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh3d((0, 5, 0, 4, 0, 3), h=(0.2, 0.25, 1/3))
+        coef = lambda p: 1 + p[..., 0]**2 + p[..., 2]
+        A = DiffusionOperator(mesh, coef=coef, bc=('neumann', 'dirichlet', 'neumann'))
+        # the coefficient given on the edges
+        a = coef(mesh.entity_barycenter('edge'))
+        B = DiffusionOperator(mesh, coef=a, bc=('neumann', 'dirichlet', 'neumann'))
+        S = bm.to_numpy(A.to_csr().to_scipy().toarray())
+        x = bm.tensor(np.random.default_rng(1).standard_normal(A.shape[1]))
+        np.testing.assert_allclose(bm.to_numpy(A @ x), S @ bm.to_numpy(x), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(B @ x), bm.to_numpy(A @ x), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(A.diagonal()), np.diag(S))
+
+        # matrix-free solve with the Jacobi preconditioner, which is symmetric
+        # on the vectors vanishing on the Dirichlet boundary
+        A = DiffusionOperator(mesh, coef=coef, c=1.)
+        x = bm.set_at(x, mesh.boundary_node_flag(), 0.)
+        b = A @ x
+        y = cg(A, b, M=JacobiPreconditioner(A), atol=0., rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(y), bm.to_numpy(x), atol=1e-8)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_gradient(self, backend):
+        bm.set_backend(backend)
+        for mesh in [UniformMesh2d((0, 6, 0, 5), h=(0.5, 0.2)),
+                     UniformMesh3d((0, 3, 0, 4, 0, 2), h=(1., 0.25, 0.5))]:
+            G = GradientOperator(mesh)
+            D = DivergenceOperator(mesh)
+            node = mesh.entity('node')
+            edge = mesh.entity('edge')
+            u = bm.sin(bm.sum(node, axis=-1))
+            length = bm.linalg.norm(node[edge[:, 1]] - node[edge[:, 0]], axis=-1)
+            du = (u[edge[:, 1]] - u[edge[:, 0]]) / length
+            np.testing.assert_allclose(bm.to_numpy(G @ u), bm.to_numpy(du), atol=1e-12)
+
+            Gm = G.to_csr().to_scipy().toarray()
+            Dm = D.to_csr().to_scipy().toarray()
+            np.testing.assert_allclose(Dm, -Gm.T)
+            v = bm.tensor(np.random.default_rng(2).standard_normal(D.shape[1]))
+            np.testing.assert_allclose(bm.to_numpy(D @ v), Dm @ bm.to_numpy(v), atol=1e-12)
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_stencil_operator.py', '-q'])
@@ -5,7 +5,7 @@ from fealpy.backend import backend_manager as bm
 from fealpy.mesh import TriangleMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
     )
 
 from bilinear_form_data import *
@@ -43,6 +43,36 @@ class TestBilinearFormInterface:
         z = bm.to_numpy(bform @ x)
         assert np.linalg.norm(y-z) < 1e-12 
 
+    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_pattern_assembly(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        space = LagrangeFESpace(mesh, p)
+
+        integrator = ScalarMassIntegrator(coef=1.)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        bform.add_integrator(integrator, group='mass')
+        A = bform.assembly().to_scipy()
+        B = bform.pattern_assembly()
+        np.testing.assert_allclose(B.to_scipy().toarray(), A.toarray(), atol=1e-12)
+
+        # Values are updated in the same pattern.
+        pattern = bform._pattern
+        integrator.coef = 2.
+        integrator.clear()
+        C = bform.pattern_assembly()
+        assert bform._pattern is pattern
+        assert C.crow() is B.crow()
+        np.testing.assert_allclose(C.to_scipy().toarray(), bform.assembly().to_scipy().toarray(),
+                                   atol=1e-12)
+
 
 if __name__ == "__main__":
     pytest.main(['./test_bilinear_form.py', '-k', 'test_matmul'])
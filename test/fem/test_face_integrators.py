@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import (BilinearForm, ScalarDiffusionIntegrator, ScalarRobinBCIntegrator,
+                        VectorRobinBCIntegrator, InterfacePenaltyIntegrator)
+
+
+@cartesian
+def kappa(p):
+    return 1 + p[..., 0]
+
+
+class TestFaceIntegrators:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('p', [1, 2])
+    def test_robin(self, backend, p):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=p)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarRobinBCIntegrator(2.0))
+        R = bform.assembly().to_dense()
+        u = space.interpolate(cartesian(lambda p: p[..., 0]))
+        # 2 * \int_{\partial\Omega} x^2 ds
+        np.testing.assert_allclose(bm.to_numpy(u @ R @ u), 2 * (1 + 2/3))
+
+        ts = TensorFunctionSpace(space, (-1, 2))
+        bform = BilinearForm(ts)
+        bform.add_integrator(VectorRobinBCIntegrator(2.0))
+        R = bform.assembly().to_dense()
+        u = ts.interpolate(cartesian(lambda p: bm.stack([p[..., 0], p[..., 1]], axis=-1)))
+        np.testing.assert_allclose(bm.to_numpy(u @ R @ u), 4 * (1 + 2/3))
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_robin_pattern(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=2)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        K = bform.assembly()
+
+        bform.add_integrator(ScalarRobinBCIntegrator(kappa))
+        A = bform.pattern_assembly()
+        assert A.nnz == K.nnz
+
+        rform = BilinearForm(space)
+        rform.add_integrator(ScalarRobinBCIntegrator(kappa))
+        R = rform.assembly()
+        np.testing.assert_allclose(bm.to_numpy(A.to_dense()),
+                                   bm.to_numpy(K.to_dense() + R.to_dense()), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_interface_penalty(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=2)
+        bform = BilinearForm(space)
+        bform.add_integrator(InterfacePenaltyIntegrator(1.0))
+        P = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(P, P.T, atol=1e-12)
+
+        u = bm.to_numpy(space.interpolate(cartesian(lambda p: p[..., 0]**2 + p[..., 0]*p[..., 1])))
+        assert abs(u @ P @ u) < 1e-10
+        # The jump of the normal derivative is 2 on the line x = 0.5, h_F = 1/4.
+        u = bm.to_numpy(space.interpolate(cartesian(lambda p: bm.abs(p[..., 0] - 0.5))))
+        np.testing.assert_allclose(u @ P @ u, 2**2 / 16)
+
+        mesh = TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], nx=2, ny=2, nz=2)
+        space = LagrangeFESpace(mesh, p=1)
+        bform = BilinearForm(space)
+        bform.add_integrator(InterfacePenaltyIntegrator(1.0))
+        P = bm.to_numpy(bform.assembly().to_dense())
+        u = bm.to_numpy(space.interpolate(cartesian(lambda p: p[..., 0] + 2*p[..., 1])))
+        assert abs(u @ P @ u) < 1e-10
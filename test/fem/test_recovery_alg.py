@@ -1,5 +1,7 @@
 
-import ipdb
+import gc
+
+import numpy as np
 import pytest
 
 from fealpy.backend import backend_manager as bm
@@ -32,6 +34,39 @@ class TestRecoveryAlg:
         print('eta4:', eta4)
         
 
+    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("method", ['simple', 'area', 'area_harmonic',
+                                        'distance', 'distance_harmonic'])
+    def test_averaging_operator(self, backend, method):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], 4, 4)
+        space = LagrangeFESpace(mesh, 2)
+        recovery = RecoveryAlg()
+        R = recovery.averaging_operator(space, method=method)
+        assert R.shape == (space.number_of_global_dofs(), mesh.number_of_cells())
+        assert recovery.averaging_operator(space, method=method) is R
+
+        # The gradient of a linear function is recovered exactly.
+        uh = space.function()
+        ip = space.interpolation_points()
+        uh[:] = 1 + 2*ip[:, 0] - ip[:, 1]
+        rguh = recovery.grad_recovery(uh, method=method)
+        gval = bm.to_numpy(rguh[:]).reshape(2, -1)
+        np.testing.assert_allclose(gval[0], 2.)
+        np.testing.assert_allclose(gval[1], -1.)
+
+        # The operator is rebuilt when the mesh changes.
+        mesh.uniform_refine()
+        space = LagrangeFESpace(mesh, 2)
+        R = recovery.averaging_operator(space, method=method)
+        assert R.shape == (space.number_of_global_dofs(), mesh.number_of_cells())
+
+        # The entries go with the spaces.
+        recovery.grad_recovery(space.function(), method=method)
+        del space, uh, rguh
+        gc.collect()
+        assert len(recovery._cache) == 1
+
     def fun(self, p):
         x = p[..., 0]
         y = p[..., 1]
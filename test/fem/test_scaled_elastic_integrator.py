@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.fem import BilinearForm, LinearElasticIntegrator
+from fealpy.material.elastic_material import LinearElasticMaterial
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+
+
+def _simp(rho, p=3, Emin=1e-3):
+    return Emin + rho**p*(1 - Emin), p*rho**(p-1)*(1 - Emin)
+
+
+class TestScaledElasticIntegrator:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    def test_scaled_assembly(self, backend, GD):
+        bm.set_backend(backend)
+        if GD == 2:
+            mesh = TriangleMesh.from_box(nx=4, ny=4)
+            hypo = 'plane_stress'
+        else:
+            mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+            hypo = '3D'
+        NC = mesh.number_of_cells()
+        space = TensorFunctionSpace(LagrangeFESpace(mesh, p=1), shape=(GD, -1))
+        material = LinearElasticMaterial(name='E1', elastic_modulus=1, poisson_ratio=0.3,
+                                         hypo=hypo)
+        integrator = LinearElasticIntegrator(material, q=3, method='scaled')
+        form = BilinearForm(space)
+        form.add_integrator(integrator)
+        rng = np.random.default_rng(0)
+
+        for _ in range(2):
+            rho = bm.tensor(rng.uniform(0.1, 1., NC))
+            integrator.coef, _ = _simp(rho)
+            integrator.clear()
+            K = form.pattern_assembly()
+
+            ref = BilinearForm(space)
+            ref.add_integrator(LinearElasticIntegrator(material, q=3, coef=integrator.coef))
+            np.testing.assert_allclose(K.to_scipy().toarray(),
+                                       ref.assembly().to_scipy().toarray(), atol=1e-12)
+
+        # the compliance sensitivity against the central differences of u^T K(rho) u
+        uh = bm.tensor(rng.standard_normal(space.number_of_global_dofs()))
+        E, dE = _simp(rho)
+        dc = bm.to_numpy(integrator.compliance_sensitivity(space, uh, dE))
+        ce = integrator.element_compliance(space, uh)
+        np.testing.assert_allclose(bm.to_numpy(uh) @ K.to_scipy() @ bm.to_numpy(uh),
+                                   bm.sum(E*ce), rtol=1e-12)
+        h = 1e-6
+        for c in [0, NC-1]:
+            drho = bm.zeros((NC, ), dtype=bm.float64)
+            drho[c] = h
+            cp = bm.sum(_simp(rho + drho)[0]*ce)
+            cm = bm.sum(_simp(rho - drho)[0]*ce)
+            np.testing.assert_allclose(-dc[c], (cp - cm)/(2*h), rtol=1e-6)
+
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('GD, method', [(2, 'fast_strain'), (2, 'fast_stress'), (3, 'fast_3d')])
+    def test_fast_assembly_coef(self, backend, GD, method):
+        bm.set_backend(backend)
+        if GD == 2:
+            mesh = TriangleMesh.from_box(nx=4, ny=4)
+            hypo = 'plane_strain' if method == 'fast_strain' else 'plane_stress'
+        else:
+            mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+            hypo = '3D'
+        NC = mesh.number_of_cells()
+        space = TensorFunctionSpace(LagrangeFESpace(mesh, p=1), shape=(GD, -1))
+        material = LinearElasticMaterial(name='E1', elastic_modulus=1, poisson_ratio=0.3,
+                                         hypo=hypo)
+        coef, _ = _simp(bm.tensor(np.random.default_rng(0).uniform(0.1, 1., NC)))
+        KE = LinearElasticIntegrator(material, q=3, method=method)(space)
+        KK = LinearElasticIntegrator(material, q=3, coef=coef, method=method)(space)
+        np.testing.assert_allclose(bm.to_numpy(KK), bm.to_numpy(coef[:, None, None]*KE),
+                                   atol=1e-12)
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_scaled_elastic_integrator.py', '-q'])
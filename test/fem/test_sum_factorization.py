@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import QuadrangleMesh, HexahedronMesh, UniformMesh2d
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+                        SumFactorization, SumFactorizationOperator)
+from fealpy.solver import cg, JacobiPreconditioner
+
+
+@cartesian
+def coef(p):
+    return 1 + p[..., 0]**2 + p[..., 1]
+
+
+def _meshes():
+    return [QuadrangleMesh.from_box(nx=3, ny=2),
+            HexahedronMesh.from_box(nx=2, ny=1, nz=2),
+            UniformMesh2d((0, 2, 0, 3), h=(0.5, 0.25))]
+
+
+class TestSumFactorization:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('mesh', _meshes())
+    def test_cell_matrix(self, backend, mesh):
+        bm.set_backend(backend)
+        space = LagrangeFESpace(mesh, p=3)
+        for Int, name in [(ScalarDiffusionIntegrator, 'diffusion'),
+                          (ScalarMassIntegrator, 'mass')]:
+            A0 = Int(coef=coef, q=5).assembly(space)
+            A1 = Int(coef=coef, q=5, method='sumfac')(space)
+            np.testing.assert_allclose(bm.to_numpy(A1), bm.to_numpy(A0), atol=1e-12)
+
+            sf = SumFactorization(space, q=5)
+            uc = bm.tensor(np.random.default_rng(0).standard_normal(A0.shape[:2]))
+            Au = bm.einsum('cij, cj -> ci', A0, uc)
+            np.testing.assert_allclose(bm.to_numpy(getattr(sf, name + '_apply')(uc, coef)),
+                                       bm.to_numpy(Au), atol=1e-12)
+            np.testing.assert_allclose(bm.to_numpy(getattr(sf, name + '_diagonal')(coef)),
+                                       bm.to_numpy(bm.einsum('cii -> ci', A0)), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_operator(self, backend):
+        bm.set_backend(backend)
+        mesh = HexahedronMesh.from_box(nx=3, ny=3, nz=3)
+        # a distorted but valid mesh
+        node = mesh.entity('node')
+        node = bm.set_at(node, (..., 0), node[..., 0] + 0.05*bm.sin(3*node[..., 1]))
+        mesh = HexahedronMesh(node, mesh.entity('cell'))
+        space = LagrangeFESpace(mesh, p=4)
+
+        A = SumFactorizationOperator(space, diffusion=coef, mass=2.)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(coef=coef, method='sumfac'))
+        bform.add_integrator(ScalarMassIntegrator(coef=2., method='sumfac'))
+        S = bform.assembly()
+
+        x = bm.tensor(np.random.default_rng(1).standard_normal(A.shape[1]))
+        np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(S @ x), atol=1e-10)
+        S = S.to_scipy()
+        np.testing.assert_allclose(bm.to_numpy(A.diagonal()), S.diagonal(), atol=1e-10)
+
+        b = A @ x
+        y = cg(A, b, M=JacobiPreconditioner(A), atol=0., rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(y), bm.to_numpy(x), atol=1e-6)
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_sum_factorization.py', '-q'])
@@ -0,0 +1,93 @@
+import os
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import Mesh, TriangleMesh, TetrahedronMesh, QuadrangleMesh, UniformMesh2d
+
+
+def _mesh(name):
+    if name == 'tri':
+        return TriangleMesh.from_box(nx=4, ny=4)
+    elif name == 'tet':
+        return TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+    return QuadrangleMesh.from_box(nx=3, ny=2)
+
+
+class TestMeshIO:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('name', ['tri', 'tet', 'quad'])
+    def test_save_load(self, backend, name, tmp_path):
+        bm.set_backend(backend)
+        mesh = _mesh(name)
+        mesh.nodedata['u'] = mesh.entity('node')[:, 0]
+        mesh.celldata['area'] = mesh.entity_measure('cell')
+        path = os.path.join(tmp_path, 'mesh')
+        mesh.save(path)
+
+        new = Mesh.load(path, verify=True)
+        assert type(new) is type(mesh)
+        assert isinstance(new.entity('cell'), np.memmap)
+        for etype in ['node', 'edge', 'face', 'cell']:
+            np.testing.assert_array_equal(bm.to_numpy(new.entity(etype)),
+                                          bm.to_numpy(mesh.entity(etype)))
+        np.testing.assert_array_equal(new.face_to_cell(), mesh.face_to_cell())
+        np.testing.assert_array_equal(new.cell_to_edge(), mesh.cell_to_edge())
+        np.testing.assert_array_equal(new.boundary_node_flag(), mesh.boundary_node_flag())
+        np.testing.assert_allclose(new.celldata['area'], mesh.entity_measure('cell'))
+        np.testing.assert_allclose(new.nodedata['u'], mesh.nodedata['u'])
+        assert (new.facedata is new.edgedata) == (mesh.facedata is mesh.edgedata)
+
+        with pytest.raises(ValueError):
+            new.node[0, 0] = 1.0
+        new = type(mesh).load(path, mmap_mode=None)
+        new.node[0, 0] = 1.0
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('name', ['tri', 'tet', 'quad'])
+    def test_load_skips_construct(self, backend, name, tmp_path, monkeypatch):
+        bm.set_backend(backend)
+        mesh = _mesh(name)
+        path = os.path.join(tmp_path, 'mesh')
+        mesh.save(path)
+
+        def construct(self):
+            raise AssertionError('construct() is called in load.')
+        monkeypatch.setattr(type(mesh), 'construct', construct)
+        new = Mesh.load(path)
+        assert '_topology' not in new.__dict__
+        np.testing.assert_array_equal(new.cell_to_face(), mesh.cell_to_face())
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_integrity(self, backend, tmp_path):
+        bm.set_backend(backend)
+        mesh = _mesh('tri')
+        path = os.path.join(tmp_path, 'mesh')
+        mesh.save(path)
+
+        with pytest.raises(TypeError):
+            TetrahedronMesh.load(path)
+
+        fname = os.path.join(path, 'node.npy')
+        node = np.load(fname)
+        node[0, 0] += 1.0
+        np.save(fname, node)
+        TriangleMesh.load(path)
+        with pytest.raises(ValueError):
+            TriangleMesh.load(path, verify=True)
+        np.save(fname, node[:-1])
+        with pytest.raises(ValueError):
+            TriangleMesh.load(path)
+
+        os.remove(os.path.join(path, 'meta.json'))
+        with pytest.raises(FileNotFoundError):
+            TriangleMesh.load(path)
+
+        with pytest.raises(TypeError):
+            UniformMesh2d((0, 2, 0, 2), h=(0.5, 0.5)).save(os.path.join(tmp_path, 'umesh'))
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_mesh_io.py', '-q'])
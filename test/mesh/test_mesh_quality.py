@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.mesh.mesh_quality import RadiusRatioQuality
+from fealpy.mesh.opt import SumObjective
+from fealpy.opt import TruncatedNewtonAlg, opt_alg_options
+
+
+def _perturbed_mesh(TD, n, seed=0):
+    if TD == 2:
+        mesh = TriangleMesh.from_box(nx=n, ny=n)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=n, ny=n, nz=n)
+    rng = np.random.default_rng(seed)
+    node = bm.to_numpy(mesh.entity('node')).copy()
+    isFreeNode = ~bm.to_numpy(mesh.boundary_node_flag())
+    node[isFreeNode] += 0.3/n*(rng.random((isFreeNode.sum(), TD)) - 0.5)
+    return mesh, bm.tensor(node)
+
+
+class TestRadiusRatioQuality:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('TD', [2, 3])
+    def test_derivatives(self, backend, TD):
+        bm.set_backend(backend)
+        mesh, node = _perturbed_mesh(TD, 2)
+        quality = RadiusRatioQuality(mesh)
+        cell = bm.to_numpy(mesh.entity('cell'))
+        g = bm.to_numpy(quality.jac(node))
+        H = bm.to_numpy(quality.cell_hess(node))
+
+        h = 1e-6
+        for a in range(TD):
+            dx = np.zeros(node.shape)
+            dx[cell[0, 1], a] = h
+            df = (quality.fun(node + dx) - quality.fun(node - dx))/(2*h)
+            dg = (quality.jac(node + dx) - quality.jac(node - dx))/(2*h)
+            np.testing.assert_allclose(g[0, 1, a], df[0], rtol=1e-6)
+            np.testing.assert_allclose(H[0, :, :, 1, a], dg[0], rtol=1e-5, atol=1e-6)
+
+        # the gradient from the frozen-coefficient blocks
+        blocks = quality.hess(node)
+        xc = bm.to_numpy(node)[cell]
+        gx = np.einsum('nij, nj -> ni', blocks[0], xc[..., 0])
+        gx += np.einsum('nij, nj -> ni', blocks[-1], xc[..., 1])
+        if TD == 3:
+            gx += np.einsum('nij, nj -> ni', blocks[2], xc[..., 2])
+        np.testing.assert_allclose(gx, g[..., 0], rtol=1e-10, atol=1e-10)
+
+
+class TestSumObjective:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('TD', [2, 3])
+    def test_hess(self, backend, TD):
+        bm.set_backend(backend)
+        mesh, node = _perturbed_mesh(TD, 3)
+        fixed = mesh.boundary_node_flag()
+        obj = SumObjective(RadiusRatioQuality(mesh), fixed)
+        H = obj.hess(node)
+        pattern = obj._pattern
+        p = bm.tensor(np.random.rand(*node.shape))
+
+        Hp = H.to_scipy() @ bm.to_numpy(p).reshape(-1)
+        np.testing.assert_allclose(Hp, bm.to_numpy(obj.hessp(node, p)).reshape(-1),
+                                   rtol=1e-10, atol=1e-10)
+        # fixed nodes are decoupled
+        np.testing.assert_array_equal(bm.to_numpy(obj.jac(node))[bm.to_numpy(fixed)], 0.)
+        np.testing.assert_allclose(Hp.reshape(node.shape)[bm.to_numpy(fixed)],
+                                   bm.to_numpy(p)[bm.to_numpy(fixed)])
+        obj.hess(node + 0.01)
+        assert obj._pattern is pattern
+
+        # a new cell array of the same shape, e.g. from reorder_mesh, rebuilds it
+        mesh.cell = bm.copy(mesh.entity('cell')[::-1])
+        H = obj.hess(node)
+        assert obj._pattern[-1][0] is mesh.entity('cell')
+        np.testing.assert_allclose(H.to_scipy() @ bm.to_numpy(p).reshape(-1),
+                                   bm.to_numpy(obj.hessp(node, p)).reshape(-1),
+                                   rtol=1e-10, atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('TD', [2, 3])
+    def test_truncated_newton(self, backend, TD):
+        bm.set_backend(backend)
+        mesh, node = _perturbed_mesh(TD, 8 if TD == 2 else 3)
+        obj = SumObjective(RadiusRatioQuality(mesh), mesh.boundary_node_flag())
+        options = opt_alg_options(node, obj, MaxIters=30, NormGradTol=1e-6, Print=False)
+        alg = TruncatedNewtonAlg(options)
+        x, f, g, _ = alg.run()
+
+        assert float(bm.max(bm.abs(g))) < 1e-6
+        assert f < obj.fun(node)
+        assert alg.NF < 30
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_mesh_quality.py', '-q'])
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.mesh.reorder import reorder_mesh, rcm_ordering, sfc_ordering, entity_graph
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+
+
+def _shuffled_mesh(TD, seed=0):
+    if TD == 2:
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+    else:
+        mesh = TetrahedronMesh.from_box(nx=3, ny=3, nz=3)
+    rng = np.random.default_rng(seed)
+    NN, NC = mesh.number_of_nodes(), mesh.number_of_cells()
+    reorder_mesh(mesh, node=bm.tensor(rng.permutation(NN)),
+                 cell=bm.tensor(rng.permutation(NC)))
+    return mesh
+
+
+def _bandwidth(mesh):
+    G = entity_graph(mesh, 'node').tocoo()
+    return np.max(np.abs(G.row - G.col))
+
+
+def f(p):
+    return bm.sin(3*p[..., 0]) + p[..., 1]**2 + p[..., -1]
+
+
+class TestReorder:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('TD', [2, 3])
+    def test_reorder_mesh(self, backend, TD):
+        bm.set_backend(backend)
+        mesh = _shuffled_mesh(TD)
+        node0 = bm.to_numpy(mesh.entity('node')).copy()
+        cell0 = bm.to_numpy(mesh.entity('cell')).copy()
+        space = LagrangeFESpace(mesh, p=3)
+        tspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (TD, -1))
+        u0 = bm.to_numpy(space.interpolate(f))
+        ip0 = bm.to_numpy(tspace.scalar_space.interpolation_points())
+        mesh.celldata['index'] = bm.arange(mesh.number_of_cells())
+        mesh.edgedata['length'] = mesh.entity_measure('edge')
+        b0 = _bandwidth(mesh)
+
+        node_perm, cell_perm, dof_perm, tdof_perm = reorder_mesh(
+            mesh, node='rcm', cell='hilbert', spaces=[space, tspace])
+        node_perm, cell_perm = bm.to_numpy(node_perm), bm.to_numpy(cell_perm)
+
+        assert _bandwidth(mesh) < b0
+        np.testing.assert_array_equal(bm.to_numpy(mesh.entity('node')), node0[node_perm])
+        np.testing.assert_array_equal(node_perm[bm.to_numpy(mesh.entity('cell'))],
+                                      cell0[cell_perm])
+        np.testing.assert_array_equal(bm.to_numpy(mesh.celldata['index']), cell_perm)
+        np.testing.assert_allclose(bm.to_numpy(mesh.edgedata['length']),
+                                   bm.to_numpy(mesh.entity_measure('edge')))
+        # the data of the spaces are mapped by the DoF permutations
+        np.testing.assert_allclose(bm.to_numpy(space.interpolate(f)),
+                                   u0[bm.to_numpy(dof_perm)], atol=1e-14)
+        ip = bm.to_numpy(tspace.scalar_space.interpolation_points())
+        gdof = ip.shape[0]
+        tdof_perm = bm.to_numpy(tdof_perm)
+        np.testing.assert_array_equal(tdof_perm[:gdof] + gdof, tdof_perm[gdof:2*gdof])
+        np.testing.assert_allclose(ip, ip0[tdof_perm[:gdof]])
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('curve', ['hilbert', 'morton'])
+    def test_sfc_ordering(self, backend, curve):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=15, ny=15)
+        perm = bm.to_numpy(sfc_ordering(mesh, 'node', curve=curve, level=4))
+        node = bm.to_numpy(mesh.entity('node'))[perm]
+        assert np.array_equal(np.sort(perm), np.arange(mesh.number_of_nodes()))
+        if curve == 'hilbert':
+            # consecutive grid points on the Hilbert curve are neighbours
+            step = np.abs(np.diff(np.round(node*15), axis=0)).sum(axis=1)
+            np.testing.assert_array_equal(step, 1)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_rcm_ordering(self, backend):
+        bm.set_backend(backend)
+        mesh = _shuffled_mesh(2, seed=1)
+        perm = bm.to_numpy(rcm_ordering(mesh, 'cell'))
+        assert np.array_equal(np.sort(perm), np.arange(mesh.number_of_cells()))
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_reorder.py', '-q'])
@@ -326,6 +326,23 @@ class TestTetrahedronMeshInterfaces:
         u = bm.array(data1['nodedata'][0],dtype=bm.float64)
         np.testing.assert_allclose(bm.to_numpy(u), data["u"],atol= 1e-6)
 
+    @pytest.mark.parametrize("backend", ["numpy"])
+    @pytest.mark.parametrize("p", [1, 2])
+    def test_bisect_transfer_operator(self, backend, p):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+
+        def f(x):
+            return x[..., 0]**p + x[..., 1]*x[..., 2]**(p-1)
+
+        u0 = f(mesh.interpolation_points(p))
+        NC = mesh.number_of_cells()
+        isMarkedCell = bm.arange(NC) < 7
+        options = mesh.bisect_options(IM=p, disp=False)
+        mesh.bisect(isMarkedCell, options=options)
+        np.testing.assert_allclose(bm.to_numpy(options['IM'] @ u0),
+                                   bm.to_numpy(f(mesh.interpolation_points(p))), atol=1e-12)
+
     @pytest.mark.parametrize("backend", ["numpy", "pytorch", "jax"])
     @pytest.mark.parametrize("data", crack_box_data)
     def test_from_crack_box(self,data,backend):
@@ -375,6 +375,119 @@ class TestTriangleMeshInterfaces:
         np.testing.assert_array_equal(bm.to_numpy(face2cell), data["face2cell"])
         np.testing.assert_allclose(u , data['u'])
 
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_coarsen(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        node0 = bm.to_numpy(mesh.entity('node'))
+        area0 = bm.to_numpy(mesh.entity_measure('cell'))
+        for r in [0.4, 0.3, 0.2]:
+            bc = mesh.entity_barycenter('cell')
+            isMarkedCell = bm.sqrt(bm.sum((bc - 0.5)**2, axis=-1)) < r
+            mesh.bisect(isMarkedCell, options={'disp': False})
+
+        def f(p):
+            return 1 + p[..., 0] + 2*p[..., 1]**2 - p[..., 0]*p[..., 1]
+        data = {'u': f(mesh.entity('node')),
+                'uh': f(mesh.interpolation_points(2))[mesh.cell_to_ipoint(2)],
+                'c': bm.ones(mesh.number_of_cells(), dtype=bm.float64)}
+
+        for _ in range(4):
+            NC = mesh.number_of_cells()
+            mesh.coarsen(bm.ones(NC, dtype=bm.bool), options={'data': data, 'lagrange': True})
+
+            # the incremental topology is consistent with the cells
+            cell = bm.to_numpy(mesh.entity('cell'))
+            edge = bm.to_numpy(mesh.entity('edge'))
+            edge2cell = bm.to_numpy(mesh.face_to_cell())
+            localEdge = bm.to_numpy(mesh.localEdge)
+            np.testing.assert_array_equal(
+                    cell[edge2cell[:, 0:1], localEdge[edge2cell[:, 2]]], edge)
+            isIn = edge2cell[:, 0] != edge2cell[:, 1]
+            np.testing.assert_array_equal(
+                    cell[edge2cell[isIn, 1:2], localEdge[edge2cell[isIn, 3]]],
+                    edge[isIn][:, ::-1])
+            cell2edge = bm.to_numpy(mesh.cell_to_edge())
+            np.testing.assert_array_equal(edge[cell2edge].reshape(-1, 2).sum(axis=1),
+                                          cell[:, localEdge].reshape(-1, 2).sum(axis=1))
+            new = TriangleMesh(mesh.entity('node'), mesh.entity('cell'))
+            assert mesh.number_of_edges() == new.number_of_edges()
+            assert bm.sum(mesh.boundary_face_flag()) == bm.sum(new.boundary_face_flag())
+
+            np.testing.assert_allclose(data['u'], f(mesh.entity('node')))
+            np.testing.assert_allclose(
+                    data['uh'], f(mesh.interpolation_points(2))[mesh.cell_to_ipoint(2)])
+            np.testing.assert_allclose(data['c'], 1.)
+
+        # back to the initial mesh
+        assert mesh.number_of_cells() == area0.shape[0]
+        np.testing.assert_allclose(bm.to_numpy(mesh.entity('node')), node0)
+        np.testing.assert_allclose(bm.to_numpy(mesh.entity_measure('cell')), area0)
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_coarsen_cell_arrays(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        mesh.bisect(None, options={'disp': False})
+        NC = mesh.number_of_cells()
+        # cell arrays that are not Lagrange values are averaged
+        mesh.celldata['grad'] = bm.ones((NC, 2), dtype=bm.float64)
+        mesh.celldata['vec'] = bm.stack([bm.ones(NC), 2*bm.ones(NC), 3*bm.ones(NC)], axis=1)
+        data = {'w': bm.ones((NC, 3), dtype=bm.float64)}
+        mesh.coarsen(bm.ones(NC, dtype=bm.bool), options={'data': data})
+        NC = mesh.number_of_cells()
+        assert NC == 8
+        np.testing.assert_allclose(mesh.celldata['grad'], np.ones((NC, 2)))
+        np.testing.assert_allclose(mesh.celldata['vec'], np.tile([1., 2., 3.], (NC, 1)))
+        np.testing.assert_allclose(data['w'], np.ones((NC, 3)))
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("p", [1, 2, 3])
+    def test_transfer_operator(self, backend, p):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+
+        def f(x):
+            return 1 + x[..., 0]**p - x[..., 0]*x[..., 1]**(p-1)
+
+        def interpolate(mesh):
+            return f(mesh.interpolation_points(p))
+
+        u0 = bm.stack([interpolate(mesh), 2*interpolate(mesh)], axis=1)
+        bc = mesh.entity_barycenter('cell')
+        isMarkedCell = bm.sqrt(bm.sum((bc - 0.5)**2, axis=-1)) < 0.3
+        options = mesh.bisect_options(IM=p, disp=False)
+        mesh.bisect(isMarkedCell, options=options)
+        u1 = options['IM'] @ u0
+        np.testing.assert_allclose(u1[:, 0], interpolate(mesh), atol=1e-12)
+        np.testing.assert_allclose(u1[:, 1], 2*interpolate(mesh), atol=1e-12)
+
+        NC = mesh.number_of_cells()
+        options = {'IM': p}
+        mesh.coarsen(bm.ones(NC, dtype=bm.bool), options=options)
+        assert mesh.number_of_cells() == 32
+        np.testing.assert_allclose(options['IM'] @ u1[:, 0], interpolate(mesh), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_transfer_operator_with_cell_data(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+
+        def f(x):
+            return 1 + x[..., 0]**2 - x[..., 0]*x[..., 1]
+
+        u0 = f(mesh.interpolation_points(2))
+        # P1 cell data alongside the P2 transfer operator
+        uh = f(mesh.interpolation_points(1))[mesh.cell_to_ipoint(1)]
+        NC = mesh.number_of_cells()
+        isMarkedCell = bm.arange(NC) < 5
+        options = mesh.bisect_options(IM=2, data={'uh': uh}, disp=False)
+        mesh.bisect(isMarkedCell, options=options)
+        np.testing.assert_allclose(options['IM'] @ u0, f(mesh.interpolation_points(2)),
+                                   atol=1e-12)
+        assert options['data']['uh'].shape == (mesh.number_of_cells(), 3)
+
+
 if __name__ == "__main__":
     #a = TestTriangleMeshInterfaces()
     #a.test_from_box(from_box[0], 'pytorch')
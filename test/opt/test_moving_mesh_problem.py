@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (BilinearForm, LinearForm,
+                        ScalarDiffusionIntegrator, ScalarSourceIntegrator)
+from fealpy.opt.moving_mesh_problem import MovingMeshAlg
+
+
+class SinSinData:
+    @cartesian
+    def solution(self, p):
+        x, y = p[..., 0], p[..., 1]
+        return bm.sin(bm.pi*x) * bm.sin(bm.pi*y)
+
+    @cartesian
+    def source(self, p):
+        x, y = p[..., 0], p[..., 1]
+        return 2*bm.pi**2 * bm.sin(bm.pi*x) * bm.sin(bm.pi*y)
+
+
+class TestMovingMeshAlg:
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    def test_get_energy(self, backend):
+        bm.set_backend(backend)
+        pde = SinSinData()
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        cell = mesh.entity('cell')
+        node0 = bm.copy(mesh.entity('node'))
+        isbdnode = mesh.boundary_node_flag()
+        alg = MovingMeshAlg(mesh, 1, pde)
+
+        for _ in range(2):
+            node = node0 + 0.02 * bm.random.rand(*node0.shape) * (~isbdnode)[:, None]
+            E = alg.get_energy(node)
+            assert alg.mesh.entity('cell') is cell
+
+            # energy of a new mesh with the dense interior stiffness matrix
+            space = LagrangeFESpace(TriangleMesh(node, cell), 1)
+            bform = BilinearForm(space)
+            bform.add_integrator(ScalarDiffusionIntegrator(method="fast"))
+            A = bform.assembly().to_dense()[~isbdnode][:, ~isbdnode]
+            lform = LinearForm(space)
+            lform.add_integrator(ScalarSourceIntegrator(pde.source))
+            F = lform.assembly()[~isbdnode]
+            u = pde.solution(node)[~isbdnode]
+            np.testing.assert_allclose(E, 0.5 * u @ A @ u - u @ F, rtol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_moving_mesh_problem.py", "-q"])
@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+
+from fealpy.backend import backend_manager as bm
+from fealpy.opt import PopulationEvaluator, PSOProblem
+
+
+def sphere(x):
+    return float(np.sum(x**2))
+
+
+class TestPopulationEvaluator:
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_evaluate(self, backend, workers):
+        bm.set_backend(backend)
+        x = bm.random.rand(10, 3)
+        expected = bm.to_numpy(bm.sum(x**2, axis=1))
+
+        ev = PopulationEvaluator(lambda x: bm.sum(x**2, axis=1))
+        np.testing.assert_allclose(bm.to_numpy(ev(x)), expected)
+
+        out = bm.zeros((10,), dtype=x.dtype)
+        with PopulationEvaluator(sphere, vectorized=False, workers=workers) as ev:
+            val = ev(x, out=out)
+        assert val is out
+        np.testing.assert_allclose(bm.to_numpy(out), expected)
+
+    @pytest.mark.parametrize("backend", ['numpy'])
+    @pytest.mark.parametrize("numLM0", [1, 3])
+    def test_pso_fitness(self, backend, numLM0):
+        import networkx as nx
+        bm.set_backend(backend)
+        MAP = np.zeros((6, 6))
+        MAP[2, 1:5] = 1
+        problem = PSOProblem(MAP, (0, 0), (5, 5))
+        data = problem.builddata()
+        data['numLM0'] = numLM0
+
+        X = bm.random.rand(7, data['node'].shape[0])
+        fit = problem.fitness(X)
+
+        G = nx.DiGraph(data['net'])
+        for j in range(X.shape[0]):
+            path = [int(data['noS'])] + [int(i) for i in np.argsort(X[j])[:numLM0]] + [int(data['noE'])]
+            d = sum(nx.shortest_path_length(G, path[i], path[i+1]) for i in range(len(path) - 1))
+            assert float(fit[j]) == d
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_population_evaluator.py", "-q"])
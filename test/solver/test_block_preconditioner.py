@@ -0,0 +1,78 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import (
+    BilinearForm, BlockForm,
+    ScalarDiffusionIntegrator, ScalarMassIntegrator, PressWorkIntegrator
+)
+from fealpy.solver import (
+    minres, fgmres,
+    JacobiPreconditioner, LUPreconditioner,
+    BlockOperator, BlockDiagonalPreconditioner, BlockTriangularPreconditioner,
+    MassSchurComplement, LSCSchurComplement
+)
+
+
+class TestBlockPreconditioner:
+
+    def _get_system(self):
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        pspace = LagrangeFESpace(mesh, p=1)
+        uspace = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), (2, -1))
+
+        A = BilinearForm(uspace)
+        A.add_integrator(ScalarDiffusionIntegrator(q=4))
+        A.add_integrator(ScalarMassIntegrator(q=4))
+        Bt = BilinearForm((pspace, uspace))
+        Bt.add_integrator(PressWorkIntegrator(q=4))
+        Mp = BilinearForm(pspace)
+        Mp.add_integrator(ScalarMassIntegrator(q=3))
+
+        form = BlockForm([[A, Bt], [Bt.T, None]])
+        op = BlockOperator.from_block_form(form)
+        x = bm.tensor(np.random.rand(op.shape[0]))
+        b = op @ x
+        return form, op, Mp.assembly(), x, b
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_block_operator(self, backend):
+        bm.set_backend(backend)
+        form, op, _, x, b = self._get_system()
+
+        np.testing.assert_allclose(bm.to_numpy(form @ x), bm.to_numpy(b))
+        np.testing.assert_allclose(bm.to_numpy(op.to_sparse() @ x), bm.to_numpy(b))
+        np.testing.assert_allclose(bm.to_numpy(form.assembly() @ x), bm.to_numpy(b))
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_minres_block_diagonal(self, backend):
+        bm.set_backend(backend)
+        _, op, Mp, x, b = self._get_system()
+        P = BlockDiagonalPreconditioner(
+            [LUPreconditioner(op[0, 0]), MassSchurComplement(Mp, preconditioner=JacobiPreconditioner)],
+            op
+        )
+        x0 = minres(op, b, M=P, rtol=1e-12, maxiter=500)
+        np.testing.assert_allclose(bm.to_numpy(x0), bm.to_numpy(x), atol=1e-8)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('schur', ['mass', 'lsc'])
+    def test_fgmres_block_triangular(self, backend, schur):
+        bm.set_backend(backend)
+        _, op, Mp, x, b = self._get_system()
+
+        if schur == 'mass':
+            PS = MassSchurComplement(Mp)
+        else:
+            PS = LSCSchurComplement(op[0, 0], op[1, 0], op[0, 1])
+
+        P = BlockTriangularPreconditioner([LUPreconditioner(op[0, 0]), PS], op)
+        x0 = fgmres(op, b, M=P, rtol=1e-12, maxiter=500)
+        np.testing.assert_allclose(bm.to_numpy(x0), bm.to_numpy(x), atol=1e-8)
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_block_preconditioner.py', '-q'])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import cg, JacobiPreconditioner
+
+
+class TestConjugateGradient:
+
+    def _get_system(self):
+        mesh = TriangleMesh.from_box(nx=16, ny=16)
+        space = LagrangeFESpace(mesh, p=2)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+        bform.add_integrator(ScalarMassIntegrator(q=3))
+        return bform.assembly()
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('method', ['cg', 'block'])
+    def test_multi_rhs(self, backend, method):
+        bm.set_backend(backend)
+        A = self._get_system()
+        rng = np.random.default_rng(0)
+        b = rng.standard_normal((A.shape[0], 8))
+        b[:, :4] *= 1e-4 # the relative tolerance applies to each column
+        b[:, 5] = bm.to_numpy(A @ bm.tensor(np.ones(A.shape[0])))
+        b = bm.tensor(b)
+
+        x, info = cg(A, b, M=JacobiPreconditioner(A), atol=0., rtol=1e-10,
+                     method=method, return_info=True)
+        r = bm.to_numpy(b - A @ x)
+        rel = np.linalg.norm(r, axis=0) / np.linalg.norm(bm.to_numpy(b), axis=0)
+        assert np.all(rel < 1e-10)
+        assert bm.all(info['converged'])
+        np.testing.assert_allclose(bm.to_numpy(info['residual']),
+                                   np.linalg.norm(r, axis=0), rtol=1e-2)
+        if method == 'cg':
+            # a column converges in its own number of iterations
+            assert info['niter'][5] < bm.max(info['niter'])
+            x0 = cg(A, b[:, 0], M=JacobiPreconditioner(A), atol=0., rtol=1e-10)
+            np.testing.assert_allclose(bm.to_numpy(x0), bm.to_numpy(x[:, 0]), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_info(self, backend):
+        bm.set_backend(backend)
+        A = self._get_system()
+        b = bm.tensor(np.random.default_rng(1).standard_normal((3, A.shape[0])))
+        b = bm.set_at(b, 1, 0.)
+
+        x, info = cg(A, b, batch_first=True, rtol=1e-10, maxiter=5, return_info=True)
+        assert x.shape == b.shape
+        assert not bm.any(info['converged'][[0, 2]])
+        assert info['converged'][1] and info['niter'][1] == 0
+        assert np.all(bm.to_numpy(x[1]) == 0.)
+        assert np.all(bm.to_numpy(info['niter'][[0, 2]]) == 5)
+
+        x, info = cg(A, b[0], rtol=1e-10, return_info=True)
+        assert info['converged'] and info['niter'] > 5
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_conjugate_gradient.py', '-q'])
@@ -0,0 +1,60 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import mpir
+
+
+class TestMixedPrecisionSolver:
+
+    def _get_system(self, ftype):
+        mesh = TriangleMesh.from_box(nx=16, ny=16, ftype=ftype)
+        space = LagrangeFESpace(mesh, p=2)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+        bform.add_integrator(ScalarMassIntegrator(q=3))
+        return bform.assembly()
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_float32_assembly(self, backend):
+        bm.set_backend(backend)
+        A = self._get_system(bm.float32)
+        assert A.values().dtype == bm.float32
+
+        mesh = TriangleMesh.from_box(nx=2, ny=2, ftype=bm.float32)
+        for q in (3, 12):
+            bcs, ws = mesh.quadrature_formula(q).get_quadrature_points_and_weights()
+            assert bcs.dtype == bm.float32
+            assert ws.dtype == bm.float32
+        bcs, ws = mesh.quadrature_formula(3, 'edge').get_quadrature_points_and_weights()
+        assert bcs.dtype == bm.float32
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('inner', ['lu', 'cg'])
+    def test_mpir(self, backend, inner):
+        bm.set_backend(backend)
+        A = self._get_system(bm.float64)
+        x = bm.tensor(np.random.rand(A.shape[0]))
+        b = A @ x
+
+        x0 = mpir(A, b, inner=inner, rtol=1e-12)
+        assert x0.dtype == bm.float64
+        assert bm.max(bm.abs(x0 - x)) < 1e-8
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_mpir_multi_rhs(self, backend):
+        bm.set_backend(backend)
+        A = self._get_system(bm.float64)
+        x = bm.tensor(np.random.rand(A.shape[0], 3))
+        b = A @ x
+
+        x0 = mpir(A, b, rtol=1e-12)
+        assert bm.max(bm.abs(x0 - x)) < 1e-8
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_mixed_precision.py', '-q'])
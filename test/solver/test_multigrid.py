@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, QuadrangleMesh, TetrahedronMesh, HexahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, DirichletBC
+from fealpy.solver import cg, GMGPreconditioner, PMGPreconditioner
+
+
+class TestGeometricMultigrid:
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('mesh_class, kwargs', [
+        (TriangleMesh, dict(nx=2, ny=3)),
+        (QuadrangleMesh, dict(nx=2, ny=3)),
+        (TetrahedronMesh, dict(nx=1, ny=2, nz=1))])
+    def test_prolongation(self, backend, mesh_class, kwargs):
+        bm.set_backend(backend)
+        mesh = mesh_class.from_box(**kwargs)
+        f = lambda p: 1. + 2.*p[:, 0] - 3.*p[:, 1]
+        u = f(mesh.entity('node'))
+        c0 = bm.to_numpy(mesh.entity_barycenter('cell'))
+        Ps, Cs = mesh.uniform_refine(2, returnim=True)
+        assert len(Ps) == 2 and len(Cs) == 2
+        for P in Ps:
+            u = P @ u
+        np.testing.assert_allclose(bm.to_numpy(u), bm.to_numpy(f(mesh.entity('node'))),
+                                   atol=1e-12)
+        # the children have equal sizes, whose barycenters average to the parent's
+        c = bm.to_numpy(mesh.entity_barycenter('cell'))
+        for C in reversed(Cs):
+            C = C.to_scipy()
+            c = (C.T @ c) / np.asarray(C.sum(axis=0)).reshape(-1, 1)
+        np.testing.assert_allclose(c, c0, atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('mesh_class, kwargs', [
+        (TriangleMesh, dict(nx=2, ny=3)),
+        (QuadrangleMesh, dict(nx=2, ny=3)),
+        (TetrahedronMesh, dict(nx=1, ny=2, nz=1))])
+    def test_prolongation_dtype(self, backend, mesh_class, kwargs):
+        bm.set_backend(backend)
+        mesh = mesh_class.from_box(**kwargs)
+        mesh = mesh_class(bm.astype(mesh.entity('node'), bm.float32), mesh.entity('cell'))
+        Ps, Cs = mesh.uniform_refine(1, returnim=True)
+        assert Ps[0].values().dtype == bm.float32
+        assert Cs[0].values().dtype == bm.float32
+
+        if mesh_class is TriangleMesh:
+            data = {'u': bm.ones((mesh.number_of_nodes(), ), dtype=bm.float32)}
+            mesh.bisect(bm.ones((mesh.number_of_cells(), ), dtype=bm.bool),
+                        options=mesh.bisect_options(data=data, disp=False))
+            assert data['u'].dtype == bm.float32
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('cycle', ['V', 'W'])
+    @pytest.mark.parametrize('smoother', ['gs', 'jacobi'])
+    def test_poisson(self, backend, cycle, smoother):
+        bm.set_backend(backend)
+        niter = []
+        for n in [3, 5]:
+            mesh = TriangleMesh.from_box(nx=4, ny=4)
+            Ps, _ = mesh.uniform_refine(n, returnim=True)
+            space = LagrangeFESpace(mesh, p=1)
+            bform = BilinearForm(space)
+            bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+            A = bform.assembly()
+            A, b = DirichletBC(space, gD=0.).apply(A, bm.ones(A.shape[0]))
+
+            P = GMGPreconditioner(A, Ps, cycle=cycle, smoother=smoother)
+            assert P.number_of_levels == n + 1
+            x, info = cg(A, b, M=P, rtol=1e-10, return_info=True)
+            assert info['converged']
+            niter.append(int(info['niter']))
+            r = bm.to_numpy(b - A @ x)
+            assert np.linalg.norm(r) < 1e-9 * np.linalg.norm(bm.to_numpy(b))
+
+            # a block of vectors
+            B = bm.stack([b, 2*b], axis=1)
+            np.testing.assert_allclose(bm.to_numpy((P @ B)[:, 1]), 2*bm.to_numpy(P @ b))
+        # the number of iterations does not grow with the refinement
+        assert niter[1] <= niter[0] + 2
+
+        with pytest.raises(ValueError):
+            GMGPreconditioner(A, Ps[:-1])
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('mesh_class, kwargs', [
+        (TriangleMesh, dict(nx=3, ny=2)),
+        (QuadrangleMesh, dict(nx=3, ny=2)),
+        (TetrahedronMesh, dict(nx=2, ny=1, nz=2)),
+        (HexahedronMesh, dict(nx=2, ny=1, nz=2))])
+    def test_p_prolongation(self, backend, mesh_class, kwargs):
+        bm.set_backend(backend)
+        mesh = mesh_class.from_box(**kwargs)
+        for p0, p1 in [(1, 2), (1, 4), (2, 3), (3, 5)]:
+            def f(x):
+                return sum(x[:, 0]**i * x[:, 1]**(p0-i) for i in range(p0+1)) + x[:, -1]**p0
+            P = mesh.prolongation_matrix(p0, p1)
+            assert P.shape == (mesh.number_of_global_ipoints(p1),
+                               mesh.number_of_global_ipoints(p0))
+            u0 = f(mesh.interpolation_points(p0))
+            u1 = f(mesh.interpolation_points(p1))
+            np.testing.assert_allclose(bm.to_numpy(P @ u0), bm.to_numpy(u1), atol=1e-12)
+
+        with pytest.raises(ValueError):
+            mesh.prolongation_matrix(2, 1)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_p_multigrid(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        Hs, _ = mesh.uniform_refine(2, returnim=True)
+        space = LagrangeFESpace(mesh, p=3)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=5))
+        A = bform.assembly()
+        A, b = DirichletBC(space, gD=0.).apply(A, bm.ones(A.shape[0]))
+        _, info0 = cg(A, b, rtol=1e-10, return_info=True)
+
+        for orders, prolongations in [(None, ()), ([1, 3], Hs)]:
+            P = PMGPreconditioner(A, space, orders=orders, prolongations=prolongations)
+            x, info = cg(A, b, M=P, rtol=1e-10, return_info=True)
+            assert info['converged']
+            assert int(info['niter']) < int(info0['niter']) // 5
+            r = bm.to_numpy(b - A @ x)
+            assert np.linalg.norm(r) < 1e-9 * np.linalg.norm(bm.to_numpy(b))
+        assert P.number_of_levels == 4
+
+        with pytest.raises(ValueError):
+            PMGPreconditioner(A, space, orders=[2, 3])
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_multigrid.py', '-q'])
@@ -0,0 +1,94 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    SemilinearForm,
+    ScalarSemilinearDiffusionIntegrator, ScalarSemilinearMassIntegrator,
+    ScalarSourceIntegrator
+)
+from fealpy.pde.semilinear_2d import SemilinearData
+from fealpy.solver import NewtonSolver
+
+
+class TestNewtonSolver:
+
+    def _get_problem(self, source=True):
+        pde = SemilinearData([0, 1, 0, 1])
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=8, ny=8)
+        space = LagrangeFESpace(mesh, p=1)
+        uh = space.function()
+        isDDof = space.set_dirichlet_bc(pde.dirichlet, uh)[-1]
+
+        @cartesian
+        def diffusion_coef(p):
+            return pde.diffusion_coefficient(p)
+        diffusion_coef.kernel_func = lambda u: u
+        diffusion_coef.grad_kernel_func = lambda u: bm.ones_like(u)
+        diffusion_coef.uh = uh
+
+        @cartesian
+        def reaction_coef(p):
+            return pde.reaction_coefficient(p)
+        reaction_coef.kernel_func = lambda u: u**3
+        reaction_coef.grad_kernel_func = lambda u: 3*u**2
+        reaction_coef.uh = uh
+
+        sform = SemilinearForm(space)
+        sform.add_integrator([
+            ScalarSemilinearDiffusionIntegrator(diffusion_coef, q=3),
+            ScalarSemilinearMassIntegrator(reaction_coef, q=3)
+        ])
+        if source:
+            sform.add_integrator(ScalarSourceIntegrator(pde.source, q=3))
+        return sform, uh, isDDof
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_residual_assembly(self, backend):
+        bm.set_backend(backend)
+        sform, uh, _ = self._get_problem()
+        uh[:] = bm.tensor(np.random.rand(uh.shape[0]))
+        _, F = sform.assembly()
+        F0 = sform.assembly_residual()
+        np.testing.assert_allclose(bm.to_numpy(F0), bm.to_numpy(F), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('kwargs', [
+        dict(),
+        dict(jacobian_refresh=3),
+        dict(linear_solver='cg'),
+        dict(linear_solver='gmres', jacobian_refresh=2, preconditioner_refresh=2),
+    ])
+    def test_newton(self, backend, kwargs):
+        bm.set_backend(backend)
+        sform, uh, isDDof = self._get_problem()
+        solver = NewtonSolver(sform, uh, isDDof=isDDof, rtol=1e-10, **kwargs)
+        solver.solve()
+
+        assert solver.residuals[-1] < 1e-10 * solver.residuals[0]
+        F = sform.assembly_residual()
+        F = bm.set_at(F, isDDof, 0.)
+        assert float(bm.linalg.norm(F)) < 1e-10 * solver.residuals[0]
+
+        if kwargs.get('jacobian_refresh', 1) > 1:
+            assert solver.n_jacobian < len(solver.residuals) - 1
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_zero_residual(self, backend):
+        bm.set_backend(backend)
+        # u = 0 solves the problem without source exactly
+        sform, uh, isDDof = self._get_problem(source=False)
+        uh[:] = 0.
+        solver = NewtonSolver(sform, uh, isDDof=isDDof, atol=0., linear_solver='cg')
+        solver.solve()
+        assert solver.residuals == [0.]
+        assert solver._forcing_term(0.5, 0., 0., 0.) == 0.5
+        assert solver._forcing_term(0.5, 0., 1., 0.) == 0.5
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_newton.py', '-q'])
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import cg, fgmres, SchwarzPreconditioner
+
+
+class TestSchwarzPreconditioner:
+
+    def _get_system(self):
+        mesh = TriangleMesh.from_box(nx=24, ny=24)
+        space = LagrangeFESpace(mesh, p=2)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+        bform.add_integrator(ScalarMassIntegrator(coef=1e-2, q=3))
+        bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+        parts = np.floor(bc[:, 0]*3).astype(np.int64) + 3*np.floor(bc[:, 1]*3).astype(np.int64)
+        return space, bform.assembly(), parts
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_additive(self, backend):
+        bm.set_backend(backend)
+        space, A, parts = self._get_system()
+        b = bm.tensor(np.random.default_rng(0).standard_normal(A.shape[0]))
+        _, info0 = cg(A, b, rtol=1e-8, return_info=True)
+
+        niter = []
+        for coarse in [False, True]:
+            P = SchwarzPreconditioner(A, space, parts=parts, overlap=2,
+                                      restricted=False, coarse=coarse)
+            x, info = cg(A, b, M=P, rtol=1e-8, return_info=True)
+            assert info['converged']
+            niter.append(int(info['niter']))
+        assert niter[0] < int(info0['niter']) // 4
+        assert niter[1] < niter[0]
+
+        # the local solves in the worker processes give the same result
+        r = bm.tensor(np.random.default_rng(1).standard_normal((A.shape[0], 2)))
+        Pw = SchwarzPreconditioner(A, space, parts=parts, overlap=2,
+                                   restricted=False, coarse=True, workers=2)
+        try:
+            np.testing.assert_allclose(bm.to_numpy(Pw @ r), bm.to_numpy(P @ r), atol=1e-12)
+            np.testing.assert_allclose(bm.to_numpy(Pw @ r[:, 0]), bm.to_numpy(P @ r[:, 0]),
+                                       atol=1e-12)
+        finally:
+            Pw.close()
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_restricted(self, backend):
+        bm.set_backend(backend)
+        space, A, parts = self._get_system()
+        x0 = bm.tensor(np.random.default_rng(2).random(A.shape[0]))
+        b = A @ x0
+
+        P = SchwarzPreconditioner(A, space, parts=parts, overlap=1)
+        # the owned DoFs of the subdomains are a partition of all the DoFs
+        owned = np.concatenate([idx[own] for idx, own in P.subdomains])
+        np.testing.assert_array_equal(np.sort(owned), np.arange(A.shape[0]))
+        x = fgmres(A, b, M=P, rtol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(x0), atol=1e-5)
+
+        # partition of the matrix rows without the space
+        dof_parts = (bm.to_numpy(space.interpolation_points())[:, 0] > 0.5).astype(np.int64)
+        P = SchwarzPreconditioner(A, parts=dof_parts, overlap=2)
+        assert P.nparts == 2
+        x = fgmres(A, b, M=P, rtol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(x0), atol=1e-5)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_overlap_dense_rows(self, backend):
+        bm.set_backend(backend)
+        # P3 on tetrahedra gives rows with more than 127 entries
+        mesh = TetrahedronMesh.from_box(nx=4, ny=4, nz=4)
+        space = LagrangeFESpace(mesh, p=3)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=5))
+        bform.add_integrator(ScalarMassIntegrator(q=5))
+        A = bform.assembly()
+        S = A.to_scipy().tocsr()
+        assert np.diff(S.indptr).max() > 127
+
+        bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+        parts = (bc[:, 0] > 0.5).astype(np.int64)
+        P = SchwarzPreconditioner(A, space, parts=parts, overlap=1)
+        cell2dof = bm.to_numpy(space.cell_to_dof())
+        G = S.astype(bool)
+        for k, (idx, own) in enumerate(P.subdomains):
+            mask = np.zeros(S.shape[0], dtype=bool)
+            mask[cell2dof[parts == k]] = True
+            np.testing.assert_array_equal(idx, np.nonzero(G @ mask)[0])
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_schwarz_preconditioner.py', '-q'])
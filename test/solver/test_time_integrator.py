@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from scipy.linalg import eigh
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
+from fealpy.solver import ThetaScheme, BDFScheme, NewmarkScheme, cg, JacobiPreconditioner
+
+
+class TestTimeIntegrator:
+
+    def _get_system(self):
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=1)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarMassIntegrator(q=3))
+        M = bform.assembly()
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(q=3))
+        A = bform.assembly()
+        return space, M, A
+
+    def _modes(self, M, A, u0):
+        lam, V = eigh(A.to_scipy().toarray(), M.to_scipy().toarray())
+        c = V.T @ (M.to_scipy() @ bm.to_numpy(u0))
+        return lam, V, c
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    @pytest.mark.parametrize('scheme, kwargs, order', [
+        (ThetaScheme, {'theta': 1.}, 1), (ThetaScheme, {'theta': 0.5}, 2),
+        (BDFScheme, {'order': 2}, 2), (BDFScheme, {'order': 3}, 3)])
+    def test_first_order(self, backend, scheme, kwargs, order):
+        bm.set_backend(backend)
+        space, M, A = self._get_system()
+        node = space.interpolation_points()
+        u0 = bm.cos(bm.pi*node[:, 0]) * bm.cos(bm.pi*node[:, 1])
+        lam, V, c = self._modes(M, A, u0)
+        T = 0.1
+        exact = V @ (np.exp(-lam*T) * c)
+
+        errors = []
+        for nt in [20, 40]:
+            stepper = scheme(M, A, **kwargs)
+            if scheme is BDFScheme:
+                # the exact history avoids the lower-order start-up steps
+                dt = T/nt
+                history = [bm.tensor(V @ (np.exp(lam*j*dt) * c)) for j in range(1, order)]
+                stepper.set_initial(u0, history=history, dt=dt)
+            else:
+                stepper.set_initial(u0)
+            u = stepper.run(nt, T/nt)
+            # only one system is set up, and then reused
+            assert len(stepper._systems) == 1
+            errors.append(np.max(np.abs(bm.to_numpy(u) - exact)))
+        assert abs(stepper.t - T) < 1e-12
+        assert errors[0] / errors[1] > 2**order * 0.8
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_dirichlet(self, backend):
+        bm.set_backend(backend)
+        space, M, A = self._get_system()
+        isDDof = space.is_boundary_dof()
+        node = bm.to_numpy(space.interpolation_points())
+        gd = lambda t: bm.tensor(np.sin(t + node[:, 0]))
+        source = lambda t: M @ bm.tensor(np.full(node.shape[0], t))
+        dt, theta = 0.05, 0.5
+
+        stepper = ThetaScheme(M, A, theta=theta, source=source, isDDof=isDDof, gd=gd,
+                              solver=cg, preconditioner=JacobiPreconditioner,
+                              atol=0., rtol=1e-13)
+        u0 = bm.tensor(np.zeros(node.shape[0]))
+        stepper.set_initial(u0)
+
+        # reference: form and eliminate the system at every step
+        Ms, As = M.to_scipy().toarray(), A.to_scipy().toarray()
+        isD = bm.to_numpy(isDDof)
+        u, t = np.zeros(node.shape[0]), 0.
+        for _ in range(5):
+            K = Ms/dt + theta*As
+            r = (Ms/dt - (1 - theta)*As) @ u + bm.to_numpy(
+                theta*source(t + dt) + (1 - theta)*source(t))
+            g = np.where(isD, bm.to_numpy(gd(t + dt)), 0.)
+            r = r - K @ g
+            r[isD] = g[isD]
+            K[isD, :] = 0.
+            K[:, isD] = 0.
+            K[isD, isD] = 1.
+            u, t = np.linalg.solve(K, r), t + dt
+            np.testing.assert_allclose(bm.to_numpy(stepper.step(dt)), u, atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy'])
+    def test_newmark(self, backend):
+        bm.set_backend(backend)
+        space, M, A = self._get_system()
+        node = space.interpolation_points()
+        u0 = bm.cos(bm.pi*node[:, 0]) * bm.cos(bm.pi*node[:, 1])
+        lam, V, c = self._modes(M, A, u0)
+        T = 0.5
+        exact = V @ (np.cos(np.sqrt(np.abs(lam))*T) * c)
+
+        errors = []
+        for nt in [40, 80]:
+            stepper = NewmarkScheme(M, A)
+            stepper.set_initial(u0)
+            u = stepper.run(nt, T/nt)
+            errors.append(np.max(np.abs(bm.to_numpy(u) - exact)))
+        assert errors[0] / errors[1] > 3.2
+
+        # the average acceleration method conserves the energy
+        energy = lambda s: float(s.v @ (M @ s.v) + s.u @ (A @ s.u))
+        stepper.set_initial(u0)
+        e0 = energy(stepper)
+        stepper.run(20, 0.1)
+        assert abs(energy(stepper) - e0) < 1e-10 * e0
+
+
+if __name__ == '__main__':
+    pytest.main(['./test_time_integrator.py', '-q'])
+
+
+def test_bdf_startup():
+    bm.set_backend('numpy')
+    space, M, A = TestTimeIntegrator()._get_system()
+    u0 = bm.tensor(np.random.default_rng(0).random(M.shape[0]))
+    stepper = BDFScheme(M, A, order=3)
+    stepper.set_initial(u0)
+    stepper.run(5, 0.01)
+    # BDF1, BDF2, then BDF3 for the rest
+    assert len(stepper._systems) == 3
+    stepper.run(2, 0.02)
+    assert len(stepper._systems) == 4 # the oldest one is dropped on the 5th system